@@ -1,13 +1,56 @@
 import asyncio
 from collections.abc import Hashable
+from contextlib import AbstractAsyncContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Generic, TypeVar
+import functools
+import inspect
+import time
+from typing import Any, Awaitable, Callable, Generator, Generic, Iterable, TypeVar
 
 from httpx import HTTPStatusError
 
+from kfinance.client.fetch import batch_request_context, get_batch_request_context
+from kfinance.metrics import BATCH_SIZE, CONCURRENCY_WAIT, get_active_metrics
+
 
 ResultKeyT = TypeVar("ResultKeyT", bound=Hashable)
 
+# Context variable for a concurrency limit shared by all batches in an async context
+_shared_throttle: ContextVar[asyncio.Semaphore | None] = ContextVar("shared_throttle", default=None)
+# Set in tasks that hold a slot of the shared throttle. Batches nested in these tasks run
+# within that slot instead of waiting for a second one, which could deadlock.
+_holds_shared_throttle: ContextVar[bool] = ContextVar("holds_shared_throttle", default=False)
+
+# The maximum number of tasks of a batch that run at once without a shared limit. Batches
+# nested in a task that holds a slot of the shared limit also get this limit.
+DEFAULT_BATCH_CONCURRENCY = 10
+
+
+@contextmanager
+def shared_concurrency_limit(max_concurrency: int) -> Generator[None, None, None]:
+    """Context manager to share one concurrency limit between all batches in the context.
+
+    Without a shared limit, every batch runs up to 10 tasks at once. Within the context,
+    at most max_concurrency tasks of top-level batches run at once across all batches, for
+    example across multiple tool calls that run in parallel. A batch nested in one of these
+    tasks runs within the slot of its parent task and gets its own limit of 10 tasks, so
+    at most max_concurrency * 10 nested tasks run at once.
+    """
+    token = _shared_throttle.set(asyncio.Semaphore(max_concurrency))
+    try:
+        yield
+    finally:
+        _shared_throttle.reset(token)
+
+
+def _get_throttle() -> AbstractAsyncContextManager:
+    """Return the throttle for the tasks of a batch."""
+    shared_throttle = _shared_throttle.get()
+    if shared_throttle is None or _holds_shared_throttle.get():
+        return asyncio.Semaphore(DEFAULT_BATCH_CONCURRENCY)
+    return shared_throttle
+
 
 @dataclass(kw_only=True)
 class AsyncTask(Generic[ResultKeyT]):
@@ -33,21 +76,39 @@ class AsyncTask(Generic[ResultKeyT]):
 async def batch_execute_async_tasks(tasks: list[AsyncTask[ResultKeyT]]) -> None:
     """Execute a list of tasks in the with up to 10 parallel tasks.
 
+    Within a `shared_concurrency_limit`, the limit of the context applies instead.
+
     The results from the execution (result or error) are directly stored in the task.
+    Requests made by the tasks include Kfinance-Batch-Id/Size headers. Nested batches
+    keep the headers of the outermost batch.
     """
     tasks[0].func.__name__ if tasks else "none"
 
-    # Allow a maximum of 10 tasks to run at once.
-    throttle = asyncio.Semaphore(10)
-    await asyncio.gather(*[execute_task_with_throttle(task, throttle) for task in tasks])
+    metrics = get_active_metrics()
+    if metrics is not None:
+        metrics.observe(BATCH_SIZE, len(tasks))
+
+    throttle = _get_throttle()
+    nested = get_batch_request_context() is not None
+    with nullcontext() if nested else batch_request_context(batch_size=len(tasks)):
+        # asyncio.gather wraps each coroutine in a task with a copy of the current
+        # context, so the batch propagates to all tasks.
+        await asyncio.gather(*[execute_task_with_throttle(task, throttle) for task in tasks])
 
 
 async def execute_task_with_throttle(
-    task: AsyncTask[ResultKeyT], throttle: asyncio.Semaphore
+    task: AsyncTask[ResultKeyT], throttle: AbstractAsyncContextManager
 ) -> None:
     """Execute a single task and store the result in the task's `result` attribute."""
 
+    metrics = get_active_metrics()
+    wait_start = time.perf_counter() if metrics is not None else 0.0
     async with throttle:
+        if metrics is not None:
+            metrics.observe(CONCURRENCY_WAIT, time.perf_counter() - wait_start)
+        if _shared_throttle.get() is not None:
+            # Each task runs in a copy of the context, so this only applies to this task.
+            _holds_shared_throttle.set(True)
         try:
             result = await task.func(*task.args, **task.kwargs)
             task.result = result
@@ -61,3 +122,52 @@ async def execute_task_with_throttle(
             # should be raised.
             else:
                 raise http_err
+
+
+async def batch_execute_async_tasks_into_dict(
+    tasks: list[AsyncTask[ResultKeyT]],
+) -> dict[ResultKeyT, Any]:
+    """Execute a list of tasks and return a dict mapping from each task's key to its result.
+
+    This mirrors the error handling of the thread pool based group objects: if a task
+    fails with a 400 or 404, the corresponding value is None. All other errors are raised.
+    """
+    await batch_execute_async_tasks(tasks=tasks)
+    return {task.result_key: None if task.error else task.result for task in tasks}
+
+
+def add_coroutines_of_singular_class_to_iterable_class(singular_cls: type) -> Callable:
+    """Returns a decorator that adds coroutine methods from a singular to a plural class.
+
+    This is the async equivalent of `add_methods_of_singular_class_to_iterable_class`.
+    Awaiting a coroutine added by the decorator fans out the call to all objects in the
+    iterable via asyncio and returns a dict mapping each object to its result.
+    For example, `await companies.info()` returns {<AsyncCompany object>: {...}, ...}.
+    """
+
+    def decorator(iterable_cls: type) -> type:
+        """Adds coroutine functions from a singular class to an iterable class."""
+        for method_name in dir(singular_cls):
+            if method_name.startswith("_"):
+                continue
+            method = getattr(singular_cls, method_name)
+            if not inspect.iscoroutinefunction(method):
+                continue
+
+            def create_coroutine_wrapper(method: Callable[..., Awaitable[Any]]) -> Callable:
+                @functools.wraps(method)
+                async def coroutine_wrapper(self: Iterable, *args: Any, **kwargs: Any) -> dict:
+                    return await batch_execute_async_tasks_into_dict(
+                        tasks=[
+                            AsyncTask(func=method, args=(obj, *args), kwargs=kwargs, result_key=obj)
+                            for obj in self
+                        ]
+                    )
+
+                return coroutine_wrapper
+
+            setattr(iterable_cls, method_name, create_coroutine_wrapper(method))
+
+        return iterable_cls
+
+    return decorator
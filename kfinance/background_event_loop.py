@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, TypeVar
+
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """An event loop running in a daemon thread that runs coroutines for sync callers.
+
+    Sync callers block until their coroutine has finished on the background loop. Because
+    the loop stays alive between calls, objects bound to it (like the connection pool of an
+    httpx.AsyncClient) get reused. Coroutines run in a copy of the caller's context, so
+    context variables like batch request headers propagate.
+    """
+
+    def __init__(self, name: str = "kfinance-event-loop") -> None:
+        """Start the event loop thread
+
+        :param name: The name of the thread
+        :type name: str
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def _run_forever(self) -> None:
+        """Run the event loop until it gets stopped."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def is_current(self) -> bool:
+        """Return True if called from a coroutine running on the background loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run coroutine on the background loop and return its result.
+
+        This also works from threads that run an event loop of their own (for example
+        Jupyter notebooks), whose loop gets blocked until the coroutine has finished.
+        """
+        if self.is_current():
+            coroutine.close()
+            raise RuntimeError("BackgroundEventLoop.run can't be called from its own loop.")
+        if self._loop.is_closed():
+            coroutine.close()
+            raise RuntimeError("The background event loop is closed.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def close(self) -> None:
+        """Stop the event loop and wait for its thread to finish."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
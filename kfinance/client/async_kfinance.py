@@ -0,0 +1,797 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Iterable, Literal, Optional, cast
+
+import httpx
+import pandas as pd
+
+from kfinance.async_batch_execution import add_coroutines_of_singular_class_to_iterable_class
+from kfinance.client.dataframe_builders import (
+    ValueDtype,
+    build_line_item_df,
+    build_statement_df,
+    get_default_value_dtype,
+)
+from kfinance.client.meta_classes import validate_time_inputs
+from kfinance.client.models.date_and_period_models import Periodicity, PeriodType
+from kfinance.client.models.numeric import NumericMode
+from kfinance.domains.capitalizations.capitalization_models import Capitalization, Capitalizations
+from kfinance.domains.capitalizations.capitalization_tools import (
+    fetch_capitalizations_from_company_id,
+)
+from kfinance.domains.companies.company_models import CompanyDescriptions, IdentificationTriple
+from kfinance.domains.companies.company_tools import (
+    fetch_company_summary_and_description_from_company_id,
+    fetch_info_from_company_id,
+)
+from kfinance.domains.cusip_and_isin.cusip_and_isin_tools import (
+    fetch_cusip_or_isin_from_security_id,
+)
+from kfinance.domains.line_items.line_item_tools import fetch_line_item_from_company_ids
+from kfinance.domains.prices.price_models import HistoryMetadataResp, PriceHistory
+from kfinance.domains.prices.price_tools import (
+    fetch_history_metadata_from_trading_item_id,
+    fetch_price_history_from_trading_item_id,
+)
+from kfinance.domains.statements.statement_tools import fetch_statements_from_company_ids
+
+
+if TYPE_CHECKING:
+    from kfinance.client.kfinance import Client
+
+
+class AsyncTradingItem:
+    """Async equivalent of `TradingItem`
+
+    Supports `history_metadata` and `history`. The other methods and properties of
+    `TradingItem` (for example `price_chart`) are only available in the sync API.
+
+    :param httpx_client: The async httpx client used to fetch data
+    :type httpx_client: httpx.AsyncClient
+    :param trading_item_id: The S&P CIQ Trading Item ID
+    :type trading_item_id: int
+    """
+
+    def __init__(self, httpx_client: httpx.AsyncClient, trading_item_id: int):
+        """Initialize the async trading item object
+
+        :param httpx_client: The async httpx client used to fetch data
+        :type httpx_client: httpx.AsyncClient
+        :param trading_item_id: The S&P CIQ Trading Item ID
+        :type trading_item_id: int
+        """
+        self.httpx_client = httpx_client
+        self.trading_item_id = trading_item_id
+        self._history_metadata: HistoryMetadataResp | None = None
+
+    def __str__(self) -> str:
+        """String representation for the async trading item object"""
+        return f"{type(self).__module__}.{type(self).__qualname__} of {self.trading_item_id}"
+
+    async def history_metadata(self) -> HistoryMetadataResp:
+        """Get information about exchange and quotation
+
+        :return: A model containing data about the currency, symbol, exchange, type of instrument, and the first trading date
+        :rtype: HistoryMetadataResp
+        """
+        if self._history_metadata is None:
+            self._history_metadata = await fetch_history_metadata_from_trading_item_id(
+                trading_item_id=self.trading_item_id, httpx_client=self.httpx_client
+            )
+        return self._history_metadata
+
+    async def history(
+        self,
+        periodicity: Periodicity = Periodicity.day,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> PriceHistory:
+        """Retrieves the historical price data for a given asset over a specified date range.
+
+        See `TradingItem.history` for a description of the parameters and the response.
+        """
+        if start_date and end_date:
+            if (
+                datetime.strptime(start_date, "%Y-%m-%d").date()
+                > datetime.strptime(end_date, "%Y-%m-%d").date()
+            ):
+                return PriceHistory(prices=[])
+
+        return await fetch_price_history_from_trading_item_id(
+            trading_item_id=self.trading_item_id,
+            httpx_client=self.httpx_client,
+            start_date=date.fromisoformat(start_date) if start_date else None,
+            end_date=date.fromisoformat(end_date) if end_date else None,
+            periodicity=periodicity,
+            adjusted=adjusted,
+        )
+
+
+class AsyncSecurity:
+    """Async equivalent of `Security`
+
+    Supports `isin`, `cusip`, and `primary_trading_item`. The other methods and properties of
+    `Security` (for example `trading_items`) are only available in the sync API.
+
+    :param httpx_client: The async httpx client used to fetch data
+    :type httpx_client: httpx.AsyncClient
+    :param security_id: The S&P CIQ security id
+    :type security_id: int
+    """
+
+    def __init__(self, httpx_client: httpx.AsyncClient, security_id: int):
+        """Initialize the async security object
+
+        :param httpx_client: The async httpx client used to fetch data
+        :type httpx_client: httpx.AsyncClient
+        :param security_id: The S&P CIQ security id
+        :type security_id: int
+        """
+        self.httpx_client = httpx_client
+        self.security_id = security_id
+        self._cusip: str | None = None
+        self._isin: str | None = None
+        self._primary_trading_item: AsyncTradingItem | None = None
+
+    def __str__(self) -> str:
+        """String representation for the async security object"""
+        return f"{type(self).__module__}.{type(self).__qualname__} of {self.security_id}"
+
+    async def isin(self) -> str:
+        """Get the ISIN for the object
+
+        :return: The ISIN
+        :rtype: str
+        """
+        if self._isin is None:
+            self._isin = await fetch_cusip_or_isin_from_security_id(
+                security_id=self.security_id, cusip_or_isin="isin", httpx_client=self.httpx_client
+            )
+        return self._isin
+
+    async def cusip(self) -> str:
+        """Get the CUSIP for the object
+
+        :return: The CUSIP
+        :rtype: str
+        """
+        if self._cusip is None:
+            self._cusip = await fetch_cusip_or_isin_from_security_id(
+                security_id=self.security_id, cusip_or_isin="cusip", httpx_client=self.httpx_client
+            )
+        return self._cusip
+
+    async def primary_trading_item(self) -> AsyncTradingItem:
+        """Return the primary trading item for the security
+
+        :return: an AsyncTradingItem object of the primary trading item of security_id
+        :rtype: AsyncTradingItem
+        """
+        if self._primary_trading_item is None:
+            resp = await self.httpx_client.get(url=f"/trading_items/{self.security_id}/primary")
+            resp.raise_for_status()
+            self._primary_trading_item = AsyncTradingItem(
+                httpx_client=self.httpx_client,
+                trading_item_id=resp.json()["primary_trading_item"],
+            )
+        return self._primary_trading_item
+
+
+class AsyncCompanyFunctionsMetaClass:
+    """Async equivalent of `CompanyFunctionsMetaClass`
+
+    The data returned by each coroutine is the same as the data returned by the
+    corresponding method of `CompanyFunctionsMetaClass`. Supported are `info`, `name`,
+    `summary`, `description`, the statements, `line_item`, and the capitalizations. The
+    other methods and properties (for example the other info properties, earnings,
+    mergers and acquisitions, rounds of funding, segments, and estimates) are only
+    available in the sync API.
+    """
+
+    httpx_client: httpx.AsyncClient
+
+    def __init__(self, numeric: NumericMode = NumericMode.decimal) -> None:
+        """Initialize the AsyncCompanyFunctionsMetaClass object
+
+        :param numeric: The numeric mode of the client, which selects the default value dtype
+            of statement and line item DataFrames.
+        :type numeric: NumericMode
+        """
+        self.numeric = numeric
+        self._info: dict | None = None
+        self._company_descriptions: CompanyDescriptions | None = None
+
+    @property
+    def default_value_dtype(self) -> ValueDtype:
+        """Return the value dtype of DataFrames for the numeric mode of the client."""
+        return get_default_value_dtype(self.numeric)
+
+    @abstractmethod
+    async def get_company_id(self) -> int:
+        """Return the company id for the object"""
+        raise NotImplementedError("child classes must implement get_company_id")
+
+    async def info(self) -> dict:
+        """Get the company info
+
+        :return: a dict with containing: name, status, type, simple industry, number of employees (if available), founding date, webpage, address, city, zip code, state, country, & iso_country
+        :rtype: dict
+        """
+        if self._info is None:
+            self._info = await fetch_info_from_company_id(
+                company_id=await self.get_company_id(), httpx_client=self.httpx_client
+            )
+        return self._info
+
+    async def name(self) -> str:
+        """Get the company name
+
+        :return: The company name
+        :rtype: str
+        """
+        return (await self.info())["name"]
+
+    async def _fetch_company_descriptions(self) -> CompanyDescriptions:
+        """Lazily fetch and return a company's summary and description"""
+        if self._company_descriptions is None:
+            self._company_descriptions = (
+                await fetch_company_summary_and_description_from_company_id(
+                    company_id=await self.get_company_id(), httpx_client=self.httpx_client
+                )
+            )
+        return self._company_descriptions
+
+    async def summary(self) -> str:
+        """Lazily fetch and return a company's summary"""
+        return (await self._fetch_company_descriptions()).summary
+
+    async def description(self) -> str:
+        """Lazily fetch and return a company's description"""
+        return (await self._fetch_company_descriptions()).description
+
+    async def statement(
+        self,
+        statement_type: str,
+        period_type: Optional[PeriodType] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        start_quarter: Optional[int] = None,
+        end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
+    ) -> pd.DataFrame:
+        """Get the company's financial statement
+
+        value_dtype selects the dtype of the values, see ValueDtype. It defaults to float64 for
+        clients with numeric="float" and to object otherwise.
+        """
+        try:
+            validate_time_inputs(
+                start_year=start_year,
+                end_year=end_year,
+                start_quarter=start_quarter,
+                end_quarter=end_quarter,
+            )
+        except ValueError:
+            return pd.DataFrame()
+
+        statement_response = await fetch_statements_from_company_ids(
+            company_ids=[await self.get_company_id()],
+            statement_type=statement_type,
+            httpx_client=self.httpx_client,
+            period_type=period_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=cast(Literal[1, 2, 3, 4] | None, start_quarter),
+            end_quarter=cast(Literal[1, 2, 3, 4] | None, end_quarter),
+        )
+
+        if not statement_response.results:
+            return pd.DataFrame()
+
+        # Get the first (and only) result
+        return build_statement_df(
+            next(iter(statement_response.results.values())),
+            value_dtype=value_dtype or self.default_value_dtype,
+        )
+
+    async def income_statement(
+        self,
+        period_type: Optional[PeriodType] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        start_quarter: Optional[int] = None,
+        end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
+    ) -> pd.DataFrame:
+        """The templated income statement"""
+        return await self.statement(
+            statement_type="income_statement",
+            period_type=period_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=start_quarter,
+            end_quarter=end_quarter,
+            value_dtype=value_dtype,
+        )
+
+    async def balance_sheet(
+        self,
+        period_type: Optional[PeriodType] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        start_quarter: Optional[int] = None,
+        end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
+    ) -> pd.DataFrame:
+        """The templated balance sheet"""
+        return await self.statement(
+            statement_type="balance_sheet",
+            period_type=period_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=start_quarter,
+            end_quarter=end_quarter,
+            value_dtype=value_dtype,
+        )
+
+    async def cash_flow(
+        self,
+        period_type: Optional[PeriodType] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        start_quarter: Optional[int] = None,
+        end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
+    ) -> pd.DataFrame:
+        """The templated cash flow statement"""
+        return await self.statement(
+            statement_type="cash_flow",
+            period_type=period_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=start_quarter,
+            end_quarter=end_quarter,
+            value_dtype=value_dtype,
+        )
+
+    async def line_item(
+        self,
+        line_item: str,
+        period_type: Optional[PeriodType] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        start_quarter: Optional[int] = None,
+        end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
+    ) -> pd.DataFrame:
+        """Get a DataFrame of a financial line item according to the date ranges.
+
+        value_dtype selects the dtype of the values, see ValueDtype. It defaults to float64 for
+        clients with numeric="float" and to object otherwise.
+        """
+        try:
+            validate_time_inputs(
+                start_year=start_year,
+                end_year=end_year,
+                start_quarter=start_quarter,
+                end_quarter=end_quarter,
+            )
+        except ValueError:
+            return pd.DataFrame()
+
+        response = await fetch_line_item_from_company_ids(
+            company_ids=[await self.get_company_id()],
+            line_item=line_item,
+            httpx_client=self.httpx_client,
+            period_type=period_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=cast(Literal[1, 2, 3, 4] | None, start_quarter),
+            end_quarter=cast(Literal[1, 2, 3, 4] | None, end_quarter),
+        )
+
+        if not response.results:
+            return pd.DataFrame()
+
+        # Get the first (and only) result
+        return build_line_item_df(
+            next(iter(response.results.values())),
+            line_item=line_item,
+            value_dtype=value_dtype or self.default_value_dtype,
+        )
+
+    async def capitalizations(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Capitalizations:
+        """Retrieves market caps, TEVs, and shares outstanding between start and end date.
+
+        :param start_date: The start date in format "YYYY-MM-DD", default to None
+        :type start_date: str, optional
+        :param end_date: The end date in format "YYYY-MM-DD", default to None
+        :type end_date: str, optional
+        :return: The capitalizations in the date range
+        :rtype: Capitalizations
+        """
+        return await fetch_capitalizations_from_company_id(
+            company_id=await self.get_company_id(),
+            start_date=date.fromisoformat(start_date) if start_date else None,
+            end_date=date.fromisoformat(end_date) if end_date else None,
+            httpx_client=self.httpx_client,
+        )
+
+    async def market_cap(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict:
+        """Retrieves market caps for a company between start and end date."""
+        capitalizations = await self.capitalizations(start_date=start_date, end_date=end_date)
+        return capitalizations.model_dump_json_single_metric(Capitalization.market_cap)
+
+    async def tev(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict:
+        """Retrieves TEV (total enterprise value) for a company between start and end date."""
+        capitalizations = await self.capitalizations(start_date=start_date, end_date=end_date)
+        return capitalizations.model_dump_json_single_metric(Capitalization.tev)
+
+    async def shares_outstanding(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict:
+        """Retrieves shares outstanding for a company between start and end date."""
+        capitalizations = await self.capitalizations(start_date=start_date, end_date=end_date)
+        return capitalizations.model_dump_json_single_metric(Capitalization.shares_outstanding)
+
+
+class AsyncCompany(AsyncCompanyFunctionsMetaClass):
+    """Async equivalent of `Company`
+
+    Supports the coroutines of `AsyncCompanyFunctionsMetaClass` and `primary_security`.
+    `securities` and the other methods and properties of `Company` are only available in the
+    sync API.
+
+    :param httpx_client: The async httpx client used to fetch data
+    :type httpx_client: httpx.AsyncClient
+    :param company_id: The S&P Global CIQ Company Id
+    :type company_id: int
+    :param numeric: The numeric mode of the client
+    :type numeric: NumericMode
+    """
+
+    def __init__(
+        self,
+        httpx_client: httpx.AsyncClient,
+        company_id: int,
+        numeric: NumericMode = NumericMode.decimal,
+    ):
+        """Initialize the async company object
+
+        :param httpx_client: The async httpx client used to fetch data
+        :type httpx_client: httpx.AsyncClient
+        :param company_id: The S&P Global CIQ Company Id
+        :type company_id: int
+        :param numeric: The numeric mode of the client
+        :type numeric: NumericMode
+        """
+        super().__init__(numeric=numeric)
+        self.httpx_client = httpx_client
+        self.company_id = company_id
+        self._primary_security: AsyncSecurity | None = None
+
+    def __str__(self) -> str:
+        """String representation for the async company object"""
+        return f"{type(self).__module__}.{type(self).__qualname__} of {self.company_id}"
+
+    async def get_company_id(self) -> int:
+        """Return the company id of the company."""
+        return self.company_id
+
+    async def primary_security(self) -> AsyncSecurity:
+        """Return the primary security for the company
+
+        :return: an AsyncSecurity object of the primary security of company_id
+        :rtype: AsyncSecurity
+        """
+        if self._primary_security is None:
+            resp = await self.httpx_client.get(url=f"/securities/{self.company_id}/primary")
+            resp.raise_for_status()
+            self._primary_security = AsyncSecurity(
+                httpx_client=self.httpx_client, security_id=resp.json()["primary_security"]
+            )
+        return self._primary_security
+
+
+class AsyncTicker(AsyncCompanyFunctionsMetaClass):
+    """Async equivalent of `Ticker`
+
+    Supports the coroutines of `AsyncCompanyFunctionsMetaClass`, `id_triple`, `company`,
+    `primary_trading_item`, `history_metadata`, and `history`. The security, ISIN, CUSIP,
+    and the other methods and properties of `Ticker` are only available in the sync API.
+
+    :param httpx_client: The async httpx client used to fetch data
+    :type httpx_client: httpx.AsyncClient
+    :param identifier: The ticker symbol, ISIN, or CUSIP
+    :type identifier: str, optional
+    :param exchange_code: The exchange code identifying which exchange the ticker is on
+    :type exchange_code: str, optional
+    """
+
+    def __init__(
+        self,
+        httpx_client: httpx.AsyncClient,
+        identifier: Optional[str] = None,
+        exchange_code: Optional[str] = None,
+        company_id: Optional[int] = None,
+        security_id: Optional[int] = None,
+        trading_item_id: Optional[int] = None,
+        numeric: NumericMode = NumericMode.decimal,
+    ) -> None:
+        """Initialize the async ticker object.
+
+        Like for `Ticker`, [identifier] can be a ticker, ISIN, or CUSIP. Identifier is
+        prioritized over identification triple (company_id, security_id, & trading_item_id).
+        numeric is the numeric mode of the client.
+        """
+        super().__init__(numeric=numeric)
+        self.httpx_client = httpx_client
+        self._identifier = identifier
+        self.exchange_code = exchange_code
+        self._id_triple: IdentificationTriple | None = None
+        if identifier is None:
+            if company_id is None or security_id is None or trading_item_id is None:
+                raise RuntimeError(
+                    "Neither an identifier nor an identification triple (company id, security id, & trading item id) were passed in"
+                )
+            self._id_triple = IdentificationTriple(
+                company_id=company_id, security_id=security_id, trading_item_id=trading_item_id
+            )
+        self._company: AsyncCompany | None = None
+        self._primary_trading_item: AsyncTradingItem | None = None
+
+    def __str__(self) -> str:
+        """String representation for the async ticker object"""
+        if self._identifier is not None:
+            description = (
+                f"{self.exchange_code + ':' if self.exchange_code else ''}{self._identifier}"
+            )
+        else:
+            assert self._id_triple is not None
+            description = (
+                f"identification triple ({self._id_triple.company_id}/"
+                f"{self._id_triple.security_id}/{self._id_triple.trading_item_id})"
+            )
+        return f"{type(self).__module__}.{type(self).__qualname__} of {description}"
+
+    async def id_triple(self) -> IdentificationTriple:
+        """Returns a unique identification triple for the ticker.
+
+        :return: an identification triple consisting of company_id, security_id, and trading_item_id
+        :rtype: IdentificationTriple
+        """
+        if self._id_triple is None:
+            assert self._identifier is not None
+            url = f"/id/{self._identifier}"
+            if self.exchange_code is not None:
+                url = url + f"/exchange_code/{self.exchange_code}"
+            resp = await self.httpx_client.get(url=url)
+            resp.raise_for_status()
+            self._id_triple = IdentificationTriple.model_validate(resp.json())
+        return self._id_triple
+
+    async def get_company_id(self) -> int:
+        """Return the company id of the ticker."""
+        return (await self.id_triple()).company_id
+
+    async def company(self) -> AsyncCompany:
+        """Return the company for the ticker
+
+        :return: The company returned as AsyncCompany object
+        :rtype: AsyncCompany
+        """
+        if self._company is None:
+            self._company = AsyncCompany(
+                httpx_client=self.httpx_client,
+                company_id=await self.get_company_id(),
+                numeric=self.numeric,
+            )
+            # Share already fetched company data between ticker and company.
+            self._company._info = self._info  # noqa: SLF001
+        return self._company
+
+    async def primary_trading_item(self) -> AsyncTradingItem:
+        """Return the trading item for the ticker
+
+        :return: The trading item returned as AsyncTradingItem object
+        :rtype: AsyncTradingItem
+        """
+        if self._primary_trading_item is None:
+            trading_item_id = (await self.id_triple()).trading_item_id
+            if trading_item_id is None:
+                raise ValueError(f"Ticker {self._identifier} does not have a trading_item_id.")
+            self._primary_trading_item = AsyncTradingItem(
+                httpx_client=self.httpx_client, trading_item_id=trading_item_id
+            )
+        return self._primary_trading_item
+
+    async def history_metadata(self) -> HistoryMetadataResp:
+        """Get information about exchange and quotation
+
+        :return: A model containing data about the currency, symbol, exchange, type of instrument, and the first trading date
+        :rtype: HistoryMetadataResp
+        """
+        return await (await self.primary_trading_item()).history_metadata()
+
+    async def history(
+        self,
+        periodicity: Periodicity = Periodicity.day,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> PriceHistory:
+        """Retrieves the historical price data for a given asset over a specified date range.
+
+        See `Ticker.history` for a description of the parameters and the response.
+        """
+        return await (await self.primary_trading_item()).history(
+            periodicity, adjusted, start_date, end_date
+        )
+
+
+@add_coroutines_of_singular_class_to_iterable_class(AsyncCompany)
+class AsyncCompanies(set):
+    """Async equivalent of `Companies`
+
+    Coroutines of `AsyncCompany` get fanned out to all companies via asyncio, for example,
+    `await companies.info()` returns a dict mapping each AsyncCompany to its info.
+    """
+
+    def __init__(
+        self,
+        httpx_client: httpx.AsyncClient,
+        company_ids: Iterable[int],
+        numeric: NumericMode = NumericMode.decimal,
+    ) -> None:
+        """Initialize the AsyncCompanies object
+
+        :param httpx_client: The async httpx client used to fetch data
+        :type httpx_client: httpx.AsyncClient
+        :param company_ids: An iterable of S&P CIQ Company ids
+        :type company_ids: Iterable[int]
+        :param numeric: The numeric mode of the client
+        :type numeric: NumericMode
+        """
+        self.httpx_client = httpx_client
+        super().__init__(
+            AsyncCompany(httpx_client=httpx_client, company_id=company_id, numeric=numeric)
+            for company_id in company_ids
+        )
+
+
+@add_coroutines_of_singular_class_to_iterable_class(AsyncTicker)
+class AsyncTickers(set):
+    """Async equivalent of `Tickers`
+
+    Coroutines of `AsyncTicker` get fanned out to all tickers via asyncio, for example,
+    `await tickers.history()` returns a dict mapping each AsyncTicker to its PriceHistory.
+    """
+
+    def __init__(self, httpx_client: httpx.AsyncClient, tickers: Iterable[AsyncTicker]) -> None:
+        """Initialize the AsyncTickers object
+
+        :param httpx_client: The async httpx client used to fetch data
+        :type httpx_client: httpx.AsyncClient
+        :param tickers: An iterable of AsyncTicker objects
+        :type tickers: Iterable[AsyncTicker]
+        """
+        self.httpx_client = httpx_client
+        super().__init__(tickers)
+
+
+class AsyncClient:
+    """Async equivalent of the object oriented `Client` interface.
+
+    The AsyncClient shares the authentication and the httpx connection pool of the `Client`
+    it was created from, so it should usually be accessed via `Client.async_client`.
+
+    :param kfinance_client: The client whose httpx client is used to fetch data
+    :type kfinance_client: Client
+    """
+
+    def __init__(self, kfinance_client: Client):
+        """Initialize the AsyncClient
+
+        :param kfinance_client: The client whose httpx client is used to fetch data
+        :type kfinance_client: Client
+        """
+        self.kfinance_client = kfinance_client
+
+    @property
+    def httpx_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx client of the underlying `Client`."""
+        return self.kfinance_client.httpx_client
+
+    @property
+    def numeric(self) -> NumericMode:
+        """Return the numeric mode of the underlying `Client`."""
+        return self.kfinance_client.kfinance_api_client.numeric
+
+    def ticker(self, identifier: int | str, exchange_code: Optional[str] = None) -> AsyncTicker:
+        """Generate an AsyncTicker object from [identifier] that is a ticker, ISIN, or CUSIP.
+
+        :param identifier: the ticker symbol, ISIN, or CUSIP
+        :type identifier: str
+        :param exchange_code: The code representing the equity exchange the ticker is listed on.
+        :type exchange_code: str, optional
+        :return: AsyncTicker object that corresponds to the identifier
+        :rtype: AsyncTicker
+        """
+        return AsyncTicker(self.httpx_client, str(identifier), exchange_code, numeric=self.numeric)
+
+    def tickers(self, identifiers: Iterable[int | str]) -> AsyncTickers:
+        """Generate an AsyncTickers group from tickers, ISINs, or CUSIPs.
+
+        :param identifiers: the ticker symbols, ISINs, or CUSIPs
+        :type identifiers: Iterable[str]
+        :return: AsyncTickers object containing one AsyncTicker per identifier
+        :rtype: AsyncTickers
+        """
+        return AsyncTickers(
+            self.httpx_client,
+            tickers=[
+                AsyncTicker(self.httpx_client, str(identifier), numeric=self.numeric)
+                for identifier in identifiers
+            ],
+        )
+
+    def company(self, company_id: int) -> AsyncCompany:
+        """Generate the AsyncCompany object from company_id
+
+        :param company_id: CIQ company id
+        :type company_id: int
+        :return: The AsyncCompany specified by the company id
+        :rtype: AsyncCompany
+        """
+        return AsyncCompany(
+            httpx_client=self.httpx_client, company_id=company_id, numeric=self.numeric
+        )
+
+    def companies(self, company_ids: Iterable[int]) -> AsyncCompanies:
+        """Generate the AsyncCompanies object from company_ids
+
+        :param company_ids: CIQ company ids
+        :type company_ids: Iterable[int]
+        :return: The AsyncCompanies specified by the company ids
+        :rtype: AsyncCompanies
+        """
+        return AsyncCompanies(
+            httpx_client=self.httpx_client, company_ids=company_ids, numeric=self.numeric
+        )
+
+    def security(self, security_id: int) -> AsyncSecurity:
+        """Generate AsyncSecurity object from security_id
+
+        :param security_id: CIQ security id
+        :type security_id: int
+        :return: The AsyncSecurity specified by the security id
+        :rtype: AsyncSecurity
+        """
+        return AsyncSecurity(httpx_client=self.httpx_client, security_id=security_id)
+
+    def trading_item(self, trading_item_id: int) -> AsyncTradingItem:
+        """Generate AsyncTradingItem object from trading_item_id
+
+        :param trading_item_id: CIQ trading item id
+        :type trading_item_id: int
+        :return: The trading item specified by the trading item id
+        :rtype: AsyncTradingItem
+        """
+        return AsyncTradingItem(httpx_client=self.httpx_client, trading_item_id=trading_item_id)
@@ -1,20 +1,80 @@
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError, as_completed, wait
+from contextlib import nullcontext
+from contextvars import Context, copy_context
 from dataclasses import dataclass, field
 import functools
 import threading
-from typing import Any, Callable, Hashable, Iterable, Protocol, Sized, Type, TypeVar
+import time
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Protocol,
+    Sized,
+    Type,
+    TypeVar,
+)
 
 from requests.exceptions import HTTPError
 
-from kfinance.client.fetch import KFinanceApiClient
+from kfinance.client.fetch import (
+    KFinanceApiClient,
+    batch_request_context,
+    set_batch_request_context,
+)
 
 
 T = TypeVar("T")
 
 MAX_WORKERS_CAP: int = 10
 
+# The throttle caps the number of batch tasks running concurrently across all batches.
+# Only top level batches acquire it. Nested batches (batches started from within a batch
+# task) run inline in the worker thread, which already holds a throttle slot.
 throttle = threading.Semaphore(MAX_WORKERS_CAP)
 
+_batch_worker_state = threading.local()
+
+
+def in_batch_worker() -> bool:
+    """Return True if the current thread is executing a batch task."""
+    return getattr(_batch_worker_state, "active", False)
+
+
+def run_as_batch_worker(func: Callable, /, *args: Any, **kwargs: Any) -> Any:
+    """Call func(*args, **kwargs) and mark the current thread as a batch worker meanwhile."""
+    previously_active = in_batch_worker()
+    _batch_worker_state.active = True
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _batch_worker_state.active = previously_active
+
+
+def submit_task(api_client: KFinanceApiClient, task: "Task", context: Context) -> Future:
+    """Submit a task to the thread pool to run in a copy of [context].
+
+    Running the task in a copy of the submitting context propagates context variables like
+    the batch request headers into the worker thread. Each task needs its own copy because
+    a context can't be entered by multiple threads at the same time.
+    """
+    return api_client.thread_pool.submit(
+        context.copy().run, run_as_batch_worker, task.func, *task.args, **task.kwargs
+    )
+
+
+def run_task_inline(task: "Task") -> Future:
+    """Execute a task in the current thread and return a completed future."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+    try:
+        future.set_result(run_as_batch_worker(task.func, *task.args, **task.kwargs))
+    except Exception as err:  # noqa: BLE001
+        future.set_exception(err)
+    return future
+
 
 def add_methods_of_singular_class_to_iterable_class(singular_cls: Type[T]) -> Callable:
     """Returns a decorator that adds methods and properties from a singular to a plural class."""
@@ -50,6 +110,18 @@ def add_methods_of_singular_class_to_iterable_class(singular_cls: Type[T]) -> Ca
             for that object in the dictionary will be set to None.
             - For any other HTTP error, the error is raised and bubbles up.
 
+        Streaming:
+            The decorator also adds a `stream` method (aliased as `iter`), which
+            yields (object, result) tuples as soon as each result is available
+            instead of returning a dictionary after all results are available, e.g.
+            `for company, info in companies.stream("info"): ...`
+            See `iter_tasks_as_completed` for details.
+
+        Deadlines and partial results:
+            The decorator also adds a `gather` method, which returns a `BatchResult`
+            with successes, errors, and unfinished objects instead of a dictionary, e.g.
+            `companies.gather("info", timeout=5, keep_going=True)`.
+
         Note:
             This decorator requires [iterable_cls] to be an iterable of
             instances of [singular_cls].
@@ -97,11 +169,82 @@ def add_methods_of_singular_class_to_iterable_class(singular_cls: Type[T]) -> Ca
 
                 setattr(iterable_cls, method_name, property(create_prop_wrapper(method)))
 
+        def stream(
+            self: IterableKfinanceClass,
+            attribute_name: str,
+            *args: Any,
+            max_in_flight: int = MAX_WORKERS_CAP,
+            **kwargs: Any,
+        ) -> Iterator[tuple[Hashable, Any]]:
+            """Yield (object, result) tuples for [attribute_name] as each result completes.
+
+            [args] and [kwargs] get passed to [attribute_name] if it is a method.
+            At most [max_in_flight] calls are submitted at a time. Breaking out of the
+            loop cancels all calls that have not started yet.
+            """
+            func = get_singular_attribute_function(singular_cls, attribute_name, args, kwargs)
+
+            return iter_tasks_as_completed(
+                api_client=self.kfinance_api_client,
+                tasks=(
+                    Task(func=func, args=(obj, *args), kwargs=kwargs, result_key=obj)
+                    for obj in self
+                ),
+                batch_size=len(self),
+                max_in_flight=max_in_flight,
+            )
+
+        def gather(
+            self: IterableKfinanceClass,
+            attribute_name: str,
+            *args: Any,
+            timeout: float | None = None,
+            keep_going: bool = False,
+            **kwargs: Any,
+        ) -> BatchResult:
+            """Fetch [attribute_name] for each object and return a BatchResult.
+
+            [args] and [kwargs] get passed to [attribute_name] if it is a method.
+            See `process_tasks_with_partial_results` for [timeout] and [keep_going].
+            """
+            func = get_singular_attribute_function(singular_cls, attribute_name, args, kwargs)
+            return process_tasks_with_partial_results(
+                api_client=self.kfinance_api_client,
+                tasks=[
+                    Task(func=func, args=(obj, *args), kwargs=kwargs, result_key=obj)
+                    for obj in self
+                ],
+                timeout=timeout,
+                keep_going=keep_going,
+            )
+
+        setattr(iterable_cls, "stream", stream)
+        setattr(iterable_cls, "iter", stream)
+        setattr(iterable_cls, "gather", gather)
+
         return iterable_cls
 
     return decorator
 
 
+def get_singular_attribute_function(
+    singular_cls: type, attribute_name: str, args: tuple, kwargs: dict
+) -> Callable:
+    """Return the function to call for [attribute_name], which can be a method or property."""
+    attribute = getattr(singular_cls, attribute_name, None)
+    if attribute_name.startswith("_") or attribute is None:
+        raise AttributeError(f"{singular_cls.__name__} has no public attribute {attribute_name}")
+    if isinstance(attribute, property):
+        assert attribute.fget is not None
+        if args or kwargs:
+            raise TypeError(f"{attribute_name} is a property and takes no arguments")
+        return attribute.fget
+    elif callable(attribute):
+        return attribute
+    else:
+        raise AttributeError(f"{attribute_name} is neither a method nor a property")
+
+
 @dataclass(kw_only=True)
 class Task:
     """A task for batch processing.
@@ -121,32 +264,211 @@ class Task:
     future: Future | None = field(init=False, default=None)
 
 
+@dataclass
+class BatchResult:
+    """The outcome of a batch of tasks.
+
+    - results maps the result_key of each successful task to its result. Like for
+        `process_tasks_in_thread_pool_executor`, tasks that failed with a 400 or 404
+        are successful with a result of None.
+    - errors maps the result_key of each task that failed with any other exception
+        to that exception.
+    - unfinished contains the result_keys of tasks that did not finish, either because
+        the deadline passed or because the batch was cancelled after a fatal error.
+    """
+
+    results: dict[Hashable, Any] = field(default_factory=dict)
+    errors: dict[Hashable, Exception] = field(default_factory=dict)
+    unfinished: list[Hashable] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """Return True if all tasks finished successfully."""
+        return not self.errors and not self.unfinished
+
+
 def process_tasks_in_thread_pool_executor(api_client: KFinanceApiClient, tasks: list[Task]) -> dict:
     """Execute a list of tasks in the api client's thread pool executor and return the results.
 
     Returns a dict mapping from each task's key to the corresponding result.
+    If a task fails with an error other than a 400 or 404, all queued tasks get
+    cancelled and the error is raised.
+    """
+
+    batch_result = process_tasks_with_partial_results(api_client=api_client, tasks=tasks)
+    if batch_result.errors:
+        raise next(iter(batch_result.errors.values()))
+    return batch_result.results
+
+
+def process_tasks_with_partial_results(
+    api_client: KFinanceApiClient,
+    tasks: list[Task],
+    timeout: float | None = None,
+    keep_going: bool = False,
+) -> BatchResult:
+    """Execute a list of tasks in the api client's thread pool executor and return a BatchResult.
+
+    - If [timeout] (in seconds) is set, tasks that have not finished when the deadline
+        passes get cancelled (if they have not started yet) and reported as unfinished.
+    - If [keep_going] is False, the first error other than a 400 or 404 cancels all
+        queued tasks, which get reported as unfinished. If [keep_going] is True, all
+        tasks run and their errors get collected.
+
+    If this function gets called from within a batch task (for example, when accessing a
+    group property inside a group property), the tasks run inline in the current worker
+    thread. Waiting on the thread pool from within the thread pool could otherwise
+    exhaust the throttle and all workers and deadlock.
     """
 
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def remaining_time() -> float | None:
+        """Return the time left until the deadline or None if there is no deadline."""
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    fatal_error = threading.Event()
+
+    def on_done(future: Future) -> None:
+        """Release the throttle and flag fatal errors."""
+        throttle.release()
+        if not keep_going and not future.cancelled() and is_fatal_error(future.exception()):
+            fatal_error.set()
+
     # Update access if necessary before submitting batch job.
     # If the batch job starts without a valid token, each thread may try to refresh it.
     assert api_client.access_token
-    with api_client.batch_request_header(batch_size=len(tasks)):
+    nested = in_batch_worker()
+    # Nested batches keep the batch header of the top level batch.
+    with nullcontext() if nested else batch_request_context(batch_size=len(tasks)):
         for task in tasks:
-            # Acquire throttle before submitting the task
-            throttle.acquire()
-            future = api_client.thread_pool.submit(task.func, *task.args, **task.kwargs)
+            if fatal_error.is_set():
+                break
+            if nested:
+                if remaining_time() == 0:
+                    break
+                task.future = run_task_inline(task)
+                if not keep_going and is_fatal_error(task.future.exception()):
+                    fatal_error.set()
+                continue
+            # Acquire throttle before submitting the task. Stop submitting once the
+            # deadline has passed.
+            if not throttle.acquire(timeout=remaining_time()):
+                break
+            future = submit_task(api_client=api_client, task=task, context=copy_context())
             # On success or failure, release the throttle.
-            # This releases the throttle before the
-            # `resolve_future_with_error_handling` call.
-            future.add_done_callback(lambda f: throttle.release())
+            future.add_done_callback(on_done)
             task.future = future
 
-        results = {}
+        futures = [task.future for task in tasks if task.future is not None]
+        try:
+            for future in as_completed(futures, timeout=remaining_time()):
+                if not keep_going and is_fatal_error(future.exception()):
+                    break
+        except TimeoutError:
+            pass
+
+        # Cancel all tasks that have not started yet. Tasks that are already running
+        # can't be cancelled and finish in the background.
+        for future in futures:
+            future.cancel()
+
+        batch_result = BatchResult()
         for task in tasks:
-            assert task.future
-            results[task.result_key] = resolve_future_with_error_handling(task.future)
+            if task.future is None or not task.future.done() or task.future.cancelled():
+                batch_result.unfinished.append(task.result_key)
+                continue
+            try:
+                batch_result.results[task.result_key] = resolve_future_with_error_handling(
+                    task.future
+                )
+            except Exception as err:  # noqa: BLE001
+                batch_result.errors[task.result_key] = err
+
+    return batch_result
+
+
+def iter_tasks_as_completed(
+    api_client: KFinanceApiClient,
+    tasks: Iterable[Task],
+    batch_size: int,
+    max_in_flight: int = MAX_WORKERS_CAP,
+) -> Iterator[tuple[Hashable, Any]]:
+    """Execute tasks in the api client's thread pool executor and yield results as they complete.
+
+    Yields a (result_key, result) tuple for each task in completion order.
+    - Like for `process_tasks_in_thread_pool_executor`, 400 and 404 errors return None.
+    - All other exceptions are yielded as the result instead of getting raised, so that
+        one failing task does not end the stream.
+
+    [tasks] is consumed lazily and at most [max_in_flight] tasks are submitted at any
+    time, so memory usage is bounded by the in-flight window rather than by the number
+    of tasks. When the generator gets closed early (e.g. by breaking out of a for loop),
+    submitted tasks that have not started yet get cancelled and the remaining tasks
+    never get submitted.
+
+    Like for `process_tasks_with_partial_results`, tasks run inline if this function
+    gets called from within a batch task.
+    """
+
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
 
-    return results
+    # Update access if necessary before submitting batch job.
+    # If the batch job starts without a valid token, each thread may try to refresh it.
+    assert api_client.access_token
+    if in_batch_worker():
+        for task in tasks:
+            future = run_task_inline(task)
+            try:
+                result = resolve_future_with_error_handling(future)
+            except Exception as err:  # noqa: BLE001
+                result = err
+            yield task.result_key, result
+        return
+
+    remaining_tasks = iter(tasks)
+    in_flight: dict[Future, Task] = {}
+    # Unlike a `with batch_request_context(...)` block, which would leak the batch into
+    # the consumer's context between yields, the batch only gets set in a copied context.
+    batch_context = copy_context()
+    batch_context.run(set_batch_request_context, batch_size)
+    try:
+        while True:
+            while len(in_flight) < max_in_flight:
+                next_task = next(remaining_tasks, None)
+                if next_task is None:
+                    break
+                throttle.acquire()
+                future = submit_task(api_client=api_client, task=next_task, context=batch_context)
+                future.add_done_callback(lambda f: throttle.release())
+                next_task.future = future
+                in_flight[future] = next_task
+
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = in_flight.pop(future)
+                try:
+                    result = resolve_future_with_error_handling(future)
+                except Exception as err:  # noqa: BLE001
+                    result = err
+                yield task.result_key, result
+    finally:
+        # Tasks that are already running can't be cancelled and finish in the background.
+        for future in in_flight:
+            future.cancel()
+
+
+def is_fatal_error(err: BaseException | None) -> bool:
+    """Return True if err is an error that should not be converted into a None result."""
+    if err is None:
+        return False
+    if isinstance(err, HTTPError) and err.response is not None:
+        return err.response.status_code not in (400, 404)
+    return True
 
 
 def resolve_future_with_error_handling(future: Future) -> Any:
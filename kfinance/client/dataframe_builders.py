@@ -0,0 +1,172 @@
+from decimal import Decimal
+from typing import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+from strenum import StrEnum
+
+from kfinance.client.models.numeric import NumericMode
+from kfinance.domains.estimates.estimates_models import CiqEstimates
+from kfinance.domains.line_items.line_item_models import LineItemResp
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+class ValueDtype(StrEnum):
+    """The dtype of the values in statement, line item, and estimate DataFrames.
+
+    - object: Python numbers with None for missing values in object columns. This is the
+        historical behavior and the default.
+    - float64: NumPy float64 columns with NaN for missing values.
+    - Float64: Nullable pandas Float64 columns with pd.NA for missing values.
+    - decimal: The Decimals of the response in object columns with None for missing values.
+    """
+
+    object = "object"
+    float64 = "float64"
+    Float64 = "Float64"
+    decimal = "decimal"
+
+
+def get_default_value_dtype(numeric: NumericMode) -> ValueDtype:
+    """Return the default value dtype for clients with the numeric mode."""
+    if numeric == NumericMode.float:
+        return ValueDtype.float64
+    return ValueDtype.object
+
+
+# A cell of a DataFrame: (row key, column position, value)
+Cell = tuple[Hashable, int, Decimal | float | None]
+
+
+def build_value_df(
+    cells: Iterable[Cell],
+    columns: list[str],
+    value_dtype: ValueDtype,
+    index_names: list[str] | None = None,
+) -> pd.DataFrame:
+    """Build a (row key x columns) DataFrame directly from Decimal or float cells.
+
+    Rows are ordered by the first appearance of their key. Missing cells are NaN, pd.NA, or
+    None depending on value_dtype.
+    """
+    row_positions: dict[Hashable, int] = {}
+    row_indices = []
+    column_indices = []
+    values = []
+    for row_key, column_position, value in cells:
+        row_indices.append(row_positions.setdefault(row_key, len(row_positions)))
+        column_indices.append(column_position)
+        values.append(value)
+
+    shape = (len(row_positions), len(columns))
+    if value_dtype == ValueDtype.decimal:
+        data = np.full(shape, None, dtype=object)
+        data[row_indices, column_indices] = np.array(values, dtype=object)
+    else:
+        data = np.full(shape, np.nan)
+        data[row_indices, column_indices] = np.fromiter(
+            (np.nan if value is None else float(value) for value in values),
+            dtype=np.float64,
+            count=len(values),
+        )
+
+    row_keys = list(row_positions)
+    if index_names and row_keys:
+        index = pd.MultiIndex.from_tuples(row_keys, names=index_names)
+    elif index_names:
+        index = pd.MultiIndex.from_arrays([[] for _ in index_names], names=index_names)
+    else:
+        index = pd.Index(row_keys, dtype=object)
+    df = pd.DataFrame(data, index=index, columns=columns, copy=False)
+    if value_dtype == ValueDtype.Float64:
+        return df.astype("Float64")
+    return df
+
+
+def build_statement_df(
+    statement_resp: StatementsResp, value_dtype: ValueDtype = ValueDtype.object
+) -> pd.DataFrame:
+    """Build a DataFrame (line items x periods) from a single company's statements."""
+    if value_dtype == ValueDtype.object:
+        periods = statement_resp.model_dump(mode="json")["periods"]
+
+        # Extract statements data from each period
+        statements_data = {}
+        for period_key, period_data in periods.items():
+            period_statements = {}
+            for statement in period_data["statements"]:
+                for line_item in statement["line_items"]:
+                    period_statements[line_item["name"]] = line_item["value"]
+            statements_data[period_key] = period_statements
+
+        return pd.DataFrame(statements_data).apply(pd.to_numeric).replace(np.nan, None)
+
+    return build_value_df(
+        cells=(
+            (line_item.name, column_position, line_item.value)
+            for column_position, period_data in enumerate(statement_resp.periods.values())
+            for statement in period_data.statements
+            for line_item in statement.line_items
+        ),
+        columns=list(statement_resp.periods),
+        value_dtype=value_dtype,
+    )
+
+
+def build_line_item_df(
+    line_item_resp: LineItemResp, line_item: str, value_dtype: ValueDtype = ValueDtype.object
+) -> pd.DataFrame:
+    """Build a single row DataFrame (indexed by line_item) from a single company's line item."""
+    if value_dtype == ValueDtype.object:
+        line_item_data = {}
+        for period_key, period_data in line_item_resp.periods.items():
+            line_item_data[period_key] = period_data.line_item.value
+
+        return (
+            pd.DataFrame({"line_item": line_item_data})
+            .transpose()
+            .apply(pd.to_numeric)
+            .replace(np.nan, None)
+            .set_index(pd.Index([line_item]))
+        )
+
+    return build_value_df(
+        cells=(
+            (line_item, column_position, period_data.line_item.value)
+            for column_position, period_data in enumerate(line_item_resp.periods.values())
+        ),
+        columns=list(line_item_resp.periods),
+        value_dtype=value_dtype,
+    )
+
+
+def build_estimates_df(
+    estimates: CiqEstimates, value_dtype: ValueDtype = ValueDtype.object
+) -> pd.DataFrame:
+    """Build a DataFrame ((ticker_or_company, name) x periods) from a company's estimates."""
+    if value_dtype == ValueDtype.object:
+        periods = estimates.model_dump(mode="json")["periods"]
+
+        estimates_data = {}
+        for period_key, period_data in periods.items():
+            period_estimates = {}
+            for ticker_or_company, group in period_data["estimates"].items():
+                for estimate in group["estimates"]:
+                    period_estimates[(ticker_or_company, estimate["name"])] = estimate["value"]
+            estimates_data[period_key] = period_estimates
+
+        df = pd.DataFrame(estimates_data).apply(pd.to_numeric).replace(np.nan, None)
+        df.index = pd.MultiIndex.from_tuples(df.index, names=["ticker_or_company", "name"])
+        return df
+
+    return build_value_df(
+        cells=(
+            ((ticker_or_company, estimate.name), column_position, estimate.value)
+            for column_position, period_data in enumerate(estimates.periods.values())
+            for ticker_or_company, group in period_data.estimates.items()
+            for estimate in group.estimates
+        ),
+        columns=list(estimates.periods),
+        value_dtype=value_dtype,
+        index_names=["ticker_or_company", "name"],
+    )
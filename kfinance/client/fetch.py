@@ -1,8 +1,10 @@
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from contextvars import ContextVar, Token
 import logging
-from time import time
-from typing import Any, Callable, Generator, Optional
+from time import perf_counter, time
+from typing import Any, Callable, Generator, Iterator, NamedTuple, Optional
+from urllib.parse import urlparse
 from uuid import uuid4
 
 import jwt
@@ -15,8 +17,11 @@ from kfinance.client.models.date_and_period_models import (
     Periodicity,
     PeriodType,  # used by non-Visible Alpha fetch methods
 )
+from kfinance.client.models.numeric import NumericMode
 from kfinance.client.models.response_models import PostResponse, SingleResultResp
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
+from kfinance.client.streaming_json import DEFAULT_STREAM_CHUNK_SIZE, WILDCARD, iter_json_items
 from kfinance.domains.business_relationships.business_relationship_models import (
     BusinessRelationshipType,
     RelationshipResponse,
@@ -31,7 +36,7 @@ from kfinance.domains.companies.company_models import (
     UnifiedIdTripleResponse,
 )
 from kfinance.domains.competitors.competitor_models import CompetitorResponse, CompetitorSource
-from kfinance.domains.earnings.earning_models import EarningsCallResp
+from kfinance.domains.earnings.earning_models import EarningsCallResp, TranscriptComponent
 from kfinance.domains.estimates.estimates_models import (
     AnalystRecommendations,
     CiqEstimates,
@@ -44,7 +49,12 @@ from kfinance.domains.mergers_and_acquisitions.merger_and_acquisition_models imp
     MergersInfo,
     MergersResp,
 )
-from kfinance.domains.prices.price_models import HistoryMetadataResp, PriceHistory
+from kfinance.domains.prices.price_models import (
+    ColumnarPriceHistory,
+    HistoryMetadataResp,
+    PriceHistory,
+)
+from kfinance.domains.prices.price_store import LocalPriceStore
 from kfinance.domains.professionals.professionals_models import (
     CompanyProfessionalsResp,
     PersonProfessionalsResp,
@@ -58,7 +68,8 @@ from kfinance.domains.rounds_of_funding.rounds_of_funding_models import (
     RoundsOfFundingResp,
 )
 from kfinance.domains.segments.segment_models import SegmentsResp, SegmentType
-from kfinance.domains.statements.statement_models import StatementsResp
+from kfinance.domains.statements.statement_models import StatementPeriodData, StatementsResp
+from kfinance.metrics import MetricsRegistry, record_http_request
 
 
 # version.py gets autogenerated by setuptools-scm and is not available
@@ -71,6 +82,56 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class BatchRequestContext(NamedTuple):
+    """The batch id and batch size sent as Kfinance-Batch-Id/Size request headers."""
+
+    batch_id: str
+    batch_size: int
+
+
+# Context variable for the batch request headers of the current batch. Contexts propagate
+# into asyncio tasks and (via contextvars.copy_context) into batch thread pool tasks, so
+# concurrent batches on the same client don't overwrite each other's headers.
+_batch_request_context: ContextVar[BatchRequestContext | None] = ContextVar(
+    "batch_request_context", default=None
+)
+
+
+def set_batch_request_context(batch_size: int) -> Token[BatchRequestContext | None]:
+    """Start a new batch with a random batch id in the current context."""
+    return _batch_request_context.set(
+        BatchRequestContext(batch_id=str(uuid4()), batch_size=batch_size)
+    )
+
+
+def get_batch_request_context() -> BatchRequestContext | None:
+    """Return the batch of the current context or None if there is no batch."""
+    return _batch_request_context.get()
+
+
+def get_batch_request_headers() -> dict[str, str]:
+    """Return the batch request headers for the batch of the current context."""
+    batch_request_context = _batch_request_context.get()
+    if batch_request_context is None:
+        return {}
+    return {
+        "Kfinance-Batch-Id": batch_request_context.batch_id,
+        "Kfinance-Batch-Size": str(batch_request_context.batch_size),
+    }
+
+
+@contextmanager
+def batch_request_context(batch_size: int) -> Generator[BatchRequestContext, None, None]:
+    """Set batch id and batch size for batch request headers in the current context."""
+    token = set_batch_request_context(batch_size=batch_size)
+    try:
+        batch = _batch_request_context.get()
+        assert batch is not None
+        yield batch
+    finally:
+        _batch_request_context.reset(token)
+
+
 DEFAULT_API_HOST: str = "https://kfinance.kensho.com"
 DEFAULT_API_VERSION: int = 1
 DEFAULT_OKTA_HOST: str = "https://kensho.okta.com"
@@ -89,6 +150,9 @@ class KFinanceApiClient:
         api_version: int = DEFAULT_API_VERSION,
         okta_host: str = DEFAULT_OKTA_HOST,
         okta_auth_server: str = DEFAULT_OKTA_AUTH_SERVER,
+        numeric: NumericMode | str = NumericMode.decimal,
+        price_store: LocalPriceStore | None = None,
+        metrics_registry: MetricsRegistry | None = None,
     ):
         """Configuration of KFinance Client.
 
@@ -110,6 +174,13 @@ class KFinanceApiClient:
         :type okta_host: str
         :param okta_auth_server: the okta route for authentication
         :type okta_auth_server: str
+        :param numeric: the type of numeric values in responses, Decimal (default) or float
+        :type numeric: NumericMode | str
+        :param price_store: a local store that daily price histories get read through
+        :type price_store: LocalPriceStore, Optional
+        :param metrics_registry: a registry for the latency, status codes, and response bytes
+            of requests by endpoint
+        :type metrics_registry: MetricsRegistry, Optional
         """
         if refresh_token is not None:
             self.refresh_token = refresh_token
@@ -126,28 +197,26 @@ class KFinanceApiClient:
         self.api_version = api_version
         self.okta_host = okta_host
         self.okta_auth_server = okta_auth_server
+        self.numeric = NumericMode(numeric)
+        self.price_store = price_store
+        self.metrics_registry = metrics_registry
         self._thread_pool = thread_pool
         self.url_base = f"{self.api_host}/api/v{self.api_version}/"
+        self._url_base_path = urlparse(self.url_base).path.rstrip("/")
         self._access_token_expiry: Any = 0
         self._access_token: str | None = None
         self.user_agent_source = "object_oriented"
-        self._batch_id: str | None = None
-        self._batch_size: str | None = None
         self._user_permissions: set[Permission] | None = None
 
     @contextmanager
     def batch_request_header(self, batch_size: int) -> Generator:
-        """Set batch id and batch size for batch request request headers"""
-        batch_id = str(uuid4())
-
-        self._batch_id = batch_id
-        self._batch_size = str(batch_size)
+        """Set batch id and batch size for batch request request headers
 
-        try:
+        The batch is stored in a context variable, so it only applies to requests made
+        from the current context.
+        """
+        with batch_request_context(batch_size=batch_size):
             yield
-        finally:
-            self._batch_id = None
-            self._batch_size = None
 
     @property
     def thread_pool(self) -> ThreadPoolExecutor:
@@ -247,30 +316,86 @@ class KFinanceApiClient:
                     permission_str,
                 )
 
-    def fetch(self, url: str, method: str = "GET", request_body: dict | None = None) -> dict:
-        """Does the request and auth"""
-
+    def _get_request_headers(self) -> dict[str, str]:
+        """Return the headers of a request, including auth and batch headers."""
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.access_token}",
             "User-Agent": f"kfinance/{kfinance_version} {self.user_agent_source}",
         }
-        if self._batch_id is not None:
-            assert self._batch_size is not None
-            headers.update(
-                {"Kfinance-Batch-Id": self._batch_id, "Kfinance-Batch-Size": self._batch_size}
-            )
+        headers.update(get_batch_request_headers())
+        return headers
 
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=request_body,
-            timeout=60,
-        )
+    def fetch(self, url: str, method: str = "GET", request_body: dict | None = None) -> dict:
+        """Does the request and auth"""
+
+        start = perf_counter()
+        response = None
+        try:
+            response = requests.request(
+                method=method,
+                url=url,
+                headers=self._get_request_headers(),
+                json=request_body,
+                timeout=60,
+            )
+        finally:
+            self._record_request_metrics(method, url, start, response)
         response.raise_for_status()
         return response.json()
 
+    def stream(
+        self,
+        url: str,
+        method: str = "GET",
+        request_body: dict | None = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Does the request and auth and yields the response body in chunks of chunk_size bytes
+
+        The request gets sent when the first chunk is requested. Use `iter_json_items`
+        to decode the chunks incrementally. The latency in the metrics includes the time
+        to stream the body.
+        """
+
+        start = perf_counter()
+        response = None
+        try:
+            with requests.request(
+                method=method,
+                url=url,
+                headers=self._get_request_headers(),
+                json=request_body,
+                timeout=60,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size=chunk_size)
+        finally:
+            self._record_request_metrics(method, url, start, response)
+
+    def _record_request_metrics(
+        self, method: str, url: str, start: float, response: requests.Response | None
+    ) -> None:
+        """Record the latency, status code, and response bytes of a request started at start.
+
+        start is a time.perf_counter() value and response is None if the request failed.
+        """
+        if self.metrics_registry is None:
+            return
+        path = urlparse(url).path
+        if path.startswith(self._url_base_path):
+            path = path[len(self._url_base_path) :]
+        record_http_request(
+            self.metrics_registry,
+            method=method.upper(),
+            path=path,
+            status_code=None if response is None else response.status_code,
+            duration=perf_counter() - start,
+            # The number of bytes read from the network (before decompression)
+            response_bytes=None if response is None else response.raw.tell(),
+        )
+
     def fetch_permissions(self) -> dict[str, list[str]]:
         """Return the permissions of the user."""
         url = f"{self.url_base}users/permissions"
@@ -319,6 +444,23 @@ class KFinanceApiClient:
         url = f"{self.url_base}trading_items/{security_id}"
         return self.fetch(url)
 
+    def _get_pricing_url(
+        self,
+        trading_item_id: int,
+        is_adjusted: bool,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        periodicity: Optional[Periodicity],
+    ) -> str:
+        """Return the url of the /pricing endpoint."""
+        return (
+            f"{self.url_base}pricing/{trading_item_id}/"
+            f"{start_date if start_date is not None else 'none'}/"
+            f"{end_date if end_date is not None else 'none'}/"
+            f"{periodicity if periodicity else 'none'}/"
+            f"{'adjusted' if is_adjusted else 'unadjusted'}"
+        )
+
     def fetch_history(
         self,
         trading_item_id: int,
@@ -328,14 +470,39 @@ class KFinanceApiClient:
         periodicity: Optional[Periodicity] = None,
     ) -> PriceHistory:
         """Get the pricing history."""
-        url = (
-            f"{self.url_base}pricing/{trading_item_id}/"
-            f"{start_date if start_date is not None else 'none'}/"
-            f"{end_date if end_date is not None else 'none'}/"
-            f"{periodicity if periodicity else 'none'}/"
-            f"{'adjusted' if is_adjusted else 'unadjusted'}"
+        url = self._get_pricing_url(
+            trading_item_id=trading_item_id,
+            is_adjusted=is_adjusted,
+            start_date=start_date,
+            end_date=end_date,
+            periodicity=periodicity,
+        )
+        return decode_response(PriceHistory, self.fetch(url), numeric=self.numeric)
+
+    def fetch_history_columns(
+        self,
+        trading_item_id: int,
+        is_adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        periodicity: Optional[Periodicity] = None,
+        stream: bool = False,
+    ) -> ColumnarPriceHistory:
+        """Get the pricing history as NumPy arrays.
+
+        If stream is True, the response gets decoded incrementally straight into the arrays
+        instead of being read into memory as a whole first.
+        """
+        url = self._get_pricing_url(
+            trading_item_id=trading_item_id,
+            is_adjusted=is_adjusted,
+            start_date=start_date,
+            end_date=end_date,
+            periodicity=periodicity,
         )
-        return PriceHistory.model_validate(self.fetch(url))
+        if stream:
+            return ColumnarPriceHistory.from_chunks(self.stream(url))
+        return ColumnarPriceHistory.from_response(self.fetch(url))
 
     def fetch_history_metadata(self, trading_item_id: int) -> HistoryMetadataResp:
         """Get the pricing history metadata."""
@@ -354,7 +521,7 @@ class KFinanceApiClient:
             f"{start_date if start_date is not None else 'none'}/"
             f"{end_date if end_date is not None else 'none'}"
         )
-        return Capitalizations.model_validate(self.fetch(url))
+        return decode_response(Capitalizations, self.fetch(url), numeric=self.numeric)
 
     def fetch_segments(
         self,
@@ -399,7 +566,7 @@ class KFinanceApiClient:
                 request_body[key] = value
 
         response_data = self.fetch(url, method="POST", request_body=request_body)
-        return PostResponse[SegmentsResp].model_validate(response_data)
+        return decode_response(PostResponse[SegmentsResp], response_data, numeric=self.numeric)
 
     def fetch_visible_alpha_segments(
         self,
@@ -446,7 +613,7 @@ class KFinanceApiClient:
                 request_body[key] = value
 
         response_data = self.fetch(url, method="POST", request_body=request_body)
-        return PostResponse[SegmentsResp].model_validate(response_data)
+        return decode_response(PostResponse[SegmentsResp], response_data, numeric=self.numeric)
 
     def fetch_price_chart(
         self,
@@ -465,19 +632,24 @@ class KFinanceApiClient:
             f"{'adjusted' if is_adjusted else 'unadjusted'}"
         )
 
-        response = requests.get(
-            url,
-            headers={
-                "Content-Type": "image/png",
-                "Authorization": f"Bearer {self.access_token}",
-            },
-            timeout=60,
-        )
+        start = perf_counter()
+        response = None
+        try:
+            response = requests.get(
+                url,
+                headers={
+                    "Content-Type": "image/png",
+                    "Authorization": f"Bearer {self.access_token}",
+                },
+                timeout=60,
+            )
+        finally:
+            self._record_request_metrics("GET", url, start, response)
         response.raise_for_status()
         return response.content
 
-    def fetch_statement(
-        self,
+    @staticmethod
+    def _get_statement_request_body(
         company_ids: list[int],
         statement_type: str,
         *,
@@ -489,10 +661,8 @@ class KFinanceApiClient:
         num_periods: int | None = None,
         period_type: PeriodType | None = None,
         calendar_type: CalendarType | None = None,
-    ) -> PostResponse[StatementsResp]:
-        """Get a specified financial statement for a specified duration."""
-
-        url = f"{self.url_base}statements/"
+    ) -> dict[str, str | int | list[int]]:
+        """Return the request body of the /statements/ endpoint."""
 
         period_type_val = period_type.value if period_type is not None else None
         calendar_type_val = calendar_type.value if calendar_type is not None else None
@@ -517,8 +687,82 @@ class KFinanceApiClient:
             if value is not None:
                 request_body[key] = value
 
+        return request_body
+
+    def fetch_statement(
+        self,
+        company_ids: list[int],
+        statement_type: str,
+        *,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        start_quarter: int | None = None,
+        end_quarter: int | None = None,
+        num_periods_back: int | None = None,
+        num_periods: int | None = None,
+        period_type: PeriodType | None = None,
+        calendar_type: CalendarType | None = None,
+    ) -> PostResponse[StatementsResp]:
+        """Get a specified financial statement for a specified duration."""
+
+        url = f"{self.url_base}statements/"
+        request_body = self._get_statement_request_body(
+            company_ids=company_ids,
+            statement_type=statement_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=start_quarter,
+            end_quarter=end_quarter,
+            num_periods_back=num_periods_back,
+            num_periods=num_periods,
+            period_type=period_type,
+            calendar_type=calendar_type,
+        )
         response_data = self.fetch(url, method="POST", request_body=request_body)
-        return PostResponse[StatementsResp].model_validate(response_data)
+        return decode_response(PostResponse[StatementsResp], response_data, numeric=self.numeric)
+
+    def iter_statement_periods(
+        self,
+        company_ids: list[int],
+        statement_type: str,
+        *,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        start_quarter: int | None = None,
+        end_quarter: int | None = None,
+        num_periods_back: int | None = None,
+        num_periods: int | None = None,
+        period_type: PeriodType | None = None,
+        calendar_type: CalendarType | None = None,
+    ) -> Iterator[tuple[str, str, StatementPeriodData]]:
+        """Stream a specified financial statement and yield (company_id, period, period data).
+
+        The response gets decoded incrementally, so only one period is held in memory at a
+        time. Companies without statements (including companies with errors) yield nothing.
+        """
+
+        url = f"{self.url_base}statements/"
+        request_body = self._get_statement_request_body(
+            company_ids=company_ids,
+            statement_type=statement_type,
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=start_quarter,
+            end_quarter=end_quarter,
+            num_periods_back=num_periods_back,
+            num_periods=num_periods,
+            period_type=period_type,
+            calendar_type=calendar_type,
+        )
+        chunks = self.stream(url, method="POST", request_body=request_body)
+        for (_, company_id, _, period), period_data in iter_json_items(
+            chunks, path=("results", WILDCARD, "periods")
+        ):
+            yield (
+                str(company_id),
+                str(period),
+                decode_response(StatementPeriodData, period_data, numeric=self.numeric),
+            )
 
     def fetch_line_item(
         self,
@@ -562,7 +806,7 @@ class KFinanceApiClient:
                 request_body[key] = value
 
         response_data = self.fetch(url, method="POST", request_body=request_body)
-        return PostResponse[LineItemResp].model_validate(response_data)
+        return decode_response(PostResponse[LineItemResp], response_data, numeric=self.numeric)
 
     def fetch_visible_alpha_line_item(
         self,
@@ -608,7 +852,7 @@ class KFinanceApiClient:
                 request_body[key] = value
 
         response_data = self.fetch(url, method="POST", request_body=request_body)
-        return PostResponse[LineItemResp].model_validate(response_data)
+        return decode_response(PostResponse[LineItemResp], response_data, numeric=self.numeric)
 
     def fetch_info(self, company_id: int) -> dict:
         """Get the company info."""
@@ -779,6 +1023,12 @@ class KFinanceApiClient:
         url = f"{self.url_base}transcript/{key_dev_id}"
         return self.fetch(url)
 
+    def iter_transcript_components(self, key_dev_id: int) -> Iterator[TranscriptComponent]:
+        """Stream the transcript for an earnings item and yield its components one at a time."""
+        url = f"{self.url_base}transcript/{key_dev_id}"
+        for _, component in iter_json_items(self.stream(url), path=("transcript",)):
+            yield TranscriptComponent.model_validate(component)
+
     def fetch_company_descriptions(self, company_id: int) -> CompanyDescriptions:
         """Get the short description (summary) and long description for a company"""
         url = f"{self.url_base}info/{company_id}/descriptions"
@@ -884,7 +1134,11 @@ class KFinanceApiClient:
             "include_comments": include_comments,
         }
 
-        return MergersInfo.model_validate(self.fetch(url, method="POST", request_body=request_body))
+        return decode_response(
+            MergersInfo,
+            self.fetch(url, method="POST", request_body=request_body),
+            numeric=self.numeric,
+        )
 
     def fetch_advisors_for_company_in_merger(
         self,
@@ -944,7 +1198,7 @@ class KFinanceApiClient:
         :rtype: RoundOfFundingInfo
         """
         url = f"{self.url_base}fundinground/info/{transaction_id}"
-        return RoundOfFundingInfo.model_validate(self.fetch(url))
+        return decode_response(RoundOfFundingInfo, self.fetch(url), numeric=self.numeric)
 
     def fetch_advisors_for_company_raising_round_of_funding(
         self,
@@ -1018,7 +1272,7 @@ class KFinanceApiClient:
 
         response_data = self.fetch(url, method="POST", request_body=request_body)
 
-        return SingleResultResp[CiqEstimates].model_validate(response_data)
+        return decode_response(SingleResultResp[CiqEstimates], response_data, numeric=self.numeric)
 
     def fetch_visible_alpha_estimates(
         self,
@@ -1064,7 +1318,9 @@ class KFinanceApiClient:
                 request_body[key] = value
 
         response_data = self.fetch(url, method="POST", request_body=request_body)
-        return PostResponse[VisibleAlphaEstimates].model_validate(response_data)
+        return decode_response(
+            PostResponse[VisibleAlphaEstimates], response_data, numeric=self.numeric
+        )
 
     def fetch_consensus_target_price(
         self,
@@ -1073,7 +1329,9 @@ class KFinanceApiClient:
         """Get consensus target price estimates"""
         url = f"{self.url_base}estimates/consensus_target_price/{company_id}"
         response_data = self.fetch(url)
-        return SingleResultResp[ConsensusTargetPrice].model_validate(response_data)
+        return decode_response(
+            SingleResultResp[ConsensusTargetPrice], response_data, numeric=self.numeric
+        )
 
     def fetch_analyst_recommendations(
         self,
@@ -1082,7 +1340,9 @@ class KFinanceApiClient:
         """Get analyst recommendations"""
         url = f"{self.url_base}estimates/analyst_recommendations/{company_id}"
         response_data = self.fetch(url)
-        return SingleResultResp[AnalystRecommendations].model_validate(response_data)
+        return decode_response(
+            SingleResultResp[AnalystRecommendations], response_data, numeric=self.numeric
+        )
 
     def fetch_key_devs(
         self,
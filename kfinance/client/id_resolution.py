@@ -1,14 +1,151 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator
+
 import httpx
 
 from kfinance.domains.companies.company_models import UnifiedIdTripleResponse
+from kfinance.httpx_utils import KfinanceHttpxClient
 
 
-async def unified_fetch_id_triples(
+# Context variable for sharing identifier resolutions across async contexts
+_id_resolution_scope: ContextVar["IdResolutionScope | None"] = ContextVar(
+    "id_resolution_scope", default=None
+)
+
+
+class IdResolutionScope:
+    """Identifier resolutions shared by the tool calls of one request or LLM turn.
+
+    Tool calls in the same scope share one (in-flight or finished) /ids request per
+    identifier, compared case-insensitively. Failed requests don't get shared with later
+    calls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scope."""
+        # Maps upper-cased identifiers to the identifier passed to the /ids request that
+        # resolves them and to the task of that request.
+        self._resolutions: dict[str, tuple[str, asyncio.Task[UnifiedIdTripleResponse]]] = {}
+
+    def prefetch(self, identifiers: list[str], httpx_client: httpx.AsyncClient) -> None:
+        """Start resolving the identifiers that the scope hasn't resolved yet.
+
+        Later calls with any of these identifiers wait for the started request.
+        """
+        self._start_resolutions(_deduplicate_identifiers(identifiers), httpx_client)
+
+    def _start_resolutions(
+        self, identifiers: list[str], httpx_client: httpx.AsyncClient
+    ) -> asyncio.Task[UnifiedIdTripleResponse] | None:
+        """Start one /ids request for all identifiers without a shared resolution.
+
+        :return: The task of the started request or None if all identifiers were shared.
+        """
+        loop = asyncio.get_running_loop()
+        unresolved_identifiers = []
+        for identifier in identifiers:
+            resolution = self._resolutions.get(identifier.upper())
+            # Tasks can only be awaited from the event loop that runs them.
+            if resolution is None or resolution[1].get_loop() is not loop:
+                unresolved_identifiers.append(identifier)
+        if unresolved_identifiers:
+            task = loop.create_task(_fetch_id_triples(unresolved_identifiers, httpx_client))
+            task.add_done_callback(self._discard_failed_resolution)
+            for identifier in unresolved_identifiers:
+                self._resolutions[identifier.upper()] = (identifier, task)
+            return task
+        return None
+
+    async def resolve(
+        self, identifiers: list[str], httpx_client: httpx.AsyncClient
+    ) -> UnifiedIdTripleResponse:
+        """Resolve deduplicated identifiers, reusing the requests of earlier calls."""
+        started_task = self._start_resolutions(identifiers, httpx_client)
+        resolutions = {
+            identifier: self._resolutions[identifier.upper()] for identifier in identifiers
+        }
+        # Record the reuse of shared resolutions in the request trace.
+        if isinstance(httpx_client, KfinanceHttpxClient) and any(
+            task is not started_task for _, task in resolutions.values()
+        ):
+            httpx_client.trace_cache_hit(method="POST", url="/ids")
+        # Shield the shared tasks so that a cancelled call doesn't cancel other calls.
+        for task in {task for _, task in resolutions.values()}:
+            await asyncio.shield(task)
+
+        # Every call gets its own response because tools modify responses.
+        resp = UnifiedIdTripleResponse(identifiers_to_id_triples={}, errors={})
+        for identifier, (requested_identifier, task) in resolutions.items():
+            shared_resp = task.result()
+            if requested_identifier in shared_resp.identifiers_to_id_triples:
+                resp.identifiers_to_id_triples[identifier] = shared_resp.identifiers_to_id_triples[
+                    requested_identifier
+                ]
+            elif requested_identifier in shared_resp.errors:
+                resp.errors[identifier] = shared_resp.errors[requested_identifier]
+        return resp
+
+    def _discard_failed_resolution(self, task: asyncio.Task[UnifiedIdTripleResponse]) -> None:
+        """Remove the resolutions of a failed or cancelled request."""
+        if task.cancelled() or task.exception() is not None:
+            for key in [key for key, (_, t) in self._resolutions.items() if t is task]:
+                del self._resolutions[key]
+
+
+@contextmanager
+def id_resolution_scope() -> Generator[IdResolutionScope, None, None]:
+    """Context manager to share identifier resolutions between tool calls.
+
+    This is safe for concurrent async operations as it uses contextvars. Tasks (like
+    parallel tool calls started with asyncio.gather) and sync tool calls started within
+    the context share the scope.
+
+    Usage:
+        with id_resolution_scope():
+            await asyncio.gather(
+                prices_tool.arun_without_langchain(identifiers=["SPGI"]),
+                earnings_tool.arun_without_langchain(identifiers=["SPGI"]),
+            )
+    """
+    scope = IdResolutionScope()
+    token = _id_resolution_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _id_resolution_scope.reset(token)
+
+
+def _deduplicate_identifiers(identifiers: list[str]) -> list[str]:
+    """Remove case-insensitive repeats of identifiers, keeping the first spelling."""
+    deduplicated_identifiers: dict[str, str] = {}
+    for identifier in identifiers:
+        deduplicated_identifiers.setdefault(identifier.upper(), identifier)
+    return list(deduplicated_identifiers.values())
+
+
+async def _fetch_id_triples(
     identifiers: list[str], httpx_client: httpx.AsyncClient
 ) -> UnifiedIdTripleResponse:
-    """Resolve one or more identifiers to id triples using the unified (/ids) endpoint."""
-
+    """Fetch id triples from the unified (/ids) endpoint."""
     resp = await httpx_client.post(url="/ids", json=dict(identifiers=identifiers))
     resp.raise_for_status()
     resp_json = resp.json()
     return UnifiedIdTripleResponse.model_validate(resp_json)
+
+
+async def unified_fetch_id_triples(
+    identifiers: list[str], httpx_client: httpx.AsyncClient
+) -> UnifiedIdTripleResponse:
+    """Resolve one or more identifiers to id triples using the unified (/ids) endpoint.
+
+    Case-insensitive repeats of an identifier only get resolved (and returned) once. Within
+    an `id_resolution_scope`, resolutions get shared with other calls in the same scope.
+    """
+
+    deduplicated_identifiers = _deduplicate_identifiers(identifiers)
+    scope = _id_resolution_scope.get()
+    if scope is None:
+        return await _fetch_id_triples(deduplicated_identifiers, httpx_client)
+    return await scope.resolve(deduplicated_identifiers, httpx_client)
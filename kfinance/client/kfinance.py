@@ -7,15 +7,23 @@ from io import BytesIO
 import logging
 import re
 from sys import stdout
-from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple, Optional, overload
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Iterable,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    overload,
+)
 from urllib.parse import urljoin
+import weakref
 import webbrowser
 
-from google.genai import types as gapic
-from langchain_core.utils.function_calling import convert_to_openai_tool
-from langchain_google_genai._function_utils import convert_to_genai_function_declarations
-from PIL.Image import Image, open as image_open
-
+from kfinance.background_event_loop import BackgroundEventLoop
 from kfinance.client.batch_request_handling import add_methods_of_singular_class_to_iterable_class
 from kfinance.client.fetch import (
     DEFAULT_API_HOST,
@@ -38,6 +46,7 @@ from kfinance.client.models.date_and_period_models import (
     Periodicity,
     YearAndQuarter,
 )
+from kfinance.client.models.numeric import NumericMode
 from kfinance.client.server_thread import ServerThread
 from kfinance.domains.companies.company_models import IdentificationTriple
 from kfinance.domains.earnings.earning_models import EarningsCall, TranscriptComponent
@@ -46,20 +55,64 @@ from kfinance.domains.mergers_and_acquisitions.merger_and_acquisition_models imp
     MergerInfo,
     MergerTimelineElement,
 )
-from kfinance.domains.prices.price_models import HistoryMetadataResp, PriceHistory
+from kfinance.domains.prices.price_models import (
+    ColumnarPriceHistory,
+    HistoryMetadataResp,
+    PriceHistory,
+)
+from kfinance.domains.prices.price_store import LocalPriceStore
 from kfinance.domains.rounds_of_funding.rounds_of_funding_models import (
     RoundOfFundingInfo,
     RoundOfFundingInfoTimeline,
 )
 from kfinance.httpx_utils import KfinanceHttpxClient
+from kfinance.integrations.tool_calling.output_budget import ToolOutputBudget
+from kfinance.integrations.tool_calling.tool_result_cache import ToolResultCache
+from kfinance.integrations.tool_calling.tool_schemas import (
+    get_openai_tool_schema,
+    load_tool_schemas,
+)
+from kfinance.metrics import MetricsRegistry, MetricsSnapshot
+
 
+T = TypeVar("T")
 
 if TYPE_CHECKING:
+    from google.genai import types as gapic
+    from PIL.Image import Image
+
+    from kfinance.client.async_kfinance import AsyncClient
+    from kfinance.integrations.tool_calling.batch_tool_execution import (
+        ToolCall,
+        ToolCallResult,
+    )
     from kfinance.integrations.tool_calling.tool_calling_models import KfinanceTool
 
 logger = logging.getLogger(__name__)
 
 
+def _close_background_loop(
+    background_loop: BackgroundEventLoop, httpx_client: KfinanceHttpxClient
+) -> None:
+    """Close the httpx client of a background event loop and the loop itself."""
+    try:
+        background_loop.run(httpx_client.aclose())
+    except RuntimeError:
+        # The loop was already closed or this runs on the loop itself.
+        logger.debug("Could not close the background httpx client.", exc_info=True)
+    except Exception:  # noqa: BLE001
+        logger.warning("Closing the background httpx client failed.", exc_info=True)
+    if not background_loop.is_current():
+        background_loop.close()
+
+
+def image_open(fp: BytesIO) -> Image:
+    """Open an image with PIL, which only gets imported when the first image gets opened."""
+    from PIL.Image import open as pil_image_open
+
+    return pil_image_open(fp)
+
+
 class NoEarningsDataError(Exception):
     """Exception raised when no earnings data is found for a company."""
 
@@ -162,6 +215,24 @@ class TradingItem:
             ):
                 return PriceHistory(prices=[])
 
+        price_store = self.kfinance_api_client.price_store
+        if price_store is not None and periodicity == Periodicity.day:
+            columns = price_store.get_history(
+                self.kfinance_api_client,
+                trading_item_id=self.trading_item_id,
+                adjusted=adjusted,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            if columns.currency is None and len(columns):
+                # The store doesn't know the currency of prices that got stored without one.
+                columns = ColumnarPriceHistory(
+                    dates=columns.dates,
+                    values=columns.values,
+                    currency=self.history_metadata.currency,
+                )
+            return columns.price_history
+
         return self.kfinance_api_client.fetch_history(
             trading_item_id=self.trading_item_id,
             is_adjusted=adjusted,
@@ -170,6 +241,46 @@ class TradingItem:
             periodicity=periodicity,
         )
 
+    def history_columns(
+        self,
+        periodicity: Periodicity = Periodicity.day,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ColumnarPriceHistory:
+        """Retrieves the historical price data as NumPy arrays.
+
+        This is a faster and more memory efficient alternative to `history` for long
+        date ranges. The parameters are the same as for `history`.
+
+        :return: A ColumnarPriceHistory with a (num_dates x 5) float64 array of "open", "high", "low", "close", "volume" and the currency as metadata. Use `to_pandas()` for a DataFrame and `price_history` for the PriceHistory model.
+        :rtype: ColumnarPriceHistory
+        """
+        if start_date and end_date:
+            if (
+                datetime.strptime(start_date, "%Y-%m-%d").date()
+                > datetime.strptime(end_date, "%Y-%m-%d").date()
+            ):
+                return ColumnarPriceHistory.from_response({"currency": None, "prices": []})
+
+        price_store = self.kfinance_api_client.price_store
+        if price_store is not None and periodicity == Periodicity.day:
+            return price_store.get_history(
+                self.kfinance_api_client,
+                trading_item_id=self.trading_item_id,
+                adjusted=adjusted,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+        return self.kfinance_api_client.fetch_history_columns(
+            trading_item_id=self.trading_item_id,
+            is_adjusted=adjusted,
+            start_date=start_date,
+            end_date=end_date,
+            periodicity=periodicity,
+        )
+
     def price_chart(
         self,
         periodicity: Periodicity = Periodicity.day,
@@ -1360,6 +1471,26 @@ class Ticker(DelegatedCompanyFunctionsMetaClass):
             end_date,
         )
 
+    def history_columns(
+        self,
+        periodicity: Periodicity = Periodicity.day,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ColumnarPriceHistory:
+        """Retrieves the historical price data as NumPy arrays.
+
+        See `TradingItem.history_columns` for details.
+
+        :rtype: ColumnarPriceHistory
+        """
+        return self.primary_trading_item.history_columns(
+            periodicity,
+            adjusted,
+            start_date,
+            end_date,
+        )
+
     def price_chart(
         self,
         periodicity: Periodicity = Periodicity.day,
@@ -1807,6 +1938,11 @@ class Client:
         api_version: int = DEFAULT_API_VERSION,
         okta_host: str = DEFAULT_OKTA_HOST,
         okta_auth_server: str = DEFAULT_OKTA_AUTH_SERVER,
+        numeric: NumericMode | str = NumericMode.decimal,
+        price_store: LocalPriceStore | None = None,
+        tool_result_cache: ToolResultCache | None = None,
+        tool_output_budget: ToolOutputBudget | None = None,
+        metrics_registry: MetricsRegistry | None = None,
     ):
         """Initialization of the client.
 
@@ -1828,6 +1964,28 @@ class Client:
         :type okta_host: str
         :param okta_auth_server: the okta route for authentication
         :type okta_auth_server: str
+        :param numeric: "decimal" (default) parses numeric values into accounting exact Decimals.
+            "float" parses them straight into floats and makes statement, line item, and
+            estimate DataFrames default to float64 columns.
+        :type numeric: NumericMode | str
+        :param price_store: A local store that daily `TradingItem.history` and
+            `TradingItem.history_columns` calls read through. Prices that are already
+            stored get read from disk without requests.
+        :type price_store: LocalPriceStore, Optional
+        :param tool_result_cache: A cache for the results of tools run with
+            `run_without_langchain` or `arun_without_langchain`. Repeated tool calls with the
+            same arguments return the cached result without requests. A cache can be shared
+            between clients.
+        :type tool_result_cache: ToolResultCache, Optional
+        :param tool_output_budget: Size limits for the outputs of tools run with
+            `run_without_langchain`, `arun_without_langchain`, or `run_tools`. Larger outputs
+            get shortened and include a note about the shortening.
+        :type tool_output_budget: ToolOutputBudget, Optional
+        :param metrics_registry: A registry for the performance metrics of tool calls and
+            HTTP requests of tools and of the sync and async object APIs, see
+            `Client.metrics`. Without a registry, no metrics get recorded. A registry can be
+            shared between clients.
+        :type metrics_registry: MetricsRegistry, Optional
         """
 
         # method 1 refresh token
@@ -1838,6 +1996,9 @@ class Client:
                 api_version=api_version,
                 okta_host=okta_host,
                 thread_pool=thread_pool,
+                numeric=numeric,
+                price_store=price_store,
+                metrics_registry=metrics_registry,
             )
         # method 2 keypair
         elif client_id is not None and private_key is not None:
@@ -1849,6 +2010,9 @@ class Client:
                 okta_host=okta_host,
                 okta_auth_server=okta_auth_server,
                 thread_pool=thread_pool,
+                numeric=numeric,
+                price_store=price_store,
+                metrics_registry=metrics_registry,
             )
         # method 3 automatic login getting a refresh token
         else:
@@ -1868,11 +2032,99 @@ class Client:
                 api_version=api_version,
                 okta_host=okta_host,
                 thread_pool=thread_pool,
+                numeric=numeric,
+                price_store=price_store,
+                metrics_registry=metrics_registry,
             )
             stdout.write("Login credentials received.\n")
 
-        self.httpx_client = KfinanceHttpxClient(api_client=self.kfinance_api_client)
+        self.metrics_registry = metrics_registry
+        self.httpx_client = KfinanceHttpxClient(
+            api_client=self.kfinance_api_client, metrics_registry=metrics_registry
+        )
+        self.tool_result_cache = tool_result_cache
+        self.tool_output_budget = tool_output_budget
         self._tools: list[KfinanceTool] | None = None
+        self._openai_tools: list[dict[str, Any]] | None = None
+        self._anthropic_tool_descriptions: list[dict[str, Any]] | None = None
+        self._gemini_tool_descriptions: list[gapic.Tool] | None = None
+        self._async_client: AsyncClient | None = None
+        self._background_loop: BackgroundEventLoop | None = None
+        self._background_httpx_client: KfinanceHttpxClient | None = None
+        self._background_loop_lock = threading.Lock()
+
+    @property
+    def httpx_client(self) -> KfinanceHttpxClient:
+        """Return the async httpx client for the running event loop.
+
+        httpx connections are bound to the event loop that opened them, so coroutines on
+        the background loop of `run_coroutine` use a separate client.
+        """
+        if (
+            self._background_httpx_client is not None
+            and self._background_loop is not None
+            and self._background_loop.is_current()
+        ):
+            return self._background_httpx_client
+        return self._httpx_client
+
+    @httpx_client.setter
+    def httpx_client(self, httpx_client: KfinanceHttpxClient) -> None:
+        self._httpx_client = httpx_client
+
+    def metrics(self) -> MetricsSnapshot:
+        """Return a snapshot of the performance metrics of the client.
+
+        The snapshot includes histograms of tool call durations, HTTP latencies by endpoint,
+        batch sizes, concurrency limiter wait times, and response validation times, and
+        counts of tool call outcomes, HTTP status codes, and response bytes. Use
+        `to_prometheus` or `to_openmetrics` of the snapshot to export it.
+
+        :return: The current values of the metrics.
+        :rtype: MetricsSnapshot
+        """
+        if self.metrics_registry is None:
+            raise RuntimeError(
+                "Metrics are disabled. Pass a MetricsRegistry to the Client as "
+                "metrics_registry to record metrics."
+            )
+        return self.metrics_registry.snapshot()
+
+    def run_coroutine(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the client's background event loop and return its result.
+
+        Sync tool calls use this to run async tool implementations. The loop runs in a
+        daemon thread that lives as long as the client, so httpx connections get reused
+        across calls. The loop and its httpx client get closed when the client gets garbage
+        collected or the process exits.
+        """
+        if self._background_loop is None:
+            with self._background_loop_lock:
+                if self._background_loop is None:
+                    background_loop = BackgroundEventLoop()
+                    self._background_httpx_client = KfinanceHttpxClient(
+                        api_client=self.kfinance_api_client, metrics_registry=self.metrics_registry
+                    )
+                    # The finalizer must not reference the client, so that the client can
+                    # get garbage collected.
+                    weakref.finalize(
+                        self,
+                        _close_background_loop,
+                        background_loop,
+                        self._background_httpx_client,
+                    )
+                    self._background_loop = background_loop
+        return self._background_loop.run(coroutine)
+
+    @property
+    def async_client(self) -> "AsyncClient":
+        """Return an async object API that shares this client's httpx client."""
+
+        from kfinance.client.async_kfinance import AsyncClient
+
+        if self._async_client is None:
+            self._async_client = AsyncClient(kfinance_client=self)
+        return self._async_client
 
     @property
     def langchain_tools(self) -> list["KfinanceTool"]:
@@ -1905,30 +2157,97 @@ class Client:
         """
         return {t.name: t.run_without_langchain for t in self.langchain_tools}
 
+    async def arun_tools(
+        self,
+        calls: "list[ToolCall] | list[dict[str, Any]]",
+        max_concurrency: int = 10,
+    ) -> list["ToolCallResult"]:
+        """Run tool calls concurrently and return their results in order.
+
+        The args of all calls get validated before any call runs, the identifiers of all
+        calls get resolved once, and the requests of all calls share one concurrency limit.
+        Failing calls return an error instead of a result.
+
+        :param calls: The tool calls as ToolCall or dicts with `name` and `args`, for example
+            [{"name": "get_info_from_identifiers", "args": {"identifiers": ["SPGI"]}}].
+        :type calls: list[ToolCall] | list[dict[str, Any]]
+        :param max_concurrency: The maximum number of requests that the calls make at once.
+        :type max_concurrency: int
+        :return: A ToolCallResult with result or error and duration for each call.
+        :rtype: list[ToolCallResult]
+        """
+
+        from kfinance.integrations.tool_calling.batch_tool_execution import execute_tool_calls
+
+        return await execute_tool_calls(
+            calls=calls,
+            tools={tool.name: tool for tool in self.langchain_tools},
+            httpx_client=self.httpx_client,
+            max_concurrency=max_concurrency,
+        )
+
+    def run_tools(
+        self,
+        calls: "list[ToolCall] | list[dict[str, Any]]",
+        max_concurrency: int = 10,
+    ) -> list["ToolCallResult"]:
+        """Run tool calls concurrently and return their results in order.
+
+        This is the sync equivalent of `arun_tools`. The calls run on the client's
+        background event loop.
+        """
+        return self.run_coroutine(self.arun_tools(calls=calls, max_concurrency=max_concurrency))
+
     @property
     def grounding_tools(self) -> dict[str, Callable]:
         """Return a mapping of tool calling function names to the corresponding functions for the grounding agent."""
         return {t.name: t.run_with_endpoint_tracking for t in self.langchain_tools}
 
+    def _get_openai_tools(self) -> list[dict[str, Any]]:
+        """Return the OpenAI tool schemas of all tools that the user has access to.
+
+        The schemas get computed once per client. If the package ships precomputed schemas
+        and the tools haven't been built yet, the schemas get filtered by permissions without
+        importing any tools.
+        """
+        if self._openai_tools is None:
+            stored_tool_schemas = load_tool_schemas()
+            if self._tools is None and stored_tool_schemas is not None:
+                user_permissions = {
+                    permission.value for permission in self.kfinance_api_client.user_permissions
+                }
+                self._openai_tools = [
+                    tool_schema["openai_tool"]
+                    for tool_schema in stored_tool_schemas.values()
+                    if tool_schema["accepted_permissions"] is None
+                    or user_permissions.intersection(tool_schema["accepted_permissions"])
+                ]
+            else:
+                self._openai_tools = [get_openai_tool_schema(tool) for tool in self.langchain_tools]
+        return self._openai_tools
+
     @property
     def anthropic_tool_descriptions(self) -> list[dict[str, Any]]:
-        """Return tool descriptions for anthropic"""
-
-        anthropic_tool_descriptions = []
-
-        for tool in self.langchain_tools:
-            # Copied from https://python.langchain.com/api_reference/_modules/langchain_anthropic/chat_models.html#convert_to_anthropic_tool
-            # to avoid adding a langchain-anthropic dependency.
-            oai_formatted = convert_to_openai_tool(tool)["function"]
-            anthropic_tool_descriptions.append(
-                dict(
-                    name=oai_formatted["name"],
-                    description=oai_formatted["description"],
-                    input_schema=oai_formatted["parameters"],
+        """Return tool descriptions for anthropic
+
+        The descriptions are shared between calls and should not be modified.
+        """
+
+        if self._anthropic_tool_descriptions is None:
+            self._anthropic_tool_descriptions = []
+            for openai_tool in self._get_openai_tools():
+                # Copied from https://python.langchain.com/api_reference/_modules/langchain_anthropic/chat_models.html#convert_to_anthropic_tool
+                # to avoid adding a langchain-anthropic dependency.
+                oai_formatted = openai_tool["function"]
+                self._anthropic_tool_descriptions.append(
+                    dict(
+                        name=oai_formatted["name"],
+                        description=oai_formatted["description"],
+                        input_schema=oai_formatted["parameters"],
+                    )
                 )
-            )
 
-        return anthropic_tool_descriptions
+        return list(self._anthropic_tool_descriptions)
 
     @property
     def gemini_tool_descriptions(self) -> list[gapic.Tool]:
@@ -1937,16 +2256,27 @@ class Client:
         The conversion from BaseTool -> openai tool description -> google tool mirrors the
         langchain implementation.
         """
-        openai_tool_descriptions = [
-            convert_to_openai_tool(t)["function"] for t in self.langchain_tools
-        ]
-        return convert_to_genai_function_declarations(openai_tool_descriptions)
+        if self._gemini_tool_descriptions is None:
+            # The Gemini SDKs only get imported when Gemini tool descriptions get requested.
+            from langchain_google_genai._function_utils import (
+                convert_to_genai_function_declarations,
+            )
+
+            openai_tool_descriptions = [
+                openai_tool["function"] for openai_tool in self._get_openai_tools()
+            ]
+            self._gemini_tool_descriptions = convert_to_genai_function_declarations(
+                openai_tool_descriptions
+            )
+        return list(self._gemini_tool_descriptions)
 
     @property
     def openai_tool_descriptions(self) -> list[dict[str, Any]]:
-        """Return tool descriptions for gemini"""
-        openai_tool_descriptions = [convert_to_openai_tool(t) for t in self.langchain_tools]
-        return openai_tool_descriptions
+        """Return tool descriptions for openai
+
+        The descriptions are shared between calls and should not be modified.
+        """
+        return list(self._get_openai_tools())
 
     @property
     def access_token(self) -> str:
@@ -1,11 +1,11 @@
+from __future__ import annotations
+
 from abc import abstractmethod
 from datetime import datetime
 import logging
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from cachetools import LRUCache, cached
-import numpy as np
-import pandas as pd
 
 from kfinance.client.fetch import KFinanceApiClient
 from kfinance.client.models.date_and_period_models import (
@@ -35,12 +35,38 @@ from kfinance.domains.professionals.professionals_models import (
 from kfinance.domains.segments.segment_models import SegmentType
 
 
+# pandas and numpy only get imported when the first DataFrame gets built.
 if TYPE_CHECKING:
+    import pandas as pd
+
+    from kfinance.client.dataframe_builders import ValueDtype
+
     from .kfinance import BusinessRelationships, Companies
 
 logger = logging.getLogger(__name__)
 
 
+def validate_time_inputs(
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    start_quarter: Optional[int] = None,
+    end_quarter: Optional[int] = None,
+) -> None:
+    """Test the time inputs for validity."""
+
+    if start_year and (start_year > datetime.now().year):
+        raise ValueError("start_year is in the future")
+
+    if end_year and not (1900 < end_year < 2100):
+        raise ValueError("end_year is not in range")
+
+    if start_quarter and not (1 <= start_quarter <= 4):
+        raise ValueError("start_qtr is out of range 1 to 4")
+
+    if end_quarter and not (1 <= end_quarter <= 4):
+        raise ValueError("end_qtr is out of range 1 to 4")
+
+
 class CompanyFunctionsMetaClass:
     kfinance_api_client: KFinanceApiClient
 
@@ -56,6 +82,13 @@ class CompanyFunctionsMetaClass:
         """Set and return the company id for the object"""
         raise NotImplementedError("child classes must implement company id property")
 
+    @property
+    def default_value_dtype(self) -> ValueDtype:
+        """Return the value dtype of DataFrames for the numeric mode of the client."""
+        from kfinance.client.dataframe_builders import get_default_value_dtype
+
+        return get_default_value_dtype(self.kfinance_api_client.numeric)
+
     def validate_inputs(
         self,
         start_year: Optional[int] = None,
@@ -64,18 +97,12 @@ class CompanyFunctionsMetaClass:
         end_quarter: Optional[int] = None,
     ) -> None:
         """Test the time inputs for validity."""
-
-        if start_year and (start_year > datetime.now().year):
-            raise ValueError("start_year is in the future")
-
-        if end_year and not (1900 < end_year < 2100):
-            raise ValueError("end_year is not in range")
-
-        if start_quarter and not (1 <= start_quarter <= 4):
-            raise ValueError("start_qtr is out of range 1 to 4")
-
-        if end_quarter and not (1 <= end_quarter <= 4):
-            raise ValueError("end_qtr is out of range 1 to 4")
+        validate_time_inputs(
+            start_year=start_year,
+            end_year=end_year,
+            start_quarter=start_quarter,
+            end_quarter=end_quarter,
+        )
 
     @cached(cache=LRUCache(maxsize=100))
     def statement(
@@ -86,8 +113,17 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
-        """Get the company's financial statement"""
+        """Get the company's financial statement
+
+        value_dtype selects the dtype of the values, see ValueDtype. It defaults to float64 for
+        clients with numeric="float" and to object otherwise.
+        """
+        import pandas as pd
+
+        from kfinance.client.dataframe_builders import build_statement_df
+
         try:
             self.validate_inputs(
                 start_year=start_year,
@@ -113,18 +149,9 @@ class CompanyFunctionsMetaClass:
 
         # Get the first (and only) result
         statement_resp = list(statement_response.results.values())[0]
-        periods = statement_resp.model_dump(mode="json")["periods"]
-
-        # Extract statements data from each period
-        statements_data = {}
-        for period_key, period_data in periods.items():
-            period_statements = {}
-            for statement in period_data["statements"]:
-                for line_item in statement["line_items"]:
-                    period_statements[line_item["name"]] = line_item["value"]
-            statements_data[period_key] = period_statements
-
-        return pd.DataFrame(statements_data).apply(pd.to_numeric).replace(np.nan, None)
+        return build_statement_df(
+            statement_resp, value_dtype=value_dtype or self.default_value_dtype
+        )
 
     def income_statement(
         self,
@@ -133,6 +160,7 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """The templated income statement"""
         return self.statement(
@@ -142,6 +170,7 @@ class CompanyFunctionsMetaClass:
             end_year=end_year,
             start_quarter=start_quarter,
             end_quarter=end_quarter,
+            value_dtype=value_dtype,
         )
 
     def income_stmt(
@@ -151,6 +180,7 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """The templated income statement"""
         return self.statement(
@@ -160,6 +190,7 @@ class CompanyFunctionsMetaClass:
             end_year=end_year,
             start_quarter=start_quarter,
             end_quarter=end_quarter,
+            value_dtype=value_dtype,
         )
 
     def balance_sheet(
@@ -169,6 +200,7 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """The templated balance sheet"""
         return self.statement(
@@ -178,6 +210,7 @@ class CompanyFunctionsMetaClass:
             end_year=end_year,
             start_quarter=start_quarter,
             end_quarter=end_quarter,
+            value_dtype=value_dtype,
         )
 
     def cash_flow(
@@ -187,6 +220,7 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """The templated cash flow statement"""
         return self.statement(
@@ -196,6 +230,7 @@ class CompanyFunctionsMetaClass:
             end_year=end_year,
             start_quarter=start_quarter,
             end_quarter=end_quarter,
+            value_dtype=value_dtype,
         )
 
     def cashflow(
@@ -205,6 +240,7 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """The templated cash flow statement"""
         return self.statement(
@@ -214,6 +250,7 @@ class CompanyFunctionsMetaClass:
             end_year=end_year,
             start_quarter=start_quarter,
             end_quarter=end_quarter,
+            value_dtype=value_dtype,
         )
 
     @cached(cache=LRUCache(maxsize=100))
@@ -225,8 +262,17 @@ class CompanyFunctionsMetaClass:
         end_year: Optional[int] = None,
         start_quarter: Optional[int] = None,
         end_quarter: Optional[int] = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
-        """Get a DataFrame of a financial line item according to the date ranges."""
+        """Get a DataFrame of a financial line item according to the date ranges.
+
+        value_dtype selects the dtype of the values, see ValueDtype. It defaults to float64 for
+        clients with numeric="float" and to object otherwise.
+        """
+        import pandas as pd
+
+        from kfinance.client.dataframe_builders import build_line_item_df
+
         try:
             self.validate_inputs(
                 start_year=start_year,
@@ -252,17 +298,10 @@ class CompanyFunctionsMetaClass:
 
         # Get the first (and only) result
         line_item_response = list(response.results.values())[0]
-
-        line_item_data = {}
-        for period_key, period_data in line_item_response.periods.items():
-            line_item_data[period_key] = period_data.line_item.value
-
-        return (
-            pd.DataFrame({"line_item": line_item_data})
-            .transpose()
-            .apply(pd.to_numeric)
-            .replace(np.nan, None)
-            .set_index(pd.Index([line_item]))
+        return build_line_item_df(
+            line_item_response,
+            line_item=line_item,
+            value_dtype=value_dtype or self.default_value_dtype,
         )
 
     def line_item_va(
@@ -276,6 +315,9 @@ class CompanyFunctionsMetaClass:
         currency: Optional[str] = None,
     ) -> pd.DataFrame:
         """Get a DataFrame of a financial line item from Visible Alpha."""
+        import numpy as np
+        import pandas as pd
+
         try:
             self.validate_inputs(
                 start_year=start_year,
@@ -706,7 +748,12 @@ class CompanyFunctionsMetaClass:
         num_periods_forward: int | None = None,
         num_periods_backward: int | None = None,
         period_type: EstimatePeriodType | None = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
+        import pandas as pd
+
+        from kfinance.client.dataframe_builders import build_estimates_df
+
         try:
             self.validate_inputs(
                 start_year=start_year,
@@ -732,19 +779,9 @@ class CompanyFunctionsMetaClass:
         if not estimate_response.result:
             return pd.DataFrame()
 
-        periods = estimate_response.result.model_dump(mode="json")["periods"]
-
-        estimates_data = {}
-        for period_key, period_data in periods.items():
-            period_estimates = {}
-            for ticker_or_company, group in period_data["estimates"].items():
-                for estimate in group["estimates"]:
-                    period_estimates[(ticker_or_company, estimate["name"])] = estimate["value"]
-            estimates_data[period_key] = period_estimates
-
-        df = pd.DataFrame(estimates_data).apply(pd.to_numeric).replace(np.nan, None)
-        df.index = pd.MultiIndex.from_tuples(df.index, names=["ticker_or_company", "name"])
-        return df
+        return build_estimates_df(
+            estimate_response.result, value_dtype=value_dtype or self.default_value_dtype
+        )
 
     def consensus_estimates(
         self,
@@ -755,6 +792,7 @@ class CompanyFunctionsMetaClass:
         num_periods_forward: int | None = None,
         num_periods_backward: int | None = None,
         period_type: EstimatePeriodType | None = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """Get consensus estimates for the time range and period type."""
 
@@ -767,6 +805,7 @@ class CompanyFunctionsMetaClass:
             num_periods_forward=num_periods_forward,
             num_periods_backward=num_periods_backward,
             period_type=period_type,
+            value_dtype=value_dtype,
         )
 
     def consensus_estimates_va(
@@ -783,6 +822,9 @@ class CompanyFunctionsMetaClass:
         currency: str | None = None,
     ) -> pd.DataFrame:
         """Get consensus estimates from Visible Alpha for the time range and period type."""
+        import numpy as np
+        import pandas as pd
+
         try:
             self.validate_inputs(
                 start_year=start_year,
@@ -830,6 +872,7 @@ class CompanyFunctionsMetaClass:
         num_periods_forward: int | None = None,
         num_periods_backward: int | None = None,
         period_type: EstimatePeriodType | None = None,
+        value_dtype: ValueDtype | None = None,
     ) -> pd.DataFrame:
         """Get guidance for the time range and period type."""
 
@@ -842,12 +885,14 @@ class CompanyFunctionsMetaClass:
             num_periods_forward=num_periods_forward,
             num_periods_backward=num_periods_backward,
             period_type=period_type,
+            value_dtype=value_dtype,
         )
 
     def consensus_target_price(
         self,
     ) -> pd.DataFrame:
         """Get consensus target price estimates"""
+        import pandas as pd
 
         response = self.kfinance_api_client.fetch_consensus_target_price(
             company_id=self.company_id,
@@ -871,6 +916,7 @@ class CompanyFunctionsMetaClass:
         self,
     ) -> pd.DataFrame:
         """Get analyst recommendations"""
+        import pandas as pd
 
         response = self.kfinance_api_client.fetch_analyst_recommendations(
             company_id=self.company_id,
@@ -906,6 +952,7 @@ class CompanyFunctionsMetaClass:
         :return: A DataFrame of key developments with columns: category, key_dev_id, situation, announced_date_utc, most_important_date_utc, source, and company_role
         :rtype: pd.DataFrame
         """
+        import pandas as pd
 
         key_dev_category_enum = None
         if key_dev_category is not None:
@@ -971,6 +1018,7 @@ for line_item in LINE_ITEMS:
             end_year: Optional[int] = None,
             start_quarter: Optional[int] = None,
             end_quarter: Optional[int] = None,
+            value_dtype: ValueDtype | None = None,
         ) -> pd.DataFrame:
             return self.line_item(
                 line_item=line_item_name,
@@ -979,6 +1027,7 @@ for line_item in LINE_ITEMS:
                 end_year=end_year,
                 start_quarter=start_quarter,
                 end_quarter=end_quarter,
+                value_dtype=value_dtype,
             )
 
         doc = "ciq data item " + str(line_item["dataitemid"])
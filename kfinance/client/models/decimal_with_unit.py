@@ -1,11 +1,21 @@
-from copy import deepcopy
 from decimal import Decimal
+import functools
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing_extensions import Self
 
-from kfinance.client.models.currency_models import ISO_CODE_TO_CURRENCY
+from kfinance.client.models.currency_models import ISO_CODE_TO_CURRENCY, Currency
+from kfinance.client.models.trusted_decode import build_model, to_decimal
+
+
+NAN = Decimal("NaN")
+
+
+@functools.cache
+def get_quantization_exponent(conventional_decimals: int) -> Decimal:
+    """Return the exponent used to quantize values to conventional_decimals decimals."""
+    return Decimal(1).scaleb(-conventional_decimals)
 
 
 class DecimalWithUnit(BaseModel):
@@ -34,7 +44,7 @@ class DecimalWithUnit(BaseModel):
         https://kfinance.kensho.com/api/v1/pricing/37284793/2003-01-01/2024-12-31/month/adjusted
         """
         if v is None:
-            return Decimal("NaN")
+            return NAN
         return v
 
     @model_validator(mode="after")
@@ -45,29 +55,49 @@ class DecimalWithUnit(BaseModel):
         conventional_decimals.
         For USD with conventional_decimals=2, it will show values like "1.00"
         For Shares with conventional_decimals=0, it will show values like "1"
+        Float values (see NumericMode.float) do not get quantized.
         """
-        exponent = Decimal("10") ** Decimal(-self.conventional_decimals)
-        self.value = self.value.quantize(exp=exponent)
+        if type(self).model_fields["value"].annotation is float:
+            return self
+        self.value = self.value.quantize(exp=get_quantization_exponent(self.conventional_decimals))
         return self
 
 
+def _get_currency_conventional_decimals(data: dict[str, Any]) -> int:
+    """Return the conventional_decimals of the currency in the validated unit field."""
+    if "unit" not in data:
+        # The unit failed validation, which pydantic reports.
+        return 0
+    return ISO_CODE_TO_CURRENCY[data["unit"]].conventional_decimals
+
+
 class Money(DecimalWithUnit):
-    @model_validator(mode="before")
-    @classmethod
-    def inject_conventional_decimals_into_data(cls, data: Any) -> Any:
-        """Inject conventional_decimals into data dict.
+    """Money is a DecimalWithUnit whose unit is an ISO 4217 currency code.
 
-        Each currency has an associated conventional_decimals defined in the
-        CURRENCIES list. This validator fetches that number and injects it into the
-        data dict.
-        """
+    Each currency has an associated conventional_decimals defined in the CURRENCIES list.
+    If conventional_decimals is not passed, it defaults to the conventional_decimals of the
+    currency.
+    """
 
-        if isinstance(data, dict) and "conventional_decimals" not in data:
-            data = deepcopy(data)
-            currency = ISO_CODE_TO_CURRENCY[data["unit"]]
-            data["conventional_decimals"] = currency.conventional_decimals
+    conventional_decimals: int = Field(
+        exclude=True, default_factory=_get_currency_conventional_decimals
+    )
 
-        return data
+
+def to_money_data(value: Any, unit: str) -> dict[str, Any]:
+    """Return the Money input dict for a value and an ISO currency code.
+
+    The dict includes the conventional_decimals and the shared code string of the currency
+    so that Money validation does not need to look up the currency again.
+    """
+    currency = ISO_CODE_TO_CURRENCY.get(unit)
+    if currency is None:
+        return {"value": value, "unit": unit}
+    return {
+        "value": value,
+        "unit": currency.code,
+        "conventional_decimals": currency.conventional_decimals,
+    }
 
 
 class Shares(DecimalWithUnit):
@@ -88,3 +118,40 @@ class Shares(DecimalWithUnit):
         if isinstance(data, (str, int, float, Decimal)):
             data = {"value": data}
         return data
+
+
+def _quantize_trusted_value(value: Any, exponent: Decimal) -> Decimal:
+    """Convert a trusted API value into a quantized Decimal."""
+    decimal_value = NAN if value is None else to_decimal(value)
+    return decimal_value.quantize(exp=exponent)
+
+
+def trusted_money(value: Any, currency: Currency) -> Money:
+    """Build Money from a trusted value and currency without validation."""
+    return build_model(
+        Money,
+        {
+            "value": _quantize_trusted_value(
+                value, get_quantization_exponent(currency.conventional_decimals)
+            ),
+            "unit": currency.code,
+            "conventional_decimals": currency.conventional_decimals,
+        },
+        {"value", "unit", "conventional_decimals"},
+    )
+
+
+_SHARES_EXPONENT = get_quantization_exponent(0)
+
+
+def trusted_shares(value: Any) -> Shares:
+    """Build Shares from a trusted value without validation."""
+    return build_model(
+        Shares,
+        {
+            "value": _quantize_trusted_value(value, _SHARES_EXPONENT),
+            "unit": "Shares",
+            "conventional_decimals": 0,
+        },
+        {"value"},
+    )
@@ -0,0 +1,108 @@
+from typing import Any, Generic, Iterable, Iterator, Mapping, MutableMapping, TypeVar, get_args
+
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LazyPeriods(MutableMapping[str, T], Generic[T]):
+    """A period -> period data mapping that validates each period on first access.
+
+    Responses like statements or line items can contain dozens of periods per company, and
+    tools often keep only the most recent one. LazyPeriods keeps the raw period dicts of a
+    response and validates a period only when it gets accessed or serialized, so that
+    discarded periods never get validated. Invalid period data raises a ValidationError on
+    access instead of when the response gets decoded.
+
+    Use LazyPeriods[PeriodDataModel] as the annotation of a pydantic field. The field
+    accepts dicts of raw period data or models and serializes like dict[str, PeriodDataModel].
+    Like a dict, periods can be set and deleted, for example to filter periods in place.
+    """
+
+    __slots__ = ("_raw", "_validated", "_model_cls")
+
+    def __init__(self, raw: Mapping[str, Any], model_cls: type[T]) -> None:
+        """Initialize the LazyPeriods
+
+        :param raw: period -> raw period data (or already validated models)
+        :type raw: Mapping[str, Any]
+        :param model_cls: The model of the period data
+        :type model_cls: type[T]
+        """
+        self._raw = dict(raw)
+        self._model_cls = model_cls
+        self._validated: dict[str, T] = {}
+
+    def __getitem__(self, period: str) -> T:
+        if period in self._validated:
+            return self._validated[period]
+        value = self._raw[period]
+        validated = (
+            value if isinstance(value, self._model_cls) else self._model_cls.model_validate(value)
+        )
+        self._validated[period] = validated
+        return validated
+
+    def __setitem__(self, period: str, value: T) -> None:
+        self._raw[period] = value
+        self._validated.pop(period, None)
+
+    def __delitem__(self, period: str) -> None:
+        del self._raw[period]
+        self._validated.pop(period, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, period: object) -> bool:
+        return period in self._raw
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def only(self, periods: Iterable[str]) -> "LazyPeriods[T]":
+        """Return a LazyPeriods with only the given periods, without validating any of them."""
+        subset = LazyPeriods({period: self._raw[period] for period in periods}, self._model_cls)
+        subset._validated = {
+            period: self._validated[period] for period in subset if period in self._validated
+        }
+        return subset
+
+    def with_model(self, model_cls: type[T]) -> "LazyPeriods[T]":
+        """Return a LazyPeriods of the same raw periods that validates them into model_cls."""
+        return self if model_cls is self._model_cls else LazyPeriods(self._raw, model_cls)
+
+    def to_dict(self) -> dict[str, T]:
+        """Validate all periods and return them as a dict."""
+        return {period: self[period] for period in self._raw}
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = get_args(source_type)
+        if not args:
+            raise TypeError("LazyPeriods must be parametrized with a period data model.")
+        model_cls = args[0]
+
+        def validate(value: Any, validate_dict: core_schema.ValidatorFunctionWrapHandler) -> Any:
+            if isinstance(value, LazyPeriods):
+                return value.with_model(model_cls)
+            # Only the keys and the container type get validated up front.
+            return cls(validate_dict(value), model_cls)
+
+        return core_schema.no_info_wrap_validator_function(
+            validate,
+            core_schema.dict_schema(core_schema.str_schema(), core_schema.any_schema()),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.to_dict() if isinstance(value, LazyPeriods) else value,
+                return_schema=core_schema.dict_schema(
+                    core_schema.str_schema(), handler.generate_schema(model_cls)
+                ),
+            ),
+        )
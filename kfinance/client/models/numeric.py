@@ -0,0 +1,68 @@
+from copy import copy
+from decimal import Decimal
+import functools
+import types
+from typing import Annotated, Any, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, create_model
+from strenum import StrEnum
+
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class NumericMode(StrEnum):
+    """The Python type used for numeric values of API responses.
+
+    - decimal: Values are parsed into Decimals, which keeps them accounting exact. This is
+        the default.
+    - float: Values are parsed straight into floats by pydantic-core. Statement, line item,
+        and estimate DataFrames default to float64 columns.
+    """
+
+    decimal = "decimal"
+    float = "float"
+
+
+def _to_float_annotation(annotation: Any) -> Any:
+    """Return annotation with Decimal replaced by float and models by their float models."""
+    if annotation is Decimal:
+        return float
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return get_float_model(annotation)
+
+    args = get_args(annotation)
+    origin = get_origin(annotation)
+    if not args or origin is Literal:
+        return annotation
+    float_args = tuple(_to_float_annotation(arg) for arg in args)
+    if all(float_arg is arg for float_arg, arg in zip(float_args, args)):
+        return annotation
+    if origin is Annotated:
+        return Annotated[(float_args[0], *annotation.__metadata__)]
+    if origin in (Union, types.UnionType):
+        return Union[float_args]
+    return origin[float_args]
+
+
+@functools.cache
+def get_float_model(model_cls: type[M]) -> type[M]:
+    """Return a subclass of model_cls that parses all Decimal fields as floats.
+
+    Nested models are replaced by their float models as well. Validators and methods are
+    inherited from model_cls, so instances of the float model are also instances of
+    model_cls. Models without Decimal fields get returned unchanged.
+    """
+    field_overrides: dict[str, Any] = {}
+    for field_name, field_info in model_cls.model_fields.items():
+        float_annotation = _to_float_annotation(field_info.annotation)
+        if float_annotation is not field_info.annotation:
+            field_overrides[field_name] = (float_annotation, copy(field_info))
+    if not field_overrides:
+        return model_cls
+    return create_model(
+        model_cls.__name__,
+        __base__=model_cls,
+        __module__=model_cls.__module__,
+        **field_overrides,
+    )
@@ -3,7 +3,12 @@ from typing import Any
 
 import pytest
 
-from kfinance.client.models.decimal_with_unit import DecimalWithUnit, Money, Shares
+from kfinance.client.models.decimal_with_unit import (
+    DecimalWithUnit,
+    Money,
+    Shares,
+    to_money_data,
+)
 
 
 class TestDecimalWithUnit:
@@ -56,6 +61,27 @@ class TestMoney:
         money = Money.model_validate({"value": 1, "unit": currency})
         assert money.conventional_decimals == expected_conventional_decimals
 
+    def test_money_data_does_not_get_mutated(self) -> None:
+        """
+        GIVEN a value and unit dict
+        WHEN we deserialize the dict into a Money object
+        THEN the input dict does not get modified.
+        """
+        data = {"value": "1.234", "unit": "USD"}
+        money = Money.model_validate(data)
+        assert money == Money(value=Decimal("1.23"), unit="USD", conventional_decimals=2)
+        assert data == {"value": "1.234", "unit": "USD"}
+
+    def test_to_money_data(self) -> None:
+        """
+        GIVEN a value and currency
+        WHEN we build the Money input with to_money_data
+        THEN the input includes the currency code and conventional decimals.
+        """
+        data = to_money_data(value="1.5", unit="BHD")
+        assert data == {"value": "1.5", "unit": "BHD", "conventional_decimals": 3}
+        assert Money.model_validate(data).value == Decimal("1.500")
+
 
 class TestShares:
     @pytest.mark.parametrize("input", ["1", 1, Decimal(1), {"value": 1}])
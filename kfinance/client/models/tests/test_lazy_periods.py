@@ -0,0 +1,124 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import ValidationError
+import pytest
+
+from kfinance.client.models.lazy_periods import LazyPeriods
+from kfinance.client.models.response_models import PostResponse
+from kfinance.domains.line_items.line_item_models import (
+    LineItem,
+    LineItemPeriodData,
+    LineItemResp,
+)
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+STATEMENTS_RESP = {
+    "results": {
+        "21719": {
+            "currency": "USD",
+            "periods": {
+                # Invalid: num_months is not an int
+                "CY2019": {"period_end_date": "2019-12-31", "num_months": "twelve"},
+                "CY2020": {
+                    "period_end_date": "2020-12-31",
+                    "num_months": 12,
+                    "statements": [
+                        {
+                            "name": "Income Statement",
+                            "line_items": [{"name": "Revenue", "value": "7442000000.000000"}],
+                        }
+                    ],
+                },
+            },
+        }
+    },
+    "errors": {},
+}
+
+
+class TestLazyPeriods:
+    def test_periods_get_validated_on_access(self) -> None:
+        """
+        GIVEN a statements response in which an old period is invalid
+        WHEN the response gets validated
+        THEN validation succeeds and only accessing the invalid period raises
+        """
+        resp = PostResponse[StatementsResp].model_validate(STATEMENTS_RESP)
+        periods = resp.results["21719"].periods
+        assert isinstance(periods, LazyPeriods)
+        assert list(periods) == ["CY2019", "CY2020"]
+        assert periods["CY2020"].statements[0].line_items[0].value == Decimal("7442000000")
+        # Validated periods get cached.
+        assert periods["CY2020"] is periods["CY2020"]
+        with pytest.raises(ValidationError):
+            periods["CY2019"]
+
+    def test_most_recent_period_skips_discarded_periods(self) -> None:
+        """
+        GIVEN a statements response in which an old period is invalid
+        WHEN all periods other than the most recent one get removed and the response dumped
+        THEN the dump contains the most recent period without validating the old one
+        """
+        statements = PostResponse[StatementsResp].model_validate(STATEMENTS_RESP).results["21719"]
+        statements.remove_all_periods_other_than_the_most_recent_one()
+        assert isinstance(statements.periods, LazyPeriods)
+        assert statements.model_dump(mode="json") == {
+            "currency": "USD",
+            "periods": {
+                "CY2020": {
+                    "period_end_date": "2020-12-31",
+                    "num_months": 12,
+                    "statements": [
+                        {
+                            "name": "Income Statement",
+                            "line_items": [
+                                {"name": "Revenue", "value": "7442000000.000000", "sources": []}
+                            ],
+                        }
+                    ],
+                }
+            },
+        }
+
+    def test_models_and_equality(self) -> None:
+        """
+        GIVEN period data passed as models
+        WHEN they get validated into a LazyPeriods field
+        THEN the models are kept and the periods compare equal to a dict of the same models
+        """
+        period_data = LineItemPeriodData(
+            period_end_date=date(2020, 12, 31),
+            num_months=12,
+            line_item=LineItem(name="revenue", value=Decimal(1)),
+        )
+        periods = {"CY2020": period_data}
+        line_item_resp = LineItemResp(currency="USD", periods=periods)
+        assert isinstance(line_item_resp.periods, LazyPeriods)
+        assert line_item_resp.periods["CY2020"] is period_data
+        assert line_item_resp.periods == periods
+        assert line_item_resp == LineItemResp(currency="USD", periods=periods)
+        assert line_item_resp.periods.only([]) == {}
+
+    def test_periods_can_be_modified_in_place(self) -> None:
+        """
+        GIVEN a statements response in which an old period is invalid
+        WHEN the invalid period gets deleted and a period gets replaced in place
+        THEN the dump contains the remaining and the new periods without validating the
+            deleted one
+        """
+        statements = PostResponse[StatementsResp].model_validate(STATEMENTS_RESP).results["21719"]
+        periods = statements.periods
+        original_period = periods["CY2020"]
+        del periods["CY2019"]
+        periods["CY2021"] = original_period.model_copy(
+            update={"period_end_date": date(2021, 12, 31)}
+        )
+        assert periods.pop("CY2020") is original_period
+
+        assert list(periods) == ["CY2021"]
+        assert "CY2020" not in periods
+        assert statements.model_dump(mode="json")["periods"]["CY2021"]["period_end_date"] == (
+            "2021-12-31"
+        )
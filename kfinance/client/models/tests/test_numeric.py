@@ -0,0 +1,116 @@
+from decimal import Decimal
+import math
+
+from kfinance.client.models.decimal_with_unit import Money
+from kfinance.client.models.numeric import NumericMode, get_float_model
+from kfinance.client.models.response_models import PostResponse
+from kfinance.client.models.trusted_decode import decode_response
+from kfinance.domains.companies.company_models import CompanyIdAndName
+from kfinance.domains.line_items.line_item_models import LineItemResp
+from kfinance.domains.prices.price_models import PriceHistory
+from kfinance.domains.rounds_of_funding.rounds_of_funding_models import InvestorInRoundOfFunding
+
+
+LINE_ITEM_RESP = {
+    "results": {
+        "21719": {
+            "currency": "USD",
+            "periods": {
+                "CY2020": {
+                    "period_end_date": "2020-12-31",
+                    "num_months": 12,
+                    "line_item": {"name": "revenue", "value": "7442000000.500000"},
+                },
+                "CY2021": {
+                    "period_end_date": "2021-12-31",
+                    "num_months": 12,
+                    "line_item": {"name": "revenue", "value": None},
+                },
+            },
+        }
+    },
+    "errors": {},
+}
+
+
+class TestGetFloatModel:
+    def test_nested_decimal_fields(self) -> None:
+        """
+        GIVEN a generic response model with nested Decimal fields
+        WHEN the response gets validated into the float model
+        THEN the values are floats and the result is an instance of the original model
+        """
+        float_model = get_float_model(PostResponse[LineItemResp])
+        resp = float_model.model_validate(LINE_ITEM_RESP)
+        assert isinstance(resp, PostResponse[LineItemResp])
+        periods = resp.results["21719"].periods
+        assert periods["CY2020"].line_item.value == 7442000000.5
+        assert isinstance(periods["CY2020"].line_item.value, float)
+        assert periods["CY2021"].line_item.value is None
+
+    def test_money(self) -> None:
+        """
+        GIVEN a price history with a missing open price
+        WHEN the price history gets validated into the float model
+        THEN Money values are unquantized floats and missing prices are NaN
+        """
+        price_history = get_float_model(PriceHistory).model_validate(
+            {
+                "currency": "USD",
+                "prices": [
+                    {
+                        "date": "2024-06-25",
+                        "open": None,
+                        "high": "449.240000",
+                        "low": "442.770000",
+                        "close": "448.780000",
+                        "volume": "999134",
+                    }
+                ],
+            }
+        )
+        price = price_history.prices[0]
+        assert price.open is None
+        assert isinstance(price.close, Money)
+        assert price.close.value == 448.78
+        assert price.volume is not None and price.volume.value == 999134.0
+        assert math.isnan(
+            get_float_model(Money).model_validate({"value": None, "unit": "USD"}).value
+        )
+
+    def test_investment_value(self) -> None:
+        """
+        GIVEN an investor in a round of funding
+        WHEN the investor gets validated into the float model
+        THEN investment_value is a float
+        """
+        investor = get_float_model(InvestorInRoundOfFunding).model_validate(
+            {"company_id": 1, "company_name": "Investor", "investment_value": "1000000.25"}
+        )
+        assert investor.investment_value == 1000000.25
+
+    def test_model_without_decimals(self) -> None:
+        """
+        GIVEN a model without Decimal fields
+        WHEN the float model gets requested
+        THEN the model itself gets returned
+        """
+        assert get_float_model(CompanyIdAndName) is CompanyIdAndName
+
+
+class TestDecodeResponse:
+    def test_numeric_modes(self) -> None:
+        """
+        GIVEN a line item response
+        WHEN the response gets decoded in decimal and float mode
+        THEN the values are Decimals and floats respectively
+        """
+        decimal_resp = decode_response(PostResponse[LineItemResp], LINE_ITEM_RESP)
+        float_resp = decode_response(
+            PostResponse[LineItemResp], LINE_ITEM_RESP, numeric=NumericMode.float
+        )
+        decimal_value = decimal_resp.results["21719"].periods["CY2020"].line_item.value
+        float_value = float_resp.results["21719"].periods["CY2020"].line_item.value
+        assert decimal_value == Decimal("7442000000.500000")
+        assert isinstance(float_value, float)
+        assert float_value == float(decimal_value)
@@ -0,0 +1,182 @@
+import copy
+from decimal import Decimal
+import itertools
+from typing import Any, Generator
+
+from pydantic import BaseModel
+import pytest
+
+from kfinance.client.models import trusted_decode
+from kfinance.client.models.decimal_with_unit import Shares
+from kfinance.client.models.response_models import SingleResultResp
+from kfinance.client.models.trusted_decode import (
+    configure_trusted_decode,
+    construct_from_trusted_data,
+    decode_response,
+)
+from kfinance.domains.capitalizations.capitalization_models import Capitalizations
+from kfinance.domains.estimates.estimates_models import CiqEstimates
+from kfinance.domains.prices.price_models import PriceHistory
+
+
+@pytest.fixture
+def trusted_decode_enabled(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Enable trusted decode with a sample rate of 2 for the duration of a test."""
+    monkeypatch.setattr(trusted_decode, "_decode_counter", itertools.count())
+    configure_trusted_decode(enabled=True, sample_rate=2)
+    try:
+        yield
+    finally:
+        configure_trusted_decode(enabled=False)
+
+
+class TestConstructFromTrustedData:
+    @pytest.mark.parametrize(
+        "model_cls, data",
+        [
+            pytest.param(
+                PriceHistory,
+                {
+                    "currency": "USD",
+                    "prices": [
+                        {
+                            "date": "2024-06-25",
+                            "open": "445.790000",
+                            "high": None,
+                            "low": "442.770000",
+                            "close": "448.780000",
+                            "volume": "999134",
+                        }
+                    ],
+                },
+                id="prices",
+            ),
+            pytest.param(
+                Capitalizations,
+                {
+                    "currency": "JPY",
+                    "market_caps": [
+                        {
+                            "date": "2024-06-24",
+                            "market_cap": "139231113000.123000",
+                            "tev": None,
+                            "shares_outstanding": 312900000,
+                        }
+                    ],
+                },
+                id="capitalizations",
+            ),
+        ],
+    )
+    def test_matches_model_validate(self, model_cls: type[BaseModel], data: dict) -> None:
+        """
+        GIVEN a valid API response for a model with a registered trusted decoder
+        WHEN the response gets built with the trusted decoder
+        THEN the result is identical to the result of full validation
+        """
+        constructed = construct_from_trusted_data(model_cls, data)
+        validated = model_cls.model_validate(data)
+        assert constructed == validated
+        assert constructed.model_dump(mode="json") == validated.model_dump(mode="json")
+        assert constructed.model_fields_set == validated.model_fields_set
+
+    def test_unregistered_models_get_validated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        GIVEN a model without a registered trusted decoder
+        WHEN a response gets built with construct_from_trusted_data
+        THEN the response gets validated by pydantic
+        """
+        data = {"results": {}, "errors": {}}
+        validate_calls = []
+        original_model_validate = SingleResultResp[CiqEstimates].model_validate
+
+        def spy_model_validate(data: Any) -> SingleResultResp[CiqEstimates]:
+            validate_calls.append(data)
+            return original_model_validate(data)
+
+        monkeypatch.setattr(SingleResultResp[CiqEstimates], "model_validate", spy_model_validate)
+        assert construct_from_trusted_data(SingleResultResp[CiqEstimates], data) == (
+            original_model_validate(data)
+        )
+        assert validate_calls == [data]
+
+
+class TestDecodeResponse:
+    data = {"currency": "USD", "prices": []}
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        WHEN trusted decode is not enabled
+        THEN responses get fully validated
+        """
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("trusted decoder should not be used")
+
+        monkeypatch.setattr(trusted_decode, "construct_from_trusted_data", fail)
+        assert decode_response(PriceHistory, self.data) == PriceHistory(prices=[])
+
+    def test_sampling(self, trusted_decode_enabled: None, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        GIVEN trusted decode with a sample rate of 2
+        WHEN responses get decoded
+        THEN every second response gets fully validated
+        """
+        validate_calls = []
+        original_model_validate = PriceHistory.model_validate
+
+        def spy_model_validate(data: Any) -> PriceHistory:
+            validate_calls.append(data)
+            return original_model_validate(data)
+
+        monkeypatch.setattr(PriceHistory, "model_validate", spy_model_validate)
+        for _ in range(10):
+            assert decode_response(PriceHistory, self.data) == PriceHistory(prices=[])
+        assert len(validate_calls) == 5
+
+    def test_sampled_mismatch_gets_logged(
+        self,
+        trusted_decode_enabled: None,
+        caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        GIVEN trusted decode with sampling
+        WHEN the trusted decoder disagrees with full validation on a sampled response
+        THEN a warning gets logged and the validated response gets returned
+        """
+
+        drifted = PriceHistory.model_validate(TestPriceHistoryDecoder.api_resp)
+        monkeypatch.setattr(trusted_decode, "construct_from_trusted_data", lambda *args: drifted)
+        results = [decode_response(PriceHistory, self.data) for _ in range(2)]
+        assert any("does not match" in record.message for record in caplog.records)
+        # The first response is sampled and fully validated, the second is not.
+        assert results[0] == PriceHistory(prices=[])
+        assert results[1] is drifted
+
+
+class TestPriceHistoryDecoder:
+    api_resp = {
+        "currency": "USD",
+        "prices": [
+            {
+                "date": "2024-06-25",
+                "open": "445.790000",
+                "high": "449.240000",
+                "low": "442.770000",
+                "close": "448.780000",
+                "volume": "999134",
+            }
+        ],
+    }
+
+    def test_does_not_mutate_response(self) -> None:
+        """
+        GIVEN a price history API response
+        WHEN the response gets built with the trusted decoder
+        THEN the response does not get mutated
+        """
+        original = copy.deepcopy(self.api_resp)
+        price_history = construct_from_trusted_data(PriceHistory, self.api_resp)
+        assert self.api_resp == original
+        assert price_history.prices[0].volume == Shares(value=Decimal(999134))
@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from decimal import Decimal
+import itertools
+import logging
+import time
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from kfinance.client.models.numeric import NumericMode, get_float_model
+from kfinance.metrics import DECODE_DURATION, get_active_metrics
+
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+
+@dataclass
+class TrustedDecodeSettings:
+    """Settings for decoding API responses.
+
+    - enabled: If True, responses of models with a registered trusted decoder (prices,
+        capitalizations) get built without full pydantic validation.
+    - sample_rate: Every sample_rate-th trusted decode gets fully validated instead. The
+        validated result is compared against the trusted decode to detect drift between
+        the API and the trusted decoder.
+    """
+
+    enabled: bool = False
+    sample_rate: int = 100
+
+
+trusted_decode_settings = TrustedDecodeSettings()
+
+_decode_counter = itertools.count()
+
+
+def configure_trusted_decode(enabled: bool = True, sample_rate: int = 100) -> None:
+    """Enable or disable trusted decoding of API responses.
+
+    :param enabled: Whether to skip full validation for responses of models with a
+        registered trusted decoder.
+    :type enabled: bool
+    :param sample_rate: Fully validate every sample_rate-th response.
+    :type sample_rate: int
+    """
+    if sample_rate < 1:
+        raise ValueError("sample_rate must be at least 1.")
+    trusted_decode_settings.enabled = enabled
+    trusted_decode_settings.sample_rate = sample_rate
+
+
+def decode_response(model_cls: type[M], data: Any, numeric: NumericMode = NumericMode.decimal) -> M:
+    """Decode an API response into model_cls.
+
+    If trusted decoding is disabled, this is equivalent to model_cls.model_validate(data).
+    Otherwise, the response gets built with `construct_from_trusted_data` except for a
+    sample of 1 in sample_rate responses, which get fully validated.
+
+    With NumericMode.float, the response gets validated into the float model of model_cls
+    (see `get_float_model`). pydantic-core parses floats directly, so trusted decoding
+    does not apply.
+
+    Within a tool call of a client with a metrics registry, the decode time gets recorded
+    per response model.
+    """
+    metrics = get_active_metrics()
+    if metrics is None:
+        return _decode_response(model_cls, data, numeric)
+    start = time.perf_counter()
+    try:
+        return _decode_response(model_cls, data, numeric)
+    finally:
+        metrics.observe(DECODE_DURATION, time.perf_counter() - start, model_cls.__name__)
+
+
+def _decode_response(model_cls: type[M], data: Any, numeric: NumericMode) -> M:
+    """Decode an API response into model_cls, see `decode_response`."""
+    if numeric == NumericMode.float:
+        return get_float_model(model_cls).model_validate(data)
+    if not trusted_decode_settings.enabled:
+        return model_cls.model_validate(data)
+
+    if next(_decode_counter) % trusted_decode_settings.sample_rate == 0:
+        validated = model_cls.model_validate(data)
+        try:
+            constructed = construct_from_trusted_data(model_cls, data)
+        except Exception:
+            logger.warning("Trusted decode of %s failed.", model_cls.__name__, exc_info=True)
+        else:
+            if constructed != validated:
+                logger.warning(
+                    "Trusted decode of %s does not match the validated response.",
+                    model_cls.__name__,
+                )
+        return validated
+
+    return construct_from_trusted_data(model_cls, data)
+
+
+def construct_from_trusted_data(model_cls: type[M], data: Any) -> M:
+    """Build model_cls from data that is known to be valid.
+
+    Only models with a decoder registered with `register_trusted_decoder` (price
+    histories and capitalizations) get built without validation. All other models get
+    validated by pydantic-core, which is faster than a generic python decoder.
+    """
+    return _trusted_decoders.get(model_cls, model_cls.model_validate)(data)
+
+
+_trusted_decoders: dict[type[BaseModel], Converter] = {}
+
+
+def register_trusted_decoder(
+    model_cls: type[M],
+) -> Callable[[Callable[[Any], M]], Callable[[Any], M]]:
+    """Register a decoder that builds model_cls from trusted data without validation."""
+
+    def register(decoder: Callable[[Any], M]) -> Callable[[Any], M]:
+        _trusted_decoders[model_cls] = decoder
+        return decoder
+
+    return register
+
+
+def build_model(model_cls: type[M], values: dict[str, Any], fields_set: set[str]) -> M:
+    """Build model_cls from converted values for all of its fields without validation."""
+    model = model_cls.__new__(model_cls)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def to_decimal(value: Any) -> Any:
+    """Convert API values into Decimals."""
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return value
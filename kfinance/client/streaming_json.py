@@ -0,0 +1,214 @@
+"""Incremental decoding of large JSON responses.
+
+`iter_json_items` reads a JSON document from an iterable of byte chunks (for example
+`requests.Response.iter_content`) and yields the items of one collection in the document,
+like the prices of a /pricing response, one at a time. Only the unconsumed part of the
+current chunk and the item being parsed are kept in memory, so peak memory scales with the
+chunk and item size instead of the size of the response.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Sequence
+
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Matches any key of an object in a path passed to iter_json_items.
+WILDCARD = "*"
+
+_WHITESPACE = " \t\n\r"
+# Characters that can continue a number, for example "1." or "1e" at the end of a chunk.
+_NUMBER_CONTINUATIONS = "0123456789.eE+-"
+
+
+class _JsonStreamReader:
+    """A buffer over a stream of byte chunks with primitives to parse JSON incrementally."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_length: int) -> bool:
+        """Read chunks until at least min_length unconsumed characters are buffered.
+
+        Consumed characters get dropped from the buffer. Returns False if the stream ended
+        before any new characters could be read.
+        """
+        parts = [self._buffer[self._pos :]]
+        length = len(parts[0])
+        read_any = False
+        while length < min_length and not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                text = self._utf8_decoder.decode(b"", final=True)
+            else:
+                text = self._utf8_decoder.decode(chunk)
+            if text:
+                parts.append(text)
+                length += len(text)
+                read_any = True
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return read_any
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end of the stream)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(1):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume char (after whitespace) or raise a ValueError."""
+        next_char = self.peek()
+        if next_char != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, got {next_char or 'EOF'!r}.")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """Parse and return the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number at the end of the buffer or before a character that continues
+                # it (like "1." or "1e") may continue in the next chunk.
+                if self._eof or (
+                    end < len(self._buffer) and self._buffer[end] not in _NUMBER_CONTINUATIONS
+                ):
+                    self._pos = end
+                    return value
+            # Grow the buffer geometrically so that large values get parsed in O(n) retries.
+            unconsumed = len(self._buffer) - self._pos
+            self._fill(max(2 * unconsumed, unconsumed + 1))
+
+    def read_key(self) -> str:
+        """Parse an object key including the following colon."""
+        key = self.read_value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected an object key in JSON stream, got {key!r}.")
+        self.expect(":")
+        return key
+
+    def next_member(self, closing: str) -> bool:
+        """Consume the separator after a member. Return False at the end of the container."""
+        next_char = self.peek()
+        self._pos += 1
+        if next_char == ",":
+            return True
+        if next_char == closing:
+            return False
+        raise ValueError(f"Expected ',' or {closing!r} in JSON stream, got {next_char or 'EOF'!r}.")
+
+    def is_empty_container(self, closing: str) -> bool:
+        """Consume closing and return True if the container that was just opened is empty."""
+        if self.peek() == closing:
+            self._pos += 1
+            return True
+        return False
+
+
+def _iter_collection(
+    reader: _JsonStreamReader, keys: tuple[str | int, ...], skeleton: dict, key: str
+) -> Iterator[tuple[tuple[str | int, ...], Any]]:
+    """Yield the items of the array or object that starts at the current position."""
+    opening = reader.peek()
+    if opening == "[":
+        skeleton[key] = []
+        reader.expect("[")
+        if reader.is_empty_container("]"):
+            return
+        index = 0
+        while True:
+            yield (*keys, index), reader.read_value()
+            index += 1
+            if not reader.next_member("]"):
+                return
+    elif opening == "{":
+        skeleton[key] = {}
+        reader.expect("{")
+        if reader.is_empty_container("}"):
+            return
+        while True:
+            member_key = reader.read_key()
+            yield (*keys, member_key), reader.read_value()
+            if not reader.next_member("}"):
+                return
+    else:
+        # For example "result": null
+        skeleton[key] = reader.read_value()
+
+
+def _iter_object(
+    reader: _JsonStreamReader,
+    path: Sequence[str],
+    keys: tuple[str | int, ...],
+    skeleton: dict,
+) -> Iterator[tuple[tuple[str | int, ...], Any]]:
+    """Walk the object at the current position along path."""
+    reader.expect("{")
+    if reader.is_empty_container("}"):
+        return
+    head, rest = path[0], path[1:]
+    while True:
+        key = reader.read_key()
+        if head not in (WILDCARD, key):
+            skeleton[key] = reader.read_value()
+        elif not rest:
+            yield from _iter_collection(reader, (*keys, key), skeleton, key)
+        elif reader.peek() == "{":
+            child_skeleton = skeleton[key] = {}
+            yield from _iter_object(reader, rest, (*keys, key), child_skeleton)
+        else:
+            skeleton[key] = reader.read_value()
+        if not reader.next_member("}"):
+            return
+
+
+def iter_json_items(
+    chunks: Iterable[bytes],
+    path: Sequence[str],
+    skeleton: dict | None = None,
+) -> Iterator[tuple[tuple[str | int, ...], Any]]:
+    """Yield the items of the collection at path in a JSON document streamed as chunks.
+
+    Each item gets yielded as (keys, item). keys contains the object keys along the path
+    (which is how matches of WILDCARD can be told apart) followed by the index of the item
+    for arrays or its key for objects.
+
+    Example: For the /statements/ response
+        {"results": {"21719": {"currency": "USD", "periods": {"CY2020": {...}}}}, "errors": {}}
+    the path ("results", WILDCARD, "periods") yields
+        (("results", "21719", "periods", "CY2020"), {...})
+
+    :param chunks: The bytes of a JSON object, split into chunks of any size
+    :type chunks: Iterable[bytes]
+    :param path: The keys of the objects that contain the collection. Use WILDCARD to
+        match any key.
+    :type path: Sequence[str]
+    :param skeleton: If passed, all values that are not on the path get stored in
+        skeleton, which then mirrors the document without the streamed items. For the
+        example above, it becomes
+        {"results": {"21719": {"currency": "USD", "periods": {}}}, "errors": {}}.
+        It is complete once the iterator is exhausted.
+    :type skeleton: dict, optional
+    """
+    if not path:
+        raise ValueError("path must contain at least one key.")
+    reader = _JsonStreamReader(chunks)
+    yield from _iter_object(reader, path, (), {} if skeleton is None else skeleton)
+    if reader.peek() != "":
+        raise ValueError("Unexpected data after the end of the JSON document.")
@@ -0,0 +1,416 @@
+import httpx
+import pandas as pd
+import pytest
+from pytest_httpx import HTTPXMock
+
+from kfinance.client.async_kfinance import (
+    AsyncClient,
+    AsyncCompanies,
+    AsyncCompany,
+    AsyncSecurity,
+    AsyncTicker,
+)
+from kfinance.client.dataframe_builders import ValueDtype, build_line_item_df, build_statement_df
+from kfinance.client.kfinance import Client
+from kfinance.client.models.numeric import NumericMode
+from kfinance.conftest import SPGI_ID_TRIPLE
+from kfinance.domains.capitalizations.capitalization_models import (
+    Capitalization,
+    Capitalizations,
+)
+from kfinance.domains.line_items.line_item_models import LineItemResp
+from kfinance.domains.prices.price_models import HistoryMetadataResp, PriceHistory
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+STATEMENT_RESP = {
+    "currency": "USD",
+    "periods": {
+        "CY2020": {
+            "period_end_date": "2020-12-31",
+            "num_months": 12,
+            "statements": [
+                {
+                    "name": "Income Statement",
+                    "line_items": [
+                        {"name": "Revenues", "value": "7442000000.000000", "sources": []},
+                    ],
+                }
+            ],
+        },
+    },
+}
+
+LINE_ITEM_RESP = {
+    "currency": "USD",
+    "periods": {
+        "CY2020": {
+            "period_end_date": "2020-12-31",
+            "num_months": 12,
+            "line_item": {"name": "revenue", "value": "7442000000.000000", "sources": []},
+        },
+    },
+}
+
+CAPITALIZATIONS_RESP = {
+    "currency": "USD",
+    "market_caps": [
+        {
+            "date": "2024-06-03",
+            "market_cap": "140000000000.000000",
+            "tev": "150000000000.000000",
+            "shares_outstanding": 312900000,
+        }
+    ],
+}
+
+PRICE_HISTORY_RESP = {
+    "currency": "USD",
+    "prices": [
+        {
+            "date": "2024-06-03",
+            "open": "100.00",
+            "high": "110.00",
+            "low": "95.00",
+            "close": "105.00",
+            "volume": "1000",
+        }
+    ],
+}
+
+
+class TestAsyncCompany:
+    @pytest.mark.asyncio
+    async def test_info_is_cached(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncCompany
+        WHEN info and name get awaited
+        THEN the info endpoint only gets called once and the name gets extracted from the info
+        """
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_ID_TRIPLE.company_id}",
+            json={"name": "S&P Global Inc."},
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        assert await company.info() == {"name": "S&P Global Inc."}
+        assert await company.name() == "S&P Global Inc."
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_income_statement(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncCompany
+        WHEN the income statement gets awaited
+        THEN the returned DataFrame matches the DataFrame built by the sync object API
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/statements/",
+            json={"results": {str(SPGI_ID_TRIPLE.company_id): STATEMENT_RESP}, "errors": {}},
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        expected = build_statement_df(StatementsResp.model_validate(STATEMENT_RESP))
+        pd.testing.assert_frame_equal(await company.income_statement(), expected)
+
+    @pytest.mark.asyncio
+    async def test_statement_follows_numeric_mode(self, mock_client: Client, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncCompany of a client with numeric="float"
+        WHEN the income statement gets awaited without a value dtype
+        THEN the values are float64 like in the sync object API
+        """
+        mock_client.kfinance_api_client.numeric = NumericMode.float
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/statements/",
+            json={"results": {str(SPGI_ID_TRIPLE.company_id): STATEMENT_RESP}, "errors": {}},
+        )
+        company = mock_client.async_client.company(SPGI_ID_TRIPLE.company_id)
+        expected = build_statement_df(
+            StatementsResp.model_validate(STATEMENT_RESP), value_dtype=ValueDtype.float64
+        )
+        pd.testing.assert_frame_equal(await company.income_statement(), expected)
+
+    @pytest.mark.asyncio
+    async def test_summary_and_description(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ):
+        """
+        GIVEN an AsyncCompany
+        WHEN summary and description get awaited
+        THEN the descriptions endpoint only gets called once
+        """
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_ID_TRIPLE.company_id}/descriptions",
+            json={"summary": "Short summary.", "description": "Long description."},
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        assert await company.summary() == "Short summary."
+        assert await company.description() == "Long description."
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_line_item(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncCompany
+        WHEN a line item gets awaited
+        THEN the returned DataFrame matches the DataFrame built by the sync object API
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/line_item/",
+            match_json={
+                "company_ids": [SPGI_ID_TRIPLE.company_id],
+                "line_item": "revenue",
+                "start_year": 2020,
+            },
+            json={"results": {str(SPGI_ID_TRIPLE.company_id): LINE_ITEM_RESP}, "errors": {}},
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        expected = build_line_item_df(LineItemResp.model_validate(LINE_ITEM_RESP), "revenue")
+        pd.testing.assert_frame_equal(
+            await company.line_item(line_item="revenue", start_year=2020), expected
+        )
+
+    @pytest.mark.asyncio
+    async def test_line_item_without_results(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ):
+        """
+        GIVEN an AsyncCompany
+        WHEN a line item without results gets awaited
+        THEN an empty DataFrame gets returned
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/line_item/",
+            json={"results": {}, "errors": {str(SPGI_ID_TRIPLE.company_id): "No result found."}},
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        assert (await company.line_item(line_item="revenue")).empty
+
+    @pytest.mark.asyncio
+    async def test_capitalizations(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncCompany
+        WHEN the capitalizations, market cap, tev, and shares outstanding get awaited
+        THEN they match the capitalizations response and its single metric dumps
+        """
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/market_cap/{SPGI_ID_TRIPLE.company_id}/2024-06-01/2024-06-05",
+            json=CAPITALIZATIONS_RESP,
+            is_reusable=True,
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        expected = Capitalizations.model_validate(CAPITALIZATIONS_RESP)
+        dates = {"start_date": "2024-06-01", "end_date": "2024-06-05"}
+
+        assert await company.capitalizations(**dates) == expected
+        assert await company.market_cap(**dates) == expected.model_dump_json_single_metric(
+            Capitalization.market_cap
+        )
+        assert await company.tev(**dates) == expected.model_dump_json_single_metric(
+            Capitalization.tev
+        )
+        assert await company.shares_outstanding(**dates) == expected.model_dump_json_single_metric(
+            Capitalization.shares_outstanding
+        )
+        assert await company.market_cap(**dates) == [
+            {"date": "2024-06-03", "market_cap": {"value": "140000000000.00", "unit": "USD"}}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_primary_security(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncCompany
+        WHEN the primary security gets awaited twice
+        THEN the primary security gets fetched once and returned as AsyncSecurity
+        """
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/securities/{SPGI_ID_TRIPLE.company_id}/primary",
+            json={"primary_security": SPGI_ID_TRIPLE.security_id},
+        )
+        company = AsyncCompany(httpx_client=httpx_client, company_id=SPGI_ID_TRIPLE.company_id)
+        security = await company.primary_security()
+        assert isinstance(security, AsyncSecurity)
+        assert security.security_id == SPGI_ID_TRIPLE.security_id
+        assert await company.primary_security() is security
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestAsyncSecurity:
+    @pytest.mark.asyncio
+    async def test_isin_and_cusip(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncSecurity
+        WHEN the isin and cusip get awaited twice
+        THEN each gets fetched once
+        """
+        security_id = SPGI_ID_TRIPLE.security_id
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/isin/{security_id}",
+            json={"isin": "US78409V1044"},
+        )
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/cusip/{security_id}",
+            json={"cusip": "78409V104"},
+        )
+        security = AsyncSecurity(httpx_client=httpx_client, security_id=security_id)
+        for _ in range(2):
+            assert await security.isin() == "US78409V1044"
+            assert await security.cusip() == "78409V104"
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_primary_trading_item(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ):
+        """
+        GIVEN an AsyncSecurity
+        WHEN the primary trading item and its history get awaited
+        THEN the primary trading item gets resolved and its history gets returned
+        """
+        security_id = SPGI_ID_TRIPLE.security_id
+        trading_item_id = SPGI_ID_TRIPLE.trading_item_id
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/trading_items/{security_id}/primary",
+            json={"primary_trading_item": trading_item_id},
+        )
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/pricing/{trading_item_id}/2024-06-01/2024-06-05/day/adjusted",
+            json=PRICE_HISTORY_RESP,
+        )
+        security = AsyncSecurity(httpx_client=httpx_client, security_id=security_id)
+        trading_item = await security.primary_trading_item()
+        assert trading_item.trading_item_id == trading_item_id
+        assert await security.primary_trading_item() is trading_item
+        history = await trading_item.history(start_date="2024-06-01", end_date="2024-06-05")
+        assert history == PriceHistory.model_validate(PRICE_HISTORY_RESP)
+
+
+class TestAsyncTradingItem:
+    @pytest.mark.asyncio
+    async def test_history_follows_numeric_mode(self, mock_client: Client, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncTradingItem of a client with numeric="float"
+        WHEN history gets awaited
+        THEN the prices are floats like in the sync object API
+        """
+        mock_client.kfinance_api_client.numeric = NumericMode.float
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/pricing/{SPGI_ID_TRIPLE.trading_item_id}/2024-06-01/2024-06-05/day/adjusted",
+            json=PRICE_HISTORY_RESP,
+        )
+        trading_item = mock_client.async_client.trading_item(SPGI_ID_TRIPLE.trading_item_id)
+        history = await trading_item.history(start_date="2024-06-01", end_date="2024-06-05")
+        assert history.prices[0].open.value == 100.0
+        assert isinstance(history.prices[0].open.value, float)
+
+
+class TestAsyncTicker:
+    @pytest.mark.asyncio
+    async def test_history(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN an AsyncTicker for SPGI
+        WHEN history gets awaited
+        THEN the ticker gets resolved to its primary trading item and the history gets returned
+        """
+        httpx_mock.add_response(
+            url="https://kfinance.kensho.com/api/v1/id/SPGI",
+            json=SPGI_ID_TRIPLE.model_dump(mode="json"),
+        )
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/pricing/{SPGI_ID_TRIPLE.trading_item_id}/2024-06-01/2024-06-05/day/adjusted",
+            json=PRICE_HISTORY_RESP,
+        )
+        ticker = AsyncTicker(httpx_client=httpx_client, identifier="SPGI")
+        history = await ticker.history(start_date="2024-06-01", end_date="2024-06-05")
+        assert history == PriceHistory.model_validate(PRICE_HISTORY_RESP)
+
+    @pytest.mark.asyncio
+    async def test_company_and_history_metadata(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ):
+        """
+        GIVEN an AsyncTicker for SPGI
+        WHEN its company and history metadata get awaited
+        THEN the ticker gets resolved once and the company and metadata get returned
+        """
+        httpx_mock.add_response(
+            url="https://kfinance.kensho.com/api/v1/id/SPGI",
+            json=SPGI_ID_TRIPLE.model_dump(mode="json"),
+        )
+        metadata_resp = {
+            "currency": "USD",
+            "exchange_name": "NYSE",
+            "first_trade_date": "1968-01-02",
+            "instrument_type": "Equity",
+            "symbol": "SPGI",
+        }
+        httpx_mock.add_response(
+            url=f"https://kfinance.kensho.com/api/v1/pricing/{SPGI_ID_TRIPLE.trading_item_id}/metadata",
+            json=metadata_resp,
+        )
+        ticker = AsyncTicker(httpx_client=httpx_client, identifier="SPGI")
+        company = await ticker.company()
+        assert company.company_id == SPGI_ID_TRIPLE.company_id
+        assert await ticker.company() is company
+        assert await ticker.history_metadata() == HistoryMetadataResp.model_validate(metadata_resp)
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_requires_identifier_or_id_triple(self, httpx_client: httpx.AsyncClient):
+        """
+        WHEN an AsyncTicker gets initialized without identifier or id triple
+        THEN a RuntimeError gets raised
+        """
+        with pytest.raises(RuntimeError, match="Neither an identifier"):
+            AsyncTicker(httpx_client=httpx_client)
+
+
+class TestAsyncCompanies:
+    @pytest.mark.asyncio
+    async def test_group_fan_out(self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock):
+        """
+        GIVEN AsyncCompanies with two companies, one of which does not exist
+        WHEN info gets awaited on the group
+        THEN the result maps each company to its info and the missing company to None
+        """
+        httpx_mock.add_response(
+            url="https://kfinance.kensho.com/api/v1/info/1", json={"name": "Company 1"}
+        )
+        httpx_mock.add_response(url="https://kfinance.kensho.com/api/v1/info/2", status_code=404)
+        companies = AsyncCompanies(httpx_client=httpx_client, company_ids=[1, 2])
+        result = await companies.info()
+        assert {company.company_id: info for company, info in result.items()} == {
+            1: {"name": "Company 1"},
+            2: None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_request_headers(self, mock_client: Client, httpx_mock: HTTPXMock):
+        """
+        GIVEN AsyncCompanies with two companies
+        WHEN info gets awaited on the group
+        THEN both requests include the same Kfinance-Batch-Id and a Kfinance-Batch-Size of 2
+        """
+        httpx_mock.add_response(json={"name": "Company"}, is_reusable=True)
+        companies = mock_client.async_client.companies(company_ids=[1, 2])
+        await companies.info()
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 2
+        assert len({request.headers["Kfinance-Batch-Id"] for request in requests}) == 1
+        assert all(request.headers["Kfinance-Batch-Size"] == "2" for request in requests)
+
+
+class TestAsyncClient:
+    def test_async_client_shares_httpx_client(self, mock_client: Client):
+        """
+        GIVEN a Client
+        WHEN the async client gets accessed
+        THEN the async client gets cached and shares the httpx client of the Client
+        """
+        async_client = mock_client.async_client
+        assert isinstance(async_client, AsyncClient)
+        assert async_client is mock_client.async_client
+        assert async_client.company(1).httpx_client is mock_client.httpx_client
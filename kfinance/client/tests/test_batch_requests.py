@@ -1,5 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+import threading
 import time
 from typing import Any, Dict
 from unittest import TestCase
@@ -9,8 +10,14 @@ import pytest
 import requests
 import requests_mock
 
-from kfinance.client.batch_request_handling import MAX_WORKERS_CAP
-from kfinance.client.fetch import KFinanceApiClient
+from kfinance.client.batch_request_handling import (
+    MAX_WORKERS_CAP,
+    Task,
+    iter_tasks_as_completed,
+    process_tasks_in_thread_pool_executor,
+    process_tasks_with_partial_results,
+)
+from kfinance.client.fetch import KFinanceApiClient, get_batch_request_headers
 from kfinance.client.kfinance import Companies, Company, Ticker, TradingItem, TradingItems
 from kfinance.client.models.decimal_with_unit import Money, Shares
 from kfinance.domains.prices.price_models import PriceHistory, Prices
@@ -293,3 +300,333 @@ class TestTradingItem(TestCase):
         # In practice, the requests should take barely more than the `sleep_duration` but timing
         # based tests can be flaky, especially in CI.
         assert end - start < MAX_WORKERS_CAP * sleep_duration
+
+
+class TestStreaming(TestCase):
+    def setUp(self):
+        self.kfinance_api_client = KFinanceApiClient(
+            refresh_token="fake_refresh_token", thread_pool=ThreadPoolExecutor(4)
+        )
+
+    @requests_mock.Mocker()
+    def test_stream_property(self, m):
+        """GIVEN a kfinance group object like Companies
+        WHEN we stream a property for each object in the group
+        THEN we get back (company, value) tuples with None for 404s and the
+        exception for other errors."""
+
+        m.get("https://kfinance.kensho.com/api/v1/info/1001", json={"city": "Mock City A"})
+        m.get("https://kfinance.kensho.com/api/v1/info/1002", status_code=404)
+        m.get("https://kfinance.kensho.com/api/v1/info/1003", status_code=500)
+
+        companies = Companies(self.kfinance_api_client, [1001, 1002, 1003])
+        result = {company.company_id: city for company, city in companies.stream("city")}
+
+        assert result[1001] == "Mock City A"
+        assert result[1002] is None
+        assert isinstance(result[1003], requests.exceptions.HTTPError)
+        assert result[1003].response.status_code == 500
+
+    def test_results_yielded_in_completion_order(self):
+        """GIVEN a slow and a fast task
+        WHEN the tasks get streamed
+        THEN the fast task gets yielded before the slow task completes."""
+
+        slow_task_release = threading.Event()
+
+        def slow() -> str:
+            slow_task_release.wait(timeout=5)
+            return "slow"
+
+        stream = iter_tasks_as_completed(
+            api_client=self.kfinance_api_client,
+            tasks=[
+                Task(func=slow, result_key="slow"),
+                Task(func=lambda: "fast", result_key="fast"),
+            ],
+            batch_size=2,
+        )
+        assert next(stream) == ("fast", "fast")
+        slow_task_release.set()
+        assert next(stream) == ("slow", "slow")
+        assert next(stream, None) is None
+
+    def test_early_termination_cancels_queued_work(self):
+        """GIVEN more tasks than the in-flight window
+        WHEN the consumer stops after the first result
+        THEN queued tasks get cancelled and tasks outside the window never get submitted."""
+
+        executed: list[int] = []
+        lock = threading.Lock()
+
+        def record(i: int) -> int:
+            time.sleep(0.01)
+            with lock:
+                executed.append(i)
+            return i
+
+        submitted: list[int] = []
+
+        def tasks():
+            for i in range(100):
+                submitted.append(i)
+                yield Task(func=record, args=(i,), result_key=i)
+
+        stream = iter_tasks_as_completed(
+            api_client=self.kfinance_api_client, tasks=tasks(), batch_size=100, max_in_flight=2
+        )
+        next(stream)
+        stream.close()
+        self.kfinance_api_client.thread_pool.shutdown(wait=True)
+
+        # Only the in-flight window was ever pulled from the task generator.
+        assert len(submitted) == 2
+        assert len(executed) <= len(submitted)
+
+
+class TestPartialResults(TestCase):
+    def setUp(self):
+        self.kfinance_api_client = KFinanceApiClient(
+            refresh_token="fake_refresh_token", thread_pool=ThreadPoolExecutor(1)
+        )
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def block(self) -> str:
+        """Block until the test releases the task."""
+        self.release.wait(timeout=5)
+        return "blocked"
+
+    def test_deadline_reports_unfinished_tasks(self):
+        """GIVEN a fast task and two tasks that block longer than the deadline
+        WHEN the tasks get processed with a timeout
+        THEN the fast result is returned and the other tasks are reported as unfinished."""
+
+        batch_result = process_tasks_with_partial_results(
+            api_client=self.kfinance_api_client,
+            tasks=[
+                Task(func=lambda: "fast", result_key="fast"),
+                Task(func=self.block, result_key="running"),
+                Task(func=self.block, result_key="queued"),
+            ],
+            timeout=0.1,
+        )
+        assert batch_result.results == {"fast": "fast"}
+        assert batch_result.errors == {}
+        assert batch_result.unfinished == ["running", "queued"]
+        assert not batch_result.complete
+
+    def test_fatal_error_cancels_queued_tasks(self):
+        """GIVEN a task that fails with a ValueError followed by a queued task
+        WHEN the tasks get processed without keep_going
+        THEN the error is returned and the queued task gets cancelled."""
+
+        def fail() -> None:
+            raise ValueError("fatal")
+
+        executed = []
+        batch_result = process_tasks_with_partial_results(
+            api_client=self.kfinance_api_client,
+            tasks=[
+                Task(func=fail, result_key="fail"),
+                Task(func=self.block, result_key="block"),
+                Task(func=lambda: executed.append(1), result_key="queued"),
+            ],
+        )
+        self.release.set()
+        self.kfinance_api_client.thread_pool.shutdown(wait=True)
+
+        assert isinstance(batch_result.errors["fail"], ValueError)
+        assert "queued" in batch_result.unfinished
+        assert executed == []
+
+    def test_keep_going_collects_all_errors(self):
+        """GIVEN tasks that fail with a ValueError and a 404
+        WHEN the tasks get processed with keep_going
+        THEN all tasks run, the 404 returns None, and the ValueError is collected."""
+
+        def fail() -> None:
+            raise ValueError("fatal")
+
+        def not_found() -> None:
+            response = requests.Response()
+            response.status_code = 404
+            raise requests.exceptions.HTTPError(response=response)
+
+        batch_result = process_tasks_with_partial_results(
+            api_client=self.kfinance_api_client,
+            tasks=[
+                Task(func=fail, result_key="fail"),
+                Task(func=not_found, result_key="not_found"),
+                Task(func=lambda: "ok", result_key="ok"),
+            ],
+            keep_going=True,
+        )
+        assert batch_result.results == {"not_found": None, "ok": "ok"}
+        assert list(batch_result.errors) == ["fail"]
+        assert batch_result.unfinished == []
+
+    @requests_mock.Mocker()
+    def test_gather(self, m):
+        """GIVEN a kfinance group object like Companies
+        WHEN we gather a property with keep_going and one request returns a 500
+        THEN the batch result contains the successful value and the typed HTTPError."""
+
+        m.get("https://kfinance.kensho.com/api/v1/info/1001", json={"city": "Mock City A"})
+        m.get("https://kfinance.kensho.com/api/v1/info/1002", status_code=500)
+
+        companies = Companies(self.kfinance_api_client, [1001, 1002])
+        batch_result = companies.gather("city", keep_going=True)
+
+        assert {c.company_id: city for c, city in batch_result.results.items()} == {
+            1001: "Mock City A"
+        }
+        assert [c.company_id for c in batch_result.errors] == [1002]
+        assert isinstance(next(iter(batch_result.errors.values())), requests.exceptions.HTTPError)
+
+    def test_concurrent_batches_keep_their_own_headers(self):
+        """GIVEN two threads running group calls on the same client at the same time
+        WHEN the batches get processed
+        THEN each request carries the batch id and batch size of its own batch."""
+
+        batch_headers_by_company_id: dict[int, tuple[str, str]] = {}
+        lock = threading.Lock()
+
+        def info_callback(request, context) -> dict:
+            time.sleep(0.01)
+            company_id = int(request.path.rsplit("/", 1)[-1])
+            with lock:
+                batch_headers_by_company_id[company_id] = (
+                    request.headers["Kfinance-Batch-Id"],
+                    request.headers["Kfinance-Batch-Size"],
+                )
+            return {"city": "Mock City"}
+
+        batch_a = list(range(1, 9))
+        batch_b = list(range(101, 104))
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, json=info_callback)
+            threads = [
+                threading.Thread(
+                    target=lambda ids=ids: Companies(self.kfinance_api_client, ids).city
+                )
+                for ids in (batch_a, batch_b)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        headers_a = {batch_headers_by_company_id[company_id] for company_id in batch_a}
+        headers_b = {batch_headers_by_company_id[company_id] for company_id in batch_b}
+        assert len(headers_a) == 1 and len(headers_b) == 1
+        (batch_id_a, batch_size_a), (batch_id_b, batch_size_b) = headers_a.pop(), headers_b.pop()
+        assert batch_id_a != batch_id_b
+        assert (batch_size_a, batch_size_b) == ("8", "3")
+
+
+class TestNestedBatches(TestCase):
+    def setUp(self):
+        self.kfinance_api_client = KFinanceApiClient(
+            refresh_token="fake_refresh_token", thread_pool=ThreadPoolExecutor(MAX_WORKERS_CAP)
+        )
+
+    def run_with_deadlock_timeout(self, func, timeout: float = 10) -> Any:
+        """Run func in a separate thread and fail if it does not finish within the timeout."""
+        result: dict[str, Any] = {}
+        thread = threading.Thread(target=lambda: result.update(value=func()), daemon=True)
+        thread.start()
+        thread.join(timeout=timeout)
+        assert not thread.is_alive(), "nested batch deadlocked"
+        return result["value"]
+
+    def test_nested_batches_three_levels_deep_under_full_load(self):
+        """GIVEN more top level tasks than workers, each starting a nested batch of
+        MAX_WORKERS_CAP tasks, which each start another nested batch
+        WHEN the batch gets processed
+        THEN it completes without deadlocking, never runs more than MAX_WORKERS_CAP
+        tasks concurrently, and keeps the batch header of the top level batch."""
+
+        running = 0
+        max_running = 0
+        lock = threading.Lock()
+        batch_ids = set()
+
+        def level_3(i: int) -> int:
+            batch_ids.add(get_batch_request_headers().get("Kfinance-Batch-Id"))
+            return i
+
+        def level_2(i: int) -> int:
+            results = process_tasks_in_thread_pool_executor(
+                api_client=self.kfinance_api_client,
+                tasks=[Task(func=level_3, args=(j,), result_key=j) for j in range(MAX_WORKERS_CAP)],
+            )
+            return sum(results.values())
+
+        def level_1(i: int) -> int:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            try:
+                results = dict(
+                    iter_tasks_as_completed(
+                        api_client=self.kfinance_api_client,
+                        tasks=[
+                            Task(func=level_2, args=(j,), result_key=j)
+                            for j in range(MAX_WORKERS_CAP)
+                        ],
+                        batch_size=MAX_WORKERS_CAP,
+                    )
+                )
+                return sum(results.values())
+            finally:
+                with lock:
+                    running -= 1
+
+        num_tasks = MAX_WORKERS_CAP * 3
+        result = self.run_with_deadlock_timeout(
+            lambda: process_tasks_in_thread_pool_executor(
+                api_client=self.kfinance_api_client,
+                tasks=[Task(func=level_1, args=(i,), result_key=i) for i in range(num_tasks)],
+            )
+        )
+
+        expected_sum_per_level_1_task = MAX_WORKERS_CAP * sum(range(MAX_WORKERS_CAP))
+        assert result == {i: expected_sum_per_level_1_task for i in range(num_tasks)}
+        assert max_running <= MAX_WORKERS_CAP
+        assert len(batch_ids) == 1 and None not in batch_ids
+
+    @requests_mock.Mocker()
+    def test_nested_group_access(self, m):
+        """GIVEN a Companies group
+        WHEN a group property of each company's Securities gets accessed inside a
+        Companies batch
+        THEN the nested group access completes without deadlocking."""
+
+        m.get(requests_mock.ANY, json={"isin": "US0000000000"})
+        for company_id in range(MAX_WORKERS_CAP * 2):
+            m.get(
+                f"https://kfinance.kensho.com/api/v1/securities/{company_id}",
+                json={"securities": [company_id * 10, company_id * 10 + 1]},
+            )
+
+        companies = Companies(self.kfinance_api_client, range(MAX_WORKERS_CAP * 2))
+
+        def nested_isins(company: Company) -> dict:
+            return company.securities.isin
+
+        result = self.run_with_deadlock_timeout(
+            lambda: process_tasks_in_thread_pool_executor(
+                api_client=self.kfinance_api_client,
+                tasks=[
+                    Task(func=nested_isins, args=(company,), result_key=company.company_id)
+                    for company in companies
+                ],
+            )
+        )
+        assert len(result) == MAX_WORKERS_CAP * 2
+        assert all(list(isins.values()) == ["US0000000000"] * 2 for isins in result.values())
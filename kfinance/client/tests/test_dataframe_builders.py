@@ -0,0 +1,172 @@
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kfinance.client.dataframe_builders import (
+    ValueDtype,
+    build_estimates_df,
+    build_line_item_df,
+    build_statement_df,
+)
+from kfinance.domains.estimates.estimates_models import CiqEstimates
+from kfinance.domains.line_items.line_item_models import LineItemResp
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+STATEMENTS_RESP = StatementsResp.model_validate(
+    {
+        "currency": "USD",
+        "periods": {
+            "CY2019": {
+                "period_end_date": "2019-12-31",
+                "num_months": 12,
+                "statements": [
+                    {
+                        "name": "Income Statement",
+                        "line_items": [
+                            {"name": "Revenues", "value": "6699000000.000000"},
+                            {"name": "Other Revenues", "value": None},
+                        ],
+                    }
+                ],
+            },
+            "CY2020": {
+                "period_end_date": "2020-12-31",
+                "num_months": 12,
+                "statements": [
+                    {
+                        "name": "Income Statement",
+                        "line_items": [
+                            {"name": "Revenues", "value": "7442000000.000000"},
+                            {"name": "Net Income", "value": "2339000000.000000"},
+                        ],
+                    }
+                ],
+            },
+        },
+    }
+)
+
+LINE_ITEM_RESP = LineItemResp.model_validate(
+    {
+        "currency": "USD",
+        "periods": {
+            "CY2019": {
+                "period_end_date": "2019-12-31",
+                "num_months": 12,
+                "line_item": {"name": "revenue", "value": "6699000000.000000"},
+            },
+            "CY2020": {
+                "period_end_date": "2020-12-31",
+                "num_months": 12,
+                "line_item": {"name": "revenue", "value": None},
+            },
+        },
+    }
+)
+
+ESTIMATES = CiqEstimates.model_validate(
+    {
+        "estimate_type": "consensus",
+        "period_type": "annual",
+        "periods": {
+            "FY2026": {
+                "period_end_date": "2026-12-31",
+                "estimates": [
+                    {
+                        "name": "EPS Consensus High",
+                        "value": "14.0",
+                        "currency": "EUR",
+                        "ticker_or_company": "Company Level",
+                    },
+                    {
+                        "name": "EPS Consensus High",
+                        "value": "114.5",
+                        "currency": "USD",
+                        "ticker_or_company": "ENXTAM: ASM",
+                    },
+                ],
+            },
+        },
+    }
+)
+
+
+class TestBuildStatementDf:
+    def test_float64(self) -> None:
+        """
+        GIVEN a statements response with a missing value and a line item only in one period
+        WHEN the statement DataFrame gets built with float64 values
+        THEN all columns are float64, missing values are NaN, and the values match the default
+        """
+        df = build_statement_df(STATEMENTS_RESP, value_dtype=ValueDtype.float64)
+        assert (df.dtypes == np.float64).all()
+        assert list(df.index) == ["Revenues", "Other Revenues", "Net Income"]
+        assert list(df.columns) == ["CY2019", "CY2020"]
+        assert np.isnan(df.loc["Other Revenues", "CY2019"])
+        pd.testing.assert_frame_equal(
+            df, build_statement_df(STATEMENTS_RESP).astype(np.float64), check_index_type=False
+        )
+
+    def test_nullable_float64(self) -> None:
+        """
+        GIVEN a statements response with missing values
+        WHEN the statement DataFrame gets built with nullable Float64 values
+        THEN missing values are pd.NA
+        """
+        df = build_statement_df(STATEMENTS_RESP, value_dtype=ValueDtype.Float64)
+        assert (df.dtypes == "Float64").all()
+        assert df.loc["Net Income", "CY2019"] is pd.NA
+        assert df.loc["Net Income", "CY2020"] == 2339000000.0
+
+    def test_decimal(self) -> None:
+        """
+        GIVEN a statements response
+        WHEN the statement DataFrame gets built with decimal values
+        THEN the Decimals of the response are kept
+        """
+        df = build_statement_df(STATEMENTS_RESP, value_dtype=ValueDtype.decimal)
+        assert df.loc["Revenues", "CY2020"] == Decimal("7442000000.000000")
+        assert isinstance(df.loc["Revenues", "CY2020"], Decimal)
+        assert df.loc["Other Revenues", "CY2020"] is None
+
+
+class TestBuildLineItemDf:
+    @pytest.mark.parametrize("value_dtype", [ValueDtype.float64, ValueDtype.Float64])
+    def test_line_item(self, value_dtype: ValueDtype) -> None:
+        """
+        GIVEN a line item response
+        WHEN the line item DataFrame gets built with float values
+        THEN the DataFrame has a single row indexed by the line item name
+        """
+        df = build_line_item_df(LINE_ITEM_RESP, line_item="revenue", value_dtype=value_dtype)
+        assert list(df.index) == ["revenue"]
+        assert (df.dtypes == str(value_dtype)).all()
+        assert df.loc["revenue", "CY2019"] == 6699000000.0
+        assert pd.isna(df.loc["revenue", "CY2020"])
+
+
+class TestBuildEstimatesDf:
+    def test_float64(self) -> None:
+        """
+        GIVEN estimates for two tickers
+        WHEN the estimates DataFrame gets built with float64 values
+        THEN the DataFrame has a (ticker_or_company, name) MultiIndex and matches the default
+        """
+        df = build_estimates_df(ESTIMATES, value_dtype=ValueDtype.float64)
+        assert df.index.names == ["ticker_or_company", "name"]
+        assert df.loc[("ENXTAM: ASM", "EPS Consensus High"), "FY2026"] == 114.5
+        pd.testing.assert_frame_equal(df, build_estimates_df(ESTIMATES).astype(np.float64))
+
+    def test_empty(self) -> None:
+        """
+        GIVEN estimates without periods
+        WHEN the estimates DataFrame gets built with float64 values
+        THEN the DataFrame is empty and keeps the MultiIndex names
+        """
+        estimates = CiqEstimates(estimate_type="consensus", period_type="annual", periods={})
+        df = build_estimates_df(estimates, value_dtype=ValueDtype.float64)
+        assert df.empty
+        assert df.index.names == ["ticker_or_company", "name"]
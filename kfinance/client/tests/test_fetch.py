@@ -91,6 +91,18 @@ class TestFetchItem(TestCase):
             )
         self.kfinance_api_client.fetch.assert_called_with(expected_fetch_url)
 
+    def test_fetch_history_columns(self) -> None:
+        trading_item_id = 2629108
+        expected_fetch_url = f"{self.kfinance_api_client.url_base}pricing/{trading_item_id}/2025-01-01/2025-01-31/day/adjusted"
+        self.kfinance_api_client.fetch.return_value = {"currency": "USD", "prices": []}
+        self.kfinance_api_client.fetch_history_columns(
+            trading_item_id=trading_item_id,
+            start_date="2025-01-01",
+            end_date="2025-01-31",
+            periodicity=Periodicity.day,
+        )
+        self.kfinance_api_client.fetch.assert_called_with(expected_fetch_url)
+
     def test_fetch_history_metadata(self) -> None:
         trading_item_id = 2629108
         expected_fetch_url = (
@@ -477,6 +489,32 @@ class TestFetchItem(TestCase):
         self.kfinance_api_client.fetch.assert_called_with(expected_url)
         assert result == expected_result
 
+    def test_fetch_consensus_target_price_float_numeric_mode(self) -> None:
+        """
+        GIVEN a KFinanceApiClient with numeric="float"
+        WHEN the consensus target price gets fetched
+        THEN the values are floats
+        """
+        kfinance_api_client = KFinanceApiClient(refresh_token="fake_refresh_token", numeric="float")
+        kfinance_api_client.fetch = MagicMock()
+        kfinance_api_client.fetch.return_value = {
+            "results": {
+                "21719": {
+                    "currency": "USD",
+                    "effective_date": "2025-06-01",
+                    "estimates": [
+                        {"name": "Target Price Consensus Mean", "value": "520.500000"},
+                    ],
+                }
+            },
+            "errors": {},
+        }
+
+        result = kfinance_api_client.fetch_consensus_target_price(company_id=21719)
+        assert result.result is not None
+        assert result.result.estimates[0].value == 520.5
+        assert isinstance(result.result.estimates[0].value, float)
+
     def test_fetch_analyst_recommendations(self) -> None:
         company_id = 21719
         expected_url = (
@@ -760,3 +798,96 @@ class TestFetchIssuerRatings:
         assert "21719" in resp.results
         assert "21835" in resp.results
         assert resp.errors == {}
+
+
+class TestStreamingFetch:
+    def test_fetch_history_columns_stream(self, requests_mock: Mocker, mock_client: Client) -> None:
+        """
+        GIVEN a /pricing response
+        WHEN the price history gets fetched as columns with stream=True
+        THEN the result matches the non-streamed columns
+        """
+        api_client = mock_client.kfinance_api_client
+        requests_mock.get(
+            url=f"{api_client.url_base}pricing/2629108/none/none/none/adjusted",
+            json={
+                "currency": "USD",
+                "prices": [
+                    {
+                        "date": "2024-06-25",
+                        "open": None,
+                        "high": "449.240000",
+                        "low": "442.770000",
+                        "close": "448.780000",
+                        "volume": "999134",
+                    }
+                ],
+            },
+        )
+
+        streamed = api_client.fetch_history_columns(trading_item_id=2629108, stream=True)
+        expected = api_client.fetch_history_columns(trading_item_id=2629108)
+        assert streamed.currency == expected.currency == "USD"
+        assert list(streamed.dates) == list(expected.dates)
+        assert streamed.to_numpy().tobytes() == expected.to_numpy().tobytes()
+
+    def test_iter_transcript_components(self, requests_mock: Mocker, mock_client: Client) -> None:
+        """
+        GIVEN a /transcript response
+        WHEN the transcript components get streamed
+        THEN each component gets yielded as TranscriptComponent
+        """
+        api_client = mock_client.kfinance_api_client
+        components = [
+            {"person_name": "Operator", "text": "Good morning.", "component_type": "speech"},
+            {"person_name": "CEO", "text": "Thank you.", "component_type": "speech"},
+        ]
+        requests_mock.get(
+            url=f"{api_client.url_base}transcript/12345", json={"transcript": components}
+        )
+
+        streamed = list(api_client.iter_transcript_components(key_dev_id=12345))
+        assert [c.model_dump() for c in streamed] == components
+
+    def test_iter_statement_periods(self, requests_mock: Mocker, mock_client: Client) -> None:
+        """
+        GIVEN a /statements/ response for two companies
+        WHEN the statement periods get streamed
+        THEN each period gets yielded with its company id and matches the fetched statement
+        """
+        api_client = mock_client.kfinance_api_client
+        period_data = {
+            "period_end_date": "2020-12-31",
+            "num_months": 12,
+            "statements": [
+                {
+                    "name": "Income Statement",
+                    "line_items": [{"name": "Revenues", "value": "7442000000.000000"}],
+                }
+            ],
+        }
+        requests_mock.post(
+            url=f"{api_client.url_base}statements/",
+            json={
+                "results": {
+                    "21719": {"currency": "USD", "periods": {"CY2020": period_data}},
+                    "2": {"currency": "EUR", "periods": {}},
+                },
+                "errors": {},
+            },
+        )
+
+        streamed = list(
+            api_client.iter_statement_periods(
+                company_ids=[21719, 2], statement_type="income_statement", start_year=2020
+            )
+        )
+        assert requests_mock.last_request.json() == {
+            "company_ids": [21719, 2],
+            "statement_type": "income_statement",
+            "start_year": 2020,
+        }
+        fetched = api_client.fetch_statement(
+            company_ids=[21719, 2], statement_type="income_statement", start_year=2020
+        )
+        assert streamed == [("21719", "CY2020", fetched.results["21719"].periods["CY2020"])]
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from kfinance.client.id_resolution import id_resolution_scope, unified_fetch_id_triples
+from kfinance.conftest import SPGI_ID_TRIPLE
+
+
+IDS_URL = "https://kfinance.kensho.com/api/v1/ids"
+NON_EXISTENT_ERROR = (
+    "No identification triple found for the provided identifier: NON-EXISTENT of type: ticker"
+)
+
+
+@pytest.fixture
+def httpx_client() -> httpx.AsyncClient:
+    """Create an async httpx client for the kfinance api."""
+    return httpx.AsyncClient(base_url="https://kfinance.kensho.com/api/v1")
+
+
+class TestUnifiedFetchIdTriples:
+    @pytest.mark.asyncio
+    async def test_case_insensitive_repeats_get_deduplicated(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN identifiers with case-insensitive repeats
+        WHEN they get resolved outside of a resolution scope
+        THEN each identifier only gets requested and returned once
+        """
+        httpx_mock.add_response(
+            url=IDS_URL,
+            match_json={"identifiers": ["spgi", "non-existent"]},
+            json={
+                "data": {
+                    "spgi": SPGI_ID_TRIPLE.model_dump(mode="json"),
+                    "non-existent": {"error": NON_EXISTENT_ERROR},
+                }
+            },
+        )
+        resp = await unified_fetch_id_triples(
+            ["spgi", "SPGI", "non-existent", "NON-EXISTENT"], httpx_client
+        )
+        assert resp.identifiers_to_id_triples == {"spgi": SPGI_ID_TRIPLE}
+        assert resp.errors == {"non-existent": NON_EXISTENT_ERROR}
+
+    @pytest.mark.asyncio
+    async def test_parallel_calls_share_resolutions(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN parallel calls in a resolution scope with overlapping identifiers
+        WHEN the identifiers get resolved
+        THEN each identifier only gets requested once and every call gets its own response
+        """
+        httpx_mock.add_response(
+            url=IDS_URL,
+            match_json={"identifiers": ["SPGI"]},
+            json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+        )
+        httpx_mock.add_response(
+            url=IDS_URL,
+            match_json={"identifiers": ["non-existent"]},
+            json={"data": {"non-existent": {"error": NON_EXISTENT_ERROR}}},
+        )
+
+        with id_resolution_scope():
+            spgi_resp, spgi_and_non_existent_resp = await asyncio.gather(
+                unified_fetch_id_triples(["SPGI"], httpx_client),
+                unified_fetch_id_triples(["spgi", "non-existent"], httpx_client),
+            )
+            spgi_resp.filter_out_companies_without_trading_item_ids()
+            repeated_resp = await unified_fetch_id_triples(["SPGI"], httpx_client)
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert spgi_resp.identifiers_to_id_triples == {"SPGI": SPGI_ID_TRIPLE}
+        assert spgi_and_non_existent_resp.identifiers_to_id_triples == {"spgi": SPGI_ID_TRIPLE}
+        assert spgi_and_non_existent_resp.errors == {"non-existent": NON_EXISTENT_ERROR}
+        assert repeated_resp == spgi_resp
+        assert repeated_resp is not spgi_resp
+
+    @pytest.mark.asyncio
+    async def test_failed_resolutions_get_retried(
+        self, httpx_client: httpx.AsyncClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a resolution scope in which the first /ids request fails
+        WHEN the same identifier gets resolved again
+        THEN the failed request doesn't get reused
+        """
+        httpx_mock.add_response(url=IDS_URL, status_code=500)
+        httpx_mock.add_response(
+            url=IDS_URL, json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}}
+        )
+
+        with id_resolution_scope():
+            with pytest.raises(httpx.HTTPStatusError):
+                await unified_fetch_id_triples(["SPGI"], httpx_client)
+            resp = await unified_fetch_id_triples(["SPGI"], httpx_client)
+        assert resp.identifiers_to_id_triples == {"SPGI": SPGI_ID_TRIPLE}
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+
+# Modules that only get imported on first use: the Gemini SDKs for gemini_tool_descriptions,
+# PIL for price_chart, and pandas for DataFrames.
+LAZY_MODULES = ["google.genai", "langchain_google_genai", "PIL", "pandas"]
+
+
+def get_imported_lazy_modules(module: str) -> list[str]:
+    """Import a module in a new process and return the lazy modules imported with it."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print(*[m for m in {LAZY_MODULES!r} if m in sys.modules])",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+class TestImportTime:
+    # The import time budgets get checked by scripts/benchmarks/benchmark_import_time.py
+    # because wall-clock limits are flaky on shared CI runners.
+    @pytest.mark.parametrize(
+        "module", ["kfinance.client.kfinance", "kfinance.integrations.local_mcp.local_mcp"]
+    )
+    def test_lazy_modules_dont_get_imported(self, module: str) -> None:
+        """
+        GIVEN an entry point of the package
+        WHEN it gets imported in a new process
+        THEN it doesn't import the lazy modules
+        """
+        assert get_imported_lazy_modules(module) == []
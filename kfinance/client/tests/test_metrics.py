@@ -0,0 +1,252 @@
+import math
+
+from pydantic import BaseModel
+import pytest
+from pytest_httpx import HTTPXMock
+from requests import HTTPError
+from requests_mock import Mocker
+
+from kfinance.client.kfinance import Client
+from kfinance.client.models.trusted_decode import decode_response
+from kfinance.conftest import SPGI_COMPANY_ID, SPGI_ID_TRIPLE
+from kfinance.domains.companies.company_tools import GetInfoFromIdentifiers
+from kfinance.metrics import (
+    BATCH_SIZE,
+    CONCURRENCY_WAIT,
+    DECODE_DURATION,
+    HTTP_REQUEST_DURATION,
+    HTTP_RESPONSE_BYTES,
+    HTTP_RESPONSES,
+    TOOL_CALLS,
+    TOOL_DURATION,
+    HistogramSnapshot,
+    MetricsRegistry,
+    get_endpoint_label,
+    metrics_context,
+)
+
+
+class TestMetricsRegistry:
+    def test_snapshot(self) -> None:
+        """
+        GIVEN a registry with counter increments and histogram observations
+        WHEN a snapshot gets taken
+        THEN counters get summed per label values and histograms have cumulative buckets
+        """
+        registry = MetricsRegistry()
+        registry.increment(TOOL_CALLS, "get_prices", "ok")
+        registry.increment(TOOL_CALLS, "get_prices", "ok")
+        registry.increment(TOOL_CALLS, "get_prices", "error")
+        registry.observe(TOOL_DURATION, 0.02, "get_prices")
+        registry.observe(TOOL_DURATION, 50.0, "get_prices")
+
+        snapshot = registry.snapshot()
+        assert snapshot.get(TOOL_CALLS, tool="get_prices", outcome="ok") == 2
+        assert snapshot.get(TOOL_CALLS, tool="get_prices", outcome="error") == 1
+        assert snapshot.get(TOOL_CALLS, tool="get_info", outcome="ok") is None
+        histogram = snapshot.get(TOOL_DURATION, tool="get_prices")
+        assert isinstance(histogram, HistogramSnapshot)
+        assert histogram.count == 2
+        assert histogram.mean == pytest.approx(25.01)
+        assert histogram.buckets[1] == (0.01, 0)
+        assert histogram.buckets[2] == (0.025, 1)
+        assert histogram.buckets[-2] == (30.0, 1)
+        assert histogram.buckets[-1] == (math.inf, 2)
+
+        registry.reset()
+        assert registry.snapshot().get(TOOL_CALLS, tool="get_prices", outcome="ok") is None
+
+    def test_prometheus_and_openmetrics_export(self) -> None:
+        """
+        GIVEN a registry with a counter and a histogram observation
+        WHEN the snapshot gets exported as Prometheus text and OpenMetrics
+        THEN the samples have escaped labels and OpenMetrics names counter families without
+            the _total suffix and ends with # EOF
+        """
+        registry = MetricsRegistry()
+        registry.increment(HTTP_RESPONSES, "GET", '/info/{id}"', "200")
+        registry.observe(BATCH_SIZE, 3)
+
+        prometheus_text = registry.snapshot().to_prometheus()
+        assert "# TYPE kfinance_http_responses_total counter\n" in prometheus_text
+        assert (
+            'kfinance_http_responses_total{method="GET",endpoint="/info/{id}\\"",'
+            'status_code="200"} 1\n'
+        ) in prometheus_text
+        assert "# TYPE kfinance_batch_size histogram\n" in prometheus_text
+        assert 'kfinance_batch_size_bucket{le="2.0"} 0\n' in prometheus_text
+        assert 'kfinance_batch_size_bucket{le="5.0"} 1\n' in prometheus_text
+        assert 'kfinance_batch_size_bucket{le="+Inf"} 1\n' in prometheus_text
+        assert "kfinance_batch_size_sum 3\nkfinance_batch_size_count 1\n" in prometheus_text
+        assert "# EOF" not in prometheus_text
+
+        openmetrics_text = registry.snapshot().to_openmetrics()
+        assert "# TYPE kfinance_http_responses counter\n" in openmetrics_text
+        assert "kfinance_http_responses_total{" in openmetrics_text
+        assert openmetrics_text.endswith("# EOF\n")
+
+    @pytest.mark.parametrize(
+        "path, expected_endpoint",
+        [
+            pytest.param("/ids", "/ids", id="no parameters"),
+            pytest.param("/info/21719/names", "/info/{id}/names", id="id"),
+            pytest.param(
+                "/pricing/2629108/2024-01-01/none/day/adjusted",
+                "/pricing/{id}/{id}/none/day/adjusted",
+                id="id and date",
+            ),
+        ],
+    )
+    def test_get_endpoint_label(self, path: str, expected_endpoint: str) -> None:
+        """
+        GIVEN a request path
+        WHEN the endpoint label gets built
+        THEN ids and dates get replaced by {id}
+        """
+        assert get_endpoint_label(path) == expected_endpoint
+
+    def test_decode_time_gets_recorded_in_metrics_context(self) -> None:
+        """
+        GIVEN a decode within and outside of a metrics context
+        WHEN the metrics get requested
+        THEN only the decode within the context gets recorded per response model
+        """
+
+        class Resp(BaseModel):
+            value: int
+
+        registry = MetricsRegistry()
+        decode_response(Resp, {"value": 1})
+        with metrics_context(registry):
+            decode_response(Resp, {"value": 2})
+
+        histogram = registry.snapshot().get(DECODE_DURATION, model="Resp")
+        assert isinstance(histogram, HistogramSnapshot)
+        assert histogram.count == 1
+
+
+class TestClientMetrics:
+    def test_metrics_are_disabled_by_default(self, mock_client: Client) -> None:
+        """
+        GIVEN a client without a metrics registry
+        WHEN the metrics get requested
+        THEN a RuntimeError gets raised
+        """
+        with pytest.raises(RuntimeError, match="Metrics are disabled"):
+            mock_client.metrics()
+
+    def test_tool_calls_get_recorded(self, mock_client: Client, httpx_mock: HTTPXMock) -> None:
+        """
+        GIVEN a client with a metrics registry
+        WHEN a tool fetches the info of two identifiers and then fails for one identifier
+        THEN the tool calls by outcome, the requests by endpoint and status code, the batch
+            sizes, and the concurrency limiter waits get recorded
+        """
+        registry = MetricsRegistry()
+        mock_client.metrics_registry = registry
+        mock_client.httpx_client.metrics_registry = registry
+        second_id_triple = SPGI_ID_TRIPLE.model_copy(update={"company_id": 1})
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/ids",
+            match_json={"identifiers": ["SPGI", "C1"]},
+            json={
+                "data": {
+                    "SPGI": SPGI_ID_TRIPLE.model_dump(mode="json"),
+                    "C1": second_id_triple.model_dump(mode="json"),
+                }
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/ids",
+            match_json={"identifiers": ["SPGI"]},
+            json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            json={"name": "S&P Global Inc."},
+        )
+        httpx_mock.add_response(
+            method="GET", url="https://kfinance.kensho.com/api/v1/info/1", json={"name": "C1"}
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            status_code=500,
+        )
+
+        tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
+        tool.run_without_langchain(identifiers=["SPGI", "C1"])
+        with pytest.raises(Exception, match="500"):
+            tool.run_without_langchain(identifiers=["SPGI"])
+
+        snapshot = mock_client.metrics()
+        assert snapshot.get(TOOL_CALLS, tool="get_info_from_identifiers", outcome="ok") == 1
+        assert snapshot.get(TOOL_CALLS, tool="get_info_from_identifiers", outcome="error") == 1
+        tool_duration = snapshot.get(TOOL_DURATION, tool="get_info_from_identifiers")
+        assert isinstance(tool_duration, HistogramSnapshot)
+        assert tool_duration.count == 2
+        assert snapshot.get(HTTP_RESPONSES, method="POST", endpoint="/ids", status_code="200")
+        assert (
+            snapshot.get(HTTP_RESPONSES, method="GET", endpoint="/info/{id}", status_code="200")
+            == 2
+        )
+        assert (
+            snapshot.get(HTTP_RESPONSES, method="GET", endpoint="/info/{id}", status_code="500")
+            == 1
+        )
+        http_latency = snapshot.get(HTTP_REQUEST_DURATION, method="GET", endpoint="/info/{id}")
+        assert isinstance(http_latency, HistogramSnapshot)
+        assert http_latency.count == 3
+        assert snapshot.get(HTTP_RESPONSE_BYTES, method="POST", endpoint="/ids")
+        batch_size = snapshot.get(BATCH_SIZE)
+        assert isinstance(batch_size, HistogramSnapshot)
+        assert (batch_size.count, batch_size.sum) == (2, 3)
+        concurrency_wait = snapshot.get(CONCURRENCY_WAIT)
+        assert isinstance(concurrency_wait, HistogramSnapshot)
+        assert concurrency_wait.count == 3
+
+    def test_sync_requests_get_recorded(self, mock_client: Client, requests_mock: Mocker) -> None:
+        """
+        GIVEN a client with a metrics registry
+        WHEN the sync api client fetches info, fails to fetch info, and streams a transcript
+        THEN the requests by endpoint and status code and their latencies and bytes get
+            recorded
+        """
+        registry = MetricsRegistry()
+        api_client = mock_client.kfinance_api_client
+        api_client.metrics_registry = registry
+        requests_mock.get(
+            url=f"{api_client.url_base}info/{SPGI_COMPANY_ID}", json={"name": "S&P Global Inc."}
+        )
+        requests_mock.get(url=f"{api_client.url_base}info/1", status_code=500)
+        requests_mock.get(url=f"{api_client.url_base}transcript/12345", json={"transcript": []})
+
+        api_client.fetch_info(company_id=SPGI_COMPANY_ID)
+        with pytest.raises(HTTPError, match="500"):
+            api_client.fetch_info(company_id=1)
+        assert list(api_client.iter_transcript_components(key_dev_id=12345)) == []
+
+        snapshot = registry.snapshot()
+        assert (
+            snapshot.get(HTTP_RESPONSES, method="GET", endpoint="/info/{id}", status_code="200")
+            == 1
+        )
+        assert (
+            snapshot.get(HTTP_RESPONSES, method="GET", endpoint="/info/{id}", status_code="500")
+            == 1
+        )
+        http_latency = snapshot.get(HTTP_REQUEST_DURATION, method="GET", endpoint="/info/{id}")
+        assert isinstance(http_latency, HistogramSnapshot)
+        assert http_latency.count == 2
+        assert (
+            snapshot.get(
+                HTTP_RESPONSES, method="GET", endpoint="/transcript/{id}", status_code="200"
+            )
+            == 1
+        )
+        assert snapshot.get(HTTP_RESPONSE_BYTES, method="GET", endpoint="/transcript/{id}") == len(
+            b'{"transcript": []}'
+        )
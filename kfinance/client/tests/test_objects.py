@@ -10,6 +10,7 @@ import pandas as pd
 from PIL.Image import open as image_open
 import time_machine
 
+from kfinance.client.dataframe_builders import ValueDtype
 from kfinance.client.kfinance import (
     BusinessRelationships,
     Company,
@@ -20,6 +21,7 @@ from kfinance.client.kfinance import (
     TradingItem,
     Transcript,
 )
+from kfinance.client.models.numeric import NumericMode
 from kfinance.client.models.response_models import PostResponse, SingleResultResp
 from kfinance.domains.business_relationships.business_relationship_models import (
     BusinessRelationshipType,
@@ -522,7 +524,8 @@ def ordered(obj):
 class MockKFinanceApiClient:
     def __init__(self):
         """Create a mock kfinance api client"""
-        pass
+        self.numeric = NumericMode.decimal
+        self.price_store = None
 
     def fetch_id_triple(self, identifier: int | str, exchange_code: Optional[str] = None) -> dict:
         """Get the ID triple from ticker."""
@@ -806,6 +809,28 @@ class TestCompany(TestCase):
         income_statement = self.msft_company.company.income_statement()
         pd.testing.assert_frame_equal(expected_income_statement, income_statement)
 
+    def test_income_statement_float64(self) -> None:
+        """
+        WHEN the income statement gets requested with float64 values
+        THEN all columns of the income statement are float64
+        """
+        income_statement = self.msft_company.company.income_statement(
+            value_dtype=ValueDtype.float64
+        )
+        assert not income_statement.empty
+        assert (income_statement.dtypes == np.float64).all()
+
+    def test_income_statement_float_numeric_mode(self) -> None:
+        """
+        GIVEN a client with numeric="float"
+        WHEN the income statement gets requested without value_dtype
+        THEN all columns of the income statement are float64
+        """
+        self.kfinance_api_client.numeric = NumericMode.float
+        income_statement = self.msft_company.company.income_statement()
+        assert not income_statement.empty
+        assert (income_statement.dtypes == np.float64).all()
+
     def test_estimate(self) -> None:
         estimates: CiqEstimates = MOCK_COMPANY_DB[msft_company_id]["estimates"]
 
@@ -0,0 +1,134 @@
+import json
+from json import JSONDecodeError
+
+import pytest
+
+from kfinance.client.streaming_json import WILDCARD, iter_json_items
+
+
+PRICES_RESP = {
+    "currency": "USD",
+    "prices": [
+        {
+            "date": f"2024-06-{day:02d}",
+            "open": None,
+            "high": "449.240000",
+            "low": "442.770000",
+            "close": "448.780000",
+            "volume": 999134,
+        }
+        for day in range(1, 21)
+    ],
+    "count": 20,
+}
+
+STATEMENTS_RESP = {
+    "results": {
+        "21719": {
+            "currency": "USD",
+            "periods": {
+                "CY2020": {"num_months": 12, "statements": []},
+                "CY2021": {"num_months": 12, "statements": [{"name": "Größe"}]},
+            },
+        },
+        "2": {"currency": "EUR", "periods": {}},
+    },
+    "errors": {"3": "not found"},
+}
+
+
+def to_chunks(data: dict, chunk_size: int) -> list[bytes]:
+    """Serialize data into UTF-8 chunks of chunk_size bytes."""
+    encoded = json.dumps(data, ensure_ascii=False, indent=1).encode("utf-8")
+    return [encoded[i : i + chunk_size] for i in range(0, len(encoded), chunk_size)]
+
+
+class TestIterJsonItems:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1_000_000])
+    def test_array_items(self, chunk_size: int) -> None:
+        """
+        GIVEN a price response split into chunks of different sizes
+        WHEN the prices get streamed
+        THEN each price gets yielded with its index and the skeleton contains the other values
+        """
+        skeleton: dict = {}
+        items = list(iter_json_items(to_chunks(PRICES_RESP, chunk_size), ("prices",), skeleton))
+        assert [keys for keys, _ in items] == [("prices", i) for i in range(20)]
+        assert [price for _, price in items] == PRICES_RESP["prices"]
+        assert skeleton == {"currency": "USD", "prices": [], "count": 20}
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1_000_000])
+    def test_wildcard_path(self, chunk_size: int) -> None:
+        """
+        GIVEN a statements response with multibyte characters split into chunks
+        WHEN the periods of all companies get streamed
+        THEN each period gets yielded with its company id and the skeleton keeps the errors
+        """
+        skeleton: dict = {}
+        items = list(
+            iter_json_items(
+                to_chunks(STATEMENTS_RESP, chunk_size), ("results", WILDCARD, "periods"), skeleton
+            )
+        )
+        assert items == [
+            (("results", "21719", "periods", "CY2020"), {"num_months": 12, "statements": []}),
+            (
+                ("results", "21719", "periods", "CY2021"),
+                {"num_months": 12, "statements": [{"name": "Größe"}]},
+            ),
+        ]
+        assert skeleton == {
+            "results": {
+                "21719": {"currency": "USD", "periods": {}},
+                "2": {"currency": "EUR", "periods": {}},
+            },
+            "errors": {"3": "not found"},
+        }
+
+    def test_numbers_split_at_every_offset(self) -> None:
+        """
+        GIVEN a response with fractional, negative, and exponent numbers
+        WHEN it gets split into two chunks at every byte offset and the numbers get streamed
+        THEN the numbers get parsed completely regardless of the split
+        """
+        encoded = b'{"results": [1.25, -3.5e-2, 1e5, 2E+10, 7]}'
+        for offset in range(len(encoded) + 1):
+            chunks = [encoded[:offset], encoded[offset:]]
+            assert [item for _, item in iter_json_items(chunks, ("results",))] == [
+                1.25,
+                -3.5e-2,
+                1e5,
+                2e10,
+                7,
+            ], offset
+
+    def test_null_collection(self) -> None:
+        """
+        GIVEN a response in which the collection is null
+        WHEN the collection gets streamed
+        THEN nothing gets yielded and the null value gets stored in the skeleton
+        """
+        skeleton: dict = {}
+        assert list(iter_json_items([b'{"result": null}'], ("result",), skeleton)) == []
+        assert skeleton == {"result": None}
+
+    def test_truncated_stream(self) -> None:
+        """
+        GIVEN a response that ends in the middle of an item
+        WHEN the items get streamed
+        THEN the complete items get yielded before a JSONDecodeError gets raised
+        """
+        items = iter_json_items([b'{"prices": [{"a": 1}, {"a": 2}, {"a"'], ("prices",))
+        assert next(items) == (("prices", 0), {"a": 1})
+        assert next(items) == (("prices", 1), {"a": 2})
+        with pytest.raises(JSONDecodeError):
+            next(items)
+
+    def test_trailing_data(self) -> None:
+        """
+        GIVEN a response with data after the end of the JSON document
+        WHEN the items get streamed
+        THEN a ValueError gets raised
+        """
+        with pytest.raises(ValueError, match="Unexpected data"):
+            list(iter_json_items([b'{"prices": []} []'], ("prices",)))
@@ -1,11 +1,18 @@
-from copy import deepcopy
 from datetime import date
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from strenum import StrEnum
 
-from kfinance.client.models.decimal_with_unit import Money, Shares
+from kfinance.client.models.currency_models import ISO_CODE_TO_CURRENCY
+from kfinance.client.models.decimal_with_unit import (
+    Money,
+    Shares,
+    to_money_data,
+    trusted_money,
+    trusted_shares,
+)
+from kfinance.client.models.trusted_decode import build_model, register_trusted_decoder
 
 
 class Capitalization(StrEnum):
@@ -52,22 +59,34 @@ class Capitalizations(BaseModel):
             "market_caps": [
                 {
                     "date": "2024-06-24",
-                    "market_cap": {"value": "139231113000.000000", "unit": "USD"},
-                    "tev": {"value": "153942113000.000000", "unit": "USD"},
+                    "market_cap": {
+                        "value": "139231113000.000000", "unit": "USD", "conventional_decimals": 2
+                    },
+                    "tev": {
+                        "value": "153942113000.000000", "unit": "USD", "conventional_decimals": 2
+                    },
                     "shares_outstanding": 312900000
                 },
 
         Note: shares_outstanding does not need the unit injected because the Shares class
             already has "Shares" encoded. However, currencies differ between companies,
             so we need to inject that information.
+
+        The input does not get modified. Only the market cap dicts get copied (shallowly)
+        instead of the whole response.
         """
         if isinstance(data, dict) and "currency" in data:
-            data = deepcopy(data)
             currency = data["currency"]
+            market_caps = []
             for capitalization in data["market_caps"]:
+                capitalization = dict(capitalization)
                 for key in ["market_cap", "tev"]:
                     if capitalization[key] is not None:
-                        capitalization[key] = dict(unit=currency, value=capitalization[key])
+                        capitalization[key] = to_money_data(
+                            value=capitalization[key], unit=currency
+                        )
+                market_caps.append(capitalization)
+            data = {**data, "market_caps": market_caps}
         return data
 
     def model_dump_json_single_metric(
@@ -97,3 +116,33 @@ class Capitalizations(BaseModel):
                 }
             },
         )["capitalizations"]
+
+
+@register_trusted_decoder(Capitalizations)
+def decode_trusted_capitalizations(data: Any) -> Capitalizations:
+    """Build Capitalizations from a trusted API response without copying the response."""
+    if not isinstance(data, dict) or data.get("currency") not in ISO_CODE_TO_CURRENCY:
+        return Capitalizations.model_validate(data)
+    currency = ISO_CODE_TO_CURRENCY[data["currency"]]
+    capitalizations = []
+    for capitalization in data["market_caps"]:
+        market_cap = capitalization["market_cap"]
+        tev = capitalization["tev"]
+        shares_outstanding = capitalization["shares_outstanding"]
+        capitalizations.append(
+            build_model(
+                DailyCapitalization,
+                {
+                    "date": date.fromisoformat(capitalization["date"]),
+                    "market_cap": None
+                    if market_cap is None
+                    else trusted_money(market_cap, currency),
+                    "tev": None if tev is None else trusted_money(tev, currency),
+                    "shares_outstanding": (
+                        None if shares_outstanding is None else trusted_shares(shares_outstanding)
+                    ),
+                },
+                {"date", "market_cap", "tev", "shares_outstanding"},
+            )
+        )
+    return build_model(Capitalizations, {"capitalizations": capitalizations}, {"capitalizations"})
@@ -7,8 +7,10 @@ from pydantic import BaseModel, Field
 
 from kfinance.async_batch_execution import AsyncTask, batch_execute_async_tasks
 from kfinance.client.id_resolution import unified_fetch_id_triples
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.capitalizations.capitalization_models import Capitalization, Capitalizations
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
     ToolArgsWithIdentifiers,
@@ -175,4 +177,4 @@ async def fetch_capitalizations_from_company_id(
     )
     resp = await httpx_client.get(url=url)
     resp.raise_for_status()
-    return Capitalizations.model_validate(resp.json())
+    return decode_response(Capitalizations, resp.json(), numeric=get_numeric_mode(httpx_client))
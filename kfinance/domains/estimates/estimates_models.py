@@ -6,6 +6,7 @@ from typing import Any
 from pydantic import BaseModel, model_validator
 
 from kfinance.client.models.date_and_period_models import EstimatePeriodType, EstimateType
+from kfinance.client.models.lazy_periods import LazyPeriods
 
 
 logger = logging.getLogger(__name__)
@@ -97,7 +98,7 @@ class Estimates(BaseModel):
 
 class CiqEstimates(Estimates):
     estimate_type: EstimateType
-    periods: dict[str, CiqEstimatesPeriodData]
+    periods: LazyPeriods[CiqEstimatesPeriodData]
 
 
 class VisibleAlphaEstimates(Estimates):
@@ -14,6 +14,7 @@ from kfinance.client.models.date_and_period_models import (
     NumPeriodsForward,
 )
 from kfinance.client.models.response_models import SingleResultResp
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.estimates.estimates_models import (
     AnalystRecommendations,
@@ -24,6 +25,7 @@ from kfinance.domains.line_items.line_item_models import AlternativeLineItemMeta
 from kfinance.domains.line_items.response_notes import (
     insert_fiscal_period_notes,
 )
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
     ToolArgsWithIdentifiers,
@@ -291,7 +293,9 @@ async def fetch_estimates_from_company_id(
 
     resp = await httpx_client.post(url="/estimates/", json=params)
     resp.raise_for_status()
-    return SingleResultResp[CiqEstimates].model_validate(resp.json())
+    return decode_response(
+        SingleResultResp[CiqEstimates], resp.json(), numeric=get_numeric_mode(httpx_client)
+    )
 
 
 async def get_consensus_target_price_from_identifiers(
@@ -345,7 +349,9 @@ async def fetch_consensus_target_price_from_company_id(
     """Fetch consensus target price for one company_id."""
     resp = await httpx_client.get(url=f"/estimates/consensus_target_price/{company_id}")
     resp.raise_for_status()
-    return SingleResultResp[ConsensusTargetPrice].model_validate(resp.json())
+    return decode_response(
+        SingleResultResp[ConsensusTargetPrice], resp.json(), numeric=get_numeric_mode(httpx_client)
+    )
 
 
 async def get_analyst_recommendations_from_identifiers(
@@ -399,4 +405,8 @@ async def fetch_analyst_recommendations_from_company_id(
     """Fetch analyst recommendations for one company_id."""
     resp = await httpx_client.get(url=f"/estimates/analyst_recommendations/{company_id}")
     resp.raise_for_status()
-    return SingleResultResp[AnalystRecommendations].model_validate(resp.json())
+    return decode_response(
+        SingleResultResp[AnalystRecommendations],
+        resp.json(),
+        numeric=get_numeric_mode(httpx_client),
+    )
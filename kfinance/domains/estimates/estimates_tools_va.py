@@ -10,6 +10,7 @@ from kfinance.client.models.date_and_period_models import (
     EstimateType,
 )
 from kfinance.client.models.response_models import PostResponseWithMetadata
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.estimates.estimates_models import VisibleAlphaEstimates
 from kfinance.domains.estimates.estimates_tools import (
@@ -17,6 +18,7 @@ from kfinance.domains.estimates.estimates_tools import (
 )
 from kfinance.domains.line_items.line_item_models import AlternativeLineItemMetadata, CalendarType
 from kfinance.domains.line_items.response_notes import insert_fiscal_period_notes
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
     ToolRespWithIdInfoAndErrors,
@@ -164,7 +166,11 @@ async def fetch_visible_alpha_estimates_from_company_ids(
     resp = await httpx_client.post(url="/estimates/visible_alpha", json=payload)
     resp.raise_for_status()
 
-    return PostResponseWithMetadata[VisibleAlphaEstimates].model_validate(resp.json())
+    return decode_response(
+        PostResponseWithMetadata[VisibleAlphaEstimates],
+        resp.json(),
+        numeric=get_numeric_mode(httpx_client),
+    )
 
 
 async def get_visible_alpha_estimates_from_identifiers(
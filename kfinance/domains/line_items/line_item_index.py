@@ -0,0 +1,137 @@
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+import functools
+import heapq
+
+from kfinance.domains.line_items.line_item_models import (
+    LINE_ITEM_TO_DESCRIPTIONS_MAP,
+    LineItemScore,
+)
+
+
+# Suggestions need a score above this threshold.
+MIN_SUGGESTION_SCORE = 0.1
+
+
+class LineItemIndex:
+    """An index of line items and their descriptions for suggesting similar line items.
+
+    The index stores the words of each line item name and description and maps each word
+    to the line items that contain it, so that the keyword scores of a query only touch the
+    line items that share a word with it. The expensive string similarity (SequenceMatcher)
+    only gets computed for line items whose score can still reach the suggestions, using
+    the upper bounds of SequenceMatcher.real_quick_ratio (from the lengths of the names)
+    and SequenceMatcher.quick_ratio (from the precomputed character counts of the names).
+    """
+
+    def __init__(self, descriptors: dict[str, str]) -> None:
+        """Build the index.
+
+        :param descriptors: line item name -> description
+        :type descriptors: dict[str, str]
+        """
+        self._names = list(descriptors)
+        self._descriptions = list(descriptors.values())
+        self._lower_names = [name.lower() for name in self._names]
+        self._name_char_counts = [Counter(lower_name) for lower_name in self._lower_names]
+        self._name_word_index: dict[str, list[int]] = defaultdict(list)
+        self._description_word_index: dict[str, list[int]] = defaultdict(list)
+        for i, (lower_name, description) in enumerate(zip(self._lower_names, self._descriptions)):
+            for word in set(lower_name.replace("_", " ").split()):
+                self._name_word_index[word].append(i)
+            for word in set(description.lower().split()):
+                self._description_word_index[word].append(i)
+
+    def find_similar(self, invalid_item: str, max_suggestions: int = 8) -> list[LineItemScore]:
+        """Find the line items most similar to an invalid line item.
+
+        The score of a line item combines the string similarity of the names (50%), the
+        share of the words of the invalid item in the line item name (30%) and in the
+        description (20%). Ties are broken by the order of the descriptors.
+
+        :param invalid_item: The invalid line item provided by the user
+        :type invalid_item: str
+        :param max_suggestions: Maximum number of suggestions to return
+        :type max_suggestions: int
+        :return: The best matches with a score above MIN_SUGGESTION_SCORE, best first
+        :rtype: list[LineItemScore]
+        """
+        if not self._names or max_suggestions <= 0:
+            return []
+
+        invalid_lower = invalid_item.lower()
+        invalid_words = set(invalid_lower.replace("_", " ").split())
+        num_words = max(len(invalid_words), 1)
+        name_matches = [0] * len(self._names)
+        description_matches = [0] * len(self._names)
+        for word in invalid_words:
+            for i in self._name_word_index.get(word, ()):
+                name_matches[i] += 1
+            for i in self._description_word_index.get(word, ()):
+                description_matches[i] += 1
+
+        # Upper bounds of the scores, using the upper bound of SequenceMatcher.ratio that
+        # SequenceMatcher.real_quick_ratio computes from the lengths of the strings.
+        invalid_length = len(invalid_lower)
+        candidates = []
+        for i, lower_name in enumerate(self._lower_names):
+            total_length = invalid_length + len(lower_name)
+            max_name_similarity = (
+                2.0 * min(invalid_length, len(lower_name)) / total_length if total_length else 1.0
+            )
+            max_score = (
+                max_name_similarity * 0.5
+                + name_matches[i] / num_words * 0.3
+                + description_matches[i] / num_words * 0.2
+            )
+            if max_score > MIN_SUGGESTION_SCORE:
+                candidates.append((max_score, i))
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+
+        # The lowest of the best max_suggestions scores so far.
+        best_scores: list[float] = []
+        scores: list[tuple[float, int]] = []
+        invalid_char_counts = Counter(invalid_lower)
+        for max_score, i in candidates:
+            if len(best_scores) == max_suggestions and max_score < best_scores[0]:
+                break
+            # Tighten the upper bound with the characters that both names share.
+            total_length = invalid_length + len(self._lower_names[i])
+            shared_chars = sum(
+                min(count, invalid_char_counts[char])
+                for char, count in self._name_char_counts[i].items()
+            )
+            max_name_similarity = 2.0 * shared_chars / total_length if total_length else 1.0
+            max_score = (
+                max_name_similarity * 0.5
+                + name_matches[i] / num_words * 0.3
+                + description_matches[i] / num_words * 0.2
+            )
+            if max_score <= MIN_SUGGESTION_SCORE or (
+                len(best_scores) == max_suggestions and max_score < best_scores[0]
+            ):
+                continue
+            name_similarity = SequenceMatcher(None, invalid_lower, self._lower_names[i]).ratio()
+            score = (
+                name_similarity * 0.5  # Direct name similarity
+                + name_matches[i] / num_words * 0.3  # Keyword matches in name
+                + description_matches[i] / num_words * 0.2  # Keyword matches in description
+            )
+            scores.append((score, i))
+            if len(best_scores) < max_suggestions:
+                heapq.heappush(best_scores, score)
+            elif score > best_scores[0]:
+                heapq.heapreplace(best_scores, score)
+
+        scores.sort(key=lambda score: (-score[0], score[1]))
+        return [
+            LineItemScore(name=self._names[i], description=self._descriptions[i], score=score)
+            for score, i in scores[:max_suggestions]
+            if score > MIN_SUGGESTION_SCORE
+        ]
+
+
+@functools.cache
+def get_line_item_index() -> LineItemIndex:
+    """Return the index of all line items, which gets built on first use."""
+    return LineItemIndex(LINE_ITEM_TO_DESCRIPTIONS_MAP)
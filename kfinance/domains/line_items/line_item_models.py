@@ -2,11 +2,12 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from itertools import chain
-from typing import Any, TypedDict
+from typing import Any, MutableMapping, TypedDict
 
 from pydantic import BaseModel, Field
 from strenum import StrEnum
 
+from kfinance.client.models.lazy_periods import LazyPeriods
 from kfinance.client.models.type_aliases import Source
 
 
@@ -34,19 +35,25 @@ class BasePeriodsResp(BaseModel):
     most recent one.
     """
 
-    periods: dict[str, Any]  # override in subclasses
+    periods: MutableMapping[str, Any]  # override in subclasses
 
     def remove_all_periods_other_than_the_most_recent_one(self) -> None:
-        """Remove all period data other than the most recent one."""
+        """Remove all period data other than the most recent one.
+
+        Periods stored as LazyPeriods get removed without being validated.
+        """
         if self.periods:
             most_recent_period = max(self.periods.keys())
-            most_recent_period_data = self.periods[most_recent_period]
-            self.periods = {most_recent_period: most_recent_period_data}
+            if isinstance(self.periods, LazyPeriods):
+                self.periods = self.periods.only([most_recent_period])
+            else:
+                most_recent_period_data = self.periods[most_recent_period]
+                self.periods = {most_recent_period: most_recent_period_data}
 
 
 class LineItemResp(BasePeriodsResp):
     currency: str | None
-    periods: dict[str, LineItemPeriodData]  # period -> line item and period data
+    periods: LazyPeriods[LineItemPeriodData]  # period -> line item and period data
     data_source: str | None = None
 
 
@@ -1947,6 +1954,8 @@ LINE_ITEMS: list[LineItemType] = [
 LINE_ITEM_NAMES_AND_ALIASES: list[str] = list(
     chain(*[[line_item["name"]] + list(line_item["aliases"]) for line_item in LINE_ITEMS])
 )
+# Set of LINE_ITEM_NAMES_AND_ALIASES for membership checks
+LINE_ITEM_NAMES_AND_ALIASES_SET: frozenset[str] = frozenset(LINE_ITEM_NAMES_AND_ALIASES)
 
 
 def _get_line_item_to_descriptions_map() -> dict[str, str]:
@@ -1,4 +1,3 @@
-from difflib import SequenceMatcher
 from textwrap import dedent
 from typing import Any, Literal, Type, cast
 
@@ -8,9 +7,12 @@ from pydantic import BaseModel, Field, model_validator
 from kfinance.client.id_resolution import unified_fetch_id_triples
 from kfinance.client.models.date_and_period_models import NumPeriods, NumPeriodsBack, PeriodType
 from kfinance.client.models.response_models import PostResponse
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
+from kfinance.domains.line_items.line_item_index import LineItemIndex, get_line_item_index
 from kfinance.domains.line_items.line_item_models import (
     LINE_ITEM_NAMES_AND_ALIASES,
+    LINE_ITEM_NAMES_AND_ALIASES_SET,
     LINE_ITEM_TO_DESCRIPTIONS_MAP,
     AlternativeLineItemMetadata,
     CalendarType,
@@ -21,6 +23,7 @@ from kfinance.domains.line_items.response_notes import (
     insert_fiscal_period_notes,
     insert_source_link_note,
 )
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
     ToolArgsWithIdentifiers,
@@ -42,47 +45,19 @@ def _find_similar_line_items(
     Returns:
         List of LineItemScore objects for the best matches
     """
-    if not descriptors:
-        return []
-
-    invalid_lower = invalid_item.lower()
-    scores: list[LineItemScore] = []
-
-    for line_item, description in descriptors.items():
-        # Calculate similarity scores
-        name_similarity = SequenceMatcher(None, invalid_lower, line_item.lower()).ratio()
-
-        # Check for keyword matches in the line item name
-        invalid_words = set(invalid_lower.replace("_", " ").split())
-        item_words = set(line_item.lower().replace("_", " ").split())
-        keyword_match_score = len(invalid_words.intersection(item_words)) / max(
-            len(invalid_words), 1
-        )
-
-        # Check for keyword matches in description
-        description_words = set(description.lower().split())
-        description_match_score = len(invalid_words.intersection(description_words)) / max(
-            len(invalid_words), 1
-        )
-
-        # Combined score (weighted)
-        total_score = (
-            name_similarity * 0.5  # Direct name similarity
-            + keyword_match_score * 0.3  # Keyword matches in name
-            + description_match_score * 0.2  # Keyword matches in description
-        )
-
-        scores.append(LineItemScore(name=line_item, description=description, score=total_score))
-
-    # Sort by score (descending) and return top matches
-    scores.sort(reverse=True, key=lambda x: x.score)
-    return [item for item in scores[:max_suggestions] if item.score > 0.1]
+    # The index of all line items gets built once and reused.
+    index = (
+        get_line_item_index()
+        if descriptors is LINE_ITEM_TO_DESCRIPTIONS_MAP
+        else LineItemIndex(descriptors)
+    )
+    return index.find_similar(invalid_item, max_suggestions=max_suggestions)
 
 
 def _smart_line_item_validator(v: str) -> str:
     """Custom validator that provides intelligent suggestions for invalid line items."""
-    if v not in LINE_ITEM_NAMES_AND_ALIASES:
-        # Find similar items using pre-computed descriptors
+    if v not in LINE_ITEM_NAMES_AND_ALIASES_SET:
+        # Find similar items using the pre-computed line item index
         suggestions = _find_similar_line_items(v, LINE_ITEM_TO_DESCRIPTIONS_MAP)
 
         if suggestions:
@@ -343,4 +318,6 @@ async def fetch_line_item_from_company_ids(
     resp = await httpx_client.post(url="/line_item/", json=params)
     resp.raise_for_status()
 
-    return PostResponse[LineItemResp].model_validate(resp.json())
+    return decode_response(
+        PostResponse[LineItemResp], resp.json(), numeric=get_numeric_mode(httpx_client)
+    )
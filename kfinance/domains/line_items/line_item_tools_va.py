@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from kfinance.client.id_resolution import unified_fetch_id_triples
 from kfinance.client.models.date_and_period_models import EstimatePeriodType
 from kfinance.client.models.response_models import PostResponseWithMetadata
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.line_items.line_item_models import (
     AlternativeLineItemMetadata,
@@ -21,6 +22,7 @@ from kfinance.domains.line_items.response_notes import (
     insert_fiscal_period_notes,
     insert_source_link_note,
 )
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
 )
@@ -148,7 +150,9 @@ async def fetch_visible_alpha_line_item_from_company_ids(
     resp = await httpx_client.post(url="/line_item/visible_alpha", json=params)
     resp.raise_for_status()
 
-    return PostResponseWithMetadata[LineItemResp].model_validate(resp.json())
+    return decode_response(
+        PostResponseWithMetadata[LineItemResp], resp.json(), numeric=get_numeric_mode(httpx_client)
+    )
 
 
 async def get_visible_alpha_financial_line_item_from_identifiers(
@@ -1,3 +1,5 @@
+from difflib import SequenceMatcher
+
 import httpx
 from langchain_core.utils.function_calling import convert_to_openai_tool
 import pytest
@@ -7,7 +9,12 @@ from kfinance.client.kfinance import Client
 from kfinance.client.models.response_models import PostResponse
 from kfinance.conftest import FAKE_COMPANY_1_ID_TRIPLE, FAKE_COMPANY_2_ID_TRIPLE, SPGI_ID_TRIPLE
 from kfinance.domains.companies.company_models import COMPANY_ID_PREFIX
-from kfinance.domains.line_items.line_item_models import CalendarType, LineItemResp, LineItemScore
+from kfinance.domains.line_items.line_item_models import (
+    LINE_ITEM_TO_DESCRIPTIONS_MAP,
+    CalendarType,
+    LineItemResp,
+    LineItemScore,
+)
 from kfinance.domains.line_items.line_item_tools import (
     GetFinancialLineItemFromIdentifiers,
     GetFinancialLineItemFromIdentifiersResp,
@@ -358,3 +365,38 @@ class TestFindSimilarLineItems:
             assert isinstance(item.score, float)
             assert item.name in self.TEST_DESCRIPTORS
             assert item.description == self.TEST_DESCRIPTORS[item.name]
+
+    @pytest.mark.parametrize(
+        "invalid_item",
+        ["revenues", "R&D", "cost goods", "profit", "net_incme", "EBITDA margin", "x", ""],
+    )
+    @pytest.mark.parametrize("max_suggestions", [1, 8])
+    def test_ranking_matches_scoring_every_line_item(
+        self, invalid_item: str, max_suggestions: int
+    ) -> None:
+        """
+        GIVEN all line items
+        WHEN searching for a term with the line item index
+        THEN the suggestions are the same as when scoring every line item
+        """
+        invalid_lower = invalid_item.lower()
+        invalid_words = set(invalid_lower.replace("_", " ").split())
+        scores = []
+        for name, description in LINE_ITEM_TO_DESCRIPTIONS_MAP.items():
+            name_words = set(name.lower().replace("_", " ").split())
+            description_words = set(description.lower().split())
+            score = (
+                SequenceMatcher(None, invalid_lower, name.lower()).ratio() * 0.5
+                + len(invalid_words & name_words) / max(len(invalid_words), 1) * 0.3
+                + len(invalid_words & description_words) / max(len(invalid_words), 1) * 0.2
+            )
+            scores.append(LineItemScore(name=name, description=description, score=score))
+        scores.sort(reverse=True, key=lambda x: x.score)
+        expected = [item for item in scores[:max_suggestions] if item.score > 0.1]
+
+        assert (
+            _find_similar_line_items(
+                invalid_item, LINE_ITEM_TO_DESCRIPTIONS_MAP, max_suggestions=max_suggestions
+            )
+            == expected
+        )
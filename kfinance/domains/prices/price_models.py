@@ -1,10 +1,24 @@
-from copy import deepcopy
 from datetime import date
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Iterable
 
+import numpy as np
 from pydantic import BaseModel, model_validator
 
-from kfinance.client.models.decimal_with_unit import Money, Shares
+from kfinance.client.models.currency_models import ISO_CODE_TO_CURRENCY
+from kfinance.client.models.decimal_with_unit import (
+    Money,
+    Shares,
+    to_money_data,
+    trusted_money,
+    trusted_shares,
+)
+from kfinance.client.models.trusted_decode import build_model, register_trusted_decoder
+from kfinance.client.streaming_json import iter_json_items
+
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Prices(BaseModel):
@@ -44,25 +58,213 @@ class PriceHistory(BaseModel):
         After:
             {
                 "date": "2024-06-25",
-                "open": {"value": "445.790000", "unit": "USD"},
-                "high": {"value": "449.240000", "unit": "USD"},
+                "open": {"value": "445.790000", "unit": "USD", "conventional_decimals": 2},
+                "high": {"value": "449.240000", "unit": "USD", "conventional_decimals": 2},
                 ...
             }
 
         Note: Volume does not need the unit injected because the Shares class
             already has "Shares" encoded. However, currencies differ between companies,
             so we need to inject that information.
+
+        The input does not get modified. Only the price dicts get copied (shallowly)
+        instead of the whole response.
         """
         if isinstance(data, dict) and "currency" in data:
-            data = deepcopy(data)
             currency = data["currency"]
-            for capitalization in data["prices"]:
+            prices = []
+            for price in data["prices"]:
+                price = dict(price)
                 for key in ["open", "high", "low", "close"]:
-                    if capitalization[key] is not None:
-                        capitalization[key] = dict(unit=currency, value=capitalization[key])
+                    if price[key] is not None:
+                        price[key] = to_money_data(value=price[key], unit=currency)
+                prices.append(price)
+            data = {**data, "prices": prices}
         return data
 
 
+@register_trusted_decoder(PriceHistory)
+def decode_trusted_price_history(data: Any) -> PriceHistory:
+    """Build a PriceHistory from a trusted API response without copying the response."""
+    if not isinstance(data, dict) or data.get("currency") not in ISO_CODE_TO_CURRENCY:
+        return PriceHistory.model_validate(data)
+    currency = ISO_CODE_TO_CURRENCY[data["currency"]]
+    prices = [
+        build_model(
+            Prices,
+            {
+                "date": price["date"],
+                "open": None if price["open"] is None else trusted_money(price["open"], currency),
+                "high": None if price["high"] is None else trusted_money(price["high"], currency),
+                "low": None if price["low"] is None else trusted_money(price["low"], currency),
+                "close": (
+                    None if price["close"] is None else trusted_money(price["close"], currency)
+                ),
+                "volume": None if price["volume"] is None else trusted_shares(price["volume"]),
+            },
+            {"date", "open", "high", "low", "close", "volume"},
+        )
+        for price in data["prices"]
+    ]
+    return build_model(PriceHistory, {"prices": prices}, {"prices"})
+
+
+PRICE_COLUMNS: tuple[str, ...] = ("open", "high", "low", "close", "volume")
+
+# The number of prices that ColumnarPriceHistory.from_chunks allocates space for initially.
+_INITIAL_CAPACITY = 1024
+
+
+class ColumnarPriceHistory:
+    """ColumnarPriceHistory represents stock prices over a time range as NumPy arrays.
+
+    Unlike PriceHistory, which creates pydantic Money and Shares models for every value,
+    ColumnarPriceHistory stores all open/high/low/close/volume values in a single
+    (num_dates x 5) float64 array. The currency is stored once as metadata. Missing
+    values are NaN.
+
+    The PriceHistory model of the same data can still be accessed via the (lazily
+    built) `price_history` attribute.
+    """
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, currency: str | None) -> None:
+        """Initialize the ColumnarPriceHistory
+
+        :param dates: The dates (as strings, see Prices.date) of the prices
+        :type dates: np.ndarray
+        :param values: A (num_dates x 5) float64 array with columns open, high, low, close, volume
+        :type values: np.ndarray
+        :param currency: The ISO code of the currency of the open/high/low/close prices
+        :type currency: str, optional
+        """
+        if values.shape != (len(dates), len(PRICE_COLUMNS)):
+            raise ValueError(
+                f"Expected values of shape {(len(dates), len(PRICE_COLUMNS))}, got {values.shape}."
+            )
+        self.dates = dates
+        self.values = values
+        self.currency = currency
+
+    @classmethod
+    def from_response(cls, data: dict) -> "ColumnarPriceHistory":
+        """Build a ColumnarPriceHistory directly from a /pricing response.
+
+        The response has the format {"currency": "USD", "prices": [{"date": ..., "open": ...}]}
+        with all prices as strings or None.
+        """
+        prices = data["prices"]
+        dates = np.array([price["date"] for price in prices], dtype=np.str_)
+        # NumPy parses numeric strings and converts None to NaN for float arrays.
+        values = np.array(
+            [[price[column] for column in PRICE_COLUMNS] for price in prices],
+            dtype=np.float64,
+        ).reshape(len(prices), len(PRICE_COLUMNS))
+        return cls(dates=dates, values=values, currency=data.get("currency"))
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[bytes]) -> "ColumnarPriceHistory":
+        """Build a ColumnarPriceHistory from a /pricing response streamed as byte chunks.
+
+        Prices get decoded one at a time straight into the values array, which grows
+        geometrically. Neither the response bytes nor the response dict get held in memory
+        as a whole.
+        """
+        skeleton: dict[str, Any] = {}
+        dates: list[str] = []
+        values = np.empty((_INITIAL_CAPACITY, len(PRICE_COLUMNS)), dtype=np.float64)
+        for _, price in iter_json_items(chunks, path=("prices",), skeleton=skeleton):
+            index = len(dates)
+            if index == len(values):
+                values.resize((2 * len(values), len(PRICE_COLUMNS)), refcheck=False)
+            values[index] = [
+                np.nan if price[column] is None else float(price[column])
+                for column in PRICE_COLUMNS
+            ]
+            dates.append(price["date"])
+        values.resize((len(dates), len(PRICE_COLUMNS)), refcheck=False)
+        return cls(
+            dates=np.array(dates, dtype=np.str_), values=values, currency=skeleton.get("currency")
+        )
+
+    def __len__(self) -> int:
+        """Return the number of dates."""
+        return len(self.dates)
+
+    @property
+    def open(self) -> np.ndarray:
+        """Return a view of the open prices."""
+        return self.values[:, 0]
+
+    @property
+    def high(self) -> np.ndarray:
+        """Return a view of the high prices."""
+        return self.values[:, 1]
+
+    @property
+    def low(self) -> np.ndarray:
+        """Return a view of the low prices."""
+        return self.values[:, 2]
+
+    @property
+    def close(self) -> np.ndarray:
+        """Return a view of the close prices."""
+        return self.values[:, 3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        """Return a view of the volumes."""
+        return self.values[:, 4]
+
+    def to_numpy(self) -> np.ndarray:
+        """Return the (num_dates x 5) open/high/low/close/volume array without copying."""
+        return self.values
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Return a DataFrame indexed by date with open/high/low/close/volume columns.
+
+        The DataFrame is backed by the same memory as `to_numpy()`.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.values,
+            index=pd.Index(self.dates, name="date"),
+            columns=list(PRICE_COLUMNS),
+            copy=False,
+        )
+
+    @cached_property
+    def price_history(self) -> PriceHistory:
+        """Return the PriceHistory model of the prices. It gets built on first access.
+
+        Open/high/low/close prices are Money, so prices with an unknown currency (None)
+        raise a ValueError.
+        """
+        if not len(self):
+            return PriceHistory(prices=[])
+        if self.currency is None:
+            raise ValueError(
+                "The currency of the prices is unknown, so they can't be converted to a "
+                "PriceHistory. Build a ColumnarPriceHistory with the currency (for example "
+                "from TradingItem.history_metadata) first."
+            )
+        return PriceHistory.model_validate(
+            {
+                "currency": self.currency,
+                "prices": [
+                    {
+                        "date": str(price_date),
+                        **{
+                            column: None if np.isnan(value) else repr(float(value))
+                            for column, value in zip(PRICE_COLUMNS, row)
+                        },
+                    }
+                    for price_date, row in zip(self.dates, self.values)
+                ],
+            }
+        )
+
+
 class HistoryMetadataResp(BaseModel):
     currency: str
     symbol: str
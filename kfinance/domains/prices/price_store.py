@@ -0,0 +1,519 @@
+"""A local, memory-mapped store of daily price histories.
+
+Adjusted and unadjusted prices are stored in separate tables. All trading items of a
+table share the same append-only files:
+
+    <root>/<adjusted|unadjusted>/
+        CURRENT                 the number of the current generation of files
+        gen-<n>/dates.u10       ISO dates ("YYYY-MM-DD") as raw little-endian '<U10' values
+        gen-<n>/values.f8       open/high/low/close/volume as a raw (num_rows x 5) float64 array
+        gen-<n>/index.jsonl     one record per append with the rows, the currency, and the
+                                fetched date range of a trading item
+
+Sharing the data files means that scans over thousands of trading items only need two
+memory maps (and file descriptors) per table. The rows of each append form a block.
+Consecutive appends of the same trading item extend its block, and `compact` rewrites the
+files so that every trading item is a single block again. Reads of trading items that are
+stored in a single block are views of the memory-mapped files without any copy or parsing.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+import json
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import numpy as np
+
+from kfinance.client.models.date_and_period_models import Periodicity
+from kfinance.domains.prices.price_models import PRICE_COLUMNS, ColumnarPriceHistory
+
+
+if TYPE_CHECKING:
+    from kfinance.client.fetch import KFinanceApiClient
+
+
+DATE_DTYPE = np.dtype("<U10")
+VALUE_DTYPE = np.dtype("<f8")
+_VALUES_ROW_SIZE = VALUE_DTYPE.itemsize * len(PRICE_COLUMNS)
+
+_CURRENT_FILE = "CURRENT"
+_DATES_FILE = "dates.u10"
+_VALUES_FILE = "values.f8"
+_INDEX_FILE = "index.jsonl"
+
+
+@dataclass
+class _StoredTradingItem:
+    """The blocks of rows and the metadata of a stored trading item."""
+
+    # (first row, number of rows) of each block in date order
+    blocks: list[tuple[int, int]] = field(default_factory=list)
+    currency: str | None = None
+    # The date range that was fetched. A start_date of None means the full history.
+    start_date: str | None = None
+    end_date: str | None = None
+    last_date: str | None = None
+
+
+class _PriceTable:
+    """The stored prices of all trading items with the same adjustment.
+
+    All reads and writes hold a lock, so a table can be used from several threads (for
+    example by the thread pool of `TradingItems.history`).
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load the index of the current generation."""
+        current_path = self.path / _CURRENT_FILE
+        self.generation = int(current_path.read_text()) if current_path.exists() else 0
+        self.data_path = self.path / f"gen-{self.generation}"
+        self.data_path.mkdir(exist_ok=True)
+        self.trading_items: dict[int, _StoredTradingItem] = {}
+        self._dates: np.ndarray = np.empty(0, dtype=DATE_DTYPE)
+        self._values: np.ndarray = np.empty((0, len(PRICE_COLUMNS)), dtype=VALUE_DTYPE)
+        # The number of rows in the dates file. Appends get their offset from this count.
+        dates_path = self.data_path / _DATES_FILE
+        self._num_rows = (
+            dates_path.stat().st_size // DATE_DTYPE.itemsize if dates_path.exists() else 0
+        )
+
+        index_path = self.data_path / _INDEX_FILE
+        if index_path.exists():
+            with open(index_path) as f:
+                for line in f:
+                    self._apply_record(json.loads(line))
+
+    def _apply_record(self, record: dict[str, Any]) -> None:
+        """Apply an index record to the in-memory index."""
+        trading_item_id = record["trading_item_id"]
+        if record.get("cleared"):
+            self.trading_items.pop(trading_item_id, None)
+            return
+        stored = self.trading_items.setdefault(trading_item_id, _StoredTradingItem())
+        offset, length = record["offset"], record["length"]
+        if length:
+            if stored.blocks and sum(stored.blocks[-1]) == offset:
+                first_row, num_rows = stored.blocks[-1]
+                stored.blocks[-1] = (first_row, num_rows + length)
+            else:
+                stored.blocks.append((offset, length))
+        stored.currency = record["currency"]
+        stored.start_date = record["start_date"]
+        stored.end_date = record["end_date"]
+        stored.last_date = record["last_date"]
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Append a record to the index file and apply it."""
+        with self._lock:
+            with open(self.data_path / _INDEX_FILE, "a") as f:
+                f.write(json.dumps(record) + "\n")
+            self._apply_record(record)
+
+    def _get_arrays(self, num_rows: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the memory-mapped dates and values with at least num_rows rows."""
+        if len(self._dates) < num_rows:
+            # Files only grow within a generation, so views of earlier maps stay valid.
+            num_rows = self._num_rows
+            # Plain ndarray views avoid the overhead of slicing np.memmap objects.
+            self._dates = np.memmap(
+                self.data_path / _DATES_FILE, dtype=DATE_DTYPE, mode="r", shape=(num_rows,)
+            ).view(np.ndarray)
+            self._values = np.memmap(
+                self.data_path / _VALUES_FILE,
+                dtype=VALUE_DTYPE,
+                mode="r",
+                shape=(num_rows, len(PRICE_COLUMNS)),
+            ).view(np.ndarray)
+        return self._dates, self._values
+
+    def append(
+        self,
+        trading_item_id: int,
+        history: ColumnarPriceHistory,
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> None:
+        """Append the prices of history that are newer than the last stored date."""
+        with self._lock:
+            self._append(trading_item_id, history, start_date, end_date)
+
+    def _append(
+        self,
+        trading_item_id: int,
+        history: ColumnarPriceHistory,
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> None:
+        """Append the prices of history while holding the lock, see `append`."""
+        stored = self.trading_items.get(trading_item_id)
+        dates = history.dates.astype(DATE_DTYPE)
+        values = history.values.astype(VALUE_DTYPE)
+        if stored is not None and stored.last_date is not None:
+            is_new = dates > stored.last_date
+            dates, values = dates[is_new], values[is_new]
+
+        offset = self._num_rows
+        if len(dates):
+            # Values get written first and the index record last. Rows of an interrupted
+            # append are not referenced by the index, and leftover values get overwritten.
+            values_path = self.data_path / _VALUES_FILE
+            with open(values_path, "r+b" if values_path.exists() else "wb") as f:
+                f.truncate(offset * _VALUES_ROW_SIZE)
+                f.seek(offset * _VALUES_ROW_SIZE)
+                f.write(np.ascontiguousarray(values).tobytes())
+            with open(self.data_path / _DATES_FILE, "r+b" if offset else "wb") as f:
+                # Drop the dates of an interrupted append.
+                f.truncate(offset * DATE_DTYPE.itemsize)
+                f.seek(offset * DATE_DTYPE.itemsize)
+                f.write(np.ascontiguousarray(dates).tobytes())
+            self._num_rows = offset + len(dates)
+
+        last_date = str(dates[-1]) if len(dates) else (stored.last_date if stored else None)
+        new_end_date = max(
+            (d for d in (end_date, last_date, stored.end_date if stored else None) if d),
+            default=None,
+        )
+        self._write_record(
+            {
+                "trading_item_id": trading_item_id,
+                "offset": offset,
+                "length": len(dates),
+                "currency": history.currency or (stored.currency if stored else None),
+                "start_date": stored.start_date if stored else start_date,
+                "end_date": new_end_date,
+                "last_date": last_date,
+            }
+        )
+
+    def clear(self, trading_item_id: int) -> None:
+        """Remove a trading item from the index. Its rows get dropped by the next compact."""
+        with self._lock:
+            if trading_item_id in self.trading_items:
+                self._write_record({"trading_item_id": trading_item_id, "cleared": True})
+
+    def read(
+        self, trading_item_id: int, start_date: Optional[str], end_date: Optional[str]
+    ) -> ColumnarPriceHistory:
+        """Return the stored prices between start_date and end_date (both inclusive)."""
+        with self._lock:
+            return self._read(trading_item_id, start_date, end_date)
+
+    def _read(
+        self, trading_item_id: int, start_date: Optional[str], end_date: Optional[str]
+    ) -> ColumnarPriceHistory:
+        """Read stored prices while holding the lock, see `read`."""
+        stored = self.trading_items.get(trading_item_id)
+        if stored is None or not stored.blocks:
+            return ColumnarPriceHistory(
+                dates=np.empty(0, dtype=DATE_DTYPE),
+                values=np.empty((0, len(PRICE_COLUMNS))),
+                currency=stored.currency if stored else None,
+            )
+
+        dates, values = self._get_arrays(sum(stored.blocks[-1]))
+        row_ranges: list[tuple[int, int]] = []
+        for first_row, num_rows in stored.blocks:
+            block_dates = dates[first_row : first_row + num_rows]
+            start = 0 if start_date is None else int(block_dates.searchsorted(start_date))
+            stop = (
+                num_rows
+                if end_date is None
+                else int(block_dates.searchsorted(end_date, side="right"))
+            )
+            if stop > start or not row_ranges:
+                row_ranges.append((first_row + start, first_row + max(start, stop)))
+
+        if len(row_ranges) == 1:
+            start, stop = row_ranges[0]
+            return ColumnarPriceHistory(
+                dates=dates[start:stop], values=values[start:stop], currency=stored.currency
+            )
+        return ColumnarPriceHistory(
+            dates=np.concatenate([dates[start:stop] for start, stop in row_ranges]),
+            values=np.concatenate([values[start:stop] for start, stop in row_ranges]),
+            currency=stored.currency,
+        )
+
+    def compact(self) -> None:
+        """Rewrite the data files so that each trading item is stored in a single block."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Compact the data files while holding the lock, see `compact`."""
+        dates, values = self._get_arrays(self._num_rows)
+        new_generation = self.generation + 1
+        new_data_path = self.path / f"gen-{new_generation}"
+        shutil.rmtree(new_data_path, ignore_errors=True)
+        new_data_path.mkdir()
+
+        offset = 0
+        with (
+            open(new_data_path / _DATES_FILE, "wb") as dates_file,
+            open(new_data_path / _VALUES_FILE, "wb") as values_file,
+            open(new_data_path / _INDEX_FILE, "w") as index_file,
+        ):
+            for trading_item_id, stored in self.trading_items.items():
+                length = 0
+                for first_row, num_rows in stored.blocks:
+                    dates_file.write(dates[first_row : first_row + num_rows].tobytes())
+                    values_file.write(values[first_row : first_row + num_rows].tobytes())
+                    length += num_rows
+                record = {
+                    "trading_item_id": trading_item_id,
+                    "offset": offset,
+                    "length": length,
+                    "currency": stored.currency,
+                    "start_date": stored.start_date,
+                    "end_date": stored.end_date,
+                    "last_date": stored.last_date,
+                }
+                index_file.write(json.dumps(record) + "\n")
+                offset += length
+
+        # Switch to the new generation atomically. Views of the old memory maps stay valid
+        # after the old files get deleted.
+        tmp_current_path = self.path / f"{_CURRENT_FILE}.tmp"
+        tmp_current_path.write_text(str(new_generation))
+        os.replace(tmp_current_path, self.path / _CURRENT_FILE)
+        old_data_path = self.data_path
+        self._load()
+        shutil.rmtree(old_data_path, ignore_errors=True)
+
+
+class LocalPriceStore:
+    """LocalPriceStore stores daily price histories on disk for fast repeated reads.
+
+    The store is meant for workloads like backtests that read the same daily prices of
+    many trading items over and over. Use `get_history` (or pass the store to the
+    `Client` as `price_store`) to read through the store: prices that are not stored yet
+    get fetched from the API once and appended.
+
+    A store directory should only be used by one LocalPriceStore at a time. A
+    LocalPriceStore can be used from several threads.
+
+    Adjusted prices change retroactively after splits and dividends. Call `clear` for a
+    trading item to drop its stored prices after a corporate action.
+    """
+
+    def __init__(self, root_path: str | Path) -> None:
+        """Initialize the LocalPriceStore
+
+        :param root_path: The directory of the store. It gets created if it does not exist.
+        :type root_path: str | Path
+        """
+        self.root_path = Path(root_path)
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        self._tables: dict[bool, _PriceTable] = {}
+        self._tables_lock = threading.Lock()
+
+    def _get_table(self, adjusted: bool) -> _PriceTable:
+        """Return the table of adjusted or unadjusted prices."""
+        if adjusted not in self._tables:
+            with self._tables_lock:
+                if adjusted not in self._tables:
+                    self._tables[adjusted] = _PriceTable(
+                        self.root_path / ("adjusted" if adjusted else "unadjusted")
+                    )
+        return self._tables[adjusted]
+
+    def get_meta(self, trading_item_id: int, adjusted: bool = True) -> dict[str, Any] | None:
+        """Return the metadata of a stored trading item or None if it is not stored.
+
+        The metadata contains the currency and the fetched date range as "start_date" and
+        "end_date" (ISO dates). A start_date of None means that the full history got fetched.
+        """
+        stored = self._get_table(adjusted).trading_items.get(trading_item_id)
+        if stored is None:
+            return None
+        return {
+            "currency": stored.currency,
+            "start_date": stored.start_date,
+            "end_date": stored.end_date,
+        }
+
+    def append(
+        self,
+        trading_item_id: int,
+        history: ColumnarPriceHistory,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> None:
+        """Append the prices of history that are newer than the last stored date.
+
+        :param trading_item_id: The trading item id of the prices
+        :type trading_item_id: int
+        :param history: Daily prices with ISO dates in ascending order
+        :type history: ColumnarPriceHistory
+        :param adjusted: Whether the prices are adjusted
+        :type adjusted: bool
+        :param start_date: The start date with which history was fetched (None for the full
+            history). It only gets recorded for the first append of a trading item.
+        :type start_date: str, optional
+        :param end_date: The end date with which history was fetched. Defaults to the last
+            date of history.
+        :type end_date: str, optional
+        """
+        try:
+            history.dates.astype("datetime64[D]")
+        except ValueError as e:
+            raise ValueError("Only daily prices with ISO dates can be stored.") from e
+        self._get_table(adjusted).append(
+            trading_item_id, history, start_date=start_date, end_date=end_date
+        )
+
+    def clear(self, trading_item_id: int, adjusted: bool = True) -> None:
+        """Delete the stored prices of a trading item."""
+        self._get_table(adjusted).clear(trading_item_id)
+
+    def compact(self) -> None:
+        """Rewrite the stored prices so that every trading item is stored in a single block.
+
+        Trading items that were appended to after other trading items are stored in several
+        blocks, which `read` has to concatenate. Compacting also frees the space of cleared
+        trading items.
+        """
+        for adjusted in (True, False):
+            self._get_table(adjusted).compact()
+
+    def read(
+        self,
+        trading_item_id: int,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ColumnarPriceHistory:
+        """Return the stored prices between start_date and end_date (both inclusive).
+
+        The dates and values of the result are read-only views of the memory-mapped files
+        unless the trading item is stored in several blocks (see `compact`).
+        """
+        return self._get_table(adjusted).read(
+            trading_item_id, start_date=start_date, end_date=end_date
+        )
+
+    def read_many(
+        self,
+        trading_item_ids: Iterable[int],
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> dict[int, ColumnarPriceHistory]:
+        """Return the stored prices of many trading items, see `read`."""
+        table = self._get_table(adjusted)
+        return {
+            trading_item_id: table.read(trading_item_id, start_date=start_date, end_date=end_date)
+            for trading_item_id in trading_item_ids
+        }
+
+    def get_history(
+        self,
+        kfinance_api_client: "KFinanceApiClient",
+        trading_item_id: int,
+        adjusted: bool = True,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> ColumnarPriceHistory:
+        """Return daily prices from the store, fetching what is missing from the API first.
+
+        - If the requested range was fetched before, no request gets made.
+        - If only later prices are missing, they get fetched and appended.
+        - Otherwise (for example if the requested range starts before the stored range),
+            the history of the trading item gets fetched again and replaces the stored one.
+
+        An end_date of None means today. The prices of today can still change until the
+        market closes, so they never get stored and get fetched on every call that
+        includes today.
+        """
+        today = date.today()
+        requested_end = end_date or today.isoformat()
+        # The last complete trading day that can get stored
+        stored_end = min(requested_end, (today - timedelta(days=1)).isoformat())
+
+        history = None
+        if start_date is None or start_date <= stored_end:
+            self._update(kfinance_api_client, trading_item_id, adjusted, start_date, stored_end)
+            history = self.read(
+                trading_item_id, adjusted=adjusted, start_date=start_date, end_date=stored_end
+            )
+            if requested_end <= stored_end:
+                return history
+
+        open_history = kfinance_api_client.fetch_history_columns(
+            trading_item_id=trading_item_id,
+            is_adjusted=adjusted,
+            start_date=max(start_date or today.isoformat(), today.isoformat()),
+            end_date=requested_end,
+            periodicity=Periodicity.day,
+        )
+        if history is None:
+            return open_history
+        return ColumnarPriceHistory(
+            dates=np.concatenate([history.dates, open_history.dates]),
+            values=np.concatenate([history.values, open_history.values]),
+            currency=history.currency or open_history.currency,
+        )
+
+    def _update(
+        self,
+        kfinance_api_client: "KFinanceApiClient",
+        trading_item_id: int,
+        adjusted: bool,
+        start_date: Optional[str],
+        end_date: str,
+    ) -> None:
+        """Fetch and store the prices from start_date to end_date that are not stored yet.
+
+        See `get_history` for when prices get fetched.
+        """
+        meta = self.get_meta(trading_item_id, adjusted)
+        covers_start = (
+            meta is not None
+            and meta["end_date"] is not None
+            and (
+                meta["start_date"] is None
+                or (start_date is not None and start_date >= meta["start_date"])
+            )
+        )
+
+        if meta is None or not covers_start:
+            fetch_start = start_date
+            if meta is not None and start_date is not None and meta["start_date"] is not None:
+                fetch_start = min(start_date, meta["start_date"])
+            fetch_end = max(end_date, (meta or {}).get("end_date") or end_date)
+            history = kfinance_api_client.fetch_history_columns(
+                trading_item_id=trading_item_id,
+                is_adjusted=adjusted,
+                start_date=fetch_start,
+                end_date=fetch_end,
+                periodicity=Periodicity.day,
+            )
+            self.clear(trading_item_id, adjusted)
+            self.append(
+                trading_item_id,
+                history,
+                adjusted=adjusted,
+                start_date=fetch_start,
+                end_date=fetch_end,
+            )
+        elif end_date > meta["end_date"]:
+            fetch_start = (date.fromisoformat(meta["end_date"]) + timedelta(days=1)).isoformat()
+            history = kfinance_api_client.fetch_history_columns(
+                trading_item_id=trading_item_id,
+                is_adjusted=adjusted,
+                start_date=fetch_start,
+                end_date=end_date,
+                periodicity=Periodicity.day,
+            )
+            self.append(trading_item_id, history, adjusted=adjusted, end_date=end_date)
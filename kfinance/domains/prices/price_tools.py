@@ -8,8 +8,10 @@ from pydantic import BaseModel, Field
 from kfinance.async_batch_execution import AsyncTask, batch_execute_async_tasks
 from kfinance.client.id_resolution import unified_fetch_id_triples
 from kfinance.client.models.date_and_period_models import Periodicity
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.prices.price_models import HistoryMetadataResp, PriceHistory
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
     ToolArgsWithIdentifiers,
@@ -177,7 +179,7 @@ async def fetch_price_history_from_trading_item_id(
     url = f"/pricing/{trading_item_id}/{start_date_str}/{end_date_str}/{periodicity.value}/{adjusted_str}"
     resp = await httpx_client.get(url=url)
     resp.raise_for_status()
-    return PriceHistory.model_validate(resp.json())
+    return decode_response(PriceHistory, resp.json(), numeric=get_numeric_mode(httpx_client))
 
 
 async def get_history_metadata_from_identifiers(
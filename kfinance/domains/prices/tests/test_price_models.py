@@ -1,7 +1,12 @@
+from copy import deepcopy
 from decimal import Decimal
+import json
+
+import numpy as np
+import pandas as pd
 
 from kfinance.client.models.decimal_with_unit import Money, Shares
-from kfinance.domains.prices.price_models import PriceHistory, Prices
+from kfinance.domains.prices.price_models import ColumnarPriceHistory, PriceHistory, Prices
 
 
 class TestPriceHistory:
@@ -56,3 +61,135 @@ class TestPriceHistory:
 
         price_history = PriceHistory.model_validate(self.api_resp)
         assert price_history == expected_price_history
+
+    def test_deserialization_does_not_mutate_response(self) -> None:
+        """
+        GIVEN a price history API response
+        WHEN we deserialize the response into a PriceHistory object
+        THEN the response does not get modified.
+        """
+        original = deepcopy(self.api_resp)
+        PriceHistory.model_validate(self.api_resp)
+        assert self.api_resp == original
+
+
+class TestColumnarPriceHistory:
+    api_resp = {
+        "currency": "USD",
+        "prices": [
+            {
+                "date": "2024-06-25",
+                "open": "445.790000",
+                "high": "449.240000",
+                "low": "442.770000",
+                "close": "448.780000",
+                "volume": "999134",
+            },
+            {
+                "date": "2024-06-26",
+                "open": None,
+                "high": "449.120000",
+                "low": "443.560000",
+                "close": "448.360000",
+                "volume": "1630769",
+            },
+        ],
+    }
+
+    def test_from_response(self) -> None:
+        """
+        GIVEN a price history API response with a missing open price
+        WHEN we parse the response into a ColumnarPriceHistory
+        THEN the values are stored in a float64 array with NaN for the missing price.
+        """
+        columns = ColumnarPriceHistory.from_response(self.api_resp)
+        assert len(columns) == 2
+        assert columns.currency == "USD"
+        assert list(columns.dates) == ["2024-06-25", "2024-06-26"]
+        np.testing.assert_array_equal(
+            columns.to_numpy(),
+            np.array(
+                [
+                    [445.79, 449.24, 442.77, 448.78, 999134],
+                    [np.nan, 449.12, 443.56, 448.36, 1630769],
+                ]
+            ),
+        )
+        np.testing.assert_array_equal(columns.close, [448.78, 448.36])
+
+    def test_to_pandas_does_not_copy(self) -> None:
+        """
+        GIVEN a ColumnarPriceHistory
+        WHEN we convert it into a DataFrame
+        THEN the DataFrame is indexed by date and shares memory with the NumPy array.
+        """
+        columns = ColumnarPriceHistory.from_response(self.api_resp)
+        df = columns.to_pandas()
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert df.index.name == "date"
+        assert df.loc["2024-06-26", "volume"] == 1630769
+        assert np.shares_memory(df.to_numpy(), columns.to_numpy())
+        pd.testing.assert_series_equal(
+            df["close"], pd.Series([448.78, 448.36], index=df.index, name="close")
+        )
+
+    def test_price_history_view(self) -> None:
+        """
+        GIVEN a ColumnarPriceHistory
+        WHEN we access the price_history view
+        THEN it matches the PriceHistory parsed from the same response.
+        """
+        columns = ColumnarPriceHistory.from_response(self.api_resp)
+        assert columns.price_history == PriceHistory.model_validate(self.api_resp)
+        assert columns.price_history is columns.price_history
+
+    def test_empty_response(self) -> None:
+        """
+        GIVEN a price history API response without prices
+        WHEN we parse the response into a ColumnarPriceHistory
+        THEN the result is empty.
+        """
+        columns = ColumnarPriceHistory.from_response({"currency": "USD", "prices": []})
+        assert columns.to_numpy().shape == (0, 5)
+        assert columns.to_pandas().empty
+        assert columns.price_history == PriceHistory(prices=[])
+
+    def test_from_chunks(self) -> None:
+        """
+        GIVEN a price history API response streamed in small chunks
+        WHEN we parse the chunks into a ColumnarPriceHistory
+        THEN the result matches the ColumnarPriceHistory parsed from the whole response.
+        """
+        encoded = json.dumps(self.api_resp).encode()
+        chunks = [encoded[i : i + 7] for i in range(0, len(encoded), 7)]
+        columns = ColumnarPriceHistory.from_chunks(chunks)
+        expected = ColumnarPriceHistory.from_response(self.api_resp)
+        assert columns.currency == "USD"
+        np.testing.assert_array_equal(columns.dates, expected.dates)
+        np.testing.assert_array_equal(columns.to_numpy(), expected.to_numpy())
+
+    def test_from_chunks_grows_buffer(self) -> None:
+        """
+        GIVEN a streamed price history with more prices than the initial buffer capacity
+        WHEN we parse the chunks into a ColumnarPriceHistory
+        THEN all prices are kept in order.
+        """
+        num_prices = 3000
+        api_resp = {
+            "currency": "USD",
+            "prices": [
+                {
+                    "date": str(i),
+                    "open": str(i),
+                    "high": None,
+                    "low": "1",
+                    "close": "2",
+                    "volume": 3,
+                }
+                for i in range(num_prices)
+            ],
+        }
+        columns = ColumnarPriceHistory.from_chunks([json.dumps(api_resp).encode()])
+        assert columns.to_numpy().shape == (num_prices, 5)
+        np.testing.assert_array_equal(columns.open, np.arange(num_prices))
+        assert columns.dates[-1] == str(num_prices - 1)
@@ -0,0 +1,260 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+import numpy as np
+import pytest
+import time_machine
+
+from kfinance.client.kfinance import TradingItem
+from kfinance.client.models.date_and_period_models import Periodicity
+from kfinance.domains.prices.price_models import ColumnarPriceHistory
+from kfinance.domains.prices.price_store import LocalPriceStore
+
+
+def build_history(dates: list[str]) -> ColumnarPriceHistory:
+    """Build a daily ColumnarPriceHistory whose close prices are 1, 2, 3, ..."""
+    values = np.ones((len(dates), 5))
+    values[:, 3] = np.arange(1, len(dates) + 1)
+    return ColumnarPriceHistory(dates=np.array(dates, dtype=np.str_), values=values, currency="USD")
+
+
+class TestLocalPriceStore:
+    def test_read_date_range(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store with the prices of a trading item
+        WHEN the prices get read for a date range
+        THEN the result contains the prices within the range as views of the stored files
+        """
+        store = LocalPriceStore(tmp_path)
+        store.append(2629108, build_history(["2024-06-24", "2024-06-25", "2024-06-26"]))
+
+        history = store.read(2629108, start_date="2024-06-25", end_date="2024-06-30")
+        assert list(history.dates) == ["2024-06-25", "2024-06-26"]
+        np.testing.assert_array_equal(history.close, [2, 3])
+        assert history.currency == "USD"
+        assert not history.values.flags.writeable
+        # Reading again reuses the memory-mapped files.
+        assert np.shares_memory(store.read(2629108).values, history.values)
+
+    def test_append_only_adds_newer_prices(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store with the prices of a trading item
+        WHEN an overlapping price history gets appended
+        THEN only the prices after the last stored date get added
+        """
+        store = LocalPriceStore(tmp_path)
+        store.append(2629108, build_history(["2024-06-24", "2024-06-25"]))
+        store.append(2629108, build_history(["2024-06-25", "2024-06-26", "2024-06-27"]))
+
+        history = store.read(2629108)
+        assert list(history.dates) == ["2024-06-24", "2024-06-25", "2024-06-26", "2024-06-27"]
+        np.testing.assert_array_equal(history.close, [1, 2, 2, 3])
+        assert store.get_meta(2629108) == {
+            "currency": "USD",
+            "start_date": None,
+            "end_date": "2024-06-27",
+        }
+
+    def test_non_daily_prices(self, tmp_path: Path) -> None:
+        """
+        GIVEN a weekly price history
+        WHEN it gets appended to the store
+        THEN a ValueError gets raised
+        """
+        store = LocalPriceStore(tmp_path)
+        with pytest.raises(ValueError, match="Only daily prices"):
+            store.append(2629108, build_history(["2024 Week 2"]))
+
+    def test_read_many_and_clear(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store with prices of two trading items
+        WHEN the prices of both and of a trading item that is not stored get read
+        THEN the missing trading item is empty and cleared trading items are empty as well
+        """
+        store = LocalPriceStore(tmp_path)
+        store.append(1, build_history(["2024-06-24"]))
+        store.append(2, build_history(["2024-06-24", "2024-06-25"]))
+
+        histories = store.read_many([1, 2, 3], start_date="2024-06-25")
+        assert [len(histories[i]) for i in (1, 2, 3)] == [0, 1, 0]
+
+        store.clear(2)
+        assert len(store.read(2)) == 0
+        assert store.get_meta(2) is None
+
+    def test_interleaved_appends_and_compact(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store to which two trading items got appended alternately
+        WHEN the store gets read, compacted, and reopened
+        THEN reads return the same prices, and after compacting they are views of the files
+        """
+        store = LocalPriceStore(tmp_path)
+        store.append(1, build_history(["2024-06-24", "2024-06-25"]))
+        store.append(2, build_history(["2024-06-24"]))
+        store.append(1, build_history(["2024-06-26"]))
+        store.append(2, build_history(["2024-06-25"]))
+        store.clear(2)
+
+        history = store.read(1, start_date="2024-06-25")
+        assert list(history.dates) == ["2024-06-25", "2024-06-26"]
+        np.testing.assert_array_equal(history.close, [2, 1])
+        assert history.values.flags.writeable
+
+        store.compact()
+        for reopened_store in (store, LocalPriceStore(tmp_path)):
+            history = reopened_store.read(1, start_date="2024-06-25")
+            assert list(history.dates) == ["2024-06-25", "2024-06-26"]
+            np.testing.assert_array_equal(history.close, [2, 1])
+            assert not history.values.flags.writeable
+            assert reopened_store.get_meta(2) is None
+        # The cleared rows of trading item 2 got dropped.
+        assert (tmp_path / "adjusted" / "gen-1" / "dates.u10").stat().st_size == 3 * 40
+
+    @time_machine.travel("2024-06-27", tick=False)
+    def test_get_history_reads_through(self, tmp_path: Path) -> None:
+        """
+        GIVEN an empty store
+        WHEN the history of a trading item gets requested three times with growing end dates
+        THEN the first request fetches the range, the second one is served from the store,
+            and the third one only fetches the missing days
+        """
+        store = LocalPriceStore(tmp_path)
+        api_client = MagicMock()
+        api_client.fetch_history_columns.return_value = build_history(["2024-06-24", "2024-06-25"])
+
+        history = store.get_history(
+            api_client, 2629108, start_date="2024-01-01", end_date="2024-06-25"
+        )
+        assert list(history.dates) == ["2024-06-24", "2024-06-25"]
+        api_client.fetch_history_columns.assert_called_once_with(
+            trading_item_id=2629108,
+            is_adjusted=True,
+            start_date="2024-01-01",
+            end_date="2024-06-25",
+            periodicity=Periodicity.day,
+        )
+
+        api_client.fetch_history_columns.reset_mock()
+        history = store.get_history(
+            api_client, 2629108, start_date="2024-06-25", end_date="2024-06-25"
+        )
+        assert list(history.dates) == ["2024-06-25"]
+        api_client.fetch_history_columns.assert_not_called()
+
+        api_client.fetch_history_columns.side_effect = [
+            build_history(["2024-06-26"]),
+            build_history(["2024-06-27"]),
+        ]
+        history = store.get_history(api_client, 2629108, start_date="2024-06-25")
+        assert list(history.dates) == ["2024-06-25", "2024-06-26", "2024-06-27"]
+        assert api_client.fetch_history_columns.call_args_list == [
+            call(
+                trading_item_id=2629108,
+                is_adjusted=True,
+                start_date="2024-06-26",
+                end_date="2024-06-26",
+                periodicity=Periodicity.day,
+            ),
+            call(
+                trading_item_id=2629108,
+                is_adjusted=True,
+                start_date="2024-06-27",
+                end_date="2024-06-27",
+                periodicity=Periodicity.day,
+            ),
+        ]
+
+    @time_machine.travel("2024-06-27", tick=False)
+    def test_get_history_refetches_today(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store with the prices up to yesterday
+        WHEN the history up to today gets requested twice
+        THEN today's prices get fetched both times and never get stored
+        """
+        store = LocalPriceStore(tmp_path)
+        store.append(2629108, build_history(["2024-06-25", "2024-06-26"]), end_date="2024-06-26")
+        api_client = MagicMock()
+
+        for close in (1.0, 2.0):
+            today_history = build_history(["2024-06-27"])
+            today_history.values[:, 3] = close
+            api_client.fetch_history_columns.return_value = today_history
+            history = store.get_history(api_client, 2629108, start_date="2024-06-26")
+            assert list(history.dates) == ["2024-06-26", "2024-06-27"]
+            np.testing.assert_array_equal(history.close, [2, close])
+
+        assert [
+            c.kwargs["start_date"] for c in api_client.fetch_history_columns.call_args_list
+        ] == [
+            "2024-06-27",
+            "2024-06-27",
+        ]
+        assert store.get_meta(2629108) == {
+            "currency": "USD",
+            "start_date": None,
+            "end_date": "2024-06-26",
+        }
+
+    def test_concurrent_appends(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store
+        WHEN 10 threads append the prices of 200 trading items
+        THEN the prices of every trading item get stored intact
+        """
+        store = LocalPriceStore(tmp_path)
+        dates = ["2024-06-24", "2024-06-25", "2024-06-26"]
+
+        def append(trading_item_id: int) -> None:
+            history = build_history(dates)
+            history.values[:, 3] = trading_item_id
+            store.append(trading_item_id, history)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(append, range(200)))
+
+        for reopened_store in (store, LocalPriceStore(tmp_path)):
+            for trading_item_id in range(200):
+                history = reopened_store.read(trading_item_id)
+                assert list(history.dates) == dates
+                np.testing.assert_array_equal(history.close, [trading_item_id] * 3)
+
+    def test_trading_item_history_reads_through(self, tmp_path: Path) -> None:
+        """
+        GIVEN a client with a price store that contains the requested prices
+        WHEN daily history and history_columns get requested from a TradingItem
+        THEN both are served from the store without requests
+        """
+        store = LocalPriceStore(tmp_path)
+        store.append(2629108, build_history(["2024-06-24", "2024-06-25"]), end_date="2024-06-30")
+        api_client = MagicMock()
+        api_client.price_store = store
+        trading_item = TradingItem(api_client, 2629108)
+
+        columns = trading_item.history_columns(start_date="2024-06-25", end_date="2024-06-30")
+        assert list(columns.dates) == ["2024-06-25"]
+        price_history = trading_item.history(start_date="2024-06-01", end_date="2024-06-30")
+        assert [price.date for price in price_history.prices] == ["2024-06-24", "2024-06-25"]
+        api_client.fetch_history.assert_not_called()
+        api_client.fetch_history_columns.assert_not_called()
+
+    def test_trading_item_history_with_unknown_currency(self, tmp_path: Path) -> None:
+        """
+        GIVEN a store with prices that got stored without a currency
+        WHEN the daily history gets requested from a TradingItem
+        THEN the currency of the trading item gets used for the prices
+        """
+        store = LocalPriceStore(tmp_path)
+        history = build_history(["2024-06-24"])
+        history.currency = None
+        store.append(2629108, history, end_date="2024-06-30")
+        api_client = MagicMock()
+        api_client.price_store = store
+        api_client.fetch_history_metadata.return_value.currency = "USD"
+        trading_item = TradingItem(api_client, 2629108)
+
+        price_history = trading_item.history(start_date="2024-06-01", end_date="2024-06-30")
+        assert price_history.prices[0].close is not None
+        assert price_history.prices[0].close.unit == "USD"
+        with pytest.raises(ValueError, match="currency of the prices is unknown"):
+            _ = store.read(2629108).price_history
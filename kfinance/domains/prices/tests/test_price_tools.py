@@ -1,8 +1,13 @@
+import json
+import warnings
+
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
+from kfinance.client.kfinance import Client
 from kfinance.client.models.date_and_period_models import Periodicity
+from kfinance.client.models.numeric import NumericMode
 from kfinance.conftest import (
     FAKE_COMPANY_1_ID_TRIPLE,
     FAKE_COMPANY_2_ID_TRIPLE,
@@ -13,6 +18,7 @@ from kfinance.domains.companies.company_models import COMPANY_ID_PREFIX
 from kfinance.domains.prices.price_models import HistoryMetadataResp, PriceHistory
 from kfinance.domains.prices.price_tools import (
     GetHistoryMetadataFromIdentifiersResp,
+    GetPricesFromIdentifiers,
     GetPricesFromIdentifiersResp,
     fetch_history_metadata_from_trading_item_id,
     fetch_price_history_from_trading_item_id,
@@ -182,6 +188,35 @@ class TestPrices:
         expected_resp = PriceHistory.model_validate(self.prices_resp)
         assert resp == expected_resp
 
+    def test_prices_tool_follows_numeric_mode(
+        self,
+        mock_client: Client,
+        httpx_client: httpx.AsyncClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """
+        GIVEN a client with numeric="float"
+        WHEN the prices tool gets run
+        THEN the prices are floats and get serialized as JSON numbers without warnings
+        """
+        mock_client.kfinance_api_client.numeric = NumericMode.float
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/pricing/{SPGI_TRADING_ITEM_ID}/none/none/day/adjusted",
+            json=self.prices_resp,
+            is_reusable=True,
+        )
+        tool = GetPricesFromIdentifiers(kfinance_client=mock_client)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            output = tool.run_without_langchain(identifiers=["SPGI"])
+            output_json = tool.run_without_langchain_json(identifiers=["SPGI"])
+
+        first_price = output["results"]["SPGI"]["data"]["prices"][0]
+        assert first_price["open"] == {"value": 424.26, "unit": "USD"}
+        assert first_price["volume"] == {"value": 1129158.0, "unit": "Shares"}
+        assert json.loads(output_json) == output
+
 
 class TestHistoryMetadata:
     metadata_resp = {
@@ -3,6 +3,7 @@ from datetime import date
 from pydantic import BaseModel
 from strenum import StrEnum
 
+from kfinance.client.models.lazy_periods import LazyPeriods
 from kfinance.domains.line_items.line_item_models import BasePeriodsResp, LineItem
 
 
@@ -26,5 +27,5 @@ class SegmentPeriodData(BaseModel):
 
 class SegmentsResp(BasePeriodsResp):
     currency: str | None
-    periods: dict[str, SegmentPeriodData]  # period -> segment and period data
+    periods: LazyPeriods[SegmentPeriodData]  # period -> segment and period data
     data_source: str | None = None
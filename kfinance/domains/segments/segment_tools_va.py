@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from kfinance.client.id_resolution import unified_fetch_id_triples
 from kfinance.client.models.date_and_period_models import EstimatePeriodType
 from kfinance.client.models.response_models import PostResponse
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.line_items.line_item_models import CalendarType
 from kfinance.domains.line_items.response_notes import insert_fiscal_period_notes
@@ -15,6 +16,7 @@ from kfinance.domains.segments.segment_tools import (
     BaseSegmentsFromIdentifiersArgs,
     GetSegmentsFromIdentifiersResp,
 )
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import KfinanceTool
 
 
@@ -131,7 +133,9 @@ async def fetch_visible_alpha_segments_from_company_ids(
     resp = await httpx_client.post(url="/segments/visible_alpha", json=payload)
     resp.raise_for_status()
 
-    return PostResponse[SegmentsResp].model_validate(resp.json())
+    return decode_response(
+        PostResponse[SegmentsResp], resp.json(), numeric=get_numeric_mode(httpx_client)
+    )
 
 
 async def get_visible_alpha_segments_from_identifiers(
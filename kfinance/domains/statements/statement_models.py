@@ -3,6 +3,7 @@ from datetime import date
 from pydantic import BaseModel
 from strenum import StrEnum
 
+from kfinance.client.models.lazy_periods import LazyPeriods
 from kfinance.domains.line_items.line_item_models import BasePeriodsResp, LineItem
 
 
@@ -27,4 +28,4 @@ class StatementPeriodData(BaseModel):
 
 class StatementsResp(BasePeriodsResp):
     currency: str | None
-    periods: dict[str, StatementPeriodData]  # period -> statement and period data
+    periods: LazyPeriods[StatementPeriodData]  # period -> statement and period data
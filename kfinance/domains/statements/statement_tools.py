@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from kfinance.client.id_resolution import unified_fetch_id_triples
 from kfinance.client.models.date_and_period_models import NumPeriods, NumPeriodsBack, PeriodType
 from kfinance.client.models.response_models import PostResponse
+from kfinance.client.models.trusted_decode import decode_response
 from kfinance.client.permission_models import Permission
 from kfinance.domains.line_items.line_item_models import CalendarType
 from kfinance.domains.line_items.response_notes import (
@@ -16,6 +17,7 @@ from kfinance.domains.statements.statement_models import (
     StatementsResp,
     StatementType,
 )
+from kfinance.httpx_utils import get_numeric_mode
 from kfinance.integrations.tool_calling.tool_calling_models import (
     KfinanceTool,
     ToolArgsWithIdentifiers,
@@ -247,4 +249,6 @@ async def fetch_statements_from_company_ids(
     resp = await httpx_client.post(url=url, json=payload)
     resp.raise_for_status()
 
-    return PostResponse[StatementsResp].model_validate(resp.json())
+    return decode_response(
+        PostResponse[StatementsResp], resp.json(), numeric=get_numeric_mode(httpx_client)
+    )
@@ -2,19 +2,52 @@ import asyncio
 import atexit
 from contextlib import contextmanager
 from contextvars import ContextVar
+from dataclasses import dataclass
 from queue import Queue
+import time
 from typing import Any, Generator
 
 import httpx
 from httpx import Request, Response
 
-from kfinance.client.fetch import KFinanceApiClient
+from kfinance.client.fetch import KFinanceApiClient, get_batch_request_headers
+from kfinance.client.models.numeric import NumericMode
+from kfinance.metrics import MetricsRegistry, record_http_request
 
 
 # Context variable for tracking endpoint URLs across async contexts
 _endpoint_tracker_queue: ContextVar[Queue[str] | None] = ContextVar(
     "endpoint_tracker_queue", default=None
 )
+# Context variable for the request trace of the current async context
+_request_trace: ContextVar["list[RequestTraceEntry] | None"] = ContextVar(
+    "request_trace", default=None
+)
+
+
+@dataclass
+class RequestTraceEntry:
+    """A request recorded by `KfinanceHttpxClient.request_tracker`.
+
+    Timestamps are seconds since the epoch (time.time). Entries with cache_hit=True were
+    answered from a cache (for example an identifier resolution shared within an
+    `id_resolution_scope`) without a request.
+    """
+
+    method: str
+    url: str
+    start: float
+    end: float | None = None
+    status_code: int | None = None
+    # The number of response bytes received over the network (before decompression).
+    response_bytes: int | None = None
+    cache_hit: bool = False
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """The duration of the request in seconds or None if it hasn't finished."""
+        return None if self.end is None else self.end - self.start
 
 
 class KfinanceBearerAuth(httpx.Auth):
@@ -31,15 +64,32 @@ class KfinanceBearerAuth(httpx.Auth):
 class KfinanceHttpxClient(httpx.AsyncClient):
     """httpx.AsyncClient subclass that automatically prefixes URLs with a base URL and includes endpoint tracking."""
 
-    def __init__(self, api_client: KFinanceApiClient) -> None:
-        """"""
+    def __init__(
+        self, api_client: KFinanceApiClient, metrics_registry: MetricsRegistry | None = None
+    ) -> None:
+        """Initialize the client.
+
+        :param api_client: The api client that provides the api host and access tokens.
+        :type api_client: KFinanceApiClient
+        :param metrics_registry: A registry for the latency, status codes, and response bytes
+            of requests by endpoint.
+        :type metrics_registry: MetricsRegistry, Optional
+        """
         self._kfinance_base_url: str = f"{api_client.api_host}/api/v1"
+        self._kfinance_base_path = httpx.URL(self._kfinance_base_url).path
+        self._api_client = api_client
+        self.metrics_registry = metrics_registry
 
         super().__init__(auth=KfinanceBearerAuth(api_client=api_client))
 
         # Auto-register cleanup on exit
         atexit.register(self._cleanup_on_exit)
 
+    @property
+    def numeric(self) -> NumericMode:
+        """Return the numeric mode of the api client, which selects how responses get decoded."""
+        return self._api_client.numeric
+
     @contextmanager
     def endpoint_tracker(self) -> Generator[Queue[str], None, None]:
         """Context manager to track endpoint URLs accessed during execution.
@@ -63,6 +113,44 @@ class KfinanceHttpxClient(httpx.AsyncClient):
         finally:
             _endpoint_tracker_queue.reset(token)
 
+    @contextmanager
+    def request_tracker(self) -> Generator[list[RequestTraceEntry], None, None]:
+        """Context manager to trace the requests made during execution.
+
+        Each request appends a RequestTraceEntry with its URL, method, status, timestamps,
+        and response size to the yielded list. The list is shared by the tasks started
+        within the context (for example with asyncio.gather) and only ever gets appended
+        to, so it doesn't need a lock. Like endpoint_tracker, this is safe for concurrent
+        async operations because it uses contextvars. The entries of nested trackers also
+        get added to the enclosing trace.
+
+        Usage:
+            with httpx_client.request_tracker() as trace:
+                await httpx_client.get("some/endpoint")
+            for entry in trace:
+                print(entry.url, entry.status_code, entry.duration)
+        """
+        trace: list[RequestTraceEntry] = []
+        parent_trace = _request_trace.get()
+        token = _request_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _request_trace.reset(token)
+            if parent_trace is not None:
+                parent_trace.extend(trace)
+
+    def trace_cache_hit(self, method: str, url: str) -> None:
+        """Record a request that was answered from a cache in the active request trace."""
+        trace = _request_trace.get()
+        if trace is not None:
+            now = time.time()
+            trace.append(
+                RequestTraceEntry(
+                    method=method, url=self._build_url(url), start=now, end=now, cache_hit=True
+                )
+            )
+
     def _cleanup_on_exit(self) -> None:
         """Clean up the httpx client on process exit."""
         try:
@@ -82,12 +170,62 @@ class KfinanceHttpxClient(httpx.AsyncClient):
         return f"{self._kfinance_base_url}/{url.lstrip('/')}"
 
     async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:  # type: ignore[override]
-        """Override request to prepend base_url to relative URLs and track endpoints."""
+        """Override request to prepend base_url, add batch headers, and track endpoints and requests."""
         full_url = self._build_url(url)
 
+        # Add Kfinance-Batch-Id/Size headers if the request is part of a batch.
+        batch_request_headers = get_batch_request_headers()
+        if batch_request_headers:
+            kwargs["headers"] = {**batch_request_headers, **(kwargs.get("headers") or {})}
+
         # Track endpoint if tracking is active in the current async context
         queue = _endpoint_tracker_queue.get(None)
         if queue is not None:
             queue.put(full_url)
 
-        return await super().request(method=method, url=full_url, **kwargs)
+        trace = _request_trace.get()
+        if trace is None and self.metrics_registry is None:
+            return await super().request(method=method, url=full_url, **kwargs)
+
+        entry = RequestTraceEntry(method=method.upper(), url=full_url, start=time.time())
+        # Latencies get measured with a monotonic clock, unlike the timestamps of the trace.
+        start = time.perf_counter()
+        if trace is not None:
+            trace.append(entry)
+        try:
+            response = await super().request(method=method, url=full_url, **kwargs)
+            entry.status_code = response.status_code
+            entry.response_bytes = response.num_bytes_downloaded
+        except Exception as e:
+            entry.error = type(e).__name__
+            raise
+        finally:
+            entry.end = time.time()
+            if self.metrics_registry is not None:
+                self._record_request_metrics(
+                    self.metrics_registry, entry, duration=time.perf_counter() - start
+                )
+        return response
+
+    def _record_request_metrics(
+        self, registry: MetricsRegistry, entry: RequestTraceEntry, duration: float
+    ) -> None:
+        """Record the latency, status code, and response bytes of a request."""
+        path = httpx.URL(entry.url).path
+        if path.startswith(self._kfinance_base_path):
+            path = path[len(self._kfinance_base_path) :]
+        record_http_request(
+            registry,
+            method=entry.method,
+            path=path,
+            status_code=entry.status_code,
+            duration=duration,
+            response_bytes=entry.response_bytes,
+        )
+
+
+def get_numeric_mode(httpx_client: httpx.AsyncClient) -> NumericMode:
+    """Return the numeric mode of a KfinanceHttpxClient and decimal for other httpx clients."""
+    if isinstance(httpx_client, KfinanceHttpxClient):
+        return httpx_client.numeric
+    return NumericMode.decimal
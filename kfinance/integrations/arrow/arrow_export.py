@@ -0,0 +1,294 @@
+"""Export financial responses into Apache Arrow tables and Parquet datasets.
+
+All tables share the long format schema returned by `get_financials_schema`, with one
+row per (company, period, line item). The converters accept either the pydantic models
+returned by the client or the raw JSON responses of the API. For raw responses, values
+and dates get parsed by Arrow instead of pydantic, which skips the Python object
+intermediate.
+
+pyarrow is an optional dependency. Install it with `pip install kensho-kfinance[arrow]`.
+"""
+
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple, Sequence
+
+from pydantic import BaseModel
+
+from kfinance.client.models.response_models import PostResponse
+from kfinance.domains.capitalizations.capitalization_models import Capitalizations
+from kfinance.domains.line_items.line_item_models import LineItemResp
+from kfinance.domains.prices.price_models import PriceHistory
+from kfinance.domains.segments.segment_models import SegmentsResp
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+class FinancialsRow(NamedTuple):
+    """A row of the long format financials schema."""
+
+    company_id: str | None
+    period: str
+    period_end_date: Any
+    num_months: int | None
+    section: str | None
+    name: str
+    value: str | None
+    currency: str | None
+    source: str | None
+
+
+def _import_pyarrow() -> ModuleType:
+    """Import pyarrow or raise an ImportError explaining how to install it."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow export requires pyarrow. Install it with `pip install kensho-kfinance[arrow]`."
+        ) from e
+    return pyarrow
+
+
+def get_financials_schema() -> "pa.Schema":
+    """Return the long format schema shared by all exported tables.
+
+    - company_id: The company id (or the id passed for price and capitalization histories)
+    - period: The period key like "CY2020Q1" or the price date
+    - period_end_date: The end date of the period, null if the period is not a date
+    - num_months: The number of months in the period, null for prices and capitalizations
+    - section: The statement or segment name, null for line items, prices, and capitalizations
+    - name: The line item name or the price/capitalization metric
+    - value: The value as float64
+    - currency: The ISO code of the currency, null for share counts
+    - source: The data source of the response if the API returned one
+    """
+    pa = _import_pyarrow()
+    return pa.schema(
+        [
+            pa.field("company_id", pa.string()),
+            pa.field("period", pa.string()),
+            pa.field("period_end_date", pa.date32()),
+            pa.field("num_months", pa.int32()),
+            pa.field("section", pa.string()),
+            pa.field("name", pa.string()),
+            pa.field("value", pa.float64()),
+            pa.field("currency", pa.string()),
+            pa.field("source", pa.string()),
+        ]
+    )
+
+
+def _get(obj: Any, key: str) -> Any:
+    """Return key from a raw response dict or attribute key from a model (None if missing)."""
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _to_value(value: Any) -> str | None:
+    """Convert a value into a string for Arrow to parse as float64.
+
+    Raw responses contain values as strings (and share counts as ints). Converting all
+    values into strings keeps the column homogeneous so that Arrow can parse it in one pass.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _iter_period_rows(
+    response: BaseModel | dict, data_key: str, sections_key: str | None
+) -> Iterator[FinancialsRow]:
+    """Yield rows of a PostResponse with periods of line items, statements, or segments.
+
+    :param data_key: The key of the per period data, for example "line_item" or "statements"
+    :param sections_key: The key of the line items within each section (statement or
+        segment), None if the per period data is a single line item.
+    """
+    for company_id, result in _get(response, "results").items():
+        currency = _get(result, "currency")
+        source = _get(result, "data_source")
+        for period, period_data in _get(result, "periods").items():
+            period_end_date = _get(period_data, "period_end_date")
+            num_months = _get(period_data, "num_months")
+            data = _get(period_data, data_key)
+            if sections_key is None:
+                yield FinancialsRow(
+                    company_id=company_id,
+                    period=period,
+                    period_end_date=period_end_date,
+                    num_months=num_months,
+                    section=None,
+                    name=_get(data, "name"),
+                    value=_to_value(_get(data, "value")),
+                    currency=currency,
+                    source=source,
+                )
+                continue
+            for section in data:
+                section_name = _get(section, "name")
+                for line_item in _get(section, sections_key):
+                    yield FinancialsRow(
+                        company_id=company_id,
+                        period=period,
+                        period_end_date=period_end_date,
+                        num_months=num_months,
+                        section=section_name,
+                        name=_get(line_item, "name"),
+                        value=_to_value(_get(line_item, "value")),
+                        currency=currency,
+                        source=source,
+                    )
+
+
+def _rows_to_table(rows: Iterable[FinancialsRow]) -> "pa.Table":
+    """Build a table with the financials schema from rows.
+
+    Raw string values and dates get cast by Arrow, which is faster than parsing them in
+    Python.
+    """
+    pa = _import_pyarrow()
+    schema = get_financials_schema()
+    columns = list(zip(*rows)) or [()] * len(schema)
+    arrays = []
+    for field, column in zip(schema, columns):
+        array = pa.array(column, from_pandas=True)
+        if field.name == "period_end_date" and pa.types.is_string(array.type):
+            try:
+                array = array.cast(pa.date32())
+            except pa.ArrowInvalid:
+                # Prices can have non-date periods like "2024 Week 2" or "January 2024".
+                array = pa.nulls(len(array), pa.date32())
+        arrays.append(array.cast(field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def line_items_to_arrow(response: PostResponse[LineItemResp] | dict) -> "pa.Table":
+    """Convert a line item response for one or more companies into an Arrow table."""
+    return _rows_to_table(_iter_period_rows(response, data_key="line_item", sections_key=None))
+
+
+def statements_to_arrow(response: PostResponse[StatementsResp] | dict) -> "pa.Table":
+    """Convert a statements response for one or more companies into an Arrow table."""
+    return _rows_to_table(
+        _iter_period_rows(response, data_key="statements", sections_key="line_items")
+    )
+
+
+def segments_to_arrow(response: PostResponse[SegmentsResp] | dict) -> "pa.Table":
+    """Convert a segments response for one or more companies into an Arrow table."""
+    return _rows_to_table(
+        _iter_period_rows(response, data_key="segments", sections_key="line_items")
+    )
+
+
+def _iter_history_rows(
+    entries: Iterable[Any],
+    company_id: str | None,
+    currency: str | None,
+    money_keys: Sequence[str],
+    shares_keys: Sequence[str],
+) -> Iterator[FinancialsRow]:
+    """Yield one row per metric of each entry of a price or capitalization history."""
+    for entry in entries:
+        entry_date = _get(entry, "date")
+        period = entry_date if isinstance(entry_date, str) else entry_date.isoformat()
+        for key in (*money_keys, *shares_keys):
+            value = _get(entry, key)
+            if value is not None and not isinstance(value, (str, int)):
+                # Money or Shares model
+                value = value.value
+            yield FinancialsRow(
+                company_id=company_id,
+                period=period,
+                period_end_date=period,
+                num_months=None,
+                section=None,
+                name=key,
+                value=_to_value(value),
+                currency=currency if key in money_keys else None,
+                source=None,
+            )
+
+
+def price_history_to_arrow(
+    price_history: PriceHistory | dict, company_id: str | int | None = None
+) -> "pa.Table":
+    """Convert a price history into an Arrow table.
+
+    :param price_history: A PriceHistory or a raw /pricing response
+    :type price_history: PriceHistory | dict
+    :param company_id: The id to store in the company_id column, for example the trading item id
+    :type company_id: str | int | None
+    """
+    if isinstance(price_history, dict):
+        currency = price_history.get("currency")
+        entries = price_history["prices"]
+    else:
+        entries = price_history.prices
+        currency = next((p.close.unit for p in price_history.prices if p.close is not None), None)
+    return _rows_to_table(
+        _iter_history_rows(
+            entries,
+            company_id=None if company_id is None else str(company_id),
+            currency=currency,
+            money_keys=("open", "high", "low", "close"),
+            shares_keys=("volume",),
+        )
+    )
+
+
+def capitalizations_to_arrow(
+    capitalizations: Capitalizations | dict, company_id: str | int | None = None
+) -> "pa.Table":
+    """Convert capitalizations into an Arrow table.
+
+    :param capitalizations: Capitalizations or a raw capitalization response
+    :type capitalizations: Capitalizations | dict
+    :param company_id: The id to store in the company_id column
+    :type company_id: str | int | None
+    """
+    if isinstance(capitalizations, dict):
+        currency = capitalizations.get("currency")
+        entries = capitalizations["market_caps"]
+    else:
+        entries = capitalizations.capitalizations
+        currency = next((c.market_cap.unit for c in entries if c.market_cap is not None), None)
+    return _rows_to_table(
+        _iter_history_rows(
+            entries,
+            company_id=None if company_id is None else str(company_id),
+            currency=currency,
+            money_keys=("market_cap", "tev"),
+            shares_keys=("shares_outstanding",),
+        )
+    )
+
+
+def write_parquet(
+    table: "pa.Table",
+    root_path: str | Path,
+    partition_cols: Sequence[str] = ("company_id",),
+) -> None:
+    """Write a table into a (partitioned) Parquet dataset.
+
+    :param table: A table returned by one of the *_to_arrow functions
+    :type table: pa.Table
+    :param root_path: The root directory of the dataset
+    :type root_path: str | Path
+    :param partition_cols: The columns to partition by, for example ("company_id", "period").
+        Pass an empty sequence to write a single unpartitioned file.
+    :type partition_cols: Sequence[str]
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_to_dataset(
+        table,
+        root_path=str(root_path),
+        partition_cols=list(partition_cols) or None,
+        schema=table.schema,
+    )
@@ -0,0 +1,220 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from kfinance.client.models.response_models import PostResponse
+from kfinance.domains.capitalizations.capitalization_models import Capitalizations
+from kfinance.domains.line_items.line_item_models import LineItemResp
+from kfinance.domains.prices.price_models import PriceHistory
+from kfinance.domains.statements.statement_models import StatementsResp
+from kfinance.integrations.arrow.arrow_export import (
+    capitalizations_to_arrow,
+    get_financials_schema,
+    line_items_to_arrow,
+    price_history_to_arrow,
+    statements_to_arrow,
+    write_parquet,
+)
+
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+LINE_ITEM_RESP = {
+    "results": {
+        "21719": {
+            "currency": "USD",
+            "data_source": "S&P Capital IQ",
+            "periods": {
+                "CY2019": {
+                    "period_end_date": "2019-12-31",
+                    "num_months": 12,
+                    "line_item": {"name": "revenue", "value": "6699000000.000000"},
+                },
+                "CY2020": {
+                    "period_end_date": "2020-12-31",
+                    "num_months": 12,
+                    "line_item": {"name": "revenue", "value": None},
+                },
+            },
+        },
+        "2": {"currency": "EUR", "periods": {}},
+    },
+    "errors": {},
+}
+
+STATEMENTS_RESP = {
+    "results": {
+        "21719": {
+            "currency": "USD",
+            "periods": {
+                "CY2020": {
+                    "period_end_date": "2020-12-31",
+                    "num_months": 12,
+                    "statements": [
+                        {
+                            "name": "Income Statement",
+                            "line_items": [
+                                {"name": "Revenues", "value": "7442000000.000000"},
+                                {"name": "Total Revenues", "value": "7442000000.000000"},
+                            ],
+                        }
+                    ],
+                }
+            },
+        }
+    },
+    "errors": {},
+}
+
+PRICE_RESP = {
+    "currency": "USD",
+    "prices": [
+        {
+            "date": "2024-06-25",
+            "open": None,
+            "high": "449.240000",
+            "low": "442.770000",
+            "close": "448.780000",
+            "volume": "999134",
+        }
+    ],
+}
+
+
+class TestArrowExport:
+    @pytest.mark.parametrize("validate", [False, True], ids=["raw response", "model"])
+    def test_line_items_to_arrow(self, validate: bool) -> None:
+        """
+        GIVEN a line item response for two companies as raw dict or model
+        WHEN the response gets converted into an Arrow table
+        THEN the table has one row per company and period in the financials schema
+        """
+        response = (
+            PostResponse[LineItemResp].model_validate(LINE_ITEM_RESP)
+            if validate
+            else LINE_ITEM_RESP
+        )
+        table = line_items_to_arrow(response)
+        assert table.schema == get_financials_schema()
+        assert table.to_pylist() == [
+            {
+                "company_id": "21719",
+                "period": "CY2019",
+                "period_end_date": date(2019, 12, 31),
+                "num_months": 12,
+                "section": None,
+                "name": "revenue",
+                "value": 6699000000.0,
+                "currency": "USD",
+                "source": "S&P Capital IQ",
+            },
+            {
+                "company_id": "21719",
+                "period": "CY2020",
+                "period_end_date": date(2020, 12, 31),
+                "num_months": 12,
+                "section": None,
+                "name": "revenue",
+                "value": None,
+                "currency": "USD",
+                "source": "S&P Capital IQ",
+            },
+        ]
+
+    def test_statements_to_arrow(self) -> None:
+        """
+        GIVEN a statements response
+        WHEN the response gets converted into an Arrow table
+        THEN each line item becomes a row with the statement name as section
+        """
+        raw_table = statements_to_arrow(STATEMENTS_RESP)
+        model_table = statements_to_arrow(
+            PostResponse[StatementsResp].model_validate(STATEMENTS_RESP)
+        )
+        assert raw_table.equals(model_table)
+        assert raw_table.column("section").to_pylist() == ["Income Statement"] * 2
+        assert raw_table.column("name").to_pylist() == ["Revenues", "Total Revenues"]
+
+    def test_price_history_to_arrow(self) -> None:
+        """
+        GIVEN a price history with a missing open price
+        WHEN the price history gets converted into an Arrow table
+        THEN each metric becomes a row and volume has no currency
+        """
+        raw_table = price_history_to_arrow(PRICE_RESP, company_id=2629108)
+        model_table = price_history_to_arrow(
+            PriceHistory.model_validate(PRICE_RESP), company_id=2629108
+        )
+        assert raw_table.equals(model_table)
+        assert raw_table.column("name").to_pylist() == ["open", "high", "low", "close", "volume"]
+        assert raw_table.column("value").to_pylist() == [
+            None,
+            449.24,
+            442.77,
+            448.78,
+            999134.0,
+        ]
+        assert raw_table.column("currency").to_pylist() == ["USD"] * 4 + [None]
+        assert raw_table.column("period_end_date").to_pylist() == [date(2024, 6, 25)] * 5
+
+    def test_non_date_price_periods(self) -> None:
+        """
+        GIVEN a monthly price history with non-date periods
+        WHEN the price history gets converted into an Arrow table
+        THEN period_end_date is null
+        """
+        response = {"currency": "USD", "prices": [{**PRICE_RESP["prices"][0], "date": "June 2024"}]}
+        table = price_history_to_arrow(response)
+        assert table.column("period_end_date").null_count == 5
+
+    def test_capitalizations_to_arrow(self) -> None:
+        """
+        GIVEN a capitalization response
+        WHEN the capitalizations get converted into an Arrow table
+        THEN the raw response and the model produce the same table
+        """
+        response = {
+            "currency": "USD",
+            "market_caps": [
+                {
+                    "date": "2024-06-24",
+                    "market_cap": "139231113000.000000",
+                    "tev": "153942113000.000000",
+                    "shares_outstanding": 312900000,
+                }
+            ],
+        }
+        raw_table = capitalizations_to_arrow(response, company_id=21719)
+        assert raw_table.equals(
+            capitalizations_to_arrow(Capitalizations.model_validate(response), company_id=21719)
+        )
+        assert raw_table.column("value").to_pylist() == [
+            139231113000.0,
+            153942113000.0,
+            312900000.0,
+        ]
+
+    def test_empty_response(self) -> None:
+        """
+        GIVEN a response without results
+        WHEN the response gets converted into an Arrow table
+        THEN the table is empty but has the financials schema
+        """
+        table = line_items_to_arrow({"results": {}, "errors": {}})
+        assert table.num_rows == 0
+        assert table.schema == get_financials_schema()
+
+    def test_write_parquet(self, tmp_path: Path) -> None:
+        """
+        GIVEN a line item table
+        WHEN the table gets written as Parquet dataset partitioned by company_id
+        THEN one partition per company gets written and the data can be read back
+        """
+        table = line_items_to_arrow(LINE_ITEM_RESP)
+        write_parquet(table, tmp_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["company_id=21719"]
+        read_back = pq.read_table(tmp_path, partitioning="hive")
+        assert read_back.column("value").to_pylist() == [6699000000.0, None]
@@ -3,11 +3,11 @@ from typing import Literal, Optional
 import click
 from fastmcp.tools import FunctionTool
 from fastmcp.utilities.logging import get_logger
-from langchain_core.utils.function_calling import convert_to_openai_tool
 
 from kfinance.client.kfinance import Client
 from kfinance.integrations.local_mcp.kfinance_mcp import KfinanceMcp
 from kfinance.integrations.tool_calling.tool_calling_models import KfinanceTool
+from kfinance.integrations.tool_calling.tool_schemas import get_openai_tool_schema
 
 
 logger = get_logger(__name__)
@@ -21,7 +21,8 @@ def build_mcp_tool_from_kfinance_tool(kfinance_tool: KfinanceTool) -> FunctionTo
         description=kfinance_tool.description,
         # MCP expects a JSON schema for tool params, which we
         # can generate similar to how langchain generates openai json schemas.
-        parameters=convert_to_openai_tool(kfinance_tool)["function"]["parameters"],
+        # The schemas get precomputed once per tool (or shipped with the package).
+        parameters=get_openai_tool_schema(kfinance_tool)["function"]["parameters"],
         # The langchain runner internally validates input arguments via the args_schema.
         # When running with mcp, we need to reproduce that validation ourselves in
         # arun_without_langchain (which then calls _arun).
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from typing import Any
+
+import httpx
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from kfinance.async_batch_execution import shared_concurrency_limit
+from kfinance.client.id_resolution import id_resolution_scope
+from kfinance.integrations.tool_calling.tool_calling_models import (
+    KfinanceTool,
+    get_identifiers_from_args,
+)
+
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class ToolCall(BaseModel):
+    """A tool call generated by an LLM."""
+
+    name: str
+    args: dict[str, Any] = Field(default_factory=dict)
+
+
+class ToolCallResult(BaseModel):
+    """The result of a tool call.
+
+    Exactly one of `result` and `error` is set. `duration_ms` is the run time of the call,
+    including the time spent waiting for shared identifier resolution or concurrency slots.
+    """
+
+    name: str
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    duration_ms: float
+
+
+_tool_calls_adapter = TypeAdapter(list[ToolCall])
+
+
+async def execute_tool_calls(
+    calls: list[ToolCall] | list[dict[str, Any]],
+    tools: dict[str, KfinanceTool],
+    httpx_client: httpx.AsyncClient,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[ToolCallResult]:
+    """Execute tool calls concurrently and return their results in order.
+
+    The args of all calls get validated before any call runs. The identifiers of all calls
+    get resolved with one /ids request that the calls share (see `id_resolution_scope`),
+    and the requests of all calls share one concurrency limit. A failing call doesn't
+    affect the other calls and returns an error instead of a result.
+
+    :param calls: The tool calls with name and args.
+    :type calls: list[ToolCall] | list[dict[str, Any]]
+    :param tools: A mapping from tool names to the tools that can be called.
+    :type tools: dict[str, KfinanceTool]
+    :param httpx_client: The httpx client used to resolve identifiers.
+    :type httpx_client: httpx.AsyncClient
+    :param max_concurrency: The maximum number of requests that the calls make at once.
+    :type max_concurrency: int
+    :return: The results of the calls, in the order of the calls.
+    :rtype: list[ToolCallResult]
+    """
+    tool_calls = _tool_calls_adapter.validate_python(calls)
+
+    results: list[ToolCallResult | None] = [None] * len(tool_calls)
+    valid_calls: list[tuple[int, KfinanceTool, ToolCall, BaseModel]] = []
+    for i, tool_call in enumerate(tool_calls):
+        tool = tools.get(tool_call.name)
+        if tool is None:
+            results[i] = ToolCallResult(
+                name=tool_call.name,
+                error=f"Tool {tool_call.name} does not exist or the user lacks permissions "
+                "to use it.",
+                duration_ms=0,
+            )
+            continue
+        try:
+            args_model = tool.args_schema.model_validate(tool_call.args)
+        except ValidationError as e:
+            results[i] = ToolCallResult(name=tool_call.name, error=str(e), duration_ms=0)
+            continue
+        valid_calls.append((i, tool, tool_call, args_model))
+
+    async def execute_tool_call(
+        tool: KfinanceTool, tool_call: ToolCall, args_model: BaseModel
+    ) -> ToolCallResult:
+        start = time.perf_counter()
+        try:
+            result_model = await tool._arun_without_langchain(  # noqa: SLF001
+                tool_call.args, args_model=args_model
+            )
+            result = result_model.model_dump(mode="json", exclude_none=True)
+            return ToolCallResult(
+                name=tool_call.name,
+                result=result,
+                duration_ms=(time.perf_counter() - start) * 1000,
+            )
+        except Exception as e:  # noqa: BLE001
+            return ToolCallResult(
+                name=tool_call.name,
+                error=str(e),
+                duration_ms=(time.perf_counter() - start) * 1000,
+            )
+
+    with id_resolution_scope() as scope, shared_concurrency_limit(max_concurrency):
+        identifiers = [
+            identifier
+            for _, _, _, args_model in valid_calls
+            for identifier in get_identifiers_from_args(args_model)
+        ]
+        if identifiers:
+            scope.prefetch(identifiers, httpx_client)
+        call_results = await asyncio.gather(
+            *[
+                execute_tool_call(tool, tool_call, args_model)
+                for _, tool, tool_call, args_model in valid_calls
+            ]
+        )
+    for (i, _, _, _), call_result in zip(valid_calls, call_results):
+        results[i] = call_result
+
+    return [result for result in results if result is not None]
@@ -0,0 +1,240 @@
+import functools
+from typing import Any
+
+from pydantic import BaseModel, Field, create_model
+import pydantic_core
+
+from kfinance.client.models.lazy_periods import LazyPeriods
+
+
+# LLMs use roughly one token for every four bytes of JSON.
+BYTES_PER_TOKEN = 4
+# Shorter strings (names, descriptions, dates, ...) never get truncated.
+MIN_TRUNCATED_TEXT_LENGTH = 1000
+
+_DOWNSAMPLED = "time series were downsampled to evenly spaced points"
+_RECENT_PERIODS = "only the most recent periods were kept"
+_TRUNCATED_LISTS = "lists were truncated to their first items"
+_TRUNCATED_TEXTS = "texts were truncated"
+
+
+class ToolOutputBudget:
+    """Limits for the size of tool outputs.
+
+    Tool outputs above the budget of a tool get shortened before they get returned to the
+    LLM: time series get downsampled, only the most recent periods of statements, line
+    items, segments, and estimates get kept, and other lists and long texts get truncated.
+    A note describing the shortening gets added to the `notes` of the output. Shortened
+    outputs without a `notes` field get one.
+
+    The budget applies to the estimated size of the time series, periods, lists, and long
+    texts of an output, which make up nearly all of the size of large outputs. Sizes get
+    estimated from a few serialized items per list, so outputs within the budget don't get
+    serialized twice.
+    """
+
+    def __init__(
+        self,
+        default_max_bytes: int | None = None,
+        tool_max_bytes: dict[str, int | None] | None = None,
+    ) -> None:
+        """Initialize the budget.
+
+        :param default_max_bytes: The budget of tools without a tool-specific budget. None
+            means that outputs don't get shortened.
+        :type default_max_bytes: int, Optional
+        :param tool_max_bytes: Tool name -> budget. None means that the outputs of the tool
+            don't get shortened.
+        :type tool_max_bytes: dict[str, int | None], Optional
+        """
+        self.default_max_bytes = default_max_bytes
+        self.tool_max_bytes = tool_max_bytes or {}
+
+    @classmethod
+    def from_tokens(
+        cls,
+        default_max_tokens: int | None = None,
+        tool_max_tokens: dict[str, int | None] | None = None,
+    ) -> "ToolOutputBudget":
+        """Create a budget from approximate token counts (see BYTES_PER_TOKEN)."""
+        return cls(
+            default_max_bytes=_tokens_to_bytes(default_max_tokens),
+            tool_max_bytes={
+                tool_name: _tokens_to_bytes(max_tokens)
+                for tool_name, max_tokens in (tool_max_tokens or {}).items()
+            },
+        )
+
+    def get_max_bytes(self, tool_name: str) -> int | None:
+        """Return the budget of a tool or None if its outputs don't get shortened."""
+        return self.tool_max_bytes.get(tool_name, self.default_max_bytes)
+
+    def apply(self, tool_name: str, response: BaseModel) -> BaseModel:
+        """Return the response of a tool shortened to the budget of the tool."""
+        max_bytes = self.get_max_bytes(tool_name)
+        if max_bytes is None:
+            return response
+        return apply_output_budget(response, max_bytes)
+
+
+def _tokens_to_bytes(max_tokens: int | None) -> int | None:
+    return None if max_tokens is None else max_tokens * BYTES_PER_TOKEN
+
+
+def apply_output_budget(response: BaseModel, max_bytes: int) -> BaseModel:
+    """Return a copy of a tool response shortened to about max_bytes.
+
+    Responses within the budget get returned as they are. Every time series, periods
+    mapping, and list gets shortened by the same factor but keeps at least one item, and
+    long texts keep at least MIN_TRUNCATED_TEXT_LENGTH characters. The response itself
+    doesn't get modified, so cached responses can get shortened.
+
+    :param response: The tool response.
+    :type response: BaseModel
+    :param max_bytes: The budget for the estimated size of the response.
+    :type max_bytes: int
+    :return: The shortened response.
+    :rtype: BaseModel
+    """
+    estimated_bytes = estimate_reducible_bytes(response)
+    if estimated_bytes <= max_bytes:
+        return response
+    reductions: set[str] = set()
+    reduced_response = _reduce(response, max_bytes / estimated_bytes, reductions)
+    if reductions:
+        applied_reductions = [
+            reduction
+            for reduction in (_DOWNSAMPLED, _RECENT_PERIODS, _TRUNCATED_LISTS, _TRUNCATED_TEXTS)
+            if reduction in reductions
+        ]
+        note = (
+            f"This output was shortened to fit an output budget of {max_bytes} bytes: "
+            f"{', '.join(applied_reductions)}. Request fewer identifiers or a shorter date "
+            "range to get complete data."
+        )
+        reduced_response = _add_note(reduced_response, note)
+    return reduced_response
+
+
+def _add_note(response: BaseModel, note: str) -> BaseModel:
+    """Return a copy of response with note added to its `notes`.
+
+    Responses without a `notes` field get copied into a subclass with a `notes` field, so
+    only shortened responses carry notes.
+    """
+    if "notes" in type(response).model_fields:
+        return response.model_copy(update={"notes": [*response.notes, note]})  # type: ignore[attr-defined]
+    return _with_notes_field(type(response)).model_construct(
+        _fields_set={*response.model_fields_set, "notes"},
+        **{field_name: getattr(response, field_name) for field_name in type(response).model_fields},
+        notes=[note],
+    )
+
+
+@functools.cache
+def _with_notes_field(model_cls: type[BaseModel]) -> type[BaseModel]:
+    """Return a subclass of model_cls with a `notes` field."""
+    return create_model(
+        model_cls.__name__,
+        __base__=model_cls,
+        __module__=model_cls.__module__,
+        notes=(list[str], Field(default_factory=list)),
+    )
+
+
+def estimate_reducible_bytes(value: Any) -> float:
+    """Estimate the serialized size of the time series, periods, lists, and long texts in value."""
+    if isinstance(value, str):
+        return len(value) if len(value) >= MIN_TRUNCATED_TEXT_LENGTH else 0
+    if isinstance(value, LazyPeriods):
+        # Only the sampled periods get validated.
+        periods = list(value)
+        return len(periods) * _estimate_item_bytes(
+            [value[periods[i]] for i in _get_sample_indices(len(periods))]
+        )
+    if isinstance(value, list):
+        return len(value) * _estimate_item_bytes(
+            [value[i] for i in _get_sample_indices(len(value))]
+        )
+    if isinstance(value, dict):
+        return sum(estimate_reducible_bytes(item) for item in value.values())
+    if isinstance(value, BaseModel):
+        return sum(
+            estimate_reducible_bytes(getattr(value, field_name))
+            for field_name in _get_reducible_fields(type(value))
+        )
+    return 0
+
+
+def _get_sample_indices(length: int) -> list[int]:
+    """Return the indices of the first, middle, and last item of a sequence."""
+    return sorted({0, length // 2, length - 1}) if length else []
+
+
+def _estimate_item_bytes(sample: list[Any]) -> float:
+    """Return the average serialized size of a sample of items."""
+    if not sample:
+        return 0
+    # Add one byte per item for the separating comma.
+    return sum(len(pydantic_core.to_json(item, exclude_none=True)) + 1 for item in sample) / len(
+        sample
+    )
+
+
+@functools.cache
+def _get_reducible_fields(model_cls: type[BaseModel]) -> list[str]:
+    """Return the fields of a model that get serialized and can get shortened."""
+    return [
+        field_name
+        for field_name, field_info in model_cls.model_fields.items()
+        if field_name not in ("errors", "notes")
+        # identifier_results is excluded but gets serialized as the data of `results`.
+        and (not field_info.exclude or field_name == "identifier_results")
+    ]
+
+
+def _reduce(value: Any, ratio: float, reductions: set[str]) -> Any:
+    """Return value with its time series, periods, lists, and long texts shortened by ratio.
+
+    The applied reductions get added to `reductions`.
+    """
+    if isinstance(value, str):
+        keep = max(int(len(value) * ratio), MIN_TRUNCATED_TEXT_LENGTH)
+        if keep >= len(value):
+            return value
+        reductions.add(_TRUNCATED_TEXTS)
+        return value[:keep]
+    if isinstance(value, LazyPeriods):
+        keep = max(int(len(value) * ratio), 1)
+        if keep >= len(value):
+            return value
+        reductions.add(_RECENT_PERIODS)
+        most_recent_periods = set(sorted(value)[-keep:])
+        return value.only([period for period in value if period in most_recent_periods])
+    if isinstance(value, list):
+        keep = max(int(len(value) * ratio), 1)
+        if keep >= len(value):
+            return value
+        if isinstance(value[0], BaseModel) and "date" in type(value[0]).model_fields:
+            reductions.add(_DOWNSAMPLED)
+            return _downsample(value, keep)
+        reductions.add(_TRUNCATED_LISTS)
+        return value[:keep]
+    if isinstance(value, dict):
+        return {key: _reduce(item, ratio, reductions) for key, item in value.items()}
+    if isinstance(value, BaseModel):
+        return value.model_copy(
+            update={
+                field_name: _reduce(getattr(value, field_name), ratio, reductions)
+                for field_name in _get_reducible_fields(type(value))
+            }
+        )
+    return value
+
+
+def _downsample(series: list[Any], keep: int) -> list[Any]:
+    """Return `keep` evenly spaced points of a series, always including the last point."""
+    if keep == 1:
+        return series[-1:]
+    step = (len(series) - 1) / (keep - 1)
+    return [series[round(i * step)] for i in range(keep)]
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from kfinance.async_batch_execution import (
+    DEFAULT_BATCH_CONCURRENCY,
+    AsyncTask,
+    batch_execute_async_tasks,
+    shared_concurrency_limit,
+)
+from kfinance.client.kfinance import Client
+from kfinance.client.permission_models import Permission
+from kfinance.conftest import SPGI_COMPANY_ID, SPGI_ID_TRIPLE
+
+
+@pytest.fixture
+def tool_calls_client(
+    mock_client: Client, httpx_mock: HTTPXMock, add_spgi_supplier_mock_resp: None
+) -> Client:
+    """Return a client with all permissions and mock responses for SPGI."""
+    mock_client.kfinance_api_client._user_permissions = set(Permission)  # noqa: SLF001
+    httpx_mock.add_response(
+        method="POST",
+        url="https://kfinance.kensho.com/api/v1/ids",
+        match_json={"identifiers": ["SPGI"]},
+        json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+        json={"name": "S&P Global Inc.", "status": "Operating"},
+        is_reusable=True,
+    )
+    return mock_client
+
+
+TOOL_CALLS = [
+    {"name": "get_info_from_identifiers", "args": {"identifiers": ["SPGI"]}},
+    {"name": "non_existent_tool", "args": {}},
+    {
+        "name": "get_business_relationship_from_identifiers",
+        "args": {"identifiers": ["spgi"], "business_relationship": "supplier"},
+    },
+    {"name": "get_info_from_identifiers", "args": {}},
+]
+
+
+class TestRunTools:
+    @pytest.mark.parametrize("run_async", [True, False])
+    def test_run_tools(
+        self, run_async: bool, tool_calls_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN tool calls with shared identifiers, an unknown tool, and invalid args
+        WHEN they get run with run_tools or arun_tools
+        THEN the results are returned in order, the identifiers get resolved with a single
+            request, and failed calls return errors
+        """
+        if run_async:
+            results = asyncio.run(tool_calls_client.arun_tools(TOOL_CALLS))
+        else:
+            results = tool_calls_client.run_tools(TOOL_CALLS)
+
+        assert [result.name for result in results] == [call["name"] for call in TOOL_CALLS]
+        assert results[0].result == tool_calls_client.tools["get_info_from_identifiers"](
+            identifiers=["SPGI"]
+        )
+        assert results[1].error is not None and "non_existent_tool" in results[1].error
+        assert results[2].result is not None
+        assert results[2].result["results"]["spgi"]["data"]["current"] == [
+            {"company_id": "C_883103", "company_name": "CRISIL Limited"}
+        ]
+        assert results[3].error is not None and "identifiers" in results[3].error
+        assert all(result.duration_ms >= 0 for result in results)
+        ids_requests = [
+            request for request in httpx_mock.get_requests() if request.url.path.endswith("/ids")
+        ]
+        # One request for run_tools and one for the single tools call in the assertion.
+        assert len(ids_requests) == 2
+
+
+class TestSharedConcurrencyLimit:
+    @pytest.mark.asyncio
+    async def test_parallel_and_nested_batches_share_limit(self) -> None:
+        """
+        GIVEN parallel batches and nested batches within a shared concurrency limit of 2
+        WHEN the batches get executed
+        THEN at most 2 tasks of the parallel batches run at once and nested batches run
+            within the slot of their parent task with their own limit of 10 tasks instead
+            of deadlocking
+        """
+        running = 0
+        max_running = 0
+
+        async def leaf() -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        async def with_nested_batch() -> None:
+            await batch_execute_async_tasks([AsyncTask(func=leaf, result_key=i) for i in range(25)])
+
+        with shared_concurrency_limit(2):
+            await asyncio.gather(
+                *[
+                    batch_execute_async_tasks(
+                        [AsyncTask(func=leaf, result_key=i) for i in range(5)]
+                    )
+                    for _ in range(3)
+                ]
+            )
+            assert max_running == 2
+
+            max_running = 0
+            await asyncio.wait_for(
+                batch_execute_async_tasks(
+                    [AsyncTask(func=with_nested_batch, result_key=i) for i in range(5)]
+                ),
+                timeout=5,
+            )
+            assert max_running == 2 * DEFAULT_BATCH_CONCURRENCY
@@ -0,0 +1,222 @@
+from pytest_httpx import HTTPXMock
+
+from kfinance.client.kfinance import Client
+from kfinance.client.permission_models import Permission
+from kfinance.conftest import SPGI_ID_TRIPLE
+from kfinance.domains.key_developments.key_devs_models import KeyDevelopment, KeyDevsResp
+from kfinance.domains.key_developments.key_devs_tools import GetKeyDevsFromIdentifierResp
+from kfinance.domains.prices.price_models import PriceHistory
+from kfinance.domains.prices.price_tools import GetPricesFromIdentifiersResp
+from kfinance.domains.statements.statement_models import StatementsResp
+from kfinance.domains.statements.statement_tools import GetFinancialStatementFromIdentifiersResp
+from kfinance.integrations.tool_calling.output_budget import (
+    ToolOutputBudget,
+    apply_output_budget,
+)
+
+
+def build_prices_resp(num_prices: int) -> GetPricesFromIdentifiersResp:
+    """Build a prices tool response with one price per day."""
+    prices = [
+        {
+            "date": f"2024-01-{day:02}",
+            "open": "100",
+            "high": "101",
+            "low": "99",
+            "close": "100.5",
+            "volume": "1000",
+        }
+        for day in range(1, num_prices + 1)
+    ]
+    return GetPricesFromIdentifiersResp(
+        identifier_results={
+            "SPGI": PriceHistory.model_validate({"currency": "USD", "prices": prices})
+        },
+        identifier_info={"SPGI": SPGI_ID_TRIPLE},
+    )
+
+
+class TestApplyOutputBudget:
+    def test_responses_within_budget_are_unchanged(self) -> None:
+        """
+        GIVEN a response within the budget
+        WHEN the budget gets applied
+        THEN the response gets returned as it is
+        """
+        resp = build_prices_resp(num_prices=5)
+        assert apply_output_budget(resp, max_bytes=len(resp.to_json_bytes())) is resp
+
+    def test_time_series_get_downsampled(self) -> None:
+        """
+        GIVEN a prices response that is about three times the budget
+        WHEN the budget gets applied
+        THEN evenly spaced prices including the first and last price get kept, a note
+            gets added although the prices response has no notes, and the original response
+            doesn't get modified
+        """
+        resp = build_prices_resp(num_prices=30)
+        resp_bytes = len(resp.to_json_bytes())
+        max_bytes = resp_bytes // 3
+
+        reduced_resp = apply_output_budget(resp, max_bytes=max_bytes)
+        assert isinstance(reduced_resp, GetPricesFromIdentifiersResp)
+        dates = [price.date for price in reduced_resp.identifier_results["SPGI"].prices]
+        assert len(dates) < 30
+        assert dates[0] == "2024-01-01"
+        assert dates[-1] == "2024-01-30"
+        # The budget doesn't include the company info and the note.
+        assert len(reduced_resp.to_json_bytes()) < resp_bytes // 2
+        assert reduced_resp.model_dump(mode="json")["notes"] == [
+            f"This output was shortened to fit an output budget of {max_bytes} bytes: time "
+            "series were downsampled to evenly spaced points. Request fewer identifiers or a "
+            "shorter date range to get complete data."
+        ]
+        assert len(resp.identifier_results["SPGI"].prices) == 30
+        assert "notes" not in resp.model_dump(mode="json")
+
+    def test_most_recent_periods_get_kept(self) -> None:
+        """
+        GIVEN a statements response with four periods
+        WHEN a budget of about two periods gets applied
+        THEN only the two most recent periods get kept
+        """
+        periods = {
+            f"CY{year}": {"period_end_date": f"{year}-12-31", "num_months": 12, "statements": []}
+            for year in [2023, 2021, 2024, 2022]
+        }
+        resp = GetFinancialStatementFromIdentifiersResp(
+            identifier_results={
+                "SPGI": StatementsResp.model_validate({"currency": "USD", "periods": periods})
+            },
+            identifier_info={"SPGI": SPGI_ID_TRIPLE},
+        )
+
+        reduced_resp = apply_output_budget(resp, max_bytes=130)
+        assert isinstance(reduced_resp, GetFinancialStatementFromIdentifiersResp)
+        assert list(reduced_resp.identifier_results["SPGI"].periods) == ["CY2023", "CY2024"]
+        assert "only the most recent periods were kept" in reduced_resp.notes[0]
+
+    def test_lists_get_truncated(self) -> None:
+        """
+        GIVEN a key developments response with lists per category
+        WHEN a budget of a fraction of the response gets applied
+        THEN every list keeps its first items but at least one item
+        """
+        key_devs = KeyDevsResp(
+            results={
+                "Client Announcements": [KeyDevelopment(key_dev_id=i) for i in range(10)],
+                "Earnings Releases": [KeyDevelopment(key_dev_id=10)],
+            }
+        )
+        resp = GetKeyDevsFromIdentifierResp(
+            identifier_results={"SPGI": key_devs}, identifier_info={"SPGI": SPGI_ID_TRIPLE}
+        )
+
+        reduced_resp = apply_output_budget(resp, max_bytes=100)
+        assert isinstance(reduced_resp, GetKeyDevsFromIdentifierResp)
+        reduced_key_devs = reduced_resp.identifier_results["SPGI"].results
+        assert [key_dev.key_dev_id for key_dev in reduced_key_devs["Client Announcements"]] == [
+            0,
+            1,
+            2,
+            3,
+            4,
+        ]
+        assert [key_dev.key_dev_id for key_dev in reduced_key_devs["Earnings Releases"]] == [10]
+        assert "lists were truncated to their first items" in reduced_resp.notes[0]
+
+    def test_responses_with_notes_keep_their_field_order(self) -> None:
+        """
+        GIVEN a statements response with a `notes` field
+        WHEN it gets shortened
+        THEN the note gets added to the existing notes without changing the field order
+        """
+        periods = {
+            f"CY{year}": {"period_end_date": f"{year}-12-31", "num_months": 12, "statements": []}
+            for year in [2023, 2024]
+        }
+        resp = GetFinancialStatementFromIdentifiersResp(
+            identifier_results={
+                "SPGI": StatementsResp.model_validate({"currency": "USD", "periods": periods})
+            },
+            identifier_info={"SPGI": SPGI_ID_TRIPLE},
+            notes=["existing note"],
+        )
+
+        reduced_resp = apply_output_budget(resp, max_bytes=50)
+        assert type(reduced_resp) is GetFinancialStatementFromIdentifiersResp
+        assert list(reduced_resp.model_dump(mode="json")) == list(resp.model_dump(mode="json"))
+        assert reduced_resp.notes[0] == "existing note"
+        assert len(reduced_resp.notes) == 2
+
+
+class TestToolOutputBudget:
+    def test_tool_budgets(self) -> None:
+        """
+        GIVEN a budget in tokens with a tool-specific budget
+        WHEN the budgets of tools get requested
+        THEN they get converted to bytes and tools without a specific budget get the default
+        """
+        budget = ToolOutputBudget.from_tokens(
+            default_max_tokens=1000,
+            tool_max_tokens={"get_transcript_from_key_dev_id": None, "get_prices": 10},
+        )
+        assert budget.get_max_bytes("get_info_from_identifiers") == 4000
+        assert budget.get_max_bytes("get_prices") == 40
+        assert budget.get_max_bytes("get_transcript_from_key_dev_id") is None
+
+    def test_client_budget_applies_to_tool_outputs(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a client with an output budget and a long transcript
+        WHEN the transcript tool gets run without langchain
+        THEN the transcript gets truncated and the output includes a note
+        """
+        mock_client.kfinance_api_client._user_permissions = {Permission.TranscriptsPermission}  # noqa: SLF001
+        mock_client.tool_output_budget = ToolOutputBudget(default_max_bytes=2000)
+        httpx_mock.add_response(
+            method="GET",
+            url="https://kfinance.kensho.com/api/v1/transcript/12345",
+            json={"transcript": [{"person_name": "CEO", "text": "Thank you. " * 1000}]},
+        )
+
+        output = mock_client.tools["get_transcript_from_key_dev_id"](key_dev_id=12345)
+        assert len(output["transcript"]) == 2000
+        assert output["notes"] == [
+            "This output was shortened to fit an output budget of 2000 bytes: texts were "
+            "truncated. Request fewer identifiers or a shorter date range to get complete data."
+        ]
+
+    def test_outputs_without_budget_are_unchanged(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a client without an output budget
+        WHEN the transcript and statement tools get run without langchain
+        THEN the outputs have no added notes or errors and keep their field order, with
+            empty statement notes ahead of the results
+        """
+        mock_client.kfinance_api_client._user_permissions = {  # noqa: SLF001
+            Permission.TranscriptsPermission,
+            Permission.StatementsPermission,
+        }
+        httpx_mock.add_response(
+            method="GET",
+            url="https://kfinance.kensho.com/api/v1/transcript/12345",
+            json={"transcript": [{"person_name": "CEO", "text": "Thank you."}]},
+        )
+
+        output = mock_client.tools["get_transcript_from_key_dev_id"](key_dev_id=12345)
+        assert output == {"transcript": "CEO: Thank you."}
+
+        resp = GetFinancialStatementFromIdentifiersResp(
+            identifier_results={
+                "SPGI": StatementsResp.model_validate({"currency": "USD", "periods": {}})
+            },
+            identifier_info={"SPGI": SPGI_ID_TRIPLE},
+        )
+        assert resp.to_json_bytes() == (
+            b'{"notes":[],"results":{"SPGI":{"company_name":"S&P Global Inc.",'
+            b'"ticker":"NYSE:SPGI","country":"USA","data":{"periods":{},"currency":"USD"}}}}'
+        )
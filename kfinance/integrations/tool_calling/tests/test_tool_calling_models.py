@@ -1,13 +1,19 @@
 import asyncio
 import contextlib
 from contextlib import nullcontext as does_not_raise
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import date, datetime
+import gc
+import json
 from typing import Any
+import weakref
 
 from pydantic import BaseModel, ValidationError
+import pydantic_core
 import pytest
 from pytest_httpx import HTTPXMock
 
+from kfinance.client.id_resolution import id_resolution_scope
 from kfinance.client.kfinance import Client
 from kfinance.conftest import SPGI_COMPANY_ID, SPGI_ID_TRIPLE, SPGI_TICKER
 from kfinance.domains.business_relationships.business_relationship_models import (
@@ -25,11 +31,20 @@ from kfinance.domains.companies.company_tools import (
     GetInfoFromIdentifiers,
     GetInfoFromIdentifiersResp,
 )
+from kfinance.domains.prices.price_models import PriceHistory
+from kfinance.domains.prices.price_tools import GetPricesFromIdentifiersResp
+from kfinance.domains.rounds_of_funding.rounds_of_funding_models import FundingSummary
+from kfinance.domains.rounds_of_funding.rounds_of_funding_tools import (
+    GetFundingSummaryFromIdentifiersResp,
+)
+from kfinance.domains.statements.statement_models import StatementsResp
+from kfinance.domains.statements.statement_tools import GetFinancialStatementFromIdentifiersResp
 from kfinance.integrations.tool_calling.tool_calling_models import (
     IdentifierInfoWithResult,
     ToolArgsWithIdentifiers,
     ToolRespWithIdInfoAndErrors,
     ValidQuarter,
+    dump_tool_response_json,
 )
 
 
@@ -105,7 +120,79 @@ class TestGetEndpointsFromToolCallsWithGrounding:
 
         tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
         resp = await tool.run_with_endpoint_tracking(identifiers=["SPGI"])
+        request_trace = resp.pop("request_trace")
         assert resp == expected_resp
+        assert [(entry.method, entry.url, entry.status_code) for entry in request_trace] == [
+            ("POST", resp_endpoint[0], 200),
+            ("GET", resp_endpoint[1], 200),
+        ]
+        for entry in request_trace:
+            assert entry.end is not None and entry.end >= entry.start
+            assert entry.response_bytes
+            assert not entry.cache_hit
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_get_traced(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a tool call whose /info request fails
+        WHEN we run the tool with `run_with_grounding`
+        THEN the tool call fails and the enclosing request trace includes the failed
+            request with its status code
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/ids",
+            json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            status_code=500,
+        )
+
+        tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
+        with mock_client.httpx_client.request_tracker() as request_trace:
+            with pytest.raises(Exception, match="500"):
+                await tool.run_with_endpoint_tracking(identifiers=["SPGI"])
+        assert [(entry.method, entry.status_code) for entry in request_trace] == [
+            ("POST", 200),
+            ("GET", 500),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_shared_resolutions_get_traced_as_cache_hits(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a tool call in a resolution scope that has already resolved its identifier
+        WHEN we run the tool with `run_with_grounding`
+        THEN the shared /ids resolution gets traced as a cache hit and stays in the endpoint
+            urls
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/ids",
+            json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            json={"name": "S&P Global Inc."},
+            is_reusable=True,
+        )
+
+        tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
+        with id_resolution_scope():
+            await tool.run_with_endpoint_tracking(identifiers=["SPGI"])
+            resp = await tool.run_with_endpoint_tracking(identifiers=["spgi"])
+        assert [(entry.url, entry.cache_hit) for entry in resp["request_trace"]] == [
+            ("https://kfinance.kensho.com/api/v1/ids", True),
+            (f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}", False),
+        ]
+        assert resp["request_trace"][0].status_code is None
+        assert resp["endpoint_urls"] == [entry.url for entry in resp["request_trace"]]
 
 
 class TestValidQuarter:
@@ -194,6 +281,49 @@ class TestRunSyncAndAsync:
 
         assert sync_res1 == sync_res2 == sync_res3 == sync_res4 == async_res1 == async_res2
 
+    def test_sync_runs_share_background_loop(self, mock_client: Client) -> None:
+        """
+        GIVEN a client
+        WHEN coroutines get run sync, once from plain sync code and once from a running loop
+        THEN both run on the same background loop with the same httpx client and see the
+            context variables of the caller
+        """
+        request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+        async def get_loop_state() -> tuple[str | None, Any, asyncio.AbstractEventLoop]:
+            return request_id.get(), mock_client.httpx_client, asyncio.get_running_loop()
+
+        async def run_from_running_loop() -> tuple[str | None, Any, asyncio.AbstractEventLoop]:
+            return mock_client.run_coroutine(get_loop_state())
+
+        request_id.set("request-1")
+        first_state = mock_client.run_coroutine(get_loop_state())
+        second_state = asyncio.run(run_from_running_loop())
+
+        assert first_state[0] == second_state[0] == "request-1"
+        assert first_state[1] is second_state[1]
+        assert first_state[1] is not mock_client.httpx_client
+        assert first_state[2] is second_state[2]
+
+    def test_background_loop_gets_closed_with_client(self) -> None:
+        """
+        GIVEN a client that ran a coroutine on its background loop
+        WHEN the client gets garbage collected
+        THEN the background loop gets closed and the client isn't kept alive
+        """
+
+        async def get_running_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        client = Client(refresh_token="foo")
+        background_loop = client.run_coroutine(get_running_loop())
+        client_ref = weakref.ref(client)
+
+        del client
+        gc.collect()
+        assert client_ref() is None
+        assert background_loop.is_closed()
+
 
 class TestToolResp:
     @pytest.mark.parametrize(
@@ -257,3 +387,132 @@ class TestToolResp:
             identifier_results=identifier_results, identifier_info=identifier_info
         )
         assert expected_results == tool_resp.results
+
+
+class TestToolRespJson:
+    @pytest.mark.parametrize(
+        "tool_resp",
+        [
+            pytest.param(
+                GetPricesFromIdentifiersResp(
+                    identifier_results={
+                        "SPGI": PriceHistory.model_validate(
+                            {
+                                "currency": "USD",
+                                "prices": [
+                                    {
+                                        "date": "2024-06-03",
+                                        "open": None,
+                                        "high": "449.24",
+                                        "low": "442.77",
+                                        "close": "448.78",
+                                        "volume": 999134,
+                                    }
+                                ],
+                            }
+                        )
+                    },
+                    identifier_info={"SPGI": SPGI_ID_TRIPLE},
+                    errors=[
+                        "No identification triple found for the provided identifier: NON-EXISTENT."
+                    ],
+                ),
+                id="prices",
+            ),
+            pytest.param(
+                GetFinancialStatementFromIdentifiersResp(
+                    identifier_results={
+                        "SPGI": StatementsResp.model_validate(
+                            {
+                                "currency": None,
+                                "periods": {
+                                    "CY2024": {
+                                        "period_end_date": "2024-12-31",
+                                        "num_months": 12,
+                                        "statements": [
+                                            {
+                                                "name": "Résultat",
+                                                "line_items": [{"name": "Revenue", "value": "1.5"}],
+                                            }
+                                        ],
+                                    }
+                                },
+                            }
+                        )
+                    },
+                    identifier_info={"SPGI": SPGI_ID_TRIPLE},
+                    notes=["Fiscal periods may differ between companies."],
+                ),
+                id="statements with notes and non-ASCII",
+            ),
+            pytest.param(
+                GetFundingSummaryFromIdentifiersResp(
+                    identifier_results={
+                        "COMP": FundingSummary(
+                            company_id="C_1",
+                            total_capital_raised=1e16,
+                            total_capital_raised_currency=None,
+                            total_rounds=2,
+                            first_funding_date=date(2020, 1, 1),
+                            most_recent_funding_date=None,
+                            rounds_by_type={"Series A": 2},
+                        )
+                    },
+                    identifier_info={
+                        "COMP": IdentificationTripleWithCompanyInfo(
+                            company_id=1,
+                            security_id=None,
+                            trading_item_id=None,
+                            company_name="Company",
+                            ticker=None,
+                            country=None,
+                        )
+                    },
+                ),
+                id="funding summary without ticker and country",
+            ),
+            pytest.param(
+                GetInfoFromIdentifiersResp(
+                    results={"SPGI": {"name": "S&P Global Inc."}}, errors=["error"]
+                ),
+                id="tool resp without id info",
+            ),
+        ],
+    )
+    def test_json_bytes_match_model_dump(self, tool_resp: BaseModel) -> None:
+        """
+        GIVEN a tool response
+        WHEN it gets serialized with dump_tool_response_json
+        THEN the bytes are identical to the compact JSON of model_dump(mode="json", exclude_none=True)
+        """
+        expected = pydantic_core.to_json(tool_resp.model_dump(mode="json", exclude_none=True))
+        assert dump_tool_response_json(tool_resp) == expected
+        assert json.loads(expected) == tool_resp.model_dump(mode="json", exclude_none=True)
+
+    @pytest.mark.asyncio
+    async def test_arun_without_langchain_json(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a KfinanceTool
+        WHEN it gets run with arun_without_langchain and arun_without_langchain_json
+        THEN the JSON bytes decode to the dict response
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/ids",
+            match_json={"identifiers": ["SPGI"]},
+            json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            json={"name": "S&P Global Inc.", "status": "Operating"},
+            is_reusable=True,
+        )
+
+        tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
+        resp = await tool.arun_without_langchain(identifiers=["SPGI"])
+        json_resp = await tool.arun_without_langchain_json(identifiers=["SPGI"])
+        assert json.loads(json_resp) == resp
@@ -0,0 +1,170 @@
+from datetime import timedelta
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from kfinance.client.kfinance import Client
+from kfinance.client.permission_models import Permission
+from kfinance.conftest import SPGI_COMPANY_ID, SPGI_ID_TRIPLE
+from kfinance.domains.companies.company_models import IdentificationTriple
+from kfinance.domains.companies.company_tools import (
+    GetInfoFromIdentifiers,
+    GetInfoFromIdentifiersResp,
+)
+from kfinance.integrations.tool_calling.tool_result_cache import ToolResultCache
+
+
+class TestToolResultCache:
+    def test_key_canonicalization(self) -> None:
+        """
+        GIVEN tool calls that differ in identifier order or case, tool, or permissions
+        WHEN their cache keys get built
+        THEN only the identifier order doesn't change the key
+        """
+        key = ToolResultCache.build_key(
+            "get_info_from_identifiers", {"identifiers": ["SPGI", "AAPL"]}, ["IDPermission"]
+        )
+        assert key == ToolResultCache.build_key(
+            "get_info_from_identifiers", {"identifiers": ["AAPL", "SPGI"]}, ["IDPermission"]
+        )
+        assert key != ToolResultCache.build_key(
+            "get_info_from_identifiers", {"identifiers": ["aapl", "spgi"]}, ["IDPermission"]
+        )
+        assert key != ToolResultCache.build_key(
+            "get_cusip_from_identifiers", {"identifiers": ["AAPL", "SPGI"]}, ["IDPermission"]
+        )
+        assert key != ToolResultCache.build_key(
+            "get_info_from_identifiers", {"identifiers": ["AAPL", "SPGI"]}, []
+        )
+
+    def test_ttl_eviction_and_invalidation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        GIVEN a cache with per-tool TTLs and a max size
+        WHEN results get added, time passes, and results get invalidated
+        THEN results expire after their TTL, the least recently used result gets evicted,
+            and invalidate removes the matching results
+        """
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        cache = ToolResultCache(
+            default_ttl=timedelta(minutes=10),
+            tool_ttls={"short": timedelta(seconds=1), "uncached": timedelta(0)},
+            max_size=3,
+        )
+        result = IdentificationTriple(company_id=1, security_id=1, trading_item_id=1)
+
+        cache.set("short", result, tool_name="short")
+        cache.set("uncached", result, tool_name="uncached")
+        cache.set("spgi", result, tool_name="long", identifiers=["spgi"])
+        cache.set("aapl", result, tool_name="long", identifiers=["AAPL"])
+        assert len(cache) == 3
+        assert cache.get("uncached") is None
+        assert cache.get("short") == result
+
+        now += 2
+        assert cache.get("short") is None
+        assert cache.get("spgi") == result
+
+        # "aapl" is the least recently used result.
+        cache.set("msft", result, tool_name="long", identifiers=["MSFT"])
+        cache.set("ibm", result, tool_name="other", identifiers=["IBM"])
+        assert cache.get("aapl") is None
+
+        assert cache.invalidate(identifiers=["SPGI"]) == 1
+        assert cache.get("spgi") is None
+        assert cache.invalidate(tool_name="long") == 1
+        assert cache.get("ibm") == result
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_cached_results_are_copies(self) -> None:
+        """
+        GIVEN a cached result
+        WHEN the original result and a result returned by the cache get modified
+        THEN the cached result doesn't change
+        """
+        cache = ToolResultCache()
+        result = GetInfoFromIdentifiersResp(results={"SPGI": {"name": "S&P Global Inc."}})
+        cache.set("spgi", result, tool_name="get_info_from_identifiers")
+        result.results["SPGI"]["name"] = "modified"
+
+        cached_result = cache.get("spgi")
+        assert isinstance(cached_result, GetInfoFromIdentifiersResp)
+        assert cached_result.results["SPGI"]["name"] == "S&P Global Inc."
+        cached_result.results["SPGI"]["name"] = "modified"
+        assert cache.get("spgi") == GetInfoFromIdentifiersResp(
+            results={"SPGI": {"name": "S&P Global Inc."}}
+        )
+
+
+class TestToolResultCaching:
+    @pytest.mark.asyncio
+    async def test_repeated_calls_use_cache(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a client with a tool result cache
+        WHEN a tool gets called repeatedly, sync and async, with reordered identifiers
+        THEN only the first call makes requests and a different permission set misses the cache
+        """
+        httpx_mock.add_response(
+            method="POST",
+            url="https://kfinance.kensho.com/api/v1/ids",
+            match_json={"identifiers": ["SPGI"]},
+            json={"data": {"SPGI": SPGI_ID_TRIPLE.model_dump(mode="json")}},
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            json={"name": "S&P Global Inc.", "status": "Operating"},
+            is_reusable=True,
+        )
+        mock_client.tool_result_cache = ToolResultCache()
+        mock_client.kfinance_api_client._user_permissions = {Permission.IDPermission}  # noqa: SLF001
+        tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
+
+        resp = await tool.arun_without_langchain(identifiers=["SPGI"])
+        assert len(httpx_mock.get_requests()) == 2
+        assert await tool.arun_without_langchain(identifiers="SPGI") == resp
+        assert tool.run_without_langchain(identifiers=["SPGI"]) == resp
+        assert len(httpx_mock.get_requests()) == 2
+
+        mock_client.kfinance_api_client._user_permissions = set()  # noqa: SLF001
+        assert await tool.arun_without_langchain(identifiers=["SPGI"]) == resp
+        assert len(httpx_mock.get_requests()) == 4
+
+        mock_client.tool_result_cache.invalidate(tool_name=tool.name)
+        assert tool.run_without_langchain(identifiers=["SPGI"]) == resp
+        assert len(httpx_mock.get_requests()) == 6
+
+    def test_cached_results_match_identifier_spelling(
+        self, mock_client: Client, httpx_mock: HTTPXMock
+    ) -> None:
+        """
+        GIVEN a cached result of a call with a lower-case identifier
+        WHEN the tool gets called with the upper-case identifier
+        THEN the result matches an uncached call with the upper-case identifier
+        """
+        for identifier in ["SPGI", "spgi"]:
+            httpx_mock.add_response(
+                method="POST",
+                url="https://kfinance.kensho.com/api/v1/ids",
+                match_json={"identifiers": [identifier]},
+                json={"data": {identifier: SPGI_ID_TRIPLE.model_dump(mode="json")}},
+                is_reusable=True,
+            )
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://kfinance.kensho.com/api/v1/info/{SPGI_COMPANY_ID}",
+            json={"name": "S&P Global Inc.", "status": "Operating"},
+            is_reusable=True,
+        )
+        mock_client.kfinance_api_client._user_permissions = {Permission.IDPermission}  # noqa: SLF001
+        tool = GetInfoFromIdentifiers(kfinance_client=mock_client)
+        uncached_resp = tool.run_without_langchain(identifiers=["SPGI"])
+
+        mock_client.tool_result_cache = ToolResultCache()
+        tool.run_without_langchain(identifiers=["spgi"])
+        assert tool.run_without_langchain(identifiers=["SPGI"]) == uncached_resp
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from langchain_core.utils.function_calling import convert_to_openai_tool
+import pytest
+
+from kfinance.client.kfinance import Client
+from kfinance.client.permission_models import Permission
+from kfinance.integrations.tool_calling import tool_schemas
+from kfinance.integrations.tool_calling.tool_schemas import (
+    load_tool_schemas,
+    write_tool_schemas,
+)
+
+
+class TestToolSchemas:
+    def test_stored_schemas_match_converted_schemas(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        GIVEN tool schemas written for a package version
+        WHEN they get loaded for the same and for a different version
+        THEN the schemas match the langchain conversion of the tools, and schemas of a
+            different version are ignored
+        """
+        monkeypatch.setattr(tool_schemas, "get_package_version", lambda: "1.0.0")
+        schemas_path = tmp_path / "tool_schemas.json"
+        write_tool_schemas(schemas_path)
+
+        stored_schemas = load_tool_schemas.__wrapped__(schemas_path)
+        assert stored_schemas is not None
+        client = Client(refresh_token="foo")
+        client.kfinance_api_client._user_permissions = set(Permission)  # noqa: SLF001
+        assert list(stored_schemas) == [tool.name for tool in client.langchain_tools]
+        for tool in client.langchain_tools:
+            assert stored_schemas[tool.name]["openai_tool"] == convert_to_openai_tool(tool)
+
+        monkeypatch.setattr(tool_schemas, "get_package_version", lambda: "1.0.1")
+        assert load_tool_schemas.__wrapped__(schemas_path) is None
+
+    @pytest.mark.parametrize("use_stored_schemas", [True, False])
+    def test_client_tool_descriptions(
+        self, use_stored_schemas: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        GIVEN a client for a user with some permissions, with and without stored schemas
+        WHEN tool descriptions get requested
+        THEN the descriptions match the tools available to the user and stored schemas
+            get used without building the tools
+        """
+        monkeypatch.setattr(tool_schemas, "get_package_version", lambda: "1.0.0")
+        schemas_path = tmp_path / "tool_schemas.json"
+        write_tool_schemas(schemas_path)
+        stored_schemas = load_tool_schemas.__wrapped__(schemas_path)
+        monkeypatch.setattr(
+            "kfinance.client.kfinance.load_tool_schemas",
+            lambda: stored_schemas if use_stored_schemas else None,
+        )
+
+        client = Client(refresh_token="foo")
+        client.kfinance_api_client._user_permissions = {Permission.PricingPermission}  # noqa: SLF001
+        openai_tool_descriptions = client.openai_tool_descriptions
+        anthropic_tool_descriptions = client.anthropic_tool_descriptions
+        assert (client._tools is None) == use_stored_schemas  # noqa: SLF001
+
+        expected_openai_tool_descriptions = [
+            convert_to_openai_tool(tool) for tool in client.langchain_tools
+        ]
+        assert openai_tool_descriptions == expected_openai_tool_descriptions
+        assert "get_prices_from_identifiers" in [
+            description["name"] for description in anthropic_tool_descriptions
+        ]
+        assert "get_financial_statement_from_identifiers" not in [
+            description["name"] for description in anthropic_tool_descriptions
+        ]
+        # Descriptions are computed once per client.
+        assert client.openai_tool_descriptions[0] is openai_tool_descriptions[0]
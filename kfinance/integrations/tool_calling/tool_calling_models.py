@@ -1,8 +1,20 @@
 import abc
+from datetime import timedelta
+import functools
 import json
-from typing import Annotated, Any, Callable, Coroutine, Dict, Generic, Literal, Type, TypeVar
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    Literal,
+    Type,
+    TypeVar,
+    get_args,
+)
 
-from asyncer import syncify
 from httpx import HTTPStatusError
 from langchain_core.tools import BaseTool
 from pydantic import (
@@ -10,15 +22,17 @@ from pydantic import (
     BeforeValidator,
     ConfigDict,
     Field,
+    TypeAdapter,
     computed_field,
     field_validator,
     model_serializer,
 )
+import pydantic_core
 
 from kfinance.client.kfinance import Client
 from kfinance.client.permission_models import Permission
 from kfinance.domains.companies.company_models import IdentificationTripleWithCompanyInfo
-from kfinance.httpx_utils import KfinanceHttpxClient
+from kfinance.metrics import record_tool_call
 
 
 def _sanitize_http_error(e: HTTPStatusError) -> str:
@@ -41,26 +55,129 @@ class KfinanceTool(BaseTool):
 
     model_config = ConfigDict(extra="forbid")
 
-    def run_without_langchain(self, *args: Any, **kwargs: Any) -> dict:
-        """Execute a Kfinance tool without langchain (sync version).
+    def _get_run_kwargs(self, args_model: BaseModel, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Return the kwargs for _run from the validated LLM generated kwargs.
 
         Langchain converts json input params into the pydantic args_schema, which means that
         strings get turned into enums, dates, or datetimes where necessary.
         When executing a tool without langchain, we have to handle this
         conversion ourselves.
-
-        Note: FastMCP uses arun_without_langchain (async version) to avoid event loop conflicts.
         """
-        args_model = self.args_schema.model_validate(kwargs)
         args_dict = args_model.model_dump()
         # Only pass params included in the LLM generated kwargs.
         # This means that we don't use defaults defined by the pydantic models and instead use
         # the defaults defined in the `_run` function.
         # This behavior matches the langchain handling. See
         # https://github.com/langchain-ai/langchain/blob/ca39680d2ab0d786bc035930778a5787e7bb5e01/libs/core/langchain_core/tools/base.py#L595-L597
-        args_dict = {k: v for k, v in args_dict.items() if k in kwargs}
-        result_model = self._run(**args_dict)
-        return result_model.model_dump(mode="json", exclude_none=True)
+        return {k: v for k, v in args_dict.items() if k in kwargs}
+
+    def _get_cache_key(self, args_model: BaseModel) -> str | None:
+        """Return the result cache key of a call or None if its result should not get cached.
+
+        The key includes the tool name, the validated args with defaults applied, and the
+        permissions of the user.
+        """
+        cache = self.kfinance_client.tool_result_cache
+        if cache is None or cache.get_ttl(self.name) <= timedelta(0):
+            return None
+        return cache.build_key(
+            tool_name=self.name,
+            args=args_model.model_dump(mode="json"),
+            permissions=[
+                permission.name
+                for permission in self.kfinance_client.kfinance_api_client.user_permissions
+            ],
+        )
+
+    def _get_cached_result(self, cache_key: str | None) -> BaseModel | None:
+        """Return the cached result for a cache key or None on a cache miss."""
+        cache = self.kfinance_client.tool_result_cache
+        if cache_key is None or cache is None:
+            return None
+        return cache.get(cache_key)
+
+    def _cache_result(
+        self, cache_key: str | None, args_model: BaseModel, result: BaseModel
+    ) -> None:
+        """Add a result to the result cache.
+
+        Results with errors don't get cached because errors can be transient.
+        """
+        cache = self.kfinance_client.tool_result_cache
+        if cache_key is None or cache is None or getattr(result, "errors", None):
+            return
+        cache.set(
+            key=cache_key,
+            result=result,
+            tool_name=self.name,
+            identifiers=get_identifiers_from_args(args_model),
+        )
+
+    def _apply_output_budget(self, result: BaseModel) -> BaseModel:
+        """Shorten a result to the output budget of the client (if any) for this tool."""
+        budget = self.kfinance_client.tool_output_budget
+        if budget is None:
+            return result
+        return budget.apply(self.name, result)
+
+    def _run_without_langchain(self, kwargs: dict[str, Any]) -> BaseModel:
+        """Execute a Kfinance tool without langchain and return the response model.
+
+        Results get read from and added to the tool result cache of the client (if any) and
+        get shortened to the output budget of the client (if any). The call gets recorded in
+        the metrics registry of the client (if any).
+        """
+        with record_tool_call(self.kfinance_client.metrics_registry, self.name):
+            args_model = self.args_schema.model_validate(kwargs)
+            cache_key = self._get_cache_key(args_model)
+            if (cached_result := self._get_cached_result(cache_key)) is not None:
+                return self._apply_output_budget(cached_result)
+            result = self._run(**self._get_run_kwargs(args_model, kwargs))
+            self._cache_result(cache_key, args_model, result)
+            return self._apply_output_budget(result)
+
+    def run_without_langchain(self, *args: Any, **kwargs: Any) -> dict:
+        """Execute a Kfinance tool without langchain (sync version).
+
+        Note: FastMCP uses arun_without_langchain (async version) to avoid event loop conflicts.
+        """
+        result_model = self._run_without_langchain(kwargs)
+        return result_model.model_dump(mode="json", exclude_none=True, warnings=False)
+
+    def run_without_langchain_json(self, *args: Any, **kwargs: Any) -> bytes:
+        """Execute a Kfinance tool without langchain and return the response as JSON bytes.
+
+        The bytes are the compact JSON encoding of the result of `run_without_langchain`,
+        see `dump_tool_response_json`.
+        """
+        return dump_tool_response_json(self._run_without_langchain(kwargs))
+
+    async def _arun_without_langchain(
+        self, kwargs: dict[str, Any], args_model: BaseModel | None = None
+    ) -> BaseModel:
+        """Execute a Kfinance tool without langchain and return the response model.
+
+        Results get read from and added to the tool result cache of the client (if any) and
+        get shortened to the output budget of the client (if any). The call gets recorded in
+        the metrics registry of the client (if any).
+
+        :param kwargs: The LLM generated kwargs.
+        :type kwargs: dict[str, Any]
+        :param args_model: The kwargs validated with the args_schema if they already were.
+        :type args_model: BaseModel, Optional
+        """
+        with record_tool_call(self.kfinance_client.metrics_registry, self.name):
+            if args_model is None:
+                args_model = self.args_schema.model_validate(kwargs)
+            cache_key = self._get_cache_key(args_model)
+            if (cached_result := self._get_cached_result(cache_key)) is not None:
+                return self._apply_output_budget(cached_result)
+            try:
+                result = await self._arun(**self._get_run_kwargs(args_model, kwargs))
+            except HTTPStatusError as e:
+                raise Exception(_sanitize_http_error(e)) from None
+            self._cache_result(cache_key, args_model, result)
+            return self._apply_output_budget(result)
 
     async def arun_without_langchain(self, *args: Any, **kwargs: Any) -> dict:
         """Execute a Kfinance tool without langchain (async version).
@@ -68,23 +185,31 @@ class KfinanceTool(BaseTool):
         This is the async equivalent of run_without_langchain, designed for use
         with async frameworks like FastMCP.
         """
-        args_model = self.args_schema.model_validate(kwargs)
-        args_dict = args_model.model_dump()
-        # Only pass params included in the LLM generated kwargs.
-        args_dict = {k: v for k, v in args_dict.items() if k in kwargs}
-        try:
-            result_model = await self._arun(**args_dict)
-        except HTTPStatusError as e:
-            raise Exception(_sanitize_http_error(e)) from None
-        return result_model.model_dump(mode="json", exclude_none=True)
+        result_model = await self._arun_without_langchain(kwargs)
+        return result_model.model_dump(mode="json", exclude_none=True, warnings=False)
+
+    async def arun_without_langchain_json(self, *args: Any, **kwargs: Any) -> bytes:
+        """Execute a Kfinance tool without langchain and return the response as JSON bytes.
+
+        This is the async equivalent of run_without_langchain_json.
+        """
+        return dump_tool_response_json(await self._arun_without_langchain(kwargs))
 
     async def run_with_endpoint_tracking(self, *args: Any, **kwargs: Any) -> Any:
         """Execute a Kfinance tool with endpoint tracking.
 
         This is a wrapper around the `_arun` method that adds grounding support
         for returning the endpoint urls along with the data as citation info for the LRA Data Agent.
+        The `request_trace` of the result lists a RequestTraceEntry per request (including
+        identifier resolutions and failed requests) with its method, status, timestamps,
+        response size, and cache hit flag. `endpoint_urls` lists the URLs of all entries,
+        including cache hits that never reached the network, because the tool still used
+        their data. Filter the trace by `cache_hit` to get only the requests that were sent.
         """
-        with self.kfinance_client.httpx_client.endpoint_tracker() as endpoint_tracker_queue:
+        with (
+            record_tool_call(self.kfinance_client.metrics_registry, self.name),
+            self.kfinance_client.httpx_client.request_tracker() as request_trace,
+        ):
             args_model = self.args_schema.model_validate(kwargs)
             args_dict = args_model.model_dump()
             args_dict = {k: v for k, v in args_dict.items() if k in kwargs}
@@ -93,36 +218,18 @@ class KfinanceTool(BaseTool):
             except HTTPStatusError as e:
                 raise Exception(_sanitize_http_error(e)) from None
 
-            # After completion of tool data fetching and within the endpoint_tracker context manager scope,
-            # dequeue the endpoint_tracker_queue
-            endpoint_urls = []
-            while not endpoint_tracker_queue.empty():
-                endpoint_urls.append(endpoint_tracker_queue.get())
-
-            return {
-                "data": result_model,
-                "endpoint_urls": endpoint_urls,
-            }
+        return {
+            "data": result_model,
+            "endpoint_urls": [entry.url for entry in request_trace],
+            "request_trace": request_trace,
+        }
 
     def _run(self, *args: Any, **kwargs: Any) -> BaseModel:
-        """Run a tool sync with syncify
+        """Run a tool sync on the background event loop of the client.
 
-        `syncify` closes the current event loop after the call. That loop was tied
-        to the httpx client. So once the loop gets closed, the httpx can't be
-        used anymore and has to be recreated.
+        The loop and the connections of its httpx client are reused across sync calls.
         """
-        try:
-            return syncify(self._arun, raise_sync_error=False)(*args, **kwargs)
-        except RuntimeError as e:
-            if str(e).lower() == "event loop is closed":
-                # Create a new httpx client and retry
-                self.kfinance_client.httpx_client = KfinanceHttpxClient(
-                    api_client=self.kfinance_client.kfinance_api_client
-                )
-                return syncify(self._arun, raise_sync_error=False)(*args, **kwargs)
-            else:
-                # Re-raise if it doesn't look like an event loop issue
-                raise
+        return self.kfinance_client.run_coroutine(self._arun(*args, **kwargs))
 
     @abc.abstractmethod
     def _arun(self, *args: Any, **kwargs: Any) -> Coroutine[Any, Any, BaseModel]:
@@ -175,6 +282,15 @@ class ToolArgsWithIdentifiers(BaseModel):
         return v
 
 
+def get_identifiers_from_args(args_model: BaseModel) -> list[str]:
+    """Return the identifiers of validated tool args (`identifiers` or `identifier`)."""
+    if isinstance(args_model, ToolArgsWithIdentifiers):
+        return args_model.identifiers
+    if isinstance(args_model, ToolArgsWithIdentifier):
+        return [args_model.identifier]
+    return []
+
+
 def convert_int_to_str(v: Any) -> Any:
     """Convert integers to strings if possible."""
     if isinstance(v, int):
@@ -213,6 +329,69 @@ class ToolRespWithErrors(BaseModel):
             data["errors"] = errors
         return data
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the response into compact JSON bytes.
+
+        The result is identical to the compact JSON encoding (as produced by orjson or
+        pydantic_core.to_json) of `model_dump(mode="json", exclude_none=True)`. It gets
+        built from the serialized fields instead of going through the wrap serializer,
+        which first dumps the whole response into python objects.
+
+        Responses of clients with numeric="float" contain float models (see
+        `get_float_model`) in fields declared with Decimal models. Their float values get
+        serialized as JSON numbers, so serializer warnings about the unexpected floats are
+        disabled here and in the other dumps of tool responses.
+        """
+        computed_members = self._get_computed_json_members()
+        if computed_members is None:
+            return pydantic_core.to_json(
+                self.model_dump(mode="json", exclude_none=True, warnings=False)
+            )
+        members = [
+            key + adapter.dump_json(value, exclude_none=True, warnings=False)
+            for field_name, key, adapter in _get_field_serializers(type(self))
+            if (value := getattr(self, field_name)) is not None
+        ]
+        members.extend(computed_members)
+        if self.errors:
+            members.append(b'"errors":' + pydantic_core.to_json(self.errors))
+        return b"{" + b",".join(members) + b"}"
+
+    def _get_computed_json_members(self) -> list[bytes] | None:
+        """Return the serialized computed fields or None if they can't be serialized directly."""
+        return None if type(self).model_computed_fields else []
+
+
+@functools.cache
+def _get_field_serializers(
+    model_cls: type[BaseModel],
+) -> list[tuple[str, bytes, TypeAdapter]]:
+    """Return the name, JSON key, and serializer of each serialized field except `errors`."""
+    field_serializers = []
+    for field_name, field_info in model_cls.model_fields.items():
+        if field_info.exclude or field_name == "errors":
+            continue
+        annotation: Any = (
+            Annotated[(field_info.annotation, *field_info.metadata)]
+            if field_info.metadata
+            else field_info.annotation
+        )
+        field_serializers.append(
+            (field_name, pydantic_core.to_json(field_name) + b":", TypeAdapter(annotation))
+        )
+    return field_serializers
+
+
+def dump_tool_response_json(response: BaseModel) -> bytes:
+    """Serialize a tool response into compact JSON bytes.
+
+    The result is the compact JSON encoding of
+    `response.model_dump(mode="json", exclude_none=True)`.
+    """
+    if isinstance(response, ToolRespWithErrors):
+        return response.to_json_bytes()
+    return response.__pydantic_serializer__.to_json(response, exclude_none=True, warnings=False)
+
 
 T = TypeVar("T")
 
@@ -247,3 +426,31 @@ class ToolRespWithIdInfoAndErrors(ToolRespWithErrors, Generic[T]):
             )
 
         return output
+
+    def _get_computed_json_members(self) -> list[bytes] | None:
+        """Serialize `results` without building an IdentifierInfoWithResult per identifier."""
+        if set(type(self).model_computed_fields) != {"results"}:
+            return None
+        result_serializer = _get_result_serializer(type(self))
+        results = []
+        for identifier, result in self.identifier_results.items():
+            id_triple = self.identifier_info[identifier]
+            members = [b'"company_name":' + pydantic_core.to_json(id_triple.company_name)]
+            if id_triple.ticker is not None:
+                members.append(b'"ticker":' + pydantic_core.to_json(id_triple.ticker))
+            if id_triple.country is not None:
+                members.append(b'"country":' + pydantic_core.to_json(id_triple.country))
+            if result is not None:
+                members.append(
+                    b'"data":'
+                    + result_serializer.dump_json(result, exclude_none=True, warnings=False)
+                )
+            results.append(pydantic_core.to_json(identifier) + b":{" + b",".join(members) + b"}")
+        return [b'"results":{' + b",".join(results) + b"}"]
+
+
+@functools.cache
+def _get_result_serializer(model_cls: type[ToolRespWithIdInfoAndErrors]) -> TypeAdapter:
+    """Return the serializer of the per-identifier results of a tool response."""
+    _, result_type = get_args(model_cls.model_fields["identifier_results"].annotation)
+    return TypeAdapter(result_type)
@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+import json
+import threading
+import time
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+
+DEFAULT_TOOL_RESULT_TTL = timedelta(minutes=15)
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    """A cached tool result with its expiration (in time.monotonic seconds)."""
+
+    tool_name: str
+    identifiers: frozenset[str]
+    expiration: float
+    result: BaseModel
+
+
+class ToolResultCache:
+    """In-memory cache of tool results keyed by tool name, arguments, and permissions.
+
+    Keys get built from the validated tool arguments with defaults applied, so calls that
+    only differ in the order of their identifiers or in passing a default explicitly share
+    an entry. Identifiers keep their case because results are keyed by the identifiers as
+    passed. The permissions of the user are part of the key, which allows sharing a cache
+    between the clients of different users.
+
+    Entries expire after the TTL of their tool (`tool_ttls`, falling back to `default_ttl`).
+    A TTL of zero disables caching for a tool. When the cache is full, the least recently
+    used entry gets evicted.
+
+    Results get copied when they get cached and when they get returned, so callers can
+    modify the results that they get without changing cached results.
+    """
+
+    def __init__(
+        self,
+        default_ttl: timedelta = DEFAULT_TOOL_RESULT_TTL,
+        tool_ttls: dict[str, timedelta] | None = None,
+        max_size: int = 1024,
+    ) -> None:
+        """Initialize an empty cache.
+
+        :param default_ttl: The TTL of tools without an entry in tool_ttls.
+        :type default_ttl: timedelta
+        :param tool_ttls: A mapping from tool names to TTLs.
+        :type tool_ttls: dict[str, timedelta], Optional
+        :param max_size: The maximum number of cached results.
+        :type max_size: int
+        """
+        self.default_ttl = default_ttl
+        self.tool_ttls = dict(tool_ttls or {})
+        self.max_size = max_size
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached results, including expired ones."""
+        return len(self._entries)
+
+    def get_ttl(self, tool_name: str) -> timedelta:
+        """Return the TTL of a tool."""
+        return self.tool_ttls.get(tool_name, self.default_ttl)
+
+    @staticmethod
+    def build_key(tool_name: str, args: dict[str, Any], permissions: Iterable[str]) -> str:
+        """Build the cache key of a tool call.
+
+        :param tool_name: The name of the tool.
+        :type tool_name: str
+        :param args: The validated tool arguments with defaults applied, dumped in json mode.
+        :type args: dict[str, Any]
+        :param permissions: The names of the permissions of the user.
+        :type permissions: Iterable[str]
+        """
+        if isinstance(args.get("identifiers"), list):
+            args = {**args, "identifiers": sorted(args["identifiers"])}
+        return json.dumps(
+            [tool_name, sorted(permissions), args], sort_keys=True, separators=(",", ":")
+        )
+
+    def get(self, key: str) -> BaseModel | None:
+        """Return a copy of the cached result for key or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expiration <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return entry.result.model_copy(deep=True)
+
+    def set(
+        self,
+        key: str,
+        result: BaseModel,
+        tool_name: str,
+        identifiers: Iterable[str] = (),
+    ) -> None:
+        """Cache a copy of a tool result.
+
+        :param key: The key built with `build_key`.
+        :type key: str
+        :param result: The tool result.
+        :type result: BaseModel
+        :param tool_name: The name of the tool, which determines the TTL.
+        :type tool_name: str
+        :param identifiers: The identifiers of the call, used by `invalidate`.
+        :type identifiers: Iterable[str]
+        """
+        ttl = self.get_ttl(tool_name).total_seconds()
+        if ttl <= 0:
+            return
+        entry = _CacheEntry(
+            tool_name=tool_name,
+            identifiers=frozenset(identifier.upper() for identifier in identifiers),
+            expiration=time.monotonic() + ttl,
+            result=result.model_copy(deep=True),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, tool_name: str | None = None, identifiers: Iterable[str] | None = None
+    ) -> int:
+        """Remove cached results and return the number of removed results.
+
+        Without arguments, all results get removed. Otherwise, only results of the given tool
+        and/or results of calls that include one of the given identifiers (case-insensitive)
+        get removed.
+
+        :param tool_name: Only remove results of this tool.
+        :type tool_name: str, Optional
+        :param identifiers: Only remove results of calls with one of these identifiers.
+        :type identifiers: Iterable[str], Optional
+        """
+        invalidated_identifiers = (
+            None
+            if identifiers is None
+            else frozenset(identifier.upper() for identifier in identifiers)
+        )
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if (tool_name is None or entry.tool_name == tool_name)
+                and (
+                    invalidated_identifiers is None
+                    or not entry.identifiers.isdisjoint(invalidated_identifiers)
+                )
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
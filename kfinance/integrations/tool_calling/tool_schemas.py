@@ -0,0 +1,119 @@
+import functools
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Type, TypedDict
+
+
+if TYPE_CHECKING:
+    from kfinance.integrations.tool_calling.tool_calling_models import KfinanceTool
+
+
+TOOL_SCHEMAS_PATH = Path(__file__).parent / "tool_schemas.json"
+
+
+class ToolSchema(TypedDict):
+    """The precomputed schema of a tool."""
+
+    name: str
+    description: str
+    accepted_permissions: list[str] | None
+    openai_tool: dict[str, Any]
+
+
+def get_package_version() -> str | None:
+    """Return the kfinance version or None if the version file hasn't been generated."""
+    try:
+        from kfinance.version import __version__
+    except ImportError:
+        return None
+    return __version__
+
+
+@functools.cache
+def _convert_to_openai_tool(
+    tool_cls: Type["KfinanceTool"], name: str, description: str
+) -> dict[str, Any]:
+    """Convert a tool into an OpenAI tool schema.
+
+    Converting builds the JSON schema of the args_schema, which is slow for tools with large
+    Literal enums like line items. The schema only depends on the tool class, name, and
+    description, so conversions get cached with those as key.
+    """
+    from langchain_core.utils.function_calling import convert_to_openai_tool
+
+    # The tool is only used for its schema, so it gets constructed without a client.
+    tool = tool_cls.model_construct(name=name, description=description)  # type: ignore[call-arg]
+    return convert_to_openai_tool(tool)
+
+
+def build_tool_schema(tool: "KfinanceTool") -> ToolSchema:
+    """Build the schema of a tool."""
+    return ToolSchema(
+        name=tool.name,
+        description=tool.description,
+        accepted_permissions=(
+            None
+            if tool.accepted_permissions is None
+            else sorted(permission.value for permission in tool.accepted_permissions)
+        ),
+        openai_tool=_convert_to_openai_tool(type(tool), tool.name, tool.description),
+    )
+
+
+def build_all_tool_schemas() -> list[ToolSchema]:
+    """Build the schemas of all tools in ALL_TOOLS (in the same order)."""
+    from kfinance.integrations.tool_calling.all_tools import ALL_TOOLS
+
+    return [
+        build_tool_schema(tool_cls.model_construct())  # type: ignore[call-arg]
+        for tool_cls in ALL_TOOLS
+    ]
+
+
+def write_tool_schemas(path: Path | None = None) -> None:
+    """Write the schemas of all tools for the package version to path.
+
+    :param path: The output path, defaults to TOOL_SCHEMAS_PATH.
+    :type path: Path, Optional
+    """
+    path = TOOL_SCHEMAS_PATH if path is None else path
+    path.write_text(
+        json.dumps(
+            {"version": get_package_version(), "tools": build_all_tool_schemas()},
+            separators=(",", ":"),
+        )
+    )
+
+
+@functools.cache
+def load_tool_schemas(path: Path | None = None) -> dict[str, ToolSchema] | None:
+    """Return the schemas stored at path as a mapping from tool name to schema.
+
+    A release can ship the schemas of all tools as `tool_schemas.json` (generated with
+    scripts/generate_tool_schemas.py), which allows clients to return tool descriptions
+    without importing and converting tools.
+    Returns None if the file doesn't exist or wasn't generated for the package version.
+
+    :param path: The path of the stored schemas, defaults to TOOL_SCHEMAS_PATH.
+    :type path: Path, Optional
+    """
+    path = TOOL_SCHEMAS_PATH if path is None else path
+    if not path.exists():
+        return None
+    stored_schemas = json.loads(path.read_bytes())
+    package_version = get_package_version()
+    if package_version is None or stored_schemas["version"] != package_version:
+        return None
+    return {tool_schema["name"]: tool_schema for tool_schema in stored_schemas["tools"]}
+
+
+def get_openai_tool_schema(tool: "KfinanceTool") -> dict[str, Any]:
+    """Return the OpenAI tool schema of a tool.
+
+    The schema gets read from the stored schemas if they include the tool and otherwise
+    gets converted (once per process).
+    """
+    tool_schema = (load_tool_schemas() or {}).get(tool.name)
+    if tool_schema is not None and tool_schema["description"] == tool.description:
+        return tool_schema["openai_tool"]
+    return _convert_to_openai_tool(type(tool), tool.name, tool.description)
@@ -0,0 +1,392 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import math
+import re
+import threading
+import time
+from typing import Generator, Literal
+
+
+# Upper bounds of the buckets of duration histograms in seconds
+DEFAULT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Upper bounds of the buckets of the batch size (fan-out width) histogram
+BATCH_SIZE_BUCKETS = (1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0)
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """The name, type, description, and label names of a metric."""
+
+    name: str
+    type: Literal["counter", "histogram"]
+    description: str
+    label_names: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = DEFAULT_DURATION_BUCKETS
+
+
+TOOL_DURATION = MetricDefinition(
+    name="kfinance_tool_duration_seconds",
+    type="histogram",
+    description="Duration of tool calls, including cache hits.",
+    label_names=("tool",),
+)
+TOOL_CALLS = MetricDefinition(
+    name="kfinance_tool_calls_total",
+    type="counter",
+    description="Tool calls by outcome (ok or error).",
+    label_names=("tool", "outcome"),
+)
+HTTP_REQUEST_DURATION = MetricDefinition(
+    name="kfinance_http_request_duration_seconds",
+    type="histogram",
+    description="Latency of HTTP requests by endpoint.",
+    label_names=("method", "endpoint"),
+)
+HTTP_RESPONSES = MetricDefinition(
+    name="kfinance_http_responses_total",
+    type="counter",
+    description="HTTP responses by endpoint and status code (error for failed requests).",
+    label_names=("method", "endpoint", "status_code"),
+)
+HTTP_RESPONSE_BYTES = MetricDefinition(
+    name="kfinance_http_response_bytes_total",
+    type="counter",
+    description="Response bytes received over the network by endpoint.",
+    label_names=("method", "endpoint"),
+)
+BATCH_SIZE = MetricDefinition(
+    name="kfinance_batch_size",
+    type="histogram",
+    description="Number of tasks per batch of parallel requests (fan-out width).",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+CONCURRENCY_WAIT = MetricDefinition(
+    name="kfinance_concurrency_wait_seconds",
+    type="histogram",
+    description="Time that batch tasks waited for the concurrency limiter.",
+)
+DECODE_DURATION = MetricDefinition(
+    name="kfinance_decode_duration_seconds",
+    type="histogram",
+    description="Time to validate API responses by response model.",
+    label_names=("model",),
+)
+
+ALL_METRICS = (
+    TOOL_DURATION,
+    TOOL_CALLS,
+    HTTP_REQUEST_DURATION,
+    HTTP_RESPONSES,
+    HTTP_RESPONSE_BYTES,
+    BATCH_SIZE,
+    CONCURRENCY_WAIT,
+    DECODE_DURATION,
+)
+
+# Context variable for the metrics registry of the tool call in the current async context
+_active_metrics: ContextVar["MetricsRegistry | None"] = ContextVar("active_metrics", default=None)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """The observations of a histogram.
+
+    - buckets: (upper bound, cumulative count) for each bucket, ending with math.inf
+    - count: The number of observations
+    - sum: The sum of the observations
+    """
+
+    buckets: tuple[tuple[float, int], ...]
+    count: int
+    sum: float
+
+    @property
+    def mean(self) -> float | None:
+        """The mean of the observations or None without observations."""
+        return self.sum / self.count if self.count else None
+
+
+@dataclass(frozen=True)
+class MetricSample:
+    """The value of a metric for one combination of label values."""
+
+    labels: dict[str, str]
+    value: float | HistogramSnapshot
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """A snapshot of the metrics of a MetricsRegistry.
+
+    Metrics without observations are included without samples.
+    """
+
+    samples: dict[MetricDefinition, list[MetricSample]]
+
+    def get(self, metric: MetricDefinition, **labels: str) -> float | HistogramSnapshot | None:
+        """Return the value of a metric for the given labels or None without observations.
+
+        Usage:
+            snapshot.get(TOOL_CALLS, tool="get_info_from_identifiers", outcome="ok")
+        """
+        for sample in self.samples.get(metric, []):
+            if sample.labels == labels:
+                return sample.value
+        return None
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format (version 0.0.4)."""
+        return self._format(openmetrics=False)
+
+    def to_openmetrics(self) -> str:
+        """Return the metrics in the OpenMetrics text format (version 1.0.0)."""
+        return self._format(openmetrics=True)
+
+    def _format(self, openmetrics: bool) -> str:
+        lines = []
+        for metric, samples in self.samples.items():
+            # OpenMetrics names counter families without the _total suffix of their samples.
+            family_name = (
+                metric.name.removesuffix("_total")
+                if openmetrics and metric.type == "counter"
+                else metric.name
+            )
+            lines.append(f"# HELP {family_name} {_escape(metric.description)}")
+            lines.append(f"# TYPE {family_name} {metric.type}")
+            for sample in samples:
+                if isinstance(sample.value, HistogramSnapshot):
+                    for upper_bound, count in sample.value.buckets:
+                        le = "+Inf" if math.isinf(upper_bound) else repr(upper_bound)
+                        labels = _format_labels({**sample.labels, "le": le})
+                        lines.append(f"{metric.name}_bucket{labels} {count}")
+                    labels = _format_labels(sample.labels)
+                    lines.append(f"{metric.name}_sum{labels} {_format_value(sample.value.sum)}")
+                    lines.append(f"{metric.name}_count{labels} {sample.value.count}")
+                else:
+                    labels = _format_labels(sample.labels)
+                    lines.append(f"{metric.name}{labels} {_format_value(sample.value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape backslashes and line breaks of help texts."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape backslashes, line breaks, and double quotes of label values."""
+    return _escape(value).replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Format labels as {name="value",...}."""
+    if not labels:
+        return ""
+    formatted_labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()
+    )
+    return f"{{{formatted_labels}}}"
+
+
+def _format_value(value: float) -> str:
+    """Format integral values without a decimal point."""
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class _Histogram:
+    """The bucket counts, count, and sum of the observations of a histogram."""
+
+    __slots__ = ("bounds", "bucket_counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # The last bucket counts observations above all bounds.
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative_counts = []
+        cumulative_count = 0
+        for bucket_count in self.bucket_counts:
+            cumulative_count += bucket_count
+            cumulative_counts.append(cumulative_count)
+        return HistogramSnapshot(
+            buckets=tuple(zip((*self.bounds, math.inf), cumulative_counts)),
+            count=self.count,
+            sum=self.sum,
+        )
+
+
+class MetricsRegistry:
+    """Counters and histograms of tool and HTTP performance.
+
+    Pass a registry to the `Client` as `metrics_registry` to record the metrics in
+    ALL_METRICS: the duration and outcome of tool calls, the latency, status codes, and
+    response bytes of HTTP requests by endpoint, the size of batches of parallel requests,
+    the time that batch tasks wait for the concurrency limiter, and the validation time of
+    responses by response model. Batch, concurrency, and validation metrics get recorded for
+    tool calls. Without a registry, nothing gets recorded.
+
+    `snapshot` returns the current values, which can be exported in the Prometheus text or
+    OpenMetrics format. A registry can be shared between clients and is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a registry without observations."""
+        self._lock = threading.Lock()
+        self._counters: dict[MetricDefinition, dict[tuple[str, ...], float]] = {}
+        self._histograms: dict[MetricDefinition, dict[tuple[str, ...], _Histogram]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove all observations."""
+        with self._lock:
+            self._counters = {metric: {} for metric in ALL_METRICS if metric.type == "counter"}
+            self._histograms = {metric: {} for metric in ALL_METRICS if metric.type == "histogram"}
+
+    def increment(self, metric: MetricDefinition, *label_values: str, amount: float = 1) -> None:
+        """Increment a counter.
+
+        :param metric: The counter.
+        :type metric: MetricDefinition
+        :param label_values: The values of the labels of the counter, in order.
+        :type label_values: str
+        :param amount: The amount to add.
+        :type amount: float
+        """
+        with self._lock:
+            counter = self._counters[metric]
+            counter[label_values] = counter.get(label_values, 0) + amount
+
+    def observe(self, metric: MetricDefinition, value: float, *label_values: str) -> None:
+        """Add an observation to a histogram.
+
+        :param metric: The histogram.
+        :type metric: MetricDefinition
+        :param value: The observed value.
+        :type value: float
+        :param label_values: The values of the labels of the histogram, in order.
+        :type label_values: str
+        """
+        with self._lock:
+            histograms = self._histograms[metric]
+            histogram = histograms.get(label_values)
+            if histogram is None:
+                histogram = histograms[label_values] = _Histogram(metric.buckets)
+            histogram.observe(value)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return the current values of all metrics."""
+        samples: dict[MetricDefinition, list[MetricSample]] = {}
+        with self._lock:
+            for metric in ALL_METRICS:
+                values: dict[tuple[str, ...], float | HistogramSnapshot]
+                if metric.type == "counter":
+                    values = dict(self._counters[metric])
+                else:
+                    values = {
+                        label_values: histogram.snapshot()
+                        for label_values, histogram in self._histograms[metric].items()
+                    }
+                samples[metric] = [
+                    MetricSample(labels=dict(zip(metric.label_names, label_values)), value=value)
+                    for label_values, value in sorted(values.items())
+                ]
+        return MetricsSnapshot(samples=samples)
+
+
+@contextmanager
+def metrics_context(registry: MetricsRegistry | None) -> Generator[None, None, None]:
+    """Context manager to record the batch, concurrency, and validation metrics in registry.
+
+    This is safe for concurrent async operations as it uses contextvars. Tasks started
+    within the context record into the same registry.
+    """
+    token = _active_metrics.set(registry)
+    try:
+        yield
+    finally:
+        _active_metrics.reset(token)
+
+
+def get_active_metrics() -> MetricsRegistry | None:
+    """Return the metrics registry of the current context or None if there is none."""
+    return _active_metrics.get()
+
+
+@contextmanager
+def record_tool_call(
+    registry: MetricsRegistry | None, tool_name: str
+) -> Generator[None, None, None]:
+    """Context manager to record the duration and outcome of a tool call in registry.
+
+    The registry also becomes the active registry (see `metrics_context`) of the tool call.
+    Without a registry, nothing gets recorded.
+    """
+    if registry is None:
+        yield
+        return
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        with metrics_context(registry):
+            yield
+        outcome = "ok"
+    finally:
+        registry.observe(TOOL_DURATION, time.perf_counter() - start, tool_name)
+        registry.increment(TOOL_CALLS, tool_name, outcome)
+
+
+# Path segments that start with a digit (ids, dates, years) get replaced in endpoint labels.
+_PARAMETER_SEGMENT_PATTERN = re.compile(r"(?<=/)\d[^/]*")
+
+
+def get_endpoint_label(path: str) -> str:
+    """Return the endpoint of a request path with ids, dates, and years replaced by {id}.
+
+    For example, /info/21719/names becomes /info/{id}/names. This keeps the number of
+    endpoint labels small.
+    """
+    return _PARAMETER_SEGMENT_PATTERN.sub("{id}", path)
+
+
+def record_http_request(
+    registry: MetricsRegistry,
+    method: str,
+    path: str,
+    status_code: int | None,
+    duration: float,
+    response_bytes: int | None,
+) -> None:
+    """Record the latency, status code, and response bytes of an HTTP request in registry.
+
+    :param registry: The registry to record into.
+    :type registry: MetricsRegistry
+    :param method: The HTTP method of the request.
+    :type method: str
+    :param path: The path of the request relative to the API base path, for example /info/21719.
+    :type path: str
+    :param status_code: The status code of the response or None if the request failed.
+    :type status_code: int, Optional
+    :param duration: The latency of the request in seconds.
+    :type duration: float
+    :param response_bytes: The number of response bytes received over the network.
+    :type response_bytes: int, Optional
+    """
+    endpoint = get_endpoint_label(path)
+    registry.observe(HTTP_REQUEST_DURATION, duration, method, endpoint)
+    registry.increment(
+        HTTP_RESPONSES, method, endpoint, "error" if status_code is None else str(status_code)
+    )
+    if response_bytes:
+        registry.increment(HTTP_RESPONSE_BYTES, method, endpoint, amount=response_bytes)
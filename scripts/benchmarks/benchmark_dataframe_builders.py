@@ -0,0 +1,78 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare statement DataFrame build time and aggregation speed for each ValueDtype.
+
+Usage: python scripts/benchmarks/benchmark_dataframe_builders.py [--num-line-items 300]
+    [--num-periods 40] [--repeat 20]
+"""
+
+import argparse
+import random
+import timeit
+from typing import Callable
+
+import pandas as pd
+
+from kfinance.client.dataframe_builders import ValueDtype, build_statement_df
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+def build_statements_resp(num_line_items: int, num_periods: int) -> StatementsResp:
+    """Build a synthetic statements response with some missing values."""
+    periods = {}
+    for period in range(num_periods):
+        line_items = [
+            {
+                "name": f"Line Item {i}",
+                "value": None if random.random() < 0.05 else f"{random.uniform(-1e9, 1e9):.6f}",
+            }
+            for i in range(num_line_items)
+        ]
+        periods[f"CY{1990 + period}"] = {
+            "period_end_date": f"{1990 + period}-12-31",
+            "num_months": 12,
+            "statements": [{"name": "Income Statement", "line_items": line_items}],
+        }
+    return StatementsResp.model_validate({"currency": "USD", "periods": periods})
+
+
+def aggregate(df: pd.DataFrame) -> None:
+    """Run typical downstream computations (row sums and means, period over period change)."""
+    df.sum(axis=1)
+    df.mean(axis=1)
+    df.T.pct_change(fill_method=None)
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of repeat runs in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-line-items", type=int, default=300)
+    parser.add_argument("--num-periods", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    statements_resp = build_statements_resp(args.num_line_items, args.num_periods)
+    print(f"{args.num_line_items} line items x {args.num_periods} periods")  # noqa: T201
+    for value_dtype in ValueDtype:
+        df = build_statement_df(statements_resp, value_dtype=value_dtype)
+        build_ms = best_time(
+            lambda: build_statement_df(statements_resp, value_dtype=value_dtype), args.repeat
+        )
+        # object and decimal frames have to be converted to floats for pct_change, so the
+        # conversion is part of their aggregation time.
+        is_numeric = value_dtype in (ValueDtype.float64, ValueDtype.Float64)
+        aggregate_ms = best_time(
+            lambda: aggregate(df if is_numeric else df.astype(float)), args.repeat
+        )
+        print(  # noqa: T201
+            f"{value_dtype:<8} build: {build_ms:8.2f} ms  aggregate: {aggregate_ms:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
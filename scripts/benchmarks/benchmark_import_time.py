@@ -0,0 +1,66 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Measure the import time of the entry points of the package against their budgets.
+
+Each run imports an entry point in a new python process with `python -X importtime` and
+reads its cumulative import time. The best of the runs gets compared with the budget of
+the entry point. The script exits with status 1 if an entry point exceeds its budget.
+
+Usage: python scripts/benchmarks/benchmark_import_time.py [--repeat 3]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+# Entry point -> import time budget in seconds
+IMPORT_TIME_BUDGETS = {
+    # About 0.5s, down from about 1.7s before provider SDKs, PIL, and pandas got imported
+    # lazily.
+    "kfinance.client.kfinance": 1.5,
+    # Dominated by fastmcp and langchain_core.
+    "kfinance.integrations.local_mcp.local_mcp": 4.0,
+}
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def measure_import(module: str) -> float:
+    """Import a module in a new process and return its cumulative import time in seconds."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    # Lines have the format "import time: <self us> | <cumulative us> | <indented module>".
+    # Other lines (for example warnings) get skipped.
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        _, cumulative_us, imported_module = line.split("|")
+        if imported_module.strip() == module:
+            return int(cumulative_us) / 1e6
+    raise ValueError(f"{module} is missing from the import times.")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    within_budget = True
+    print("best of", args.repeat, "runs")  # noqa: T201
+    for module, budget_s in IMPORT_TIME_BUDGETS.items():
+        import_time = min(measure_import(module) for _ in range(args.repeat))
+        within_budget = within_budget and import_time < budget_s
+        print(  # noqa: T201
+            f"{module:<45} {import_time * 1000:8.1f} ms (budget {budget_s * 1000:.0f} ms)"
+        )
+    if not within_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
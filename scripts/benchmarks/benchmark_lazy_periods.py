@@ -0,0 +1,101 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare eager and lazy validation of a multi-company /statements/ response.
+
+A tool call that only needs the most recent period validates the response, drops all
+other periods, and dumps the result. Eager validation is measured by validating the same
+periods as dict[str, StatementPeriodData].
+
+Usage: python scripts/benchmarks/benchmark_lazy_periods.py [--num-companies 20]
+    [--num-periods 40] [--num-line-items 50]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from kfinance.client.models.response_models import PostResponse
+from kfinance.domains.statements.statement_models import StatementPeriodData, StatementsResp
+
+
+def build_response(num_companies: int, num_periods: int, num_line_items: int) -> dict[str, Any]:
+    """Build a synthetic /statements/ response."""
+    periods = {
+        f"CY{2025 - i}": {
+            "period_end_date": f"{2025 - i}-12-31",
+            "num_months": 12,
+            "statements": [
+                {
+                    "name": "Income Statement",
+                    "line_items": [
+                        {"name": f"Line Item {j}", "value": f"{1000 * i + j}.000000"}
+                        for j in range(num_line_items)
+                    ],
+                }
+            ],
+        }
+        for i in range(num_periods)
+    }
+    return {
+        "results": {
+            str(company_id): {"currency": "USD", "periods": periods}
+            for company_id in range(num_companies)
+        },
+        "errors": {},
+    }
+
+
+def time_ms(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the best run time of func in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-companies", type=int, default=20)
+    parser.add_argument("--num-periods", type=int, default=40)
+    parser.add_argument("--num-line-items", type=int, default=50)
+    args = parser.parse_args()
+    data = build_response(args.num_companies, args.num_periods, args.num_line_items)
+    eager_periods_adapter = TypeAdapter(dict[str, StatementPeriodData])
+
+    def eager() -> None:
+        for company in data["results"].values():
+            periods = eager_periods_adapter.validate_python(company["periods"])
+            most_recent_period = max(periods)
+            eager_periods_adapter.dump_python(
+                {most_recent_period: periods[most_recent_period]}, mode="json"
+            )
+
+    def lazy() -> None:
+        resp = PostResponse[StatementsResp].model_validate(data)
+        for statements in resp.results.values():
+            statements.remove_all_periods_other_than_the_most_recent_one()
+            statements.model_dump(mode="json")
+
+    def lazy_all_periods() -> None:
+        resp = PostResponse[StatementsResp].model_validate(data)
+        for statements in resp.results.values():
+            statements.model_dump(mode="json")
+
+    print(  # noqa: T201
+        f"{args.num_companies} companies x {args.num_periods} periods x "
+        f"{args.num_line_items} line items"
+    )
+    for name, func in [
+        ("eager, most recent period", eager),
+        ("lazy, most recent period", lazy),
+        ("lazy, all periods", lazy_all_periods),
+    ]:
+        print(f"{name:<27} {time_ms(func):8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Measure the latency of suggestions for invalid line items.
+
+Invalid line items get suggestions either by scoring every line item with SequenceMatcher
+and keyword matches or with the line item index, which only computes the string
+similarity of line items that can still reach the suggestions. Both return the same
+suggestions.
+
+Usage: python scripts/benchmarks/benchmark_line_item_suggestions.py [--repeat 5]
+"""
+
+import argparse
+from difflib import SequenceMatcher
+import time
+
+from kfinance.domains.line_items.line_item_index import get_line_item_index
+from kfinance.domains.line_items.line_item_models import (
+    LINE_ITEM_TO_DESCRIPTIONS_MAP,
+    LineItemScore,
+)
+
+
+# Typical invalid line items generated by LLMs.
+INVALID_LINE_ITEMS = [
+    "revenues",
+    "total_revenues",
+    "net_incme",
+    "EBITDA margin",
+    "R&D",
+    "cost goods",
+    "free_cash_flow_to_equity",
+    "operating_profit",
+    "diluted eps",
+    "capital expenditures",
+    "long_term_debt_total",
+    "xyz123abc",
+]
+
+
+def find_similar_line_items_without_index(
+    invalid_item: str, max_suggestions: int = 8
+) -> list[LineItemScore]:
+    """Score every line item (the implementation before the line item index)."""
+    invalid_lower = invalid_item.lower()
+    scores = []
+    for line_item, description in LINE_ITEM_TO_DESCRIPTIONS_MAP.items():
+        name_similarity = SequenceMatcher(None, invalid_lower, line_item.lower()).ratio()
+        invalid_words = set(invalid_lower.replace("_", " ").split())
+        item_words = set(line_item.lower().replace("_", " ").split())
+        keyword_match_score = len(invalid_words.intersection(item_words)) / max(
+            len(invalid_words), 1
+        )
+        description_words = set(description.lower().split())
+        description_match_score = len(invalid_words.intersection(description_words)) / max(
+            len(invalid_words), 1
+        )
+        total_score = (
+            name_similarity * 0.5 + keyword_match_score * 0.3 + description_match_score * 0.2
+        )
+        scores.append(LineItemScore(name=line_item, description=description, score=total_score))
+    scores.sort(reverse=True, key=lambda x: x.score)
+    return [item for item in scores[:max_suggestions] if item.score > 0.1]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_line_item_index()
+    print(f"index build: {(time.perf_counter() - start) * 1000:.1f} ms")  # noqa: T201
+
+    for invalid_item in INVALID_LINE_ITEMS:
+        assert index.find_similar(invalid_item) == find_similar_line_items_without_index(
+            invalid_item
+        )
+
+    print("mean latency per invalid line item, best of", args.repeat, "runs")  # noqa: T201
+    for name, find_similar in [
+        ("without index", find_similar_line_items_without_index),
+        ("with index", index.find_similar),
+    ]:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for invalid_item in INVALID_LINE_ITEMS:
+                find_similar(invalid_item)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<14} {best / len(INVALID_LINE_ITEMS) * 1000:8.2f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare the construction time and memory of Money values with the previous implementation.
+
+Usage: python scripts/benchmarks/benchmark_money.py [--num-values 1000000]
+
+The previous implementation deep copied each Money input dict to inject the conventional
+decimals, recomputed the quantization exponent for every value, and deep copied the whole
+price history response to inject the currency. It gets reproduced here as the baseline.
+"""
+
+import argparse
+from copy import deepcopy
+from decimal import Decimal
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing_extensions import Self
+
+from kfinance.client.models.currency_models import ISO_CODE_TO_CURRENCY
+from kfinance.client.models.decimal_with_unit import Money, Shares
+from kfinance.domains.prices.price_models import PriceHistory
+
+
+class LegacyMoney(BaseModel):
+    """Money as implemented before precomputed quantization exponents."""
+
+    value: Decimal = Field(allow_inf_nan=True)
+    unit: str
+    conventional_decimals: int = Field(exclude=True)
+
+    @field_validator("value", mode="before")
+    @classmethod
+    def convert_none_to_nan(cls, v: Any) -> Any:
+        """Convert None values to NaN."""
+        if v is None:
+            return Decimal("NaN")
+        return v
+
+    @model_validator(mode="after")
+    def quantize_value(self) -> Self:
+        """Quantize the value to conventional_decimals."""
+        exponent = Decimal("10") ** Decimal(-self.conventional_decimals)
+        self.value = self.value.quantize(exp=exponent)
+        return self
+
+    @model_validator(mode="before")
+    @classmethod
+    def inject_conventional_decimals_into_data(cls, data: Any) -> Any:
+        """Inject conventional_decimals into a copy of the data dict."""
+        if isinstance(data, dict) and "conventional_decimals" not in data:
+            data = deepcopy(data)
+            data["conventional_decimals"] = ISO_CODE_TO_CURRENCY[data["unit"]].conventional_decimals
+        return data
+
+
+class LegacyPrices(BaseModel):
+    """Prices with LegacyMoney values."""
+
+    date: str
+    open: LegacyMoney | None
+    high: LegacyMoney | None
+    low: LegacyMoney | None
+    close: LegacyMoney | None
+    volume: Shares | None
+
+
+class LegacyPriceHistory(BaseModel):
+    """PriceHistory as implemented before, deep copying the whole response."""
+
+    prices: list[LegacyPrices]
+
+    @model_validator(mode="before")
+    @classmethod
+    def inject_currency_into_data(cls, data: Any) -> Any:
+        """Inject the currency into a deep copy of the response."""
+        if isinstance(data, dict) and "currency" in data:
+            data = deepcopy(data)
+            currency = data["currency"]
+            for price in data["prices"]:
+                for key in ["open", "high", "low", "close"]:
+                    if price[key] is not None:
+                        price[key] = dict(unit=currency, value=price[key])
+        return data
+
+
+def measure(build: Callable[[], Any]) -> tuple[float, float]:
+    """Return the build time in seconds and the peak traced memory in MiB.
+
+    Time and memory get measured in separate runs because tracemalloc slows down parsing.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-values", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    values = [f"{random.uniform(1, 1000):.6f}" for _ in range(args.num_values)]
+    money_inputs = [{"value": value, "unit": "USD"} for value in values]
+    # Four Money values (open, high, low, close) per price.
+    pricing_response = {
+        "currency": "USD",
+        "prices": [
+            {
+                "date": "2024-06-25",
+                "open": values[i],
+                "high": values[i + 1],
+                "low": values[i + 2],
+                "close": values[i + 3],
+                "volume": "1000",
+            }
+            for i in range(0, args.num_values - 3, 4)
+        ],
+    }
+
+    print(f"{args.num_values} Money values")  # noqa: T201
+    for name, build in [
+        ("LegacyMoney", lambda: [LegacyMoney.model_validate(data) for data in money_inputs]),
+        ("Money", lambda: [Money.model_validate(data) for data in money_inputs]),
+        ("LegacyPriceHistory", lambda: LegacyPriceHistory.model_validate(pricing_response)),
+        ("PriceHistory", lambda: PriceHistory.model_validate(pricing_response)),
+    ]:
+        elapsed, peak_mib = measure(build)
+        print(f"{name:<20} time: {elapsed:8.3f}s  peak memory: {peak_mib:8.1f} MiB")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
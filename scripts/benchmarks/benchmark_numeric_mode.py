@@ -0,0 +1,69 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare decoding and DataFrame build time of a statements response per NumericMode.
+
+Usage: python scripts/benchmarks/benchmark_numeric_mode.py [--num-line-items 300]
+    [--num-periods 40] [--repeat 20]
+"""
+
+import argparse
+import random
+import timeit
+from typing import Callable
+
+from kfinance.client.dataframe_builders import build_statement_df, get_default_value_dtype
+from kfinance.client.models.numeric import NumericMode
+from kfinance.client.models.response_models import PostResponse
+from kfinance.client.models.trusted_decode import decode_response
+from kfinance.domains.statements.statement_models import StatementsResp
+
+
+def build_statements_response(num_line_items: int, num_periods: int) -> dict:
+    """Build a synthetic raw statements response with some missing values."""
+    periods = {}
+    for period in range(num_periods):
+        line_items = [
+            {
+                "name": f"Line Item {i}",
+                "value": None if random.random() < 0.05 else f"{random.uniform(-1e9, 1e9):.6f}",
+            }
+            for i in range(num_line_items)
+        ]
+        periods[f"CY{1990 + period}"] = {
+            "period_end_date": f"{1990 + period}-12-31",
+            "num_months": 12,
+            "statements": [{"name": "Income Statement", "line_items": line_items}],
+        }
+    return {"results": {"21719": {"currency": "USD", "periods": periods}}, "errors": {}}
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of repeat runs in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-line-items", type=int, default=300)
+    parser.add_argument("--num-periods", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    response = build_statements_response(args.num_line_items, args.num_periods)
+    model_cls = PostResponse[StatementsResp]
+    print(f"{args.num_line_items} line items x {args.num_periods} periods")  # noqa: T201
+    for numeric in NumericMode:
+        decode_ms = best_time(lambda: decode_response(model_cls, response, numeric), args.repeat)
+        statements_resp = decode_response(model_cls, response, numeric).results["21719"]
+        value_dtype = get_default_value_dtype(numeric)
+        build_ms = best_time(
+            lambda: build_statement_df(statements_resp, value_dtype=value_dtype), args.repeat
+        )
+        print(  # noqa: T201
+            f"{numeric:<8} decode: {decode_ms:8.2f} ms  DataFrame ({value_dtype}): {build_ms:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
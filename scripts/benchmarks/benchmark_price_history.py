@@ -0,0 +1,79 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare parse time and memory of PriceHistory and ColumnarPriceHistory.
+
+Usage: python scripts/benchmarks/benchmark_price_history.py [--num-tickers 50] [--num-days 6300]
+
+The default of 6300 days corresponds to roughly 25 years of daily prices.
+"""
+
+import argparse
+from datetime import date, timedelta
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from kfinance.domains.prices.price_models import ColumnarPriceHistory, PriceHistory
+
+
+def build_pricing_response(num_days: int) -> dict:
+    """Build a synthetic /pricing response with num_days daily prices."""
+    start = date(2000, 1, 3)
+    close = 100.0
+    prices = []
+    for day in range(num_days):
+        close = max(close * (1 + random.gauss(0, 0.02)), 1)
+        prices.append(
+            {
+                "date": (start + timedelta(days=day)).isoformat(),
+                "open": f"{close * 0.99:.6f}",
+                "high": f"{close * 1.01:.6f}",
+                "low": f"{close * 0.98:.6f}",
+                "close": f"{close:.6f}",
+                "volume": str(random.randint(100_000, 10_000_000)),
+            }
+        )
+    return {"currency": "USD", "prices": prices}
+
+
+def measure(parse: Callable[[dict], Any], responses: list[dict]) -> tuple[float, float]:
+    """Return the parse time in seconds and the retained memory in MiB of the parsed results.
+
+    Time and memory get measured in separate runs because tracemalloc slows down parsing.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    results = [parse(response) for response in responses]
+    elapsed = time.perf_counter() - start
+    del results
+
+    gc.collect()
+    tracemalloc.start()
+    results = [parse(response) for response in responses]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return elapsed, retained / 2**20
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-tickers", type=int, default=50)
+    parser.add_argument("--num-days", type=int, default=6300)
+    args = parser.parse_args()
+
+    random.seed(0)
+    responses = [build_pricing_response(args.num_days) for _ in range(args.num_tickers)]
+    print(f"{args.num_tickers} tickers x {args.num_days} days")  # noqa: T201
+    for name, parse in [
+        ("PriceHistory", PriceHistory.model_validate),
+        ("ColumnarPriceHistory", ColumnarPriceHistory.from_response),
+    ]:
+        elapsed, retained_mib = measure(parse, responses)
+        print(f"{name:<22} parse: {elapsed:8.3f}s  retained memory: {retained_mib:8.1f} MiB")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Measure how fast a LocalPriceStore scans the daily prices of many trading items.
+
+The store gets filled with synthetic prices. The scan then reads a one year date range for
+every trading item and computes its mean close price, first with a newly opened store
+(cold, which loads the index and maps the files) and then with the store that wrote the
+prices (warm).
+Reading the same prices from /pricing JSON responses is shown for comparison.
+
+Usage: python scripts/benchmarks/benchmark_price_store.py [--num-trading-items 10000]
+    [--num-days 2520]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+
+import numpy as np
+
+from kfinance.domains.prices.price_models import ColumnarPriceHistory
+from kfinance.domains.prices.price_store import LocalPriceStore
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-trading-items", type=int, default=10_000)
+    parser.add_argument("--num-days", type=int, default=2520)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    dates = np.datetime_as_string(
+        np.datetime64("2015-01-01") + np.arange(args.num_days), unit="D"
+    ).astype(np.str_)
+    trading_item_ids = list(range(args.num_trading_items))
+
+    with tempfile.TemporaryDirectory() as root_path:
+        store = LocalPriceStore(root_path)
+        start = time.perf_counter()
+        for trading_item_id in trading_item_ids:
+            values = rng.uniform(1, 500, size=(args.num_days, 5))
+            store.append(
+                trading_item_id, ColumnarPriceHistory(dates=dates, values=values, currency="USD")
+            )
+        print(  # noqa: T201
+            f"write {args.num_trading_items} x {args.num_days} days: "
+            f"{time.perf_counter() - start:.2f} s"
+        )
+
+        start_date, end_date = str(dates[-365]), str(dates[-1])
+        for name, scan_store in [("cold", LocalPriceStore(root_path)), ("warm", None)]:
+            scan_store = scan_store or store
+            start = time.perf_counter()
+            histories = scan_store.read_many(
+                trading_item_ids, start_date=start_date, end_date=end_date
+            )
+            closes = [history.close.mean() for history in histories.values()]
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"{name} scan (1 year, mean close): {elapsed_ms:8.1f} ms")  # noqa: T201
+            assert len(closes) == args.num_trading_items
+
+        # Parsing a JSON response of the same year for a sample of trading items.
+        sample_size = min(100, args.num_trading_items)
+        response = json.dumps(
+            {
+                "currency": "USD",
+                "prices": [
+                    {
+                        "date": str(d),
+                        **{c: f"{v:.6f}" for c, v in zip(("open", "high", "low", "close"), row)},
+                        "volume": str(int(row[4])),
+                    }
+                    for d, row in zip(dates[-365:], rng.uniform(1, 500, size=(365, 5)))
+                ],
+            }
+        )
+        start = time.perf_counter()
+        for _ in range(sample_size):
+            ColumnarPriceHistory.from_response(json.loads(response))
+        elapsed_ms = (time.perf_counter() - start) * 1000 * args.num_trading_items / sample_size
+        print(  # noqa: T201
+            f"JSON parse only (extrapolated, no network): {elapsed_ms:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
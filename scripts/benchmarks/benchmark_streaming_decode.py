@@ -0,0 +1,81 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare time and peak memory of reading a /pricing response whole or streamed.
+
+The response gets generated lazily in chunks, like a streamed HTTP body, so that the
+streamed decode never holds the whole payload.
+
+Usage: python scripts/benchmarks/benchmark_streaming_decode.py [--num-prices 500000]
+    [--chunk-size 65536]
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+from kfinance.domains.prices.price_models import ColumnarPriceHistory
+
+
+def generate_chunks(num_prices: int, chunk_size: int) -> Iterator[bytes]:
+    """Yield a synthetic /pricing response in chunks of about chunk_size bytes."""
+    random.seed(0)
+    parts = ['{"currency": "USD", "prices": [']
+    size = len(parts[0])
+    for i in range(num_prices):
+        price = {
+            "date": f"{1900 + i // 365}-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "open": f"{random.uniform(1, 500):.6f}",
+            "high": f"{random.uniform(1, 500):.6f}",
+            "low": f"{random.uniform(1, 500):.6f}",
+            "close": f"{random.uniform(1, 500):.6f}",
+            "volume": str(random.randint(0, 10**8)),
+        }
+        part = ("," if i else "") + json.dumps(price)
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(parts).encode()
+            parts, size = [], 0
+    parts.append("]}")
+    yield "".join(parts).encode()
+
+
+def measure(func: Callable[[], ColumnarPriceHistory]) -> tuple[float, float]:
+    """Return the run time in seconds and the peak traced memory in MB of func.
+
+    Tracing slows allocations down, so time and memory get measured in separate runs.
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-prices", type=int, default=500_000)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    def read_whole() -> ColumnarPriceHistory:
+        body = b"".join(generate_chunks(args.num_prices, args.chunk_size))
+        return ColumnarPriceHistory.from_response(json.loads(body))
+
+    def read_streamed() -> ColumnarPriceHistory:
+        return ColumnarPriceHistory.from_chunks(generate_chunks(args.num_prices, args.chunk_size))
+
+    print(f"{args.num_prices} prices, {args.chunk_size} byte chunks")  # noqa: T201
+    for name, func in [("whole", read_whole), ("streamed", read_streamed)]:
+        elapsed, peak_mb = measure(func)
+        print(f"{name:<8} time: {elapsed:6.2f} s  peak memory: {peak_mb:8.1f} MB")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
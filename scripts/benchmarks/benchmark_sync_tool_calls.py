@@ -0,0 +1,122 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare sequential sync tool calls with syncify and with the client's background loop.
+
+A local HTTP/1.1 server with keep-alive answers the /ids and /info requests of
+get_info_from_identifiers. The syncify baseline reproduces the previous `KfinanceTool._run`:
+each call runs on a new event loop, and the httpx client gets rebuilt once it is bound to a
+closed loop. The background loop runs all calls on one long-lived loop.
+
+Usage: python scripts/benchmarks/benchmark_sync_tool_calls.py [--num-calls 100]
+"""
+
+import argparse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any, Callable
+
+from asyncer import syncify
+
+from kfinance.client.kfinance import Client
+from kfinance.domains.companies.company_tools import GetInfoFromIdentifiers
+from kfinance.httpx_utils import KfinanceHttpxClient
+
+
+ID_TRIPLE = {
+    "company_id": 21719,
+    "security_id": 2629107,
+    "trading_item_id": 2629108,
+    "company_name": "S&P Global Inc.",
+    "ticker": "NYSE:SPGI",
+    "country": "United States",
+}
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Answer /ids and /info requests and count the opened connections."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    num_connections = 0
+
+    def setup(self) -> None:
+        """Count new connections."""
+        super().setup()
+        MockApiHandler.num_connections += 1
+
+    def _send_json(self, data: dict[str, Any]) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        """Answer /ids requests."""
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._send_json({"data": {identifier: ID_TRIPLE for identifier in request["identifiers"]}})
+
+    def do_GET(self) -> None:
+        """Answer /info requests."""
+        self._send_json({"name": "S&P Global Inc.", "status": "Operating"})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Don't log requests."""
+
+
+def build_client(api_host: str) -> Client:
+    """Build a client with a valid access token."""
+    client = Client(refresh_token="foo", api_host=api_host)
+    client.kfinance_api_client._access_token = "foo"  # noqa: SLF001
+    client.kfinance_api_client._access_token_expiry = int(datetime(2100, 1, 1).timestamp())  # noqa: SLF001
+    return client
+
+
+def run_with_syncify(tool: GetInfoFromIdentifiers, **kwargs: Any) -> Any:
+    """Run a tool like the previous `KfinanceTool._run`."""
+    try:
+        return syncify(tool._arun, raise_sync_error=False)(**kwargs)  # noqa: SLF001
+    except RuntimeError as e:
+        if str(e).lower() != "event loop is closed":
+            raise
+        tool.kfinance_client.httpx_client = KfinanceHttpxClient(
+            api_client=tool.kfinance_client.kfinance_api_client
+        )
+        return syncify(tool._arun, raise_sync_error=False)(**kwargs)  # noqa: SLF001
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-calls", type=int, default=100)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    runners: list[tuple[str, Callable[[GetInfoFromIdentifiers], Any]]] = [
+        ("syncify", lambda tool: run_with_syncify(tool, identifiers=["SPGI"])),
+        ("background loop", lambda tool: tool.run_without_langchain(identifiers=["SPGI"])),
+    ]
+    print(f"{args.num_calls} sequential sync get_info_from_identifiers calls")  # noqa: T201
+    for name, run in runners:
+        tool = GetInfoFromIdentifiers(kfinance_client=build_client(api_host))
+        MockApiHandler.num_connections = 0
+        start = time.perf_counter()
+        for _ in range(args.num_calls):
+            run(tool)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(  # noqa: T201
+            f"{name:<16} {elapsed_ms:8.1f} ms  "
+            f"({elapsed_ms / args.num_calls:.2f} ms per call, "
+            f"{MockApiHandler.num_connections} connections)"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare serializing large multi-identifier tool responses via model_dump and to JSON bytes.
+
+The baseline is the current tool output, `model_dump(mode="json", exclude_none=True)`,
+encoded as compact JSON. The fast path is `dump_tool_response_json`. Both outputs get
+checked to be identical.
+
+Usage: python scripts/benchmarks/benchmark_tool_response_json.py [--num-identifiers 50]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from pydantic import BaseModel
+import pydantic_core
+
+from kfinance.domains.companies.company_models import IdentificationTripleWithCompanyInfo
+from kfinance.domains.prices.price_models import PriceHistory
+from kfinance.domains.prices.price_tools import GetPricesFromIdentifiersResp
+from kfinance.domains.rounds_of_funding.rounds_of_funding_models import RoundsOfFundingResp
+from kfinance.domains.rounds_of_funding.rounds_of_funding_tools import (
+    GetRoundsOfFundingFromIdentifiersResp,
+)
+from kfinance.domains.statements.statement_models import StatementsResp
+from kfinance.domains.statements.statement_tools import GetFinancialStatementFromIdentifiersResp
+from kfinance.integrations.tool_calling.tool_calling_models import dump_tool_response_json
+
+
+def build_identifier_info(identifiers: list[str]) -> dict[str, IdentificationTripleWithCompanyInfo]:
+    """Build identifier info for each identifier."""
+    return {
+        identifier: IdentificationTripleWithCompanyInfo(
+            company_id=i,
+            security_id=i,
+            trading_item_id=i,
+            company_name=f"Company {i}",
+            ticker=f"NYSE:{identifier}",
+            country="USA",
+        )
+        for i, identifier in enumerate(identifiers)
+    }
+
+
+def build_responses(num_identifiers: int) -> dict[str, BaseModel]:
+    """Build price (5 years daily), statement (40 periods), and funding (200 rounds) responses."""
+    identifiers = [f"ID{i}" for i in range(num_identifiers)]
+    identifier_info = build_identifier_info(identifiers)
+    price_history = PriceHistory.model_validate(
+        {
+            "currency": "USD",
+            "prices": [
+                {
+                    "date": f"{2020 + i // 252}-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                    "open": f"{100 + i % 50}.120000",
+                    "high": f"{101 + i % 50}.450000",
+                    "low": f"{99 + i % 50}.010000",
+                    "close": f"{100 + i % 50}.990000",
+                    "volume": 1000000 + i,
+                }
+                for i in range(1260)
+            ],
+        }
+    )
+    statements = StatementsResp.model_validate(
+        {
+            "currency": "USD",
+            "periods": {
+                f"CY{2024 - i}": {
+                    "period_end_date": f"{2024 - i}-12-31",
+                    "num_months": 12,
+                    "statements": [
+                        {
+                            "name": "Income Statement",
+                            "line_items": [
+                                {"name": f"Line Item {j}", "value": f"{1000 * i + j}.000000"}
+                                for j in range(50)
+                            ],
+                        }
+                    ],
+                }
+                for i in range(40)
+            },
+        }
+    )
+    rounds_of_funding = RoundsOfFundingResp.model_validate(
+        {
+            "rounds_of_funding": [
+                {
+                    "transaction_id": i,
+                    "funding_round_notes": f"Round {i} led by Investor {i}.",
+                    "closed_date": "2023-05-01" if i % 2 else None,
+                    "funding_type": "Series A",
+                }
+                for i in range(200)
+            ]
+        }
+    )
+    return {
+        "prices": GetPricesFromIdentifiersResp(
+            identifier_results={identifier: price_history for identifier in identifiers},
+            identifier_info=identifier_info,
+        ),
+        "statements": GetFinancialStatementFromIdentifiersResp(
+            identifier_results={identifier: statements for identifier in identifiers},
+            identifier_info=identifier_info,
+            notes=["Fiscal periods may differ between companies."],
+        ),
+        "funding": GetRoundsOfFundingFromIdentifiersResp(
+            identifier_results={identifier: rounds_of_funding for identifier in identifiers},
+            identifier_info=identifier_info,
+            errors=["No identification triple found for the provided identifier: NON-EXISTENT."],
+        ),
+    }
+
+
+def time_ms(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the best run time of func in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-identifiers", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{args.num_identifiers} identifiers")  # noqa: T201
+    for name, tool_resp in build_responses(args.num_identifiers).items():
+
+        def model_dump(tool_resp: BaseModel = tool_resp) -> bytes:
+            return pydantic_core.to_json(tool_resp.model_dump(mode="json", exclude_none=True))
+
+        def json_bytes(tool_resp: BaseModel = tool_resp) -> bytes:
+            return dump_tool_response_json(tool_resp)
+
+        output = json_bytes()
+        assert output == model_dump(), f"{name}: outputs differ"
+        print(  # noqa: T201
+            f"{name:<10} {len(output) / 1e6:6.1f} MB  "
+            f"model_dump: {time_ms(model_dump):8.1f} ms  "
+            f"json bytes: {time_ms(json_bytes):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
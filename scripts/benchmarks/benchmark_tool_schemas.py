@@ -0,0 +1,80 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Measure the startup time of a client that returns tool descriptions.
+
+Each run starts a new python process that imports the client, creates a client for a user
+with all permissions, and gets the OpenAI, Anthropic, and Gemini tool descriptions. Runs
+either convert the tools or read precomputed schemas written by write_tool_schemas.
+
+Usage: python scripts/benchmarks/benchmark_tool_schemas.py [--repeat 5]
+"""
+
+import argparse
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+from kfinance.integrations.tool_calling import tool_schemas
+from kfinance.integrations.tool_calling.tool_schemas import write_tool_schemas
+
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from kfinance.integrations.tool_calling import tool_schemas
+if sys.argv[1]:
+    tool_schemas.TOOL_SCHEMAS_PATH = tool_schemas.Path(sys.argv[1])
+    tool_schemas.get_package_version = lambda: "benchmark"
+from kfinance.client.kfinance import Client
+from kfinance.client.permission_models import Permission
+client = Client(refresh_token="foo")
+client.kfinance_api_client._user_permissions = set(Permission)
+imported = time.perf_counter()
+client.openai_tool_descriptions
+client.anthropic_tool_descriptions
+client.gemini_tool_descriptions
+described = time.perf_counter()
+client.openai_tool_descriptions
+client.anthropic_tool_descriptions
+client.gemini_tool_descriptions
+repeated = time.perf_counter()
+print(json.dumps([imported - start, described - imported, repeated - described]))
+"""
+
+
+def run_startup(schemas_path: str) -> list[float]:
+    """Run the startup script in a new process and return its timings in seconds."""
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT, schemas_path],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schemas_path = Path(tmp_dir) / "tool_schemas.json"
+        tool_schemas.get_package_version = lambda: "benchmark"
+        write_tool_schemas(schemas_path)
+
+        print("best of", args.repeat, "runs: import and client / first descriptions / repeated")  # noqa: T201
+        for name, path in [("converted", ""), ("precomputed", str(schemas_path))]:
+            timings = min(
+                (run_startup(path) for _ in range(args.repeat)), key=lambda t: t[0] + t[1]
+            )
+            print(  # noqa: T201
+                f"{name:<12} {timings[0] * 1000:8.1f} ms  {timings[1] * 1000:8.1f} ms  "
+                f"{timings[2] * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
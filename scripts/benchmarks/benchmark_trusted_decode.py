@@ -0,0 +1,81 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Compare the throughput of full validation and trusted decoding for models with trusted decoders.
+
+Usage: python scripts/benchmarks/benchmark_trusted_decode.py [--num-periods 100] [--repeat 20]
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from kfinance.client.models.trusted_decode import construct_from_trusted_data
+from kfinance.domains.capitalizations.capitalization_models import Capitalizations
+from kfinance.domains.prices.price_models import PriceHistory
+
+
+def build_responses(num_periods: int) -> list[tuple[type[BaseModel], dict]]:
+    """Build synthetic responses for each model with a trusted decoder."""
+    return [
+        (
+            PriceHistory,
+            {
+                "currency": "USD",
+                "prices": [
+                    {
+                        "date": "2024-06-25",
+                        "open": "445.790000",
+                        "high": "449.240000",
+                        "low": "442.770000",
+                        "close": "448.780000",
+                        "volume": "999134",
+                    }
+                    for _ in range(num_periods * 25)
+                ],
+            },
+        ),
+        (
+            Capitalizations,
+            {
+                "currency": "USD",
+                "market_caps": [
+                    {
+                        "date": "2024-06-24",
+                        "market_cap": "139231113000.000000",
+                        "tev": "153942113000.000000",
+                        "shares_outstanding": 312900000,
+                    }
+                    for _ in range(num_periods * 25)
+                ],
+            },
+        ),
+    ]
+
+
+def time_decode(decode: Callable[[], Any], repeat: int) -> float:
+    """Return the number of decodes per second of the fastest of repeat runs."""
+    return 1 / min(timeit.repeat(decode, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-periods", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'model':<32} {'validate/s':>12} {'trusted/s':>12} {'speedup':>8}")  # noqa: T201
+    for model_cls, data in build_responses(args.num_periods):
+        validated_per_second = time_decode(lambda: model_cls.model_validate(data), args.repeat)
+        trusted_per_second = time_decode(
+            lambda: construct_from_trusted_data(model_cls, data), args.repeat
+        )
+        print(  # noqa: T201
+            f"{model_cls.__name__:<32} {validated_per_second:>12.1f} {trusted_per_second:>12.1f} "
+            f"{trusted_per_second / validated_per_second:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# Copyright 2025-present Kensho Technologies, LLC.
+"""Precompute the tool schemas that get shipped with a release.
+
+The schemas get written to kfinance/integrations/tool_calling/tool_schemas.json and are only
+used by a kfinance package with the same version. Run this after installing the package
+(which generates kfinance/version.py) and before building it.
+
+Usage: python scripts/generate_tool_schemas.py [--output PATH]
+"""
+
+import argparse
+from pathlib import Path
+
+from kfinance.integrations.tool_calling.tool_schemas import (
+    TOOL_SCHEMAS_PATH,
+    get_package_version,
+    write_tool_schemas,
+)
+
+
+def main() -> None:
+    """Write the tool schemas."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=TOOL_SCHEMAS_PATH)
+    args = parser.parse_args()
+
+    package_version = get_package_version()
+    if package_version is None:
+        raise SystemExit("kfinance/version.py is missing, install the package first.")
+    write_tool_schemas(args.output)
+    print(f"Wrote tool schemas for kfinance {package_version} to {args.output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()